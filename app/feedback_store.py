@@ -0,0 +1,421 @@
+"""
+Feedback / generation-log storage for /api/tasks
+SQLite in WAL mode with one connection per thread, schema migrated once,
+inserts batched by a write-behind thread and daily rollups for /stats
+"""
+import json
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+QUALITY_GATE_KEYS = ('title_repairs', 'ac_dedupes', 'priority_boosts')
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS feedback (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        task_id TEXT,
+        generated_task TEXT NOT NULL,
+        final_task TEXT,
+        rating INTEGER,
+        comment TEXT,
+        session_id TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS generation_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        num_sentences INTEGER,
+        num_requirements INTEGER,
+        num_tasks INTEGER,
+        latency_ms INTEGER,
+        avg_confidence REAL,
+        quality_gates TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_feedback_created_at ON feedback (created_at);
+    CREATE INDEX IF NOT EXISTS idx_feedback_timestamp ON feedback (timestamp);
+    CREATE INDEX IF NOT EXISTS idx_generation_logs_timestamp ON generation_logs (timestamp);
+    CREATE TABLE IF NOT EXISTS generation_daily (
+        day TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        requests INTEGER NOT NULL DEFAULT 0,
+        latency_sum REAL NOT NULL DEFAULT 0,
+        latency_n INTEGER NOT NULL DEFAULT 0,
+        confidence_sum REAL NOT NULL DEFAULT 0,
+        confidence_n INTEGER NOT NULL DEFAULT 0,
+        title_repairs INTEGER NOT NULL DEFAULT 0,
+        ac_dedupes INTEGER NOT NULL DEFAULT 0,
+        priority_boosts INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, mode)
+    );
+'''
+
+_INSERT_FEEDBACK = '''
+    INSERT INTO feedback
+    (timestamp, task_id, generated_task, final_task, rating, comment, session_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_GENERATION_LOG = '''
+    INSERT INTO generation_logs
+    (timestamp, mode, num_sentences, num_requirements, num_tasks, latency_ms, avg_confidence, quality_gates)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_UPSERT_DAILY = '''
+    INSERT INTO generation_daily
+    (day, mode, requests, latency_sum, latency_n, confidence_sum, confidence_n,
+     title_repairs, ac_dedupes, priority_boosts)
+    VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (day, mode) DO UPDATE SET
+        requests = requests + 1,
+        latency_sum = latency_sum + excluded.latency_sum,
+        latency_n = latency_n + excluded.latency_n,
+        confidence_sum = confidence_sum + excluded.confidence_sum,
+        confidence_n = confidence_n + excluded.confidence_n,
+        title_repairs = title_repairs + excluded.title_repairs,
+        ac_dedupes = ac_dedupes + excluded.ac_dedupes,
+        priority_boosts = priority_boosts + excluded.priority_boosts
+'''
+
+
+def _gate_counts(quality_gates: Optional[str]) -> List[int]:
+    """title_repairs / ac_dedupes / priority_boosts from a stored quality_gates JSON"""
+    if not quality_gates:
+        return [0] * len(QUALITY_GATE_KEYS)
+    try:
+        gates = json.loads(quality_gates)
+        return [int(gates.get(key, 0) or 0) for key in QUALITY_GATE_KEYS]
+    except Exception:
+        return [0] * len(QUALITY_GATE_KEYS)
+
+
+def _daily_params(log: Tuple) -> Tuple:
+    timestamp, mode, _, _, _, latency_ms, avg_confidence, quality_gates = log
+    return (
+        timestamp[:10], mode,
+        latency_ms or 0, 0 if latency_ms is None else 1,
+        avg_confidence or 0, 0 if avg_confidence is None else 1,
+        *_gate_counts(quality_gates),
+    )
+
+
+class FeedbackStore:
+    """
+    SQLite data layer behind /feedback, /stats and /feedback/export
+
+    - One WAL-mode connection per thread (sqlite3 connections are not shareable)
+    - Schema, indexes and the rollup backfill run once, in __init__
+    - Writes go through a write-behind queue: a single writer thread takes
+      whatever is pending (up to `batch_size`) and commits it in one
+      transaction, so concurrent requests share a commit without added latency.
+      add_feedback() returns a Future with the row id once the batch commits.
+    - generation_daily keeps per-day, per-mode sums, updated in the same
+      transaction as each log row, so stats cost O(days) instead of O(rows)
+    """
+
+    def __init__(self, db_path: Path, batch_size: int = 64):
+        self.db_path = Path(db_path)
+        self.batch_size = max(1, batch_size)
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self.stats = {'batches': 0, 'rows_written': 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._migrate()
+
+    # ------------------------------------------------------------------
+    # Connections / schema
+    # ------------------------------------------------------------------
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection owned by the calling thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _migrate(self):
+        conn = self.connection()
+        conn.executescript(_SCHEMA)
+
+        # Backfill rollups for logs written before generation_daily existed
+        has_rollups = conn.execute('SELECT 1 FROM generation_daily LIMIT 1').fetchone()
+        has_logs = conn.execute('SELECT 1 FROM generation_logs LIMIT 1').fetchone()
+        if has_logs and not has_rollups:
+            rows = conn.execute('''
+                SELECT timestamp, mode, num_sentences, num_requirements, num_tasks,
+                       latency_ms, avg_confidence, quality_gates
+                FROM generation_logs
+            ''').fetchall()
+            conn.executemany(_UPSERT_DAILY, (_daily_params(row) for row in rows))
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Write-behind queue
+    # ------------------------------------------------------------------
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            with self._writer_lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(
+                        target=self._write_loop, name='feedback-writer', daemon=True
+                    )
+                    self._writer.start()
+
+    def _enqueue(self, kind: str, params: Optional[Tuple]) -> Future:
+        future: Future = Future()
+        self._ensure_writer()
+        self._queue.put((kind, params, future))
+        return future
+
+    def _write_loop(self):
+        conn = self.connection()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+
+            self._write_batch(conn, batch)
+            if stop:
+                return
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple]):
+        results = []
+        try:
+            with conn:
+                for kind, params, _ in batch:
+                    if kind == 'feedback':
+                        results.append(conn.execute(_INSERT_FEEDBACK, params).lastrowid)
+                    elif kind == 'generation':
+                        results.append(conn.execute(_INSERT_GENERATION_LOG, params).lastrowid)
+                        conn.execute(_UPSERT_DAILY, _daily_params(params))
+                    else:  # flush marker
+                        results.append(None)
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        written = sum(1 for kind, _, _ in batch if kind != 'flush')
+        self.stats['batches'] += 1
+        self.stats['rows_written'] += written
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def flush(self, timeout: Optional[float] = 10.0):
+        """Block until every write queued so far is committed"""
+        if self._writer is None:
+            return
+        self._enqueue('flush', None).result(timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def add_feedback(
+        self,
+        generated_task: Dict[str, Any],
+        final_task: Optional[Dict[str, Any]] = None,
+        rating: Optional[int] = None,
+        comment: Optional[str] = None,
+        task_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Future:
+        """Queue a feedback row; the Future resolves to its id after commit"""
+        return self._enqueue('feedback', (
+            datetime.now().isoformat(),
+            task_id,
+            json.dumps(generated_task),
+            json.dumps(final_task) if final_task else None,
+            rating,
+            comment,
+            session_id,
+        ))
+
+    def log_generation(
+        self,
+        mode: str,
+        num_sentences: Optional[int] = None,
+        num_requirements: Optional[int] = None,
+        num_tasks: Optional[int] = None,
+        latency_ms: Optional[int] = None,
+        avg_confidence: Optional[float] = None,
+        quality_gates: Optional[Dict[str, Any]] = None,
+    ) -> Future:
+        """Queue a generation log row (fire-and-forget for callers that don't wait)"""
+        return self._enqueue('generation', (
+            datetime.now().isoformat(),
+            mode,
+            num_sentences,
+            num_requirements,
+            num_tasks,
+            latency_ms,
+            avg_confidence,
+            json.dumps(quality_gates) if quality_gates is not None else None,
+        ))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get_stats(self, days: int = 7) -> Dict[str, Any]:
+        """
+        Aggregate generation logs from the last `days` days
+
+        Whole days come from generation_daily; only the partial first day is
+        read from generation_logs (via the timestamp index).
+        """
+        self.flush()
+        conn = self.connection()
+
+        cutoff_dt = datetime.now() - timedelta(days=days)
+        cutoff = cutoff_dt.isoformat()
+        cutoff_day = cutoff_dt.date().isoformat()
+        next_day = (cutoff_dt.date() + timedelta(days=1)).isoformat()
+
+        total = 0
+        latency_sum, latency_n = 0.0, 0
+        confidence_sum, confidence_n = 0.0, 0
+        mode_distribution: Dict[str, int] = {}
+        quality_gates_summary = {key: 0 for key in QUALITY_GATE_KEYS}
+
+        rollups = conn.execute('''
+            SELECT mode, SUM(requests), SUM(latency_sum), SUM(latency_n),
+                   SUM(confidence_sum), SUM(confidence_n),
+                   SUM(title_repairs), SUM(ac_dedupes), SUM(priority_boosts)
+            FROM generation_daily
+            WHERE day > ?
+            GROUP BY mode
+        ''', (cutoff_day,))
+        for mode, requests, l_sum, l_n, c_sum, c_n, *gates in rollups:
+            total += requests
+            mode_distribution[mode] = mode_distribution.get(mode, 0) + requests
+            latency_sum += l_sum
+            latency_n += l_n
+            confidence_sum += c_sum
+            confidence_n += c_n
+            for key, value in zip(QUALITY_GATE_KEYS, gates):
+                quality_gates_summary[key] += value
+
+        partial_day = conn.execute('''
+            SELECT mode, latency_ms, avg_confidence, quality_gates
+            FROM generation_logs
+            WHERE timestamp >= ? AND timestamp < ?
+        ''', (cutoff, next_day))
+        for mode, latency_ms, avg_confidence, quality_gates in partial_day:
+            total += 1
+            mode_distribution[mode] = mode_distribution.get(mode, 0) + 1
+            if latency_ms is not None:
+                latency_sum += latency_ms
+                latency_n += 1
+            if avg_confidence is not None:
+                confidence_sum += avg_confidence
+                confidence_n += 1
+            for key, value in zip(QUALITY_GATE_KEYS, _gate_counts(quality_gates)):
+                quality_gates_summary[key] += value
+
+        return {
+            'total_requests': total,
+            'avg_latency_ms': latency_sum / latency_n if latency_n else 0,
+            'avg_confidence': confidence_sum / confidence_n if confidence_n else 0,
+            'mode_distribution': mode_distribution,
+            'quality_gates_summary': quality_gates_summary,
+        }
+
+    def export_feedback(self, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Most recent feedback rows (uses the created_at index)"""
+        self.flush()
+        cursor = self.connection().execute('''
+            SELECT
+                id, timestamp, task_id, generated_task, final_task,
+                rating, comment, session_id
+            FROM feedback
+            ORDER BY created_at DESC
+            LIMIT ?
+        ''', (limit,))
+
+        return [
+            {
+                'id': row[0],
+                'timestamp': row[1],
+                'task_id': row[2],
+                'generated_task': json.loads(row[3]) if row[3] else None,
+                'final_task': json.loads(row[4]) if row[4] else None,
+                'rating': row[5],
+                'comment': row[6],
+                'session_id': row[7]
+            }
+            for row in cursor.fetchall()
+        ]
+
+    def close(self):
+        """Drain the write queue, stop the writer and close all connections"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=10)
+        self._writer = None
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.ProgrammingError:
+                    # Opened by another thread; closed when that thread exits
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+
+# Singleton instance
+_store: Optional[FeedbackStore] = None
+_store_lock = threading.Lock()
+
+
+def get_feedback_store() -> FeedbackStore:
+    """Get or create the feedback store (path from FEEDBACK_DB, default data/feedback.db)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = FeedbackStore(Path(os.getenv('FEEDBACK_DB', 'data/feedback.db')))
+    return _store
+
+
+def close_feedback_store():
+    """Flush pending writes and close connections (call from the app shutdown hook)"""
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
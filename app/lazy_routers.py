@@ -0,0 +1,145 @@
+"""
+Lazy loading for heavy routers
+Router modules are imported on first request under their prefix (or on
+warm-up), so worker start does not pay for spaCy / sklearn / transformers
+"""
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import anyio
+from fastapi import FastAPI
+
+
+class LazyRouter:
+    """
+    A router (or any attribute) of a module imported on first use
+
+    `prefix` must match the router's own prefix: requests under it trigger
+    the import. `enabled` decides at load time whether the router is
+    mounted (e.g. a fallback only used when the primary is unavailable).
+    `mount=False` marks a probe-only entry: imported for its availability
+    flag, never included in the app.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        module: str,
+        attr: str = "router",
+        prefix: Optional[str] = None,
+        enabled: Optional[Callable[[], bool]] = None,
+        mount: bool = True,
+    ):
+        self.label = label
+        self.module = module
+        self.attr = attr
+        self.prefix = prefix
+        self.enabled = enabled
+        self.mount = mount and prefix is not None
+        self.obj: Any = None
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.loaded = False
+        self.mounted = False
+        self.settled = not self.mount  # True once mounting was decided
+        self._lock = threading.Lock()
+
+    def load(self) -> Any:
+        """Import the module once; returns the attribute or None"""
+        if self.loaded:
+            return self.obj
+        with self._lock:
+            if not self.loaded:
+                start = time.perf_counter()
+                try:
+                    self.obj = getattr(importlib.import_module(self.module), self.attr)
+                    print(f"✅ {self.label} LOADED")
+                except Exception as e:  # ImportError, or a router failing to build
+                    self.error = str(e)
+                    print(f"❌ {self.label} not available: {e}")
+                self.load_seconds = round(time.perf_counter() - start, 3)
+                self.loaded = True
+        return self.obj
+
+    @property
+    def available(self) -> bool:
+        return self.load() is not None
+
+    def matches(self, path: str) -> bool:
+        return self.prefix is not None and (path == self.prefix or path.startswith(self.prefix + "/"))
+
+    def status(self) -> Dict[str, Any]:
+        if not self.loaded:
+            state = "skipped" if self.settled and self.mount else "lazy"
+        elif self.obj is None:
+            state = "unavailable"
+        elif self.mounted:
+            state = "mounted"
+        else:
+            state = "loaded"
+        return {"state": state, "load_seconds": self.load_seconds, "error": self.error}
+
+
+_mount_lock = threading.Lock()
+
+
+def mount_lazy_router(app: FastAPI, lazy: LazyRouter) -> bool:
+    """Import and include `lazy` in `app` (once); returns True if mounted"""
+    if lazy.settled:
+        return lazy.mounted
+    if lazy.enabled is not None and not lazy.enabled():
+        lazy.settled = True
+        return False
+    router = lazy.load()
+    with _mount_lock:
+        if not lazy.settled:
+            if router is not None:
+                app.include_router(router)
+                app.openapi_schema = None  # regenerate docs with the new routes
+                lazy.mounted = True
+                print(f"✅ {lazy.label} included")
+            lazy.settled = True
+    return lazy.mounted
+
+
+class LazyRouterMiddleware:
+    """
+    ASGI middleware: mounts a lazy router before the first request under its
+    prefix is routed; the OpenAPI schema request mounts all of them
+    """
+
+    def __init__(self, app, target: FastAPI, routers: Iterable[LazyRouter]):
+        self.app = app
+        self.target = target
+        self.routers = [r for r in routers if r.mount]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            wants_all = path == self.target.openapi_url
+            for lazy in self.routers:
+                if not lazy.settled and (wants_all or lazy.matches(path)):
+                    # The import can take seconds: keep it off the event loop
+                    await anyio.to_thread.run_sync(mount_lazy_router, self.target, lazy)
+        await self.app(scope, receive, send)
+
+
+def warm_up(app: FastAPI, routers: Iterable[LazyRouter]) -> Dict[str, Any]:
+    """
+    Explicit warm-up hook: mount every lazy router and preload NLP models
+
+    Returns per-item load times in seconds.
+    """
+    timings: Dict[str, Any] = {}
+    for lazy in routers:
+        if lazy.mount:
+            mount_lazy_router(app, lazy)
+            timings[lazy.label] = lazy.status()
+    try:
+        from requirement_analyzer.nlp_resources import warm_up as warm_up_nlp
+        timings["nlp"] = warm_up_nlp()
+    except ImportError as e:
+        timings["nlp"] = {"error": str(e)}
+    return timings
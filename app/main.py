@@ -4,6 +4,7 @@ Production-ready with logging, monitoring, and feedback collection
 """
 import os
 import sys
+import threading
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,52 +17,59 @@ sys.path.append(str(PROJECT_ROOT))
 
 from app.routers import tasks, unified, test_routes, testcase
 from app.middleware.logging import LoggingMiddleware
+from app.lazy_routers import LazyRouter, LazyRouterMiddleware, warm_up
 from dotenv import load_dotenv
 
-# Try to import V3 (Hybrid LLM) - PRIMARY
-try:
-    from requirement_analyzer.task_gen.api_adapter_v3 import router as v3_router
-    V3_ROUTER_AVAILABLE = True
-    print("✅ V3 HYBRID LLM LOADED")
-except ImportError as e:
-    V3_ROUTER_AVAILABLE = False
-    print(f"❌ V3 Router not available: {e}")
-
-# Try to import LLM-Free adapter - PREFERRED (no external APIs)
-try:
-    from requirement_analyzer.task_gen.api_adapter_llmfree import router as llmfree_router
-    LLMFREE_ROUTER_AVAILABLE = True
-    print("✅ LLM-FREE ADAPTER LOADED")
-except ImportError as e:
-    LLMFREE_ROUTER_AVAILABLE = False
-    print(f"❌ LLM-Free Router not available: {e}")
-
-# Try to import V2 test generation router - FALLBACK
-try:
-    from requirement_analyzer.task_gen.smart_ai_generator_v2 import AITestGenerator as GeneratorV2
-    V2_ROUTER_AVAILABLE = True
-except ImportError:
-    V2_ROUTER_AVAILABLE = False
-    GeneratorV2 = None
-
-# Legacy routers (keep for backward compat)
-try:
-    from requirement_analyzer.task_gen.api_ai_test_generation_v3 import router as ai_test_router
-    AI_TEST_ROUTER_AVAILABLE = True
-except ImportError:
-    AI_TEST_ROUTER_AVAILABLE = False
-
-try:
-    from requirement_analyzer.api_v2_test_generation import pure_ml_router
-    PURE_ML_ROUTER_AVAILABLE = True
-except ImportError:
-    PURE_ML_ROUTER_AVAILABLE = False
-
-try:
-    from requirement_analyzer.api_v2_test_generation import router as v2_test_router
-    V2_TEST_ROUTER_AVAILABLE = True
-except ImportError:
-    V2_TEST_ROUTER_AVAILABLE = False
+# Heavy routers (spaCy, sklearn, transformers) are imported on first request
+# under their prefix, or by warm_up() - never at import time
+
+# LLM-Free adapter - PREFERRED (no external APIs)
+LLMFREE_ROUTER = LazyRouter(
+    "LLM-Free Router", "requirement_analyzer.task_gen.api_adapter_llmfree",
+    prefix="/api/v3/test-generation",
+)
+
+# V3 (Hybrid LLM) - only mounted when LLM-Free is not available
+V3_ROUTER = LazyRouter(
+    "V3 Hybrid LLM Router", "requirement_analyzer.task_gen.api_adapter_v3",
+    prefix="/api/v1/tests",
+    enabled=lambda: not LLMFREE_ROUTER.available,
+)
+
+# Probe-only entries: availability flags for status/compat, never mounted
+V2_GENERATOR = LazyRouter(
+    "V2 Generator", "requirement_analyzer.task_gen.smart_ai_generator_v2",
+    attr="AITestGenerator", mount=False,
+)
+AI_TEST_ROUTER = LazyRouter(
+    "Legacy AI Test Router", "requirement_analyzer.task_gen.api_ai_test_generation_v3", mount=False,
+)
+PURE_ML_ROUTER = LazyRouter(
+    "Pure ML Router", "requirement_analyzer.api_v2_test_generation", attr="pure_ml_router", mount=False,
+)
+V2_TEST_ROUTER = LazyRouter(
+    "V2 Test Router", "requirement_analyzer.api_v2_test_generation", mount=False,
+)
+
+LAZY_ROUTERS = [LLMFREE_ROUTER, V3_ROUTER]
+
+# Module attributes kept for backward compat, resolved on first access
+_LAZY_FLAGS = {
+    "V3_ROUTER_AVAILABLE": V3_ROUTER,
+    "LLMFREE_ROUTER_AVAILABLE": LLMFREE_ROUTER,
+    "V2_ROUTER_AVAILABLE": V2_GENERATOR,
+    "AI_TEST_ROUTER_AVAILABLE": AI_TEST_ROUTER,
+    "PURE_ML_ROUTER_AVAILABLE": PURE_ML_ROUTER,
+    "V2_TEST_ROUTER_AVAILABLE": V2_TEST_ROUTER,
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_FLAGS:
+        return _LAZY_FLAGS[name].available
+    if name == "GeneratorV2":
+        return V2_GENERATOR.load()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 load_dotenv()
 
@@ -75,30 +83,33 @@ async def lifespan(app: FastAPI):
     print(f"Model dir: {os.getenv('MODEL_DIR', 'requirement_analyzer/models/task_gen/models')}")
     print(f"Mode: {os.getenv('DEFAULT_MODE', 'model')}")
     print("\n📡 GENERATOR STATUS:")
+    print("   LLM-Free (Smart NER) - PRIMARY, V3 (Hybrid LLM) - FALLBACK")
     
-    if LLMFREE_ROUTER_AVAILABLE:
-        print("   ✅ LLM-Free (Smart NER) - PRIMARY")
-    else:
-        print("   ❌ LLM-Free (Smart NER) - NOT AVAILABLE")
-    
-    if V3_ROUTER_AVAILABLE:
-        print("   ⚠️  V3 (Hybrid LLM) - AVAILABLE")
-    else:
-        print("   ❌ V3 (Hybrid LLM) - NOT AVAILABLE")
-    
-    if V2_ROUTER_AVAILABLE:
-        print("   ⚠️  V2 (Rule-based) - AVAILABLE")
+    # Routers load on first request; APP_WARMUP=1 loads them (and NLP models)
+    # in a background thread so startup is not blocked
+    if os.getenv("APP_WARMUP", "0") == "1":
+        threading.Thread(
+            target=warm_up, args=(app, LAZY_ROUTERS), daemon=True, name="app-warmup"
+        ).start()
+        print("   ⏳ Warm-up started in background")
     else:
-        print("   ❌ V2 (Rule-based) - NOT AVAILABLE")
+        print("   ⏳ Routers load on first request (POST /warmup to preload)")
     
-    if AI_TEST_ROUTER_AVAILABLE:
-        print("   ⚠️  Legacy AI Test Router - DEPRECATED")
+    # Feedback DB: schema/index migration and rollup backfill run once here
+    from app.feedback_store import get_feedback_store
+    get_feedback_store()
     
     print("\n" + "="*70 + "\n")
     
     yield
     # Shutdown
     print("👋 Shutting down Task Generation API...")
+    from requirement_analyzer.task_gen.generation_executor import shutdown_generation_executor
+    shutdown_generation_executor()
+    from app.feedback_store import close_feedback_store
+    close_feedback_store()
+    from app.unified_client import close_unified_client
+    await close_unified_client()
 
 
 # Create app
@@ -118,6 +129,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Mount heavy routers on first request under their prefix
+app.add_middleware(LazyRouterMiddleware, target=app, routers=LAZY_ROUTERS)
+
 # Logging middleware
 app.add_middleware(LoggingMiddleware)
 
@@ -127,20 +141,8 @@ app.include_router(unified.router, tags=["unified"])
 app.include_router(test_routes.router, tags=["testing"])
 app.include_router(testcase.router, tags=["testcase"])
 
-# LLM-FREE (Primary - no external APIs)
-if LLMFREE_ROUTER_AVAILABLE:
-    app.include_router(llmfree_router)
-    print("✅ LLM-Free Router included (Primary)")
-else:
-    print("❌ LLM-Free Router NOT available")
-
-# V3 HYBRID LLM (Fallback)
-if V3_ROUTER_AVAILABLE and not LLMFREE_ROUTER_AVAILABLE:
-    app.include_router(v3_router)
-    print("⚠️  V3 Router included (Fallback - LLM-Free not available)")
-else:
-    if V3_ROUTER_AVAILABLE:
-        print("✅ V3 Router available but LLM-Free is primary")
+# LLM-FREE (Primary) and V3 HYBRID LLM (Fallback) are mounted lazily,
+# see LAZY_ROUTERS above
 
 
 @app.get("/")
@@ -220,10 +222,17 @@ async def health():
         "status": "healthy" if models_ok else "degraded",
         "models_loaded": models_ok,
         "model_dir": str(model_dir),
-        "mode": os.getenv('DEFAULT_MODE', 'model')
+        "mode": os.getenv('DEFAULT_MODE', 'model'),
+        "routers": {r.label: r.status() for r in LAZY_ROUTERS}
     }
 
 
+@app.post("/warmup")
+def warmup():
+    """Load every lazy router and NLP model now (readiness hook); returns load times"""
+    return warm_up(app, LAZY_ROUTERS)
+
+
 if __name__ == "__main__":
     import uvicorn
     
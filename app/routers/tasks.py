@@ -3,23 +3,24 @@ Task generation router - Production endpoints
 /generate, /feedback, /stats
 Using LLM-Free AI Pipeline (Smart NER + Domain-Specific Generators)
 """
-import os
 import sys
 import time
-import json
-import sqlite3
+import asyncio
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-from datetime import datetime
 from fastapi import APIRouter, HTTPException, Body, Query
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 # Add project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
-# ✅ Use new LLM-Free adapter (no external APIs)
-from requirement_analyzer.task_gen.api_adapter_llmfree import get_llmfree_adapter
+from requirement_analyzer.task_gen.generation_executor import (
+    GenerationQueueFull,
+    GenerationTimeout,
+)
+from app.feedback_store import FeedbackStore, get_feedback_store
 
 router = APIRouter()
 
@@ -31,6 +32,9 @@ def get_adapter():
     """Get or create LLM-Free adapter instance"""
     global _adapter
     if _adapter is None:
+        # ✅ Use new LLM-Free adapter (no external APIs) - imported on first request,
+        # the pipeline is too heavy to load at worker start
+        from requirement_analyzer.task_gen.api_adapter_llmfree import get_llmfree_adapter
         # Initialize with mock extractor (can be replaced with custom AI model later)
         _adapter = get_llmfree_adapter()
         print("✅ LLM-Free Adapter Loaded")
@@ -80,45 +84,9 @@ class StatsResponse(BaseModel):
 
 
 # Feedback database
-def get_feedback_db():
-    """Get feedback database connection"""
-    db_path = Path(os.getenv('FEEDBACK_DB', 'data/feedback.db'))
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    conn = sqlite3.connect(str(db_path))
-    
-    # Create table if not exists
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS feedback (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            task_id TEXT,
-            generated_task TEXT NOT NULL,
-            final_task TEXT,
-            rating INTEGER,
-            comment TEXT,
-            session_id TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS generation_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            mode TEXT NOT NULL,
-            num_sentences INTEGER,
-            num_requirements INTEGER,
-            num_tasks INTEGER,
-            latency_ms INTEGER,
-            avg_confidence REAL,
-            quality_gates TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    conn.commit()
-    return conn
+def get_feedback_db() -> FeedbackStore:
+    """Get the shared feedback store (pooled WAL connections, batched writes)"""
+    return get_feedback_store()
 
 
 @router.post("/generate")
@@ -147,11 +115,14 @@ async def generate_tasks(request: GenerateRequest):
     start_time = time.time()
     
     try:
-        # Get adapter
-        adapter = get_adapter()
+        from requirement_analyzer.task_gen.api_adapter_llmfree import generate_tests_async
         
-        # Generate tests using LLM-Free pipeline
-        result = adapter.generate_tests(
+        # Make sure the shared adapter exists (usage counters live there)
+        get_adapter()
+        
+        # Generate tests using LLM-Free pipeline in the generation executor,
+        # so a large document does not block the event loop
+        result = await generate_tests_async(
             requirements_text=request.document_text,
             max_tests=request.max_tasks,
             quality_threshold=request.requirement_threshold,
@@ -159,9 +130,25 @@ async def generate_tasks(request: GenerateRequest):
             verbose=False
         )
         
-        # Return full result
+        # Log for /stats (queued, written in the background)
+        if result.get('status') == 'success':
+            summary = result.get('summary', {})
+            get_feedback_db().log_generation(
+                mode=result.get('mode', request.mode),
+                num_requirements=summary.get('requirements_processed'),
+                num_tasks=summary.get('unique_tests_final'),
+                latency_ms=summary.get('latency_ms'),
+                avg_confidence=summary.get('avg_confidence'),
+                quality_gates=summary.get('quality_gates')
+            )
+        
+        # Return full result (includes 'execution' timing metadata)
         return result
     
+    except GenerationQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except GenerationTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         import traceback
         print(f"❌ Error in /generate: {str(e)}")
@@ -193,26 +180,16 @@ async def submit_feedback(feedback: FeedbackRequest):
     - Build training data for future improvements
     """
     try:
-        conn = get_feedback_db()
-        
-        conn.execute('''
-            INSERT INTO feedback 
-            (timestamp, task_id, generated_task, final_task, rating, comment, session_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            datetime.now().isoformat(),
-            feedback.task_id,
-            json.dumps(feedback.generated_task),
-            json.dumps(feedback.final_task) if feedback.final_task else None,
-            feedback.rating,
-            feedback.comment,
-            feedback.session_id
+        # Queued for the batch writer; resolves once the batch is committed
+        feedback_id = await asyncio.wrap_future(get_feedback_db().add_feedback(
+            generated_task=feedback.generated_task,
+            final_task=feedback.final_task,
+            rating=feedback.rating,
+            comment=feedback.comment,
+            task_id=feedback.task_id,
+            session_id=feedback.session_id
         ))
         
-        conn.commit()
-        feedback_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
-        conn.close()
-        
         return {
             "status": "success",
             "feedback_id": feedback_id,
@@ -238,67 +215,11 @@ async def get_stats(
     - Quality gates summary
     """
     try:
-        conn = get_feedback_db()
-        
-        # Calculate cutoff date
-        from datetime import timedelta
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-        
-        # Get stats
-        cursor = conn.execute('''
-            SELECT 
-                COUNT(*) as total,
-                AVG(latency_ms) as avg_latency,
-                AVG(avg_confidence) as avg_confidence
-            FROM generation_logs
-            WHERE timestamp >= ?
-        ''', (cutoff,))
-        
-        row = cursor.fetchone()
-        total_requests = row[0] or 0
-        avg_latency = row[1] or 0
-        avg_confidence = row[2] or 0
+        # Whole days come from daily rollups, so this is O(days) not O(rows).
+        # get_stats waits for queued writes to flush, so keep it off the event loop
+        stats = await run_in_threadpool(get_feedback_db().get_stats, days=days)
         
-        # Mode distribution
-        cursor = conn.execute('''
-            SELECT mode, COUNT(*) as count
-            FROM generation_logs
-            WHERE timestamp >= ?
-            GROUP BY mode
-        ''', (cutoff,))
-        
-        mode_distribution = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Quality gates summary
-        cursor = conn.execute('''
-            SELECT quality_gates
-            FROM generation_logs
-            WHERE timestamp >= ? AND quality_gates IS NOT NULL
-        ''', (cutoff,))
-        
-        quality_gates_summary = {
-            'title_repairs': 0,
-            'ac_dedupes': 0,
-            'priority_boosts': 0
-        }
-        
-        for row in cursor.fetchall():
-            try:
-                gates = json.loads(row[0])
-                for key in quality_gates_summary:
-                    quality_gates_summary[key] += gates.get(key, 0)
-            except:
-                pass
-        
-        conn.close()
-        
-        return StatsResponse(
-            total_requests=total_requests,
-            avg_latency_ms=avg_latency,
-            avg_confidence=avg_confidence,
-            mode_distribution=mode_distribution,
-            quality_gates_summary=quality_gates_summary
-        )
+        return StatsResponse(**stats)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
@@ -314,31 +235,8 @@ async def export_feedback(
     **Returns JSONL format** - one feedback record per line
     """
     try:
-        conn = get_feedback_db()
-        
-        cursor = conn.execute('''
-            SELECT 
-                id, timestamp, task_id, generated_task, final_task, 
-                rating, comment, session_id
-            FROM feedback
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', (limit,))
-        
-        feedbacks = []
-        for row in cursor.fetchall():
-            feedbacks.append({
-                'id': row[0],
-                'timestamp': row[1],
-                'task_id': row[2],
-                'generated_task': json.loads(row[3]) if row[3] else None,
-                'final_task': json.loads(row[4]) if row[4] else None,
-                'rating': row[5],
-                'comment': row[6],
-                'session_id': row[7]
-            })
-        
-        conn.close()
+        # Blocks on the write-queue flush + query: run it in the threadpool
+        feedbacks = await run_in_threadpool(get_feedback_db().export_feedback, limit=limit)
         
         return {
             "count": len(feedbacks),
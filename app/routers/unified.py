@@ -3,17 +3,15 @@ Router for unified test & task generation endpoints
 This router bridges both systems (requirement_analyzer and rule_based_system)
 """
 
-from fastapi import APIRouter, HTTPException, Form
+import asyncio
+
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
-import httpx
-import json
 
-router = APIRouter(prefix="/api/unified", tags=["unified"])
+from app.unified_client import ANALYZER_API, TESTGEN_API, get_unified_client
 
-# API endpoints
-ANALYZER_API = "http://localhost:8000"
-TESTGEN_API = "http://localhost:8001"
+router = APIRouter(prefix="/api/unified", tags=["unified"])
 
 
 class UnifiedRequest(BaseModel):
@@ -35,33 +33,20 @@ class UnifiedResponse(BaseModel):
 @router.get("/health")
 async def unified_health():
     """Check health of both systems"""
-    health_status = {
-        "analyzer": None,
-        "testgen": None,
-        "both_online": False
+    client = get_unified_client()
+    analyzer_ok, testgen_ok = await asyncio.gather(
+        client.is_healthy(client.analyzer),
+        client.is_healthy(client.testgen),
+    )
+    return {
+        "analyzer": analyzer_ok,
+        "testgen": testgen_ok,
+        "both_online": analyzer_ok and testgen_ok
     }
-    
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Check Analyzer
-            try:
-                resp = await client.get(f"{ANALYZER_API}/health")
-                health_status["analyzer"] = resp.status_code == 200
-            except:
-                health_status["analyzer"] = False
-            
-            # Check Test Generator
-            try:
-                resp = await client.get(f"{TESTGEN_API}/health")
-                health_status["testgen"] = resp.status_code == 200
-            except:
-                health_status["testgen"] = False
-            
-            health_status["both_online"] = health_status["analyzer"] and health_status["testgen"]
-    except:
-        health_status["both_online"] = False
-    
-    return health_status
+
+
+async def _skipped():
+    return None
 
 
 @router.post("/generate", response_model=UnifiedResponse)
@@ -69,57 +54,36 @@ async def unified_generate(request: UnifiedRequest):
     """
     Generate test cases using both systems
     
-    Returns results from both analyzer and test generator
+    Both backends are called concurrently, so latency is the slower of the
+    two rather than their sum. Returns results from both analyzer and test generator
     """
-    errors = []
-    analyzer_result = None
-    testgen_result = None
+    client = get_unified_client()
+    data = {
+        "text": request.text,
+        "format": request.format
+    }
     
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Run Requirement Analyzer
-            if request.analyze:
-                try:
-                    data = {
-                        "text": request.text,
-                        "format": request.format
-                    }
-                    resp = await client.post(
-                        f"{ANALYZER_API}/api/v3/generate",
-                        data=data
-                    )
-                    if resp.status_code == 200:
-                        analyzer_result = resp.json()
-                    else:
-                        errors.append(f"Analyzer error: {resp.status_code}")
-                except Exception as e:
-                    errors.append(f"Analyzer error: {str(e)}")
-            
-            # Run Test Generator
-            if request.generate:
-                try:
-                    data = {
-                        "text": request.text,
-                        "format": request.format
-                    }
-                    resp = await client.post(
-                        f"{TESTGEN_API}/generate/text",
-                        json=data
-                    )
-                    if resp.status_code == 200:
-                        testgen_result = resp.json()
-                    else:
-                        errors.append(f"Test Generator error: {resp.status_code}")
-                except Exception as e:
-                    errors.append(f"Test Generator error: {str(e)}")
+    analyzer_call = (
+        client.generate(client.analyzer, "/api/v3/generate", request.text, request.format, data=data)
+        if request.analyze else _skipped()
+    )
+    testgen_call = (
+        client.generate(client.testgen, "/generate/text", request.text, request.format, json=data)
+        if request.generate else _skipped()
+    )
+    outcomes = await asyncio.gather(analyzer_call, testgen_call)
     
-    except Exception as e:
-        errors.append(f"Unified generation error: {str(e)}")
+    errors = []
+    results = []
+    for backend, outcome in zip((client.analyzer, client.testgen), outcomes):
+        if outcome is not None and "error" in outcome:
+            errors.append(f"{backend.name} error: {outcome['error']}")
+        results.append(outcome.get("result") if outcome else None)
     
     return UnifiedResponse(
         success=len(errors) == 0,
-        analyzer_result=analyzer_result,
-        testgen_result=testgen_result,
+        analyzer_result=results[0],
+        testgen_result=results[1],
         errors=errors
     )
 
@@ -130,7 +94,7 @@ async def compare_results(request: UnifiedRequest):
     Compare results from both systems
     Returns side-by-side analysis
     """
-    # First generate from both
+    # First generate from both (served from cache right after /generate)
     unified_resp = await unified_generate(request)
     
     if not unified_resp.success:
@@ -159,12 +123,12 @@ async def compare_results(request: UnifiedRequest):
 @router.get("/formats")
 async def get_supported_formats():
     """Get supported formats from test generator"""
+    client = get_unified_client()
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(f"{TESTGEN_API}/formats")
-            if resp.status_code == 200:
-                return resp.json()
-    except:
+        resp = await client.request(client.testgen, "GET", "/formats", timeout=5.0)
+        if resp.status_code == 200:
+            return resp.json()
+    except Exception:
         pass
     
     return {
@@ -196,6 +160,7 @@ async def get_system_status():
             }
         },
         "overall_status": "online" if health["both_online"] else "degraded",
+        "client": get_unified_client().status(),
         "features": {
             "unified_generation": health["both_online"],
             "analyzer_only": health["analyzer"],
@@ -0,0 +1,269 @@
+"""
+Pooled HTTP client for the unified router
+One app-lifetime httpx.AsyncClient shared by all requests, with a timeout and
+circuit breaker per backend and a short-TTL cache of successful responses
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import httpx
+
+# API endpoints
+ANALYZER_API = "http://localhost:8000"
+TESTGEN_API = "http://localhost:8001"
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a backend whose circuit is open"""
+
+    def __init__(self, backend: str, retry_in: float):
+        super().__init__(f"{backend} circuit open, retry in {retry_in:.0f}s")
+        self.backend = backend
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    - closed: calls go through; `failure_threshold` failures in a row open it.
+    - open: calls fail fast with CircuitOpen for `reset_timeout` seconds.
+    - half-open: one trial call is let through; success closes the circuit,
+      failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_call(self):
+        """Raise CircuitOpen unless a call may go through now"""
+        state = self.state
+        if state == "open" or (state == "half-open" and self._trial_running):
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            raise CircuitOpen(self.name, retry_in)
+        if state == "half-open":
+            self._trial_running = True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_running or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._trial_running = False
+
+    def record_cancelled(self):
+        """The call was abandoned: neither outcome, let another trial through"""
+        self._trial_running = False
+
+    def status(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures}
+
+
+class TTLCache:
+    """Small LRU of (value, stored_at); entries older than `ttl` are misses"""
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Backend:
+    """One upstream service: base URL, its own timeout and circuit breaker"""
+
+    def __init__(self, name: str, base_url: str, timeout: float, **breaker_kwargs):
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout
+        self.breaker = CircuitBreaker(name, **breaker_kwargs)
+
+
+class UnifiedClient:
+    """
+    Shared connection pool for the analyzer and test generator backends
+
+    generate() results are cached for `cache_ttl` seconds per
+    (backend, text hash, format), and identical concurrent calls share one
+    upstream request, so /compare right after /generate does not recompute.
+    """
+
+    def __init__(
+        self,
+        analyzer: Backend,
+        testgen: Backend,
+        cache_ttl: float = 60.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.analyzer = analyzer
+        self.testgen = testgen
+        self.cache = TTLCache(ttl=cache_ttl)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            transport=transport,
+        )
+
+    async def request(self, backend: Backend, method: str, path: str,
+                      timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """
+        Call a backend through its circuit breaker
+
+        Connection errors, timeouts and 5xx responses count as failures;
+        raises CircuitOpen when the backend is being skipped.
+        """
+        resp = await self._send(backend, method, path, timeout, **kwargs)
+        self._record_status(backend, resp.status_code)
+        return resp
+
+    @staticmethod
+    def _record_status(backend: Backend, status_code: int):
+        if status_code >= 500:
+            backend.breaker.record_failure()
+        else:
+            backend.breaker.record_success()
+
+    async def _send(self, backend: Backend, method: str, path: str,
+                    timeout: Optional[float], **kwargs) -> httpx.Response:
+        """Send through the breaker; the caller records the outcome of a response"""
+        backend.breaker.before_call()
+        try:
+            return await self._client.request(
+                method, f"{backend.base_url}{path}",
+                timeout=timeout if timeout is not None else backend.timeout, **kwargs
+            )
+        except asyncio.CancelledError:
+            backend.breaker.record_cancelled()
+            raise
+        except Exception:
+            backend.breaker.record_failure()
+            raise
+
+    async def generate(self, backend: Backend, path: str, text: str, fmt: Optional[str],
+                       **kwargs) -> Dict[str, Any]:
+        """
+        POST a generation request; returns {"result": json} or {"error": message}
+
+        Only successful results are cached.
+        """
+        key = (backend.name, hashlib.sha256(text.encode("utf-8")).hexdigest(), fmt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(key)
+        if task is None:
+            # A task, not a coroutine: a cancelled caller does not cancel the
+            # upstream call other callers are waiting on
+            task = asyncio.ensure_future(self._generate_uncached(backend, path, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None and "result" in task.result():
+            self.cache.put(key, task.result())
+
+    async def _generate_uncached(self, backend: Backend, path: str, **kwargs) -> Dict[str, Any]:
+        try:
+            resp = await self._send(backend, "POST", path, None, **kwargs)
+        except Exception as e:
+            return {"error": str(e) or type(e).__name__}
+        if resp.status_code != 200:
+            self._record_status(backend, resp.status_code)
+            return {"error": resp.status_code}
+        # A 200 with a body that is not JSON (proxy error page, truncated
+        # response) is a backend failure too, not an exception for the router
+        try:
+            result = resp.json()
+        except ValueError as e:  # json.JSONDecodeError, UnicodeDecodeError
+            backend.breaker.record_failure()
+            return {"error": f"invalid JSON response: {e}"}
+        backend.breaker.record_success()
+        return {"result": result}
+
+    async def is_healthy(self, backend: Backend, timeout: float = 5.0) -> bool:
+        """GET /health without touching the breaker (health checks must not open it)"""
+        try:
+            resp = await self._client.get(f"{backend.base_url}/health", timeout=timeout)
+            return resp.status_code == 200
+        except Exception:
+            return False
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "analyzer": self.analyzer.breaker.status(),
+            "testgen": self.testgen.breaker.status(),
+            "cached_responses": len(self.cache),
+        }
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+# Singleton instance (created on first use inside the running event loop)
+_client: Optional[UnifiedClient] = None
+
+
+def get_unified_client() -> UnifiedClient:
+    """Get or create the shared client (timeouts from UNIFIED_*_TIMEOUT, seconds)"""
+    global _client
+    if _client is None:
+        _client = UnifiedClient(
+            Backend("Analyzer", ANALYZER_API, float(os.getenv("UNIFIED_ANALYZER_TIMEOUT", "30"))),
+            Backend("Test Generator", TESTGEN_API, float(os.getenv("UNIFIED_TESTGEN_TIMEOUT", "30"))),
+            cache_ttl=float(os.getenv("UNIFIED_CACHE_TTL", "60")),
+        )
+    return _client
+
+
+async def close_unified_client():
+    """Close pooled connections (call from the app shutdown hook)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: đánh giá từng dự án bằng estimate_effort so với columnar_evaluation
+(một lần tính trên cả cột). Kiểm tra dự đoán của hai đường giống nhau.
+
+Usage:
+    python benchmark_columnar_evaluation.py [n_projects]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+import numpy as np
+
+try:
+    from .estimation_models import COCOMOII, FunctionPoints, UseCasePoints, PlanningPoker
+    from .columnar_evaluation import predict_frame, projects_to_frame, evaluate_grid
+except ImportError:
+    from estimation_models import COCOMOII, FunctionPoints, UseCasePoints, PlanningPoker
+    from columnar_evaluation import predict_frame, projects_to_frame, evaluate_grid
+
+
+def make_projects(n, seed=42):
+    """Sinh n dự án có đủ trường cho cả bốn mô hình"""
+    rng = random.Random(seed)
+    projects = []
+    for _ in range(n):
+        fp = rng.uniform(20, 2000)
+        projects.append({
+            "size": rng.uniform(0.3, 800.0),
+            "reliability": rng.uniform(0.7, 1.6),
+            "complexity": rng.uniform(0.7, 1.6),
+            "documentation": rng.uniform(0.8, 1.3),
+            "time_constraint": rng.uniform(0.9, 1.5),
+            "tool_experience": rng.uniform(0.7, 1.3),
+            "function_points": fp,
+            "simple_actors": rng.randint(0, 5),
+            "average_actors": rng.randint(0, 5),
+            "complex_actors": rng.randint(0, 5),
+            "simple_use_cases": rng.randint(0, 20),
+            "average_use_cases": rng.randint(0, 20),
+            "complex_use_cases": rng.randint(0, 10),
+            "technical_factors": rng.uniform(0.6, 1.3),
+            "environmental_factors": rng.uniform(0.4, 1.4),
+            "story_points": rng.randint(10, 500),
+            "velocity": rng.choice([0, 20, 30, 45]),
+            "team_size": rng.randint(2, 12),
+            "actual_effort": rng.uniform(1.0, 500.0),
+        })
+    return projects
+
+
+def run_benchmark(n_projects=5000):
+    projects = make_projects(n_projects)
+    models = [COCOMOII(), FunctionPoints(), UseCasePoints(), PlanningPoker()]
+
+    print(f"Projects: {n_projects:,}   Models: {', '.join(m.model_name for m in models)}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        scalar = {m.model_name: [m.estimate_effort(p)["effort_pm"] for p in projects] for m in models}
+        t_scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = projects_to_frame(projects)
+    columnar = {m.model_name: predict_frame(m.model_name, frame) for m in models}
+    t_columnar = time.perf_counter() - start
+
+    max_diff = max(
+        float(np.max(np.abs(np.asarray(scalar[name]) - columnar[name]))) for name in scalar
+    )
+
+    print(f"Per-row path:  {t_scalar:8.3f}s")
+    print(f"Columnar path: {t_columnar:8.3f}s")
+    print(f"Speed-up:      {t_scalar / t_columnar:8.1f}x")
+    print(f"Max abs diff:  {max_diff:.3g}")
+
+    start = time.perf_counter()
+    grid = evaluate_grid({"synthetic": frame}, k_folds=10, n_bootstrap=1000)
+    print(f"Grid (4 models, k-fold + 1000 bootstrap): {time.perf_counter() - start:.2f}s")
+    print(grid[["model", "n_projects", "mmre", "pred_25", "rmse"]].to_string(index=False))
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
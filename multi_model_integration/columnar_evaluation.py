@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+Đánh giá mô hình theo cột: công thức COCOMO II, Function Points, Use Case Points
+và Planning Poker được tính trên cả cột NumPy/pandas thay vì gọi estimate_effort
+cho từng dự án.
+
+Cung cấp:
+- các hàm *_effort(frame) trả về effort_pm cho từng hàng (giống estimate_effort)
+- compute_metrics / evaluate_frame: MMRE, PRED(25), RMSE vector hóa
+- kfold_confidence_interval / bootstrap_confidence_interval
+- evaluate_grid: chạy lưới mô hình × bộ dữ liệu song song trên nhiều tiến trình
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Số cột bootstrap xử lý trong một lần (giới hạn bộ nhớ của ma trận chỉ số)
+BOOTSTRAP_CHUNK_CELLS = 4_000_000
+
+METRICS = ("mmre", "pred_25", "rmse")
+
+# estimate_effort phân biệt khóa thiếu với khóa có giá trị NaN ("kloc" có mặt
+# nhưng NaN vẫn được dùng làm size), DataFrame thì không -> ghi lại cột _has_<khóa>
+PRESENCE_KEYS = ("size", "kloc", "loc")
+
+
+def projects_to_frame(projects):
+    """Chuyển danh sách dict dự án (đầu ra của preprocess_*) thành DataFrame"""
+    if projects is None:
+        return pd.DataFrame()
+    if isinstance(projects, pd.DataFrame):
+        return projects
+    projects = list(projects)
+    frame = pd.DataFrame.from_records(projects)
+    for key in PRESENCE_KEYS:
+        if key not in frame.columns:
+            continue
+        has_key = np.array([key in project for project in projects], dtype=bool)
+        if not has_key.all():
+            frame["_has_" + key] = has_key
+    return frame
+
+
+def _column(frame, name, default=np.nan):
+    """Cột số dạng float; thiếu cột hoặc giá trị không phải số -> default"""
+    if name not in frame.columns:
+        return np.full(len(frame), default, dtype=float)
+    values = pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float)
+    if not np.isnan(default):
+        values = np.where(np.isfinite(values), values, default)
+    return values
+
+
+def _present(values):
+    return np.isfinite(values)
+
+
+def _has_key(frame, name):
+    """Hàng nào có khóa name (như `name in project_data`); cột của DataFrame
+    nhập trực tiếp được coi là có mặt ở mọi hàng, giống row.to_dict()"""
+    if "_has_" + name in frame.columns:
+        return frame["_has_" + name].to_numpy(dtype=bool)
+    return np.full(len(frame), name in frame.columns, dtype=bool)
+
+
+def _is_number(frame, name):
+    """Hàng nào có giá trị kiểu int/float (isinstance trong estimate_effort)"""
+    if name not in frame.columns:
+        return np.zeros(len(frame), dtype=bool)
+    column = frame[name]
+    if pd.api.types.is_numeric_dtype(column):
+        return np.ones(len(frame), dtype=bool)
+    return np.array([isinstance(v, (int, float)) for v in column.tolist()], dtype=bool)
+
+
+def _round(values, ndigits=2):
+    """round() của Python cho từng phần tử: np.round lệch 0.01 ở các giá trị
+    kiểu 122.445 so với estimate_effort"""
+    return np.array([round(v, ndigits) for v in values.tolist()], dtype=float)
+
+
+# ---------------------------------------------------------------------------
+# Công thức theo cột
+# ---------------------------------------------------------------------------
+
+# Giống COCOMOII._calculate_effort_multipliers
+COCOMO_EM_DEFAULTS = {
+    "precedentedness": 1.0,
+    "development_flexibility": 1.0,
+    "architecture_risk": 1.0,
+    "team_cohesion": 1.0,
+    "process_maturity": 1.0,
+    "reliability": 1.0,
+    "database_size": 1.0,
+    "complexity": 1.0,
+    "reuse": 0.0,
+    "documentation": 1.0,
+    "time_constraint": 1.0,
+    "storage_constraint": 1.0,
+    "platform_volatility": 1.0,
+    "analyst_capability": 1.0,
+    "programmer_capability": 1.0,
+    "personnel_continuity": 1.0,
+    "team_experience": 1.0,
+    "language_experience": 1.0,
+    "tool_experience": 1.0,
+    "personnel_capability": 1.0,
+    "personnel_experience": 1.0,
+}
+
+COCOMO_PARAM_MAPPINGS = {
+    "team_exp": "team_experience",
+    "manager_exp": "personnel_capability",
+    "reliability_req": "reliability",
+}
+
+COCOMO_EM_PRODUCT = (
+    "reliability", "database_size", "complexity", "documentation",
+    "time_constraint", "storage_constraint", "platform_volatility",
+    "analyst_capability", "programmer_capability", "personnel_continuity",
+    "team_experience", "language_experience", "tool_experience",
+)
+
+
+def _flag(frame, name):
+    if name not in frame.columns:
+        return np.zeros(len(frame), dtype=bool)
+    return frame[name].fillna(False).astype(bool).to_numpy()
+
+
+def cocomo_effort_multipliers(frame):
+    """Tích các hệ số nhân nỗ lực COCOMO II cho từng hàng"""
+    params = {}
+    for param, default in COCOMO_EM_DEFAULTS.items():
+        source = param
+        if param not in frame.columns:
+            for src, dest in COCOMO_PARAM_MAPPINGS.items():
+                if dest == param and src in frame.columns:
+                    source = src
+                    break
+        params[param] = _column(frame, source, default)
+
+    if "text_complexity" in frame.columns:
+        text_complexity = _column(frame, "text_complexity")
+        complexity_factor = np.minimum(0.7 + (text_complexity - 1.0) / 2.0 * 0.6, 1.3)
+        params["complexity"] = np.where(
+            text_complexity > 1.0,
+            np.maximum(params["complexity"], complexity_factor),
+            params["complexity"],
+        )
+
+    params["reliability"] = np.where(_flag(frame, "has_security_requirements"),
+                                     params["reliability"] * 1.1, params["reliability"])
+    params["time_constraint"] = np.where(_flag(frame, "has_performance_requirements"),
+                                         params["time_constraint"] * 1.1, params["time_constraint"])
+    params["complexity"] = np.where(_flag(frame, "has_interface_requirements"),
+                                    params["complexity"] * 1.05, params["complexity"])
+    params["database_size"] = np.where(_flag(frame, "has_data_requirements"),
+                                       params["database_size"] * 1.1, params["database_size"])
+
+    very_complex = params["complexity"] > 1.3
+    params["reliability"] = np.where(very_complex, params["reliability"] * 1.1, params["reliability"])
+    params["time_constraint"] = np.where(very_complex, params["time_constraint"] * 1.1, params["time_constraint"])
+
+    em_product = 1.0 + 0.01 * params["reuse"]
+    for param in COCOMO_EM_PRODUCT:
+        em_product = em_product * np.clip(params[param], 0.7, 1.5)
+
+    invalid = ~np.isfinite(em_product) | (em_product <= 0)
+    return np.where(invalid, 1.0, np.clip(em_product, 0.5, 2.0))
+
+
+def cocomo_ii_effort(frame, A=2.94, B=1.0997):
+    """effort_pm của COCOMOII.estimate_effort (công thức truyền thống) cho từng hàng"""
+    size = _column(frame, "size")
+    kloc = _column(frame, "kloc")
+    loc = _column(frame, "loc")
+    fp = _column(frame, "function_points", 0.0)
+    fp = np.where(fp != 0, fp, _column(frame, "points_non_adjust", 0.0))
+
+    # Thứ tự ưu tiên theo khóa có mặt như estimate_effort: kloc/loc có mặt mà
+    # NaN vẫn được chọn (rồi bị kẹp thành 0.5), không rơi xuống nguồn sau
+    fallback = np.where(fp > 0, fp * 0.1, 5.0)
+    fallback = np.where(_has_key(frame, "loc"), loc / 1000, fallback)
+    fallback = np.where(_has_key(frame, "kloc"), kloc, fallback)
+    with np.errstate(invalid="ignore"):
+        valid = _has_key(frame, "size") & _is_number(frame, "size") & ~(size <= 0)
+    size = np.where(valid, size, fallback)
+    # max(0.5, min(nan, 1000)) của Python cho 0.5
+    size = np.where(np.isnan(size), 0.5, np.clip(size, 0.5, 1000))
+
+    effort = A * size ** B * cocomo_effort_multipliers(frame)
+    effort = np.where(size < 1.0, effort * 0.8, np.where(size > 50.0, effort * 1.1, effort))
+    effort = np.where(np.isfinite(effort) & (effort > 0), effort, size * 2.5)
+    return _round(np.maximum(1.0, effort))
+
+
+FP_WEIGHTS = {
+    "external_inputs": 4,
+    "external_outputs": 5,
+    "external_inquiries": 4,
+    "internal_files": 10,
+    "external_files": 7,
+}
+
+# (thành phần, hệ số từ UFP, hệ số từ default_base, các tên thay thế)
+FP_COMPONENTS = (
+    ("external_inputs", 0.3, 1.2, ("input", "external_input")),
+    ("external_outputs", 0.25, 1.0, ("output", "external_output")),
+    ("external_inquiries", 0.2, 0.8, ("inquiry", "query")),
+    ("internal_files", 0.15, 0.6, ("file", "logical_file")),
+    ("external_files", 0.1, 0.4, ("interface", "interface_file")),
+)
+
+FP_LANGUAGE_HOURS = {
+    "c": 8, "c++": 8, "c#": 7, "java": 7, "python": 6, "ruby": 6, "php": 6,
+    "javascript": 6, "typescript": 6.5, "go": 7, "swift": 7, "kotlin": 7,
+    "rust": 8.5, "assembly": 10, "cobol": 9, "fortran": 9, "perl": 6.5,
+    "visual basic": 7,
+}
+FP_MODERN_TECHS = {"react", "angular", "vue", "flutter", "django", "spring", "node.js", "express"}
+FP_COMPLEX_TECHS = {"machine learning", "ai", "blockchain", "microservices"}
+
+
+def _technology_factor(technologies):
+    if not isinstance(technologies, list):
+        return 1.0
+    techs = {str(tech).lower() for tech in technologies}
+    factor = 1.0
+    if techs & FP_MODERN_TECHS:
+        factor *= 0.9
+    if techs & FP_COMPLEX_TECHS:
+        factor *= 1.2
+    return factor
+
+
+def function_points_effort(frame):
+    """effort_pm của FunctionPoints.estimate_effort cho từng hàng"""
+    n = len(frame)
+    ufp_given = _column(frame, "function_points")
+    ufp_given = np.where(_present(ufp_given), ufp_given, _column(frame, "points_non_adjust"))
+    has_ufp = _present(ufp_given)
+
+    num_requirements = _column(frame, "num_requirements", 10.0)
+    default_base = np.clip(np.trunc(num_requirements / 2), 1, 20)
+
+    ufp = np.zeros(n)
+    for name, ufp_share, base_share, alternatives in FP_COMPONENTS:
+        count = _column(frame, name)
+        from_ufp = np.maximum(1, np.trunc(ufp_given * ufp_share))
+        missing = ~_present(count)
+        count = np.where(missing & has_ufp, from_ufp, count)
+        for alt in alternatives:
+            missing = ~_present(count)
+            count = np.where(missing, _column(frame, alt), count)
+        default = np.maximum(1, np.trunc(default_base * base_share))
+        count = np.where(_present(count) & (count >= 1), count, default)
+        ufp = ufp + count * FP_WEIGHTS[name]
+    ufp = np.maximum(20.0, ufp)
+
+    vaf = _column(frame, "complexity_adjustment")
+    complexity = _column(frame, "complexity")
+    text_complexity = _column(frame, "text_complexity")
+    derived = np.where(
+        _present(complexity),
+        0.65 + (complexity - 0.7) * 0.7 / 0.6,
+        np.where(_present(text_complexity), 0.65 + (text_complexity - 1.0) * 0.7 / 2.0, 1.0),
+    )
+    vaf = np.clip(np.where(_present(vaf), vaf, derived), 0.65, 1.35)
+    fp = ufp * vaf
+
+    if "language" in frame.columns:
+        language = frame["language"].fillna("").astype(str).str.lower()
+        hours_per_fp = language.map(FP_LANGUAGE_HOURS).fillna(8).to_numpy(dtype=float)
+    else:
+        hours_per_fp = np.full(n, 8.0)
+    if "technologies" in frame.columns:
+        hours_per_fp = hours_per_fp * frame["technologies"].map(_technology_factor).to_numpy(dtype=float)
+    override = _column(frame, "hours_per_fp")
+    hours_per_fp = np.clip(np.where(_present(override), override, hours_per_fp), 4.0, 12.0)
+
+    effort_pm = fp * hours_per_fp / 160.0
+    return _round(np.maximum(0.5, effort_pm))
+
+
+UCP_ACTOR_WEIGHTS = {"simple_actors": 1, "average_actors": 2, "complex_actors": 3}
+UCP_USE_CASE_WEIGHTS = {"simple_use_cases": 5, "average_use_cases": 10, "complex_use_cases": 15}
+
+
+def use_case_points_effort(frame):
+    """effort_pm của UseCasePoints.estimate_effort cho từng hàng"""
+    uucp = np.zeros(len(frame))
+    for name, weight in {**UCP_ACTOR_WEIGHTS, **UCP_USE_CASE_WEIGHTS}.items():
+        uucp = uucp + _column(frame, name, 0.0) * weight
+    ucp = uucp * _column(frame, "technical_factors", 1.0) * _column(frame, "environmental_factors", 1.0)
+    return ucp * _column(frame, "hours_per_ucp", 20.0) / 160
+
+
+def planning_poker_effort(frame):
+    """
+    effort_pm của PlanningPoker.estimate_effort cho từng hàng
+
+    Hàng không có story_points cho NaN (bản vô hướng ném ValueError)
+    """
+    story_points = _column(frame, "story_points")
+    team_size = _column(frame, "team_size", 5.0)
+    velocity = _column(frame, "velocity", 0.0)
+    velocity = np.where(velocity <= 0, team_size * 8, velocity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sprints_needed = np.where(velocity > 0, story_points / velocity, story_points / 8)
+    time_months = sprints_needed * (_column(frame, "sprint_length", 2.0) / 4.33)
+    effort_pm = time_months * team_size
+    return effort_pm * _column(frame, "task_complexity", 1.0) * _column(frame, "task_uncertainty", 1.0)
+
+
+# model_name -> công thức theo cột
+COLUMNAR_MODELS = {
+    "COCOMO II": cocomo_ii_effort,
+    "Function Points": function_points_effort,
+    "Use Case Points": use_case_points_effort,
+    "Planning Poker": planning_poker_effort,
+}
+
+
+def supports_model(model):
+    """Mô hình có thể đánh giá theo cột (đúng lớp gốc, không dùng mô hình ML)"""
+    try:
+        from .estimation_models import COCOMOII, FunctionPoints, UseCasePoints, PlanningPoker
+    except ImportError:
+        from estimation_models import COCOMOII, FunctionPoints, UseCasePoints, PlanningPoker
+
+    if getattr(model, "use_ml", False):
+        return False
+    return type(model) in (COCOMOII, FunctionPoints, UseCasePoints, PlanningPoker)
+
+
+def formula_params(model):
+    """Tham số công thức của một instance (hằng số A, B của COCOMO II)"""
+    if getattr(model, "model_name", None) == "COCOMO II":
+        return {"A": model.A, "B": model.B}
+    return {}
+
+
+def predict_frame(model_name, frame, **kwargs):
+    """effort_pm dự đoán cho mọi hàng của frame bằng công thức theo cột"""
+    if model_name not in COLUMNAR_MODELS:
+        raise ValueError(f"Không có công thức theo cột cho mô hình {model_name}")
+    with np.errstate(over="ignore", invalid="ignore"):
+        return COLUMNAR_MODELS[model_name](frame, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Chỉ số đánh giá
+# ---------------------------------------------------------------------------
+
+def valid_mask(actual, predicted):
+    """Giống evaluate_model_performance: actual > 0, predicted > 0 và hữu hạn"""
+    actual = np.asarray(actual, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+    return (np.isfinite(actual) & (actual > 0)
+            & np.isfinite(predicted) & (predicted > 0))
+
+
+def compute_metrics(actual, predicted, axis=-1):
+    """
+    MMRE, PRED(25) và RMSE vector hóa
+
+    actual/predicted có thể là ma trận (ví dụ mẫu bootstrap × dự án);
+    chỉ số được tính dọc theo axis.
+    """
+    actual = np.asarray(actual, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+    mre = np.abs(predicted - actual) / actual
+    return {
+        "mmre": np.mean(mre, axis=axis),
+        "pred_25": np.mean(mre <= 0.25, axis=axis),
+        "rmse": np.sqrt(np.mean((actual - predicted) ** 2, axis=axis)),
+    }
+
+
+def kfold_confidence_interval(actual, predicted, k=10, confidence=0.95, seed=42):
+    """
+    Khoảng tin cậy của các chỉ số từ k fold
+
+    Chỉ số được tính trên từng fold; khoảng tin cậy là trung bình ± t * sai số chuẩn.
+    """
+    actual = np.asarray(actual, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+    n = len(actual)
+    k = min(k, n)
+    if k < 2:
+        return None
+
+    order = np.random.default_rng(seed).permutation(n)
+    folds = [compute_metrics(actual[idx], predicted[idx]) for idx in np.array_split(order, k)]
+
+    from scipy import stats
+    t = stats.t.ppf(0.5 + confidence / 2, df=k - 1)
+
+    intervals = {}
+    for metric in METRICS:
+        values = np.array([fold[metric] for fold in folds])
+        mean = values.mean()
+        half_width = t * values.std(ddof=1) / np.sqrt(k)
+        intervals[metric] = (float(mean - half_width), float(mean + half_width))
+    return intervals
+
+
+def bootstrap_confidence_interval(actual, predicted, n_bootstrap=1000, confidence=0.95, seed=42):
+    """
+    Khoảng tin cậy bootstrap (phân vị) của các chỉ số
+
+    Mỗi khối mẫu bootstrap là một ma trận chỉ số n_bootstrap × n, tính trong một lần.
+    """
+    actual = np.asarray(actual, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+    n = len(actual)
+    if n == 0 or n_bootstrap <= 0:
+        return None
+
+    rng = np.random.default_rng(seed)
+    chunk = max(1, BOOTSTRAP_CHUNK_CELLS // n)
+    samples = {metric: [] for metric in METRICS}
+    for start in range(0, n_bootstrap, chunk):
+        idx = rng.integers(0, n, size=(min(chunk, n_bootstrap - start), n))
+        metrics = compute_metrics(actual[idx], predicted[idx], axis=1)
+        for metric in METRICS:
+            samples[metric].append(metrics[metric])
+
+    alpha = (1 - confidence) / 2 * 100
+    return {
+        metric: tuple(float(v) for v in np.percentile(np.concatenate(values), [alpha, 100 - alpha]))
+        for metric, values in samples.items()
+    }
+
+
+def evaluate_frame(model_name, frame, k_folds=0, n_bootstrap=0, confidence=0.95, seed=42,
+                   params=None):
+    """
+    Đánh giá một mô hình trên một DataFrame dự án (cần cột actual_effort)
+
+    Returns:
+        dict cùng dạng với evaluate_model_performance (không có 'results'),
+        thêm 'n_projects' và, nếu yêu cầu, 'kfold_ci' / 'bootstrap_ci'; None nếu không có hàng hợp lệ
+
+    params được chuyển cho công thức (xem formula_params).
+    """
+    frame = projects_to_frame(frame)
+    if frame.empty or "actual_effort" not in frame.columns:
+        return None
+
+    actual = _column(frame, "actual_effort")
+    predicted = predict_frame(model_name, frame, **(params or {}))
+    mask = valid_mask(actual, predicted)
+    if not mask.any():
+        return None
+
+    actual = actual[mask]
+    predicted = predicted[mask]
+    metrics = compute_metrics(actual, predicted)
+    result = {
+        "model": model_name,
+        "n_projects": int(mask.sum()),
+        "actual_efforts": actual.tolist(),
+        "predicted_efforts": predicted.tolist(),
+        **{metric: float(value) for metric, value in metrics.items()},
+    }
+    if k_folds:
+        result["kfold_ci"] = kfold_confidence_interval(actual, predicted, k_folds, confidence, seed)
+    if n_bootstrap:
+        result["bootstrap_ci"] = bootstrap_confidence_interval(actual, predicted, n_bootstrap, confidence, seed)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Lưới mô hình × bộ dữ liệu
+# ---------------------------------------------------------------------------
+
+def load_dataset_frames(directory=None):
+    """
+    Tải mọi bộ dữ liệu .csv/.arff trong thư mục (mặc định datasets/effortEstimation)
+    và tiền xử lý bằng preprocess_cocomo_data / preprocess_fp_data / preprocess_ucp_data
+
+    Returns:
+        dict: "<tên tệp>:<loại>" -> DataFrame dự án
+    """
+    try:
+        from .real_data_integration import (
+            DATASETS_DIR, preprocess_cocomo_data, preprocess_fp_data, preprocess_ucp_data
+        )
+    except ImportError:
+        from real_data_integration import (
+            DATASETS_DIR, preprocess_cocomo_data, preprocess_fp_data, preprocess_ucp_data
+        )
+
+    directory = Path(directory or DATASETS_DIR)
+    preprocessors = {
+        "cocomo": preprocess_cocomo_data,
+        "fp": preprocess_fp_data,
+        "ucp": preprocess_ucp_data,
+    }
+
+    frames = {}
+    for path in sorted(directory.glob("*")):
+        try:
+            if path.suffix == ".csv":
+                raw = pd.read_csv(path)
+            elif path.suffix == ".arff":
+                from scipy.io import arff
+                data, _ = arff.loadarff(path)
+                raw = pd.DataFrame(data)
+            else:
+                continue
+        except Exception as e:
+            print(f"Bỏ qua {path.name}: {e}")
+            continue
+
+        for kind, preprocess in preprocessors.items():
+            try:
+                projects = preprocess(raw.copy())
+            except Exception as e:
+                print(f"Không tiền xử lý được {path.name} ({kind}): {e}")
+                continue
+            if projects:
+                frames[f"{path.name}:{kind}"] = projects_to_frame(projects)
+    return frames
+
+
+def _evaluate_cell(args):
+    model_name, dataset_name, frame, options = args
+    result = evaluate_frame(model_name, frame, **options)
+    if result is None:
+        return None
+    row = {"model": model_name, "dataset": dataset_name, "n_projects": result["n_projects"]}
+    for metric in METRICS:
+        row[metric] = result[metric]
+        for ci in ("kfold_ci", "bootstrap_ci"):
+            if result.get(ci):
+                low, high = result[ci][metric]
+                row[f"{metric}_{ci}_low"] = low
+                row[f"{metric}_{ci}_high"] = high
+    return row
+
+
+def evaluate_grid(datasets, model_names=None, k_folds=10, n_bootstrap=1000,
+                  confidence=0.95, seed=42, max_workers=None):
+    """
+    Đánh giá mọi cặp mô hình × bộ dữ liệu, song song trên nhiều tiến trình
+
+    Args:
+        datasets (dict): tên bộ dữ liệu -> DataFrame hoặc danh sách dict dự án
+        model_names (list, optional): mặc định mọi mô hình trong COLUMNAR_MODELS
+        max_workers (int, optional): số tiến trình; 1 để chạy tuần tự
+
+    Returns:
+        pd.DataFrame: một hàng cho mỗi cặp có ít nhất một dự án hợp lệ
+    """
+    model_names = list(model_names or COLUMNAR_MODELS)
+    options = {"k_folds": k_folds, "n_bootstrap": n_bootstrap, "confidence": confidence, "seed": seed}
+    cells = [
+        (model_name, dataset_name, projects_to_frame(frame), options)
+        for dataset_name, frame in datasets.items()
+        for model_name in model_names
+    ]
+
+    if max_workers is None:
+        max_workers = min(len(cells), os.cpu_count() or 1)
+    if max_workers <= 1 or len(cells) <= 1:
+        rows = [_evaluate_cell(cell) for cell in cells]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(_evaluate_cell, cells))
+
+    return pd.DataFrame([row for row in rows if row is not None])
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    frames = load_dataset_frames()
+    grid = evaluate_grid(frames)
+    elapsed = time.perf_counter() - start
+
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        print(grid[["model", "dataset", "n_projects", *METRICS]] if not grid.empty else grid)
+    print(f"\nĐã đánh giá {len(grid)} cặp mô hình × bộ dữ liệu trong {elapsed:.2f}s")
@@ -15,11 +15,13 @@ try:
     from .estimation_models import COCOMOII, FunctionPoints, UseCasePoints, PlanningPoker
     from .multi_model_integration import MultiModelIntegration
     from .agile_cocomo import AgileCOCOMO
+    from .columnar_evaluation import evaluate_frame, formula_params, projects_to_frame, supports_model
 except ImportError:
     # Khi chạy trực tiếp
     from estimation_models import COCOMOII, FunctionPoints, UseCasePoints, PlanningPoker
     from multi_model_integration import MultiModelIntegration
     from agile_cocomo import AgileCOCOMO
+    from columnar_evaluation import evaluate_frame, formula_params, projects_to_frame, supports_model
 
 # Đường dẫn tới các bộ dữ liệu
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -450,6 +452,10 @@ def evaluate_model_performance(model, dataset, model_name):
         print(f"Không có dữ liệu cho mô hình {model_name}")
         return None
     
+    # Mô hình công thức: tính cả cột một lần thay vì gọi estimate_effort từng dự án
+    if supports_model(model):
+        return _evaluate_columnar(model, dataset, model_name)
+    
     results = []
     actual_efforts = []
     predicted_efforts = []
@@ -523,18 +529,34 @@ def evaluate_model_performance(model, dataset, model_name):
         'pred_25': pred_25,
         'rmse': rmse
     }
-    pred_25 = sum(1 for mre in mre_values if mre <= 0.25) / len(mre_values)
-    rmse = np.sqrt(np.mean([(result['actual_effort'] - result['predicted_effort'])**2 for result in results]))
+
+def _evaluate_columnar(model, dataset, model_name):
+    """Nhánh vector hóa của evaluate_model_performance (xem columnar_evaluation)"""
+    evaluation = evaluate_frame(model.model_name, projects_to_frame(dataset), params=formula_params(model))
+    if evaluation is None:
+        print(f"Không có kết quả đánh giá cho mô hình {model_name}")
+        return None
+    
+    print(f"Đã đánh giá thành công {evaluation['n_projects']} dự án với mô hình {model_name}")
+    
+    results = [
+        {
+            'actual_effort': actual,
+            'predicted_effort': predicted,
+            'error': abs(predicted - actual),
+            'mre': abs(predicted - actual) / actual
+        }
+        for actual, predicted in zip(evaluation['actual_efforts'], evaluation['predicted_efforts'])
+    ]
     
-    # Trả về kết quả
     return {
         'model': model_name,
-        'actual_efforts': actual_efforts,
-        'predicted_efforts': predicted_efforts,
+        'actual_efforts': evaluation['actual_efforts'],
+        'predicted_efforts': evaluation['predicted_efforts'],
         'results': results,
-        'mmre': mmre,
-        'pred_25': pred_25,
-        'rmse': rmse
+        'mmre': evaluation['mmre'],
+        'pred_25': evaluation['pred_25'],
+        'rmse': evaluation['rmse']
     }
 
 def visualize_model_performance(evaluation_results, title="Hiệu suất mô hình trên dữ liệu thực tế"):
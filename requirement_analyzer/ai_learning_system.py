@@ -12,8 +12,11 @@ Features:
 import json
 import hashlib
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import statistics
 from dataclasses import dataclass, asdict
@@ -21,6 +24,20 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# SQLite limit on bound parameters (999 before 3.32); larger batches are split
+_MAX_IN_PARAMS = 900
+
+# Per-test aggregate of learning_signals, exactly what ranking needs
+_REFRESH_STATS = '''
+    INSERT OR REPLACE INTO test_signal_stats
+    (test_case_id, signal_count, confidence_sum, weighted_quality_sum, positive_count)
+    SELECT test_case_id, COUNT(*), SUM(confidence), SUM(quality_signal * confidence),
+           SUM(quality_signal > 0)
+    FROM learning_signals
+    WHERE test_case_id IN ({placeholders})
+    GROUP BY test_case_id
+'''
+
 
 @dataclass
 class LearningSignal:
@@ -63,11 +80,23 @@ class TestCaseRanking:
 
 
 class AILearningSystem:
-    """Core AI learning system - converts feedback to learning signals"""
+    """
+    Core AI learning system - converts feedback to learning signals
+
+    Ranking reads per-test aggregates (test_signal_stats, kept up to date by
+    store_learning_signal) with one IN (...) query per batch, through an
+    in-memory LRU. The LRU is per process: with several workers writing the
+    same DB, another worker's new feedback shows up after `cache_ttl` seconds
+    (cache_size=0 disables it).
+    """
     
-    def __init__(self, db_path: str = 'data/learning.db'):
+    def __init__(self, db_path: str = 'data/learning.db', cache_size: int = 4096, cache_ttl: float = 30.0):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._stats_cache: "OrderedDict[str, Tuple[Optional[Tuple], float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._init_db()
         logger.info(f"✓ AI Learning System initialized ({db_path})")
     
@@ -92,6 +121,38 @@ class AILearningSystem:
             )
         ''')
         
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_learning_signals_test_case ON learning_signals(test_case_id)'
+        )
+        
+        conn.commit()
+        
+        # Ranking index: per-test aggregates (backfilled once from existing signals).
+        # Check, create and backfill in one write transaction, so workers opening
+        # the same DB at once do not both backfill
+        conn.execute('BEGIN IMMEDIATE')
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'test_signal_stats'"
+        ).fetchone()
+        if not has_stats:
+            conn.execute('''
+                CREATE TABLE test_signal_stats (
+                    test_case_id TEXT PRIMARY KEY,
+                    signal_count INTEGER,
+                    confidence_sum REAL,
+                    weighted_quality_sum REAL,
+                    positive_count INTEGER
+                )
+            ''')
+            conn.execute('''
+                INSERT INTO test_signal_stats
+                SELECT test_case_id, COUNT(*), SUM(confidence), SUM(quality_signal * confidence),
+                       SUM(quality_signal > 0)
+                FROM learning_signals
+                GROUP BY test_case_id
+            ''')
+        conn.commit()
+        
         # Test case rankings table
         conn.execute('''
             CREATE TABLE IF NOT EXISTS test_rankings (
@@ -283,6 +344,14 @@ class AILearningSystem:
         conn = sqlite3.connect(str(self.db_path))
         
         try:
+            # A replaced feedback_id may move to another test: refresh both aggregates
+            affected = {signal.test_case_id}
+            row = conn.execute(
+                'SELECT test_case_id FROM learning_signals WHERE feedback_id = ?', (signal.feedback_id,)
+            ).fetchone()
+            if row:
+                affected.add(row[0])
+            
             conn.execute('''
                 INSERT OR REPLACE INTO learning_signals
                 (feedback_id, test_case_id, test_title, test_type, 
@@ -302,11 +371,72 @@ class AILearningSystem:
                 signal.confidence
             ))
             
+            self._refresh_stats(conn, affected)
             conn.commit()
             logger.info(f"✓ Learning signal stored: {signal.feedback_id}")
             
         finally:
             conn.close()
+        self._invalidate_stats(affected)
+    
+    def _refresh_stats(self, conn: sqlite3.Connection, test_ids):
+        """Recompute test_signal_stats rows for test_ids from their signals (indexed)"""
+        test_ids = list(test_ids)
+        placeholders = ','.join('?' * len(test_ids))
+        conn.execute(f'DELETE FROM test_signal_stats WHERE test_case_id IN ({placeholders})', test_ids)
+        conn.execute(_REFRESH_STATS.format(placeholders=placeholders), test_ids)
+    
+    def _invalidate_stats(self, test_ids):
+        with self._cache_lock:
+            for test_id in test_ids:
+                self._stats_cache.pop(test_id, None)
+    
+    def _fetch_signal_stats(self, test_ids: List[str]) -> Dict[str, Optional[Tuple]]:
+        """
+        Aggregates for a batch of test ids: {test_id: (count, confidence_sum,
+        weighted_quality_sum, positive_count) or None if no feedback}
+
+        Cached ids are served from the LRU; the rest cost one query per
+        _MAX_IN_PARAMS ids.
+        """
+        stats: Dict[str, Optional[Tuple]] = {}
+        now = time.monotonic()
+        if self.cache_size > 0:
+            with self._cache_lock:
+                for test_id in test_ids:
+                    entry = self._stats_cache.get(test_id)
+                    if entry is not None and now - entry[1] <= self.cache_ttl:
+                        stats[test_id] = entry[0]
+                        self._stats_cache.move_to_end(test_id)
+        
+        missing = [t for t in dict.fromkeys(test_ids) if t not in stats]
+        if not missing:
+            return stats
+        
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            for start in range(0, len(missing), _MAX_IN_PARAMS):
+                batch = missing[start:start + _MAX_IN_PARAMS]
+                cursor = conn.execute(f'''
+                    SELECT test_case_id, signal_count, confidence_sum, weighted_quality_sum, positive_count
+                    FROM test_signal_stats
+                    WHERE test_case_id IN ({','.join('?' * len(batch))})
+                ''', batch)
+                for row in cursor:
+                    stats[row[0]] = row[1:]
+        finally:
+            conn.close()
+        
+        fetched = {t: stats.get(t) for t in missing}
+        stats.update(fetched)
+        if self.cache_size > 0:
+            with self._cache_lock:
+                for test_id, value in fetched.items():
+                    self._stats_cache[test_id] = (value, now)
+                    self._stats_cache.move_to_end(test_id)
+                while len(self._stats_cache) > self.cache_size:
+                    self._stats_cache.popitem(last=False)
+        return stats
     
     def rank_test_cases(self, test_cases: List[Dict[str, Any]]) -> List[TestCaseRanking]:
         """
@@ -315,28 +445,19 @@ class AILearningSystem:
         Returns:
             Ranked list (best first)
         """
-        conn = sqlite3.connect(str(self.db_path))
+        # One batched lookup for all tests instead of a query per test
+        all_stats = self._fetch_signal_stats([tc.get('id', 'unknown') for tc in test_cases])
         
         rankings = []
         for test_case in test_cases:
             test_id = test_case.get('id', 'unknown')
-            
-            # Get feedback signals for this test
-            cursor = conn.execute('''
-                SELECT quality_signal, clarity_signal, coverage_signal, confidence
-                FROM learning_signals
-                WHERE test_case_id = ?
-            ''', (test_id,))
-            
-            signals = cursor.fetchall()
+            stats = all_stats.get(test_id)
             
             # Calculate learned quality
-            if signals:
+            if stats:
                 # Weighted average of signals
-                total_weight = sum(s[3] for s in signals)  # confidence sum
-                weighted_sum = sum(s[0] * s[3] for s in signals)  # quality * confidence
-                feedback_count = len(signals)
-                positive_ratio = sum(1 for s in signals if s[0] > 0) / feedback_count if feedback_count > 0 else 0.5
+                feedback_count, total_weight, weighted_sum, positive_count = stats
+                positive_ratio = positive_count / feedback_count if feedback_count > 0 else 0.5
                 
                 learned_quality = weighted_sum / total_weight if total_weight > 0 else 0.5
             else:
@@ -370,8 +491,6 @@ class AILearningSystem:
             
             rankings.append(ranking)
         
-        conn.close()
-        
         # Sort by ranking score (best first)
         rankings.sort(key=lambda x: x.ranking_score, reverse=True)
         
@@ -2,55 +2,33 @@
 Module phân tích tài liệu requirements để trích xuất các đặc tả kỹ thuật
 """
 
+import copy
 import re
-import nltk
-import numpy as np
-import pandas as pd
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
-import spacy
-import joblib
-import os
+import threading
+from collections import OrderedDict
 
-# Download NLTK resources if needed
-def ensure_nltk_data(resource_name, download_name=None):
-    """Safely download NLTK data if not available"""
-    if download_name is None:
-        download_name = resource_name.split('/')[-1]
-    try:
-        nltk.data.find(resource_name)
-    except (LookupError, OSError):
-        nltk.download(download_name, quiet=True)
+try:
+    from .nlp_resources import (
+        ensure_nltk_resources, get_spacy, sent_tokenize, word_tokenize,
+    )
+except ImportError:
+    from nlp_resources import (
+        ensure_nltk_resources, get_spacy, sent_tokenize, word_tokenize,
+    )
 
-ensure_nltk_data('tokenizers/punkt', 'punkt')
-ensure_nltk_data('tokenizers/punkt_tab', 'punkt_tab')
-ensure_nltk_data('corpora/stopwords', 'stopwords')
-ensure_nltk_data('corpora/wordnet', 'wordnet')
+# Dữ liệu NLTK và model spaCy được nạp ở lần dùng đầu tiên (không tải gì lúc
+# import); nlp_resources.warm_up() nạp trước khi worker khởi động.
 
-# Load spaCy model for NER - with fallback
-nlp = None
-try:
-    nlp = spacy.load("en_core_web_sm")
-    print("Loaded spaCy model: en_core_web_sm")
-except OSError:
-    try:
-        # Try to download and load
-        os.system("python -m spacy download en_core_web_sm")
-        nlp = spacy.load("en_core_web_sm")
-        print("Downloaded and loaded spaCy model: en_core_web_sm")
-    except:
-        # If all fails, create a basic tokenizer
-        try:
-            nlp = spacy.blank("en")
-            print("Using blank English spaCy model (no NER)")
-        except:
-            nlp = None
-            print("Warning: spaCy not available, using basic text processing")
+
+def __getattr__(name):
+    # Giữ tương thích với mã cũ dùng biến module ``analyzer.nlp``
+    if name == "nlp":
+        return get_spacy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def safe_nlp_process(text):
     """Safely process text with spaCy or return a mock object"""
+    nlp = get_spacy()
     if nlp is not None:
         try:
             return nlp(text)
@@ -75,6 +53,98 @@ def safe_nlp_process(text):
     
     return MockDoc(text)
 
+class AnalysisContext:
+    """
+    Kết quả xử lý NLP của một tài liệu, dùng chung cho mọi bộ trích xuất
+    
+    Holds the spaCy Doc, tokens, sentences and lemmatized text of one document
+    so the extractors of RequirementAnalyzer share a single parse instead of
+    each calling safe_nlp_process on the full text. Every field is computed on
+    first use and then reused; errors propagate exactly as with a direct parse.
+    """
+    
+    def __init__(self, text, analyzer=None):
+        self.text = text
+        self.text_lower = text.lower()
+        self._analyzer = analyzer
+        self._doc = None
+        self._tokens = None
+        self._sentences = None
+        self._lemmatized_text = None
+        self._fragments = {}
+        self.results = {}  # Kết quả trung gian theo tên bộ trích xuất
+    
+    @property
+    def doc(self):
+        """spaCy Doc (hoặc MockDoc) của toàn bộ tài liệu"""
+        if self._doc is None:
+            self._doc = safe_nlp_process(self.text)
+        return self._doc
+    
+    @property
+    def tokens(self):
+        if self._tokens is None:
+            self._tokens = list(self.doc)
+        return self._tokens
+    
+    @property
+    def sentences(self):
+        if self._sentences is None:
+            self._sentences = list(self.doc.sents)
+        return self._sentences
+    
+    @property
+    def lemmatized_text(self):
+        if self._lemmatized_text is None:
+            analyzer = self._analyzer or RequirementAnalyzer()
+            self._lemmatized_text = analyzer.preprocess_text(self.text)
+        return self._lemmatized_text
+    
+    def parse_fragment(self, fragment):
+        """Parse một câu/yêu cầu con, mỗi đoạn chỉ parse một lần"""
+        doc = self._fragments.get(fragment)
+        if doc is None:
+            doc = safe_nlp_process(fragment)
+            self._fragments[fragment] = doc
+        return doc
+
+class _FeaturesCache:
+    """
+    LRU có giới hạn cho các đặc trưng đã tính, an toàn khi dùng từ nhiều thread
+
+    Một RequirementAnalyzer được dùng chung cho mọi request, nên cache phải
+    có giới hạn và được khóa; get() trả về bản sao để request này không sửa
+    được kết quả mà request khác nhận.
+    """
+    
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+    
+    def put(self, key, value):
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
+
 class RequirementAnalyzer:
     """
     Phân tích tài liệu requirements để trích xuất các thông tin cần thiết
@@ -82,16 +152,21 @@ class RequirementAnalyzer:
     """
     
     def __init__(self):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+        ensure_nltk_resources()
         self.lemmatizer = WordNetLemmatizer()
         self.stop_words = set(stopwords.words('english'))
         self.vectorizer = TfidfVectorizer(max_features=1000)
         
         # Add recursion depth tracking to prevent infinite loops
-        self._recursion_depth = 0
+        # (per thread: concurrent requests must not share one counter)
+        self._local = threading.local()
         self._max_recursion_depth = 3
         
         # Cache for already computed features to avoid recursion
-        self._features_cache = {}
+        self._features_cache = _FeaturesCache()
         
         # Mở rộng từ điển các từ khóa cho các loại yêu cầu khác nhau
         self.requirement_keywords = {
@@ -269,13 +344,34 @@ class RequirementAnalyzer:
             ]
         }
     
+    @property
+    def _recursion_depth(self):
+        """Độ sâu gọi lồng nhau của thread hiện tại"""
+        return getattr(self._local, 'depth', 0)
+    
+    @_recursion_depth.setter
+    def _recursion_depth(self, value):
+        self._local.depth = value
+    
+    def create_context(self, text):
+        """Tạo AnalysisContext cho một tài liệu để truyền vào các bộ trích xuất"""
+        return AnalysisContext(text, self)
+    
+    def _get_context(self, text, ctx):
+        """Dùng lại ctx nếu nó thuộc về cùng văn bản, ngược lại tạo mới"""
+        if ctx is not None and (ctx.text is text or ctx.text == text):
+            return ctx
+        return AnalysisContext(text, self)
+    
     def _safe_execute_with_recursion_check(self, func, text, default_value, cache_key=None):
         """
         Safely execute a function with recursion depth tracking and caching.
         """
         # Check cache first
-        if cache_key and cache_key in self._features_cache:
-            return self._features_cache[cache_key]
+        if cache_key:
+            cached = self._features_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
         # Check recursion depth
         if self._recursion_depth >= self._max_recursion_depth:
@@ -288,7 +384,7 @@ class RequirementAnalyzer:
             
             # Cache result
             if cache_key:
-                self._features_cache[cache_key] = result
+                self._features_cache.put(cache_key, result)
                 
             return result
         except Exception as e:
@@ -316,12 +412,16 @@ class RequirementAnalyzer:
         
         return ' '.join(words)
     
-    def extract_requirements(self, text):
+    def extract_requirements(self, text, ctx=None):
         """
         Trích xuất các yêu cầu từ văn bản, với hỗ trợ tốt cho tài liệu Markdown
         """
         import re
         
+        ctx = self._get_context(text, ctx)
+        if 'requirements' in ctx.results:
+            return [dict(req) for req in ctx.results['requirements']]
+        
         # Bước 1: Làm sạch text - loại bỏ markdown headers, lists, links
         cleaned_text = self._clean_markdown_text(text)
         
@@ -370,7 +470,7 @@ class RequirementAnalyzer:
             sentence_lower = sentence.lower()
             
             has_requirement_keyword = any(keyword in sentence_lower for keyword in all_keywords)
-            has_verb_noun = self._contains_verb_noun_pair(sentence)
+            has_verb_noun = self._contains_verb_noun_pair(sentence, ctx)
             
             if has_requirement_keyword or (has_verb_noun and len(sentence.split()) > 5):
                 # Phân tích đầy đủ requirement
@@ -382,7 +482,7 @@ class RequirementAnalyzer:
                 requirements.append({
                     'id': f'REQ-{req_id}',
                     'text': sentence,
-                    'type': self._classify_requirement(sentence),
+                    'type': self._classify_requirement(sentence, ctx),
                     'priority': priority,
                     'business_impact': business_impact,
                     'technical_complexity': technical_complexity,
@@ -396,6 +496,7 @@ class RequirementAnalyzer:
             x.get('score', 0)
         ), reverse=True)
         
+        ctx.results['requirements'] = [dict(req) for req in requirements]
         return requirements
     
     def _clean_markdown_text(self, text):
@@ -436,9 +537,9 @@ class RequirementAnalyzer:
         
         return text.strip()
     
-    def _contains_verb_noun_pair(self, sentence):
+    def _contains_verb_noun_pair(self, sentence, ctx=None):
         """Kiểm tra xem câu có chứa cặp động từ-danh từ không"""
-        doc = safe_nlp_process(sentence)
+        doc = ctx.parse_fragment(sentence) if ctx is not None else safe_nlp_process(sentence)
         has_verb = False
         has_noun = False
         
@@ -549,7 +650,7 @@ class RequirementAnalyzer:
         
         return round(total_score, 2)
 
-    def _classify_requirement(self, requirement):
+    def _classify_requirement(self, requirement, ctx=None):
         """
         Phân loại yêu cầu thành các loại khác nhau
         """
@@ -566,7 +667,7 @@ class RequirementAnalyzer:
                 best_type = req_type
         
         # Thêm phân tích ngữ nghĩa
-        doc = safe_nlp_process(requirement)
+        doc = ctx.parse_fragment(requirement) if ctx is not None else safe_nlp_process(requirement)
         
         # Phát hiện yêu cầu bảo mật
         security_terms = ['secure', 'security', 'protect', 'safe', 'encrypt', 'authorization', 'authentication',
@@ -749,14 +850,15 @@ class RequirementAnalyzer:
         
         return params
     
-    def extract_features(self, text):
+    def extract_features(self, text, ctx=None):
         """
         Trích xuất các đặc trưng từ văn bản để sử dụng cho mô hình ước lượng
         """
         # Use caching to prevent recursion
         cache_key = f"extract_features_{hash(text)}"
-        if cache_key in self._features_cache:
-            return self._features_cache[cache_key]
+        cached = self._features_cache.get(cache_key)
+        if cached is not None:
+            return cached
             
         # Check recursion depth
         if self._recursion_depth >= self._max_recursion_depth:
@@ -777,8 +879,9 @@ class RequirementAnalyzer:
         try:
             self._recursion_depth += 1
             
-            preprocessed_text = self.preprocess_text(text)
-            doc = safe_nlp_process(text)
+            ctx = self._get_context(text, ctx)
+            preprocessed_text = ctx.lemmatized_text
+            doc = ctx.doc
             
             # Simple requirement counting without calling extract_requirements to avoid recursion
             functional_keywords = ['shall', 'must', 'will', 'should', 'function', 'feature']
@@ -911,7 +1014,7 @@ class RequirementAnalyzer:
             }
             
             # Cache the result
-            self._features_cache[cache_key] = features
+            self._features_cache.put(cache_key, features)
             return features
             
         except Exception as e:
@@ -933,14 +1036,15 @@ class RequirementAnalyzer:
         
         return features
     
-    def extract_cocomo_parameters(self, text):
+    def extract_cocomo_parameters(self, text, ctx=None):
         """
         Trích xuất các tham số cho mô hình COCOMO II
         """
         # Use safe execution to avoid recursion
         cache_key = f"cocomo_params_{hash(text)}"
-        if cache_key in self._features_cache:
-            return self._features_cache[cache_key]
+        cached = self._features_cache.get(cache_key)
+        if cached is not None:
+            return cached
             
         if self._recursion_depth >= self._max_recursion_depth:
             print("Maximum recursion depth reached in extract_cocomo_parameters")
@@ -1000,7 +1104,7 @@ class RequirementAnalyzer:
             cocomo_params['process_maturity'] = 1.0
             
             # Cache the result
-            self._features_cache[cache_key] = cocomo_params
+            self._features_cache.put(cache_key, cocomo_params)
             return cocomo_params
             
         except Exception as e:
@@ -1009,13 +1113,14 @@ class RequirementAnalyzer:
         finally:
             self._recursion_depth -= 1
     
-    def extract_function_points_parameters(self, text):
+    def extract_function_points_parameters(self, text, ctx=None):
         """
         Trích xuất các tham số cho mô hình Function Points
         """
         cache_key = f"fp_params_{hash(text)}"
-        if cache_key in self._features_cache:
-            return self._features_cache[cache_key]
+        cached = self._features_cache.get(cache_key)
+        if cached is not None:
+            return cached
             
         if self._recursion_depth >= self._max_recursion_depth:
             print("Maximum recursion depth reached in extract_function_points_parameters")
@@ -1028,7 +1133,7 @@ class RequirementAnalyzer:
         try:
             self._recursion_depth += 1
             
-            doc = safe_nlp_process(text)
+            doc = self._get_context(text, ctx).doc
             
             # Simple requirement counting
             functional_keywords = ['input', 'output', 'form', 'report', 'query', 'search']
@@ -1097,14 +1202,15 @@ class RequirementAnalyzer:
         finally:
             self._recursion_depth -= 1
     
-    def extract_use_case_points_parameters(self, text):
+    def extract_use_case_points_parameters(self, text, ctx=None):
         """
         Trích xuất các tham số cho mô hình Use Case Points
         """
-        features = self.extract_features(text)
+        ctx = self._get_context(text, ctx)
+        features = self.extract_features(text, ctx)
         
         # Đếm số actor được đề cập
-        doc = safe_nlp_process(text)
+        doc = ctx.doc
         actors = []
         for ent in doc.ents:
             if ent.label_ == 'PERSON' or ent.label_ == 'ORG':
@@ -1164,7 +1270,7 @@ class RequirementAnalyzer:
         
         return ucp_params
 
-    def extract_loc_parameters(self, text):
+    def extract_loc_parameters(self, text, ctx=None):
         """
         Trích xuất tham số cho mô hình Lines of Code (LOC)
         
@@ -1180,7 +1286,7 @@ class RequirementAnalyzer:
         # Nếu không tìm thấy số LOC trực tiếp, ước tính từ các thông tin khác
         if loc is None:
             # Đếm số lượng yêu cầu chức năng và phi chức năng
-            features = self.extract_features(text)
+            features = self.extract_features(text, ctx)
             functional_reqs = features.get('functional_reqs', 0)
             non_functional_reqs = features.get('non_functional_reqs', 0)
             
@@ -1214,7 +1320,7 @@ class RequirementAnalyzer:
             default=3)
         
         # Trích xuất độ phức tạp
-        features = self.extract_features(text)
+        features = self.extract_features(text, ctx)
         complexity = features.get('complexity', 1.0)
         
         # Trích xuất mức độ kinh nghiệm của đội
@@ -1268,7 +1374,7 @@ class RequirementAnalyzer:
             'tech_score': tech_score  # Điểm công nghệ
         }
     
-    def extract_machine_learning_features(self, text):
+    def extract_machine_learning_features(self, text, ctx=None):
         """
         Trích xuất các đặc trưng cho mô hình máy học từ văn bản yêu cầu
         
@@ -1281,8 +1387,9 @@ class RequirementAnalyzer:
         features = {}
         
         # Phân tích văn bản
-        doc = safe_nlp_process(text)
-        sentences = list(doc.sents)
+        ctx = self._get_context(text, ctx)
+        doc = ctx.doc
+        sentences = ctx.sentences
         
         # Trích xuất thông tin số lượng nhà phát triển
         developers = self._extract_numeric_feature(text, 
@@ -1331,7 +1438,7 @@ class RequirementAnalyzer:
         features['manager_exp'] = manager_exp
         
         # Ước lượng kích thước dự án từ văn bản
-        size = self._extract_project_size(text)
+        size = self._extract_project_size(text, ctx)
         features['size'] = size
         
         # Tính toán các tham số bổ sung
@@ -1359,7 +1466,7 @@ class RequirementAnalyzer:
         features['kloc_per_month'] = size / max(time_months, 1)
         
         # Ước lượng điểm chức năng (Function Points)
-        fp_params = self.extract_function_points_parameters(text)
+        fp_params = self.extract_function_points_parameters(text, ctx)
         
         # Tính tổng điểm chức năng chưa điều chỉnh
         unadjusted_fp = (
@@ -1374,11 +1481,11 @@ class RequirementAnalyzer:
         features['adjustment'] = fp_params['complexity_multiplier']
         
         # Ước lượng số lượng giao dịch từ văn bản
-        transactions = self._count_transactions(text)
+        transactions = self._count_transactions(text, ctx)
         features['transactions'] = transactions
         
         # Ước lượng số lượng thực thể dữ liệu
-        entities = self._count_entities(text)
+        entities = self._count_entities(text, ctx)
         features['entities'] = entities
         
         # Tính toán tỷ lệ FP/month và FP/dev
@@ -1425,7 +1532,7 @@ class RequirementAnalyzer:
                 return matches[0]
         return default
     
-    def _extract_project_size(self, text):
+    def _extract_project_size(self, text, ctx=None):
         """Ước lượng kích thước dự án (KLOC) từ văn bản"""
         # In ra để debug
         print(f"Extracting project size from: {text}")
@@ -1492,12 +1599,13 @@ class RequirementAnalyzer:
                             pass
         
         # Phân tích sự phức tạp của yêu cầu để ước tính kích thước
-        complexity_score = self._assess_text_complexity(text)
+        ctx = self._get_context(text, ctx)
+        complexity_score = self._assess_text_complexity(text, ctx)
         
         # Đếm số yêu cầu và số thực thể nghiệp vụ
-        requirements = self.extract_requirements(text)
+        requirements = self.extract_requirements(text, ctx)
         num_requirements = len(requirements)
-        entities = self._count_entities(text)
+        entities = self._count_entities(text, ctx)
         
         # Đếm số tính năng và mô-đun được đề cập
         feature_count = 0
@@ -1572,7 +1680,7 @@ class RequirementAnalyzer:
         print(f"Final estimated size: {size} KLOC")
         return size
     
-    def _assess_text_complexity(self, text):
+    def _assess_text_complexity(self, text, ctx=None):
         """Đánh giá độ phức tạp của văn bản yêu cầu"""
         # Đếm số từ kỹ thuật
         technical_terms = [
@@ -1596,13 +1704,13 @@ class RequirementAnalyzer:
         tech_count = len(tech_terms_found)
         
         # Đếm số câu phức tạp
-        doc = safe_nlp_process(text)
+        ctx = self._get_context(text, ctx)
         
         # Câu phức tạp: câu dài hoặc có nhiều mệnh đề
         complex_sentences = 0
         total_sentences = 0
         
-        for sent in doc.sents:
+        for sent in ctx.sentences:
             total_sentences += 1
             
             # Câu dài (>20 từ)
@@ -1642,7 +1750,7 @@ class RequirementAnalyzer:
         complexity = 1.0 + tech_score + sentence_score + complex_tech_score
         return min(3.0, complexity)  # Giới hạn tối đa là 3.0
     
-    def _count_transactions(self, text):
+    def _count_transactions(self, text, ctx=None):
         """Ước lượng số lượng giao dịch từ văn bản"""
         # Tìm kiếm các hành động CRUD trong văn bản
         crud_terms = [
@@ -1654,10 +1762,10 @@ class RequirementAnalyzer:
         ]
         
         # Đếm các động từ hành động
-        doc = safe_nlp_process(text)
+        ctx = self._get_context(text, ctx)
         action_verbs = set()
         
-        for token in doc:
+        for token in ctx.tokens:
             if token.pos_ == "VERB" and token.lemma_.lower() in crud_terms:
                 action_verbs.add(token.lemma_.lower())
         
@@ -1668,7 +1776,7 @@ class RequirementAnalyzer:
         api_count = sum(1 for term in api_terms if term in text.lower())
         
         # Đếm số thực thể nghiệp vụ
-        business_entities = self._count_entities(text)
+        business_entities = self._count_entities(text, ctx)
         
         # Đếm số tính năng người dùng
         user_features = sum(1 for term in ['user can', 'allow user', 'enable user', 'user should', 'user will'] 
@@ -1677,20 +1785,29 @@ class RequirementAnalyzer:
         # Kết hợp các yếu tố, với mức tối thiểu là 5
         return max(5, crud_count + (api_count / 2) + business_entities + user_features)
     
-    def _count_entities(self, text):
+    def _count_entities(self, text, ctx=None):
         """Ước lượng số lượng thực thể dữ liệu từ văn bản"""
+        ctx = self._get_context(text, ctx)
+        if 'entity_count' in ctx.results:
+            return ctx.results['entity_count']
+        
         # Sử dụng spaCy để trích xuất thực thể có tên
-        doc = safe_nlp_process(text)
+        doc = ctx.doc
         named_entities = set([ent.text.lower() for ent in doc.ents])
         
         # Tìm các thực thể dữ liệu tiềm năng từ các danh từ
         potential_entities = set()
-        for token in doc:
+        data_sentences = None  # Câu có nhắc tới dữ liệu, chỉ tính khi cần
+        for token in ctx.tokens:
             if token.pos_ == "NOUN" and len(token.text) > 3 and token.text.lower() not in self.stop_words:
+                if data_sentences is None:
+                    data_sentences = [
+                        sent.text.lower() for sent in ctx.sentences
+                        if any(data_term in sent.text.lower() for data_term in
+                               ['store', 'save', 'database', 'record', 'data', 'entity', 'object', 'class'])
+                    ]
                 # Kiểm tra xem danh từ này có phải là một thực thể dữ liệu không
-                if any(token.text.lower() in sent.text.lower() for sent in doc.sents 
-                      if any(data_term in sent.text.lower() for data_term in 
-                           ['store', 'save', 'database', 'record', 'data', 'entity', 'object', 'class'])):
+                if any(token.text.lower() in sent_text for sent_text in data_sentences):
                     potential_entities.add(token.text.lower())
         
         # Tìm các từ liên quan đến thực thể dữ liệu
@@ -1704,7 +1821,7 @@ class RequirementAnalyzer:
         for term in data_terms:
             if term in text.lower():
                 # Tìm các danh từ gần với từ dữ liệu này
-                for sent in doc.sents:
+                for sent in ctx.sentences:
                     if term in sent.text.lower():
                         for token in sent:
                             if token.pos_ == "NOUN" and token.text.lower() != term and len(token.text) > 3:
@@ -1718,7 +1835,8 @@ class RequirementAnalyzer:
         filtered_entities = set([e for e in all_entities if e not in common_words])
         
         # Kết hợp số thực thể, với mức tối thiểu là 3
-        return max(3, len(filtered_entities))
+        ctx.results['entity_count'] = max(3, len(filtered_entities))
+        return ctx.results['entity_count']
         
     def extract_parameters(self, text):
         """
@@ -1731,10 +1849,10 @@ class RequirementAnalyzer:
             dict: Các tham số đã trích xuất cho việc ước lượng
         """
         # Phân tích toàn bộ tài liệu yêu cầu
-        params = self.analyze_requirements_document(text)
+        ctx = self.create_context(text)
+        params = self.analyze_requirements_document(text, ctx)
         
         # Trích xuất thêm thông tin về mức độ phức tạp
-        doc = safe_nlp_process(text)
         complexity_words = ['complex', 'complicated', 'difficult', 'advanced', 'sophisticated',
                           'phức tạp', 'khó', 'cao cấp', 'tiên tiến', 'phức hợp']
                           
@@ -1768,15 +1886,18 @@ class RequirementAnalyzer:
         
         # Trích xuất các tham số LOC nếu chưa có
         if 'loc_linear' not in params or 'loc_random_forest' not in params:
-            loc_params = self.extract_loc_parameters(text)
+            loc_params = self.extract_loc_parameters(text, ctx)
             params['loc_linear'] = loc_params
             params['loc_random_forest'] = loc_params
             
         return params
     
-    def analyze_requirements_document(self, text):
+    def analyze_requirements_document(self, text, ctx=None):
         """
         Phân tích toàn bộ tài liệu yêu cầu và trích xuất tất cả thông tin cần thiết
+        
+        Tài liệu chỉ được parse một lần: một AnalysisContext được tạo (hoặc
+        nhận từ ctx) và truyền cho mọi bộ trích xuất.
         """
         try:
             # Đảm bảo văn bản hợp lệ
@@ -1789,15 +1910,17 @@ class RequirementAnalyzer:
             if len(text.strip()) < 10:
                 text = text + "\nDefault software project with standard requirements."
             
+            ctx = self._get_context(text, ctx)
+            
             # Trích xuất các tham số cho từng mô hình
             try:
-                cocomo_params = self.extract_cocomo_parameters(text)
+                cocomo_params = self.extract_cocomo_parameters(text, ctx)
             except Exception as e:
                 print(f"Error extracting COCOMO parameters: {e}")
                 cocomo_params = {'size': 5.0, 'eaf': 1.0}
             
             try:
-                fp_params = self.extract_function_points_parameters(text)
+                fp_params = self.extract_function_points_parameters(text, ctx)
             except Exception as e:
                 print(f"Error extracting Function Points parameters: {e}")
                 fp_params = {
@@ -1807,7 +1930,7 @@ class RequirementAnalyzer:
                 }
             
             try:
-                ucp_params = self.extract_use_case_points_parameters(text)
+                ucp_params = self.extract_use_case_points_parameters(text, ctx)
             except Exception as e:
                 print(f"Error extracting Use Case Points parameters: {e}")
                 ucp_params = {
@@ -1818,21 +1941,21 @@ class RequirementAnalyzer:
             
             # Trích xuất đặc trưng cho mô hình máy học
             try:
-                ml_features = self.extract_machine_learning_features(text)
+                ml_features = self.extract_machine_learning_features(text, ctx)
             except Exception as e:
                 print(f"Error extracting ML features: {e}")
                 ml_features = {}
             
             # Trích xuất yêu cầu
             try:
-                requirements = self.extract_requirements(text)
+                requirements = self.extract_requirements(text, ctx)
             except Exception as e:
                 print(f"Error extracting requirements: {e}")
                 requirements = []
             
             # Trích xuất đặc trưng
             try:
-                features = self.extract_features(text)
+                features = self.extract_features(text, ctx)
             except Exception as e:
                 print(f"Error extracting features: {e}")
                 features = {
@@ -1843,7 +1966,7 @@ class RequirementAnalyzer:
                 
             # Trích xuất tham số LOC
             try:
-                loc_params = self.extract_loc_parameters(text)
+                loc_params = self.extract_loc_parameters(text, ctx)
             except Exception as e:
                 print(f"Error extracting LOC parameters: {e}")
                 loc_params = {'kloc': 5.0}
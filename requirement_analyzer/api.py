@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import Response as StarletteResponse
 from io import BytesIO
 from pydantic import BaseModel
@@ -82,6 +83,12 @@ def _init_task_generator():
             logger.info("[TaskGen] Priority classifier warmed up ✓")
         except Exception as e:
             logger.warning(f"[TaskGen] Priority warm-up skipped: {e}")
+        # NLTK data / spaCy model are no longer loaded at import time
+        try:
+            from requirement_analyzer.nlp_resources import warm_up as warm_up_nlp
+            logger.info(f"[TaskGen] NLP resources warmed up: {warm_up_nlp()}")
+        except Exception as e:
+            logger.warning(f"[TaskGen] NLP warm-up skipped: {e}")
         with _task_gen_lock:
             _task_gen_instance = inst
             _task_gen_ready = True
@@ -103,11 +110,17 @@ async def lifespan(app: FastAPI):
     logger.info("[Startup] Task gen initialisation started in background thread")
     yield
     logger.info("[Shutdown] API shutting down")
+    from requirement_analyzer.ingestion import shutdown_pdf_executor
+    from requirement_analyzer.task_gen.pipeline_v2 import shutdown_pipeline_executor
+    shutdown_pdf_executor()
+    shutdown_pipeline_executor()
 
 # Model cho request API
 class RequirementText(BaseModel):
     text: str
     method: Optional[str] = "weighted_average"
+    # history_session_id của lần sinh trước: trả thêm "diff" các story thay đổi
+    previous_session_id: Optional[str] = None
 
 class TaskList(BaseModel):
     tasks: List[Dict[str, Any]]
@@ -131,6 +144,16 @@ class WhatIfRequest(BaseModel):
     new_sprint: int
     language: Optional[str] = None
 
+
+class WhatIfMove(BaseModel):
+    story_id: str
+    new_sprint: Optional[int] = None
+
+
+class WhatIfMovesRequest(BaseModel):
+    """One undoable batch of sprint moves inside a what-if session."""
+    moves: List[WhatIfMove]
+
 class COCOMOParameters(BaseModel):
     # Software Size
     software_size: Optional[float] = 10.0  # KLOC
@@ -382,17 +405,21 @@ async def upload_requirements(file: UploadFile = File(...), method: str = Form("
                 detail=f"Unsupported file format. Please upload one of: {', '.join(allowed_extensions)}"
             )
             
-        # Đọc file
-        content = await file.read()
+        # Ghi file ra file tạm theo từng khối (không đọc cả file vào bộ nhớ)
+        from requirement_analyzer.ingestion import spool_upload
+        tmp_path = await run_in_threadpool(spool_upload, file.file, file_ext)
         
         # Parse the document based on file type
         try:
+            size_bytes = os.path.getsize(tmp_path)
             parser = DocumentParser()
-            text = parser.parse(content, filename)
+            text = await run_in_threadpool(parser.parse_file, tmp_path, filename)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error parsing document: {str(e)}")
+        finally:
+            os.unlink(tmp_path)
         
         # Check if any text was extracted
         if not text or text.strip() == "":
@@ -411,7 +438,7 @@ async def upload_requirements(file: UploadFile = File(...), method: str = Form("
         result["document"] = {
             "filename": filename,
             "file_type": file_ext,
-            "size_bytes": len(content),
+            "size_bytes": size_bytes,
             "text_length": len(text)
         }
         
@@ -523,6 +550,8 @@ async def generate_tasks_from_text(requirement: RequirementText):
     - Specific Given/When/Then acceptance criteria
     - Functional vs Non-functional requirement distinction
     - INVEST scoring for story quality
+    - Incremental: unchanged requirement lines reuse memoized output;
+      pass previous_session_id to get a diff of added/removed/changed stories
     """
     try:
         # Use pre-warmed singleton (raises 503 if still loading)
@@ -538,6 +567,7 @@ async def generate_tasks_from_text(requirement: RequirementText):
             text=requirement.text,
             language=None,       # auto-detect
             sprint_weeks=sprint_weeks,
+            previous_session_id=requirement.previous_session_id,
         )
 
         return result
@@ -563,18 +593,22 @@ async def generate_tasks_from_file(file: UploadFile = File(...)):
             detail=f"Unsupported file type '{ext}'. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
 
+    tmp_path = None
     try:
-        content = await file.read()
+        # Spool to a temp file in chunks instead of reading the upload into memory
+        from requirement_analyzer.ingestion import spool_upload
+        tmp_path = await run_in_threadpool(spool_upload, file.file, ext)
+        file_size = os.path.getsize(tmp_path)
 
         # Enforce size limit
-        if len(content) > MAX_FILE_SIZE_MB * 1024 * 1024:
+        if file_size > MAX_FILE_SIZE_MB * 1024 * 1024:
             raise HTTPException(
                 status_code=413,
                 detail=f"File too large (max {MAX_FILE_SIZE_MB} MB)"
             )
 
-        # Extract text based on format
-        text_content = _extract_text_from_upload(content, ext, filename)
+        # Extract text based on format (PDF pages in parallel, off the event loop)
+        text_content = await run_in_threadpool(_extract_text_from_upload, tmp_path, ext, filename)
 
         if not text_content or len(text_content.strip()) < 20:
             raise HTTPException(
@@ -585,7 +619,7 @@ async def generate_tasks_from_file(file: UploadFile = File(...)):
         generator = get_task_generator()
         result = generator.generate_from_text(text=text_content, language=None)
         result["filename"] = filename
-        result["file_size_bytes"] = len(content)
+        result["file_size_bytes"] = file_size
         result["extracted_chars"] = len(text_content)
         return result
 
@@ -594,6 +628,9 @@ async def generate_tasks_from_file(file: UploadFile = File(...)):
     except Exception as e:
         logger.error(f"Error generating tasks from file: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if tmp_path:
+            os.unlink(tmp_path)
 
 
 # ── Dependency AI endpoints ──────────────────────────────────────────────
@@ -614,12 +651,11 @@ async def dependency_ai_analyze(payload: DependencyAIRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/task-generation/dependency-ai/what-if")
-async def dependency_ai_what_if(payload: WhatIfRequest):
-    """Simulate moving ``story_id`` to ``new_sprint``.
+def _build_dependency_ai(stories: List[Dict[str, Any]]):
+    """Parse ``stories`` and build a :class:`DependencyAI` graph.
 
-    Returns the resolved/introduced violations and net delta without
-    mutating the persisted plan.
+    Raises 503 when the semantic engine is unavailable and 422 when no
+    story is parseable.
     """
     try:
         from requirement_analyzer.task_gen.semantic import (
@@ -634,7 +670,7 @@ async def dependency_ai_what_if(payload: WhatIfRequest):
 
     parser = SemanticParser()
     nodes = []
-    for idx, s in enumerate(payload.stories):
+    for idx, s in enumerate(stories):
         text = ((s.get("title") or "") + ". "
                 + (s.get("user_story") or "")).strip(". ").strip()
         if not text:
@@ -658,7 +694,18 @@ async def dependency_ai_what_if(payload: WhatIfRequest):
         embed = auto_backend()
     except Exception:
         embed = None
-    ai = DependencyAI(embedding_backend=embed).build(nodes)
+    return DependencyAI(embedding_backend=embed).build(nodes)
+
+
+@app.post("/api/task-generation/dependency-ai/what-if")
+async def dependency_ai_what_if(payload: WhatIfRequest):
+    """Simulate moving ``story_id`` to ``new_sprint``.
+
+    Returns the resolved/introduced violations and net delta without
+    mutating the persisted plan.  Interactive planners should prefer the
+    session endpoints below, which keep the graph between moves.
+    """
+    ai = _build_dependency_ai(payload.stories)
 
     if payload.story_id not in ai.nodes:
         raise HTTPException(
@@ -669,9 +716,87 @@ async def dependency_ai_what_if(payload: WhatIfRequest):
     return ai.what_if(payload.story_id, payload.new_sprint)
 
 
-def _extract_text_from_upload(content: bytes, ext: str, filename: str) -> str:
-    """Extract plain text from uploaded file content."""
+# ── What-if sessions (graph kept server-side between moves) ─────────────
+_what_if_store = None
+_what_if_store_lock = threading.Lock()
+
+
+def _get_what_if_store():
+    global _what_if_store
+    with _what_if_store_lock:
+        if _what_if_store is None:
+            from requirement_analyzer.task_gen.semantic import WhatIfSessionStore
+            _what_if_store = WhatIfSessionStore()
+        return _what_if_store
+
+
+def _get_what_if_session(session_id: str):
+    session = _get_what_if_store().get(session_id)
+    if session is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"What-if session '{session_id}' not found or expired",
+        )
+    return session
+
+
+@app.post("/api/task-generation/dependency-ai/what-if/sessions")
+async def create_what_if_session(payload: DependencyAIRequest):
+    """Build the graph once and open a what-if session on it.
+
+    Returns ``session_id`` plus the current plan and violations; moves
+    are then posted to ``/sessions/{session_id}/moves``.
+    """
+    ai = _build_dependency_ai(payload.stories)
+    session_id, session = _get_what_if_store().create(ai)
+    return {"session_id": session_id, **session.summary()}
+
+
+@app.get("/api/task-generation/dependency-ai/what-if/sessions/{session_id}")
+async def get_what_if_session(session_id: str):
+    """Current plan, violations and undo depth of a what-if session."""
+    return {"session_id": session_id, **_get_what_if_session(session_id).summary()}
+
+
+@app.post("/api/task-generation/dependency-ai/what-if/sessions/{session_id}/moves")
+async def what_if_session_moves(session_id: str, payload: WhatIfMovesRequest):
+    """Apply a batch of sprint moves (one undo step).
+
+    Only the moved stories' edges are re-checked.  Returns the violations
+    resolved/introduced by the batch and the new violation count.
+    """
+    session = _get_what_if_session(session_id)
+    try:
+        return session.apply([(m.story_id, m.new_sprint) for m in payload.moves])
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"story_id {e} not found")
+
+
+@app.post("/api/task-generation/dependency-ai/what-if/sessions/{session_id}/undo")
+async def what_if_session_undo(session_id: str):
+    """Revert the last batch of moves."""
+    session = _get_what_if_session(session_id)
+    try:
+        return session.undo()
+    except IndexError:
+        raise HTTPException(status_code=409, detail="Nothing to undo")
+
+
+@app.delete("/api/task-generation/dependency-ai/what-if/sessions/{session_id}")
+async def delete_what_if_session(session_id: str):
+    """Close a what-if session."""
+    if not _get_what_if_store().delete(session_id):
+        raise HTTPException(
+            status_code=404,
+            detail=f"What-if session '{session_id}' not found or expired",
+        )
+    return {"status": "deleted", "session_id": session_id}
+
+
+def _extract_text_from_upload(path: str, ext: str, filename: str) -> str:
+    """Extract plain text from an uploaded file spooled to `path`."""
     if ext in (".txt", ".md", ".rst"):
+        content = Path(path).read_bytes()
         # Try UTF-8 first, fall back to latin-1
         for enc in ("utf-8", "utf-8-sig", "latin-1", "cp1252"):
             try:
@@ -681,31 +806,19 @@ def _extract_text_from_upload(content: bytes, ext: str, filename: str) -> str:
         return content.decode("latin-1", errors="replace")
 
     if ext == ".pdf":
-        try:
-            import io
-            import pdfplumber
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                pages = [page.extract_text() or "" for page in pdf.pages]
-            return "\n".join(pages)
-        except ImportError:
-            pass
-        # Fallback: try PyPDF2
-        try:
-            import io
-            import PyPDF2
-            reader = PyPDF2.PdfReader(io.BytesIO(content))
-            return "\n".join(page.extract_text() or "" for page in reader.pages)
-        except ImportError:
+        from requirement_analyzer.ingestion import available_pdf_backends, iter_pdf_pages
+        if not available_pdf_backends():
             raise HTTPException(
                 status_code=422,
                 detail="PDF parsing requires 'pdfplumber' or 'PyPDF2'. Install with: pip install pdfplumber"
             )
+        # Page ranges are extracted in parallel and arrive in page order
+        return "\n".join(text for _, text in iter_pdf_pages(path))
 
     if ext in (".docx", ".doc"):
         try:
-            import io
             import docx
-            doc = docx.Document(io.BytesIO(content))
+            doc = docx.Document(path)
             return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
         except ImportError:
             raise HTTPException(
@@ -714,18 +827,23 @@ def _extract_text_from_upload(content: bytes, ext: str, filename: str) -> str:
             )
 
     # Generic fallback
-    return content.decode("utf-8", errors="replace")
+    return Path(path).read_bytes().decode("utf-8", errors="replace")
 
 
 @app.get("/api/task-generation/history")
-async def get_task_history(limit: int = 20):
+async def get_task_history(limit: int = 20, offset: int = 0):
     """
     Get list of recent task generation sessions.
-    Returns session summaries (no task payload).
+    Returns session summaries (no task payload), paginated by limit/offset.
     """
     try:
-        from requirement_analyzer.task_gen.task_history import list_history
-        return {"sessions": list_history(limit=limit)}
+        from requirement_analyzer.task_gen.task_history import list_history, count_history
+        return {
+            "sessions": list_history(limit=limit, offset=offset),
+            "total": count_history(),
+            "limit": limit,
+            "offset": offset
+        }
     except Exception as e:
         logger.error(f"Error getting task history: {e}")
         raise HTTPException(status_code=500, detail=str(e))
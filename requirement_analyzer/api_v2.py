@@ -152,7 +152,8 @@ async def generate_v2_from_file(
                 "high_gaps": batch_output.summary["high_gaps_count"],
                 "avg_invest_score": round(batch_output.avg_invest_score, 2),
                 "success_rate": round(batch_output.summary["success_rate"], 2),
-                "processing_time_seconds": round(processing_time, 3)
+                "processing_time_seconds": round(processing_time, 3),
+                "stage_timings": batch_output.stage_timings,
             },
             "requirements": []
         }
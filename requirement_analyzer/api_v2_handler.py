@@ -30,7 +30,16 @@ from requirement_analyzer.task_gen.smart_priority import (
     detect_language,
     parse_sprint_weeks,
 )
-from requirement_analyzer.task_gen.task_history import save_history
+from requirement_analyzer.task_gen.task_history import save_history, get_history_session
+from requirement_analyzer.task_gen.story_dedup import (
+    STORY_DEDUP_THRESHOLD,
+    deduplicate_story_indices,
+)
+from requirement_analyzer.task_gen.requirement_memo import (
+    RequirementMemo,
+    diff_stories,
+    requirement_fingerprint,
+)
 
 # Dependency AI is optional — never break the API if it fails to import
 try:
@@ -58,6 +67,8 @@ class V2TaskGenerator:
         self.pipeline = V2Pipeline()
         self.detector = self._load_detector()
         self.priority_clf = get_priority_classifier()
+        # Re-submitted documents only re-run the pipeline for edited lines
+        self.requirement_memo = RequirementMemo()
         
     def _load_detector(self):
         """Load requirement detector"""
@@ -74,15 +85,23 @@ class V2TaskGenerator:
         language: Optional[str] = None,
         sprint_weeks: Optional[int] = None,
         team_velocity: int = 40,
+        previous_session_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generate tasks from requirement text using V2 pipeline.
 
+        Requirements seen before (same normalized text, language and pipeline
+        version) reuse their memoized V2 output; only new or edited lines go
+        through the pipeline, while dedup, sprints, dependency AI, epics and
+        explainability always re-run over the whole document.
+
         Args:
             text: Requirement text
             language: Force language ('vi' or 'en'). Auto-detected if None.
             sprint_weeks: Sprint duration in weeks (auto-parsed from text if None)
             team_velocity: Team velocity in SP/sprint (default 40)
+            previous_session_id: history_session_id of an earlier generation of
+                this document; adds a "diff" of added/removed/changed stories
 
         Returns:
             Dictionary with tasks, stats, quality metrics, sprint assignments, and history_session_id
@@ -139,6 +158,10 @@ class V2TaskGenerator:
         # Stage 5: Add Explainable AI reasoning
         tasks_output = self._add_explainability(tasks_output)
 
+        # Stage 5a: What changed since the previous generation of this document
+        if previous_session_id:
+            tasks_output["diff"] = self._diff_against_session(previous_session_id, all_stories)
+
         # Stage 5: Save to history
         try:
             flat_for_history = []
@@ -711,45 +734,15 @@ class V2TaskGenerator:
     def _deduplicate_stories(self, tasks_output: dict) -> dict:
         """
         Remove near-duplicate user stories across different requirements.
-        Uses simple token-overlap (Jaccard similarity) to detect duplicates.
+        Uses token-overlap (Jaccard similarity >= 0.75) to detect duplicates,
+        comparing only candidates from a prefix-filtered token index.
         Keeps the story with higher story_points (more specific).
         """
-        import re as _re
-
-        def _tokens(text: str) -> set:
-            return set(_re.findall(r'\w+', (text or "").lower()))
-
-        def _jaccard(a: set, b: set) -> float:
-            if not a and not b:
-                return 1.0
-            union = a | b
-            return len(a & b) / len(union) if union else 0.0
-
-        THRESHOLD = 0.75  # 75% token overlap → duplicate
-
         all_stories: list[dict] = []
         for task in tasks_output.get("tasks", []):
             all_stories.extend(task.get("user_stories", []))
 
-        # Mark duplicates
-        kept_indices: list[int] = []
-        seen_tokens: list[set] = []
-
-        for i, story in enumerate(all_stories):
-            title_tokens = _tokens(story.get("title", "") + " " + story.get("user_story", ""))
-            is_dup = False
-            for j, prev_tokens in enumerate(seen_tokens):
-                if _jaccard(title_tokens, prev_tokens) >= THRESHOLD:
-                    # Keep the one with more story_points (more granular)
-                    prev_idx = kept_indices[j]
-                    if (story.get("story_points") or 0) > (all_stories[prev_idx].get("story_points") or 0):
-                        kept_indices[j] = i
-                        seen_tokens[j] = title_tokens
-                    is_dup = True
-                    break
-            if not is_dup:
-                kept_indices.append(i)
-                seen_tokens.append(title_tokens)
+        kept_indices = deduplicate_story_indices(all_stories, STORY_DEDUP_THRESHOLD)
 
         # Rebuild kept story id set
         kept_ids = {all_stories[i].get("id") for i in kept_indices}
@@ -848,6 +841,7 @@ class V2TaskGenerator:
         tasks = []
         functional_count = 0
         nfr_count = 0
+        reused = 0
         
         for requirement in requirements:
             try:
@@ -858,18 +852,28 @@ class V2TaskGenerator:
                 else:
                     functional_count += 1
                 
-                # Process through V2 pipeline
-                v2_output = self.pipeline.process_single_requirement(requirement)
+                # Process through V2 pipeline (memoized per requirement line)
+                memo_key = RequirementMemo.key(requirement.original_text, language, requirement.domain)
+                v2_output = self.requirement_memo.get(memo_key, requirement.requirement_id)
+                if v2_output is None:
+                    v2_output = self.pipeline.process_single_requirement(requirement)
+                    self.requirement_memo.put(memo_key, v2_output)
+                else:
+                    reused += 1
 
                 # Convert V2 output to task format
                 task = self._convert_v2_to_task(v2_output, language)
-                tasks.append(task)
 
             except Exception as e:
                 logger.error(f"Error processing {requirement.requirement_id}: {e}")
                 # Add basic task as fallback
                 task = self._create_fallback_task(requirement, language)
-                tasks.append(task)
+
+            # Stable story identity across edits: requirement text + position
+            fingerprint = requirement_fingerprint(requirement.original_text)
+            for n, story in enumerate(task.get("user_stories", [])):
+                story["source_key"] = f"{fingerprint}:{n}"
+            tasks.append(task)
         
         return {
             "status": "success",
@@ -877,8 +881,25 @@ class V2TaskGenerator:
             "total_tasks": len(tasks),
             "functional_requirements": functional_count,
             "non_functional_requirements": nfr_count,
-            "summary": self._generate_summary(tasks, functional_count, nfr_count)
+            "summary": self._generate_summary(tasks, functional_count, nfr_count),
+            "incremental": {
+                "reused_requirements": reused,
+                "processed_requirements": len(requirements) - reused,
+            },
         }
+
+    def _diff_against_session(self, session_id: str, stories: list) -> Dict[str, Any]:
+        """Diff current stories against a saved history session"""
+        try:
+            previous = get_history_session(session_id)
+        except Exception as e:
+            logger.warning(f"Could not load history session {session_id}: {e}")
+            previous = None
+        if previous is None:
+            return {"base_session_id": session_id, "error": "session not found"}
+        diff = diff_stories(previous.get("tasks", []), stories)
+        diff["base_session_id"] = session_id
+        return diff
     
     def _convert_v2_to_task(self, v2_output, language: str = "en") -> Dict[str, Any]:
         """
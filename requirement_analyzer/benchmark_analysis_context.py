@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RequirementAnalyzer.analyze_requirements_document
+So sánh thời gian phân tích một tài liệu khi mỗi bộ trích xuất tự parse
+(cách cũ) và khi dùng chung một AnalysisContext (cách mới)
+
+Usage:
+    python -m requirement_analyzer.benchmark_analysis_context
+"""
+
+import contextlib
+import io
+import time
+
+from requirement_analyzer import nlp_resources
+from requirement_analyzer.analyzer import RequirementAnalyzer
+
+
+SAMPLE_PARAGRAPH = (
+    "The system shall allow registered users to create, update and delete orders. "
+    "Customers must be able to search the product catalog and store items in a cart. "
+    "The payment service should integrate with an external API and record every transaction in the database. "
+    "Administrators can generate monthly reports and export them as PDF files. "
+    "The platform must respond within 2 seconds under 500 concurrent users and encrypt personal data.\n"
+)
+
+
+def make_document(size_bytes):
+    """Lặp đoạn mẫu cho đến khi đạt kích thước mong muốn"""
+    repeats = max(1, size_bytes // len(SAMPLE_PARAGRAPH))
+    return SAMPLE_PARAGRAPH * repeats
+
+
+class _CountingNLP:
+    """Bọc model spaCy để đếm số lần parse văn bản"""
+    
+    def __init__(self, nlp):
+        self._nlp = nlp
+        self.calls = 0
+        self.chars = 0
+    
+    def __call__(self, text):
+        self.calls += 1
+        self.chars += len(text)
+        return self._nlp(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._nlp, name)
+
+
+def _legacy_analyze(analyzer, text):
+    """Mô phỏng cách cũ: mỗi bộ trích xuất nhận text và tự parse lại"""
+    analyzer.extract_cocomo_parameters(text)
+    analyzer.extract_function_points_parameters(text)
+    analyzer.extract_use_case_points_parameters(text)
+    analyzer.extract_machine_learning_features(text)
+    analyzer.extract_requirements(text)
+    analyzer.extract_features(text)
+    analyzer.extract_loc_parameters(text)
+
+
+def _timed(func, analyzer, text, counter):
+    analyzer._features_cache.clear()
+    if counter is not None:
+        counter.calls = counter.chars = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func(analyzer, text)
+        elapsed = time.perf_counter() - start
+    if counter is None:
+        return elapsed, None, "n/a"
+    return elapsed, counter.calls, counter.chars
+
+
+def _install_counter(model_name=nlp_resources.DEFAULT_SPACY_MODEL):
+    """
+    Đặt bộ đếm vào cache model của nlp_resources, nơi safe_nlp_process lấy
+    model qua get_spacy(); trả về None nếu không có spaCy (MockDoc, không đếm)
+    """
+    nlp = nlp_resources.get_spacy(model_name)
+    if nlp is None:
+        return None
+    counter = _CountingNLP(nlp)
+    nlp_resources._spacy_models[model_name] = counter
+    return counter
+
+
+def _remove_counter(counter, model_name=nlp_resources.DEFAULT_SPACY_MODEL):
+    if counter is not None and nlp_resources._spacy_models.get(model_name) is counter:
+        nlp_resources._spacy_models[model_name] = counter._nlp
+
+
+def run_benchmark(sizes=(1_000, 20_000, 200_000)):
+    analyzer = RequirementAnalyzer()
+    counter = _install_counter()
+    
+    print("\n" + "=" * 78)
+    print("BENCHMARK: analyze_requirements_document (per-extractor parse vs AnalysisContext)")
+    print("=" * 78)
+    if counter is None:
+        print("spaCy not available: parses are not counted (MockDoc fallback)")
+    print(f"{'size':>8} | {'before (s)':>10} {'parsed chars':>13} | {'after (s)':>10} {'parsed chars':>13} | {'speed-up':>8}")
+    
+    try:
+        for size in sizes:
+            text = make_document(size)
+            before, before_calls, before_chars = _timed(_legacy_analyze, analyzer, text, counter)
+            after, after_calls, after_chars = _timed(
+                lambda a, t: a.analyze_requirements_document(t), analyzer, text, counter
+            )
+            if counter is not None:
+                # Bộ đếm phải thấy các lần parse, nếu không số liệu bên dưới là sai
+                assert before_calls > 0 and after_calls > 0, "spaCy parse counter never fired"
+            print(f"{len(text):>8} | {before:>10.2f} {before_chars:>13} | {after:>10.2f} {after_chars:>13} | "
+                  f"{before / max(after, 1e-9):>7.1f}x")
+    finally:
+        _remove_counter(counter)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: EffortEstimator.estimate_from_ml_model (từng dự án) so với
+estimate_batch_from_ml_models (một ma trận, một lần predict cho mỗi mô hình)
+Kiểm tra kết quả từng dự án khớp nhau (sai số tương đối <= EffortEstimator.BATCH_RTOL)
+
+Usage:
+    python -m requirement_analyzer.benchmark_batch_estimation [n_projects]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+import numpy as np
+
+from requirement_analyzer.estimator import EffortEstimator
+
+
+def make_projects(n, seed=42):
+    """Sinh n bộ đặc trưng COCOMO II ngẫu nhiên (có cả giá trị thiếu/không hợp lệ)"""
+    rng = random.Random(seed)
+    drivers = [
+        "PREC", "FLEX", "RESL", "TEAM", "PMAT", "RELY", "DATA", "CPLX", "RUSE",
+        "DOCU", "TIME", "STOR", "PVOL", "ACAP", "PCAP", "PCON", "APEX", "PLEX",
+        "LTEX", "TOOL", "SITE", "SCED"
+    ]
+    projects = []
+    for i in range(n):
+        project = {
+            "size": rng.uniform(0.5, 500.0),
+            "complexity": rng.choice([0.5, 1.0, 1.5, 2.0]),
+            "developers": rng.randint(1, 40),
+            "time_months": rng.uniform(1.0, 36.0),
+        }
+        for driver in drivers:
+            project[driver] = rng.uniform(0.7, 1.6)
+        if i % 50 == 0:
+            project["size"] = float("nan")
+        if i % 70 == 0:
+            del project["complexity"]
+        projects.append(project)
+    return projects
+
+
+def run_benchmark(n_projects=10000):
+    with contextlib.redirect_stdout(io.StringIO()):
+        estimator = EffortEstimator()
+    model_names = list(estimator.ml_models.keys())
+    projects = make_projects(n_projects)
+
+    print(f"Projects: {n_projects:,}   Models: {', '.join(model_names) or '(none - fallback formula)'}")
+
+    # Đường vô hướng: một lần gọi cho mỗi dự án và mỗi mô hình
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        scalar = {
+            name: [estimator.estimate_from_ml_model(dict(p), name) for p in projects]
+            for name in (model_names or ["Random_Forest"])
+        }
+        t_scalar = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = estimator.estimate_batch_from_ml_models(projects, model_names or None)
+        t_batch = time.perf_counter() - start
+
+    matches = True
+    exact = True
+    max_diff = 0.0
+    for name, values in scalar.items():
+        expected, actual = np.asarray(values), np.asarray(batch[name])
+        diff = np.abs(expected - actual)
+        max_diff = max(max_diff, float(diff.max()) if len(diff) else 0.0)
+        matches &= bool(np.allclose(actual, expected, rtol=EffortEstimator.BATCH_RTOL, atol=0.0))
+        exact &= values == batch[name]
+
+    print(f"Scalar path:  {t_scalar:8.2f}s  ({n_projects / t_scalar:,.0f} projects/sec)")
+    print(f"Batch path:   {t_batch:8.2f}s  ({n_projects / t_batch:,.0f} projects/sec)")
+    print(f"Speed-up:     {t_scalar / t_batch:8.1f}x")
+    print(f"Match:        {matches}  (rtol {EffortEstimator.BATCH_RTOL:g}; bit-identical: {exact}, "
+          f"max abs diff {max_diff:.3g})")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
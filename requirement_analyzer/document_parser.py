@@ -50,6 +50,39 @@ class DocumentParser:
         else:
             raise ValueError(f"Unsupported file format: {ext}")
     
+    def parse_file(self, path, filename):
+        """
+        Parse a document already on disk (e.g. a spooled upload).
+        
+        PDFs are read page range by page range (in parallel for large files)
+        instead of being loaded into memory first.
+        
+        Args:
+            path (str): Path of the file
+            filename (str): Original filename with extension
+            
+        Returns:
+            str: Extracted text content
+        """
+        _, ext = os.path.splitext(filename)
+        if ext.lower() == '.pdf':
+            return self._parse_pdf_file(path)
+        with open(path, 'rb') as f:
+            return self.parse(f.read(), filename)
+    
+    def _parse_pdf_file(self, path):
+        """Parse a PDF file from disk."""
+        from requirement_analyzer.ingestion import available_pdf_backends, iter_pdf_pages
+        
+        if not available_pdf_backends():
+            logger.error("No PDF library installed. Cannot parse PDF.")
+            raise ValueError("PDF parsing requires PyPDF2 library. Please install it using: pip install PyPDF2")
+        try:
+            return "".join(text + "\n\n" for _, text in iter_pdf_pages(path))
+        except Exception as e:
+            logger.error(f"Error parsing PDF: {str(e)}")
+            raise ValueError(f"Failed to parse PDF file: {str(e)}")
+    
     def _parse_text(self, content):
         """Parse plain text or markdown files."""
         try:
@@ -11,6 +11,8 @@ import pandas as pd
 import json
 import math
 import random
+import hashlib
+import threading
 from pathlib import Path
 
 # Thêm thư mục gốc vào sys.path để import các module khác
@@ -54,9 +56,15 @@ class EffortEstimator:
         self.model_path = model_path or os.path.join(PROJECT_ROOT, "models")
         
         # Khởi tạo các mô hình
+        # Sau khi khởi tạo, các mô hình không bị thay đổi theo từng request
+        # (giá trị riêng của request đi qua tham số, không gán lại estimate)
         self.models = {}
         self.ml_models = {}
         
+        # RequirementAnalyzer dùng chung, tạo lười một lần
+        self.analyzer = None
+        self._analyzer_lock = threading.Lock()
+        
         try:
             # Khởi tạo các mô hình cơ bản
             self._init_base_models()
@@ -136,10 +144,11 @@ class EffortEstimator:
                 loc_linear.train()
                 
             # Tạo wrapper để phù hợp với giao diện của các mô hình khác
+            # (staticmethod: estimate nhận project_data, không nhận self)
             self.models['loc_linear'] = type('LOCLinearWrapper', (), {
-                'estimate': lambda project_data: {
+                'estimate': staticmethod(lambda project_data: {
                     'effort_pm': loc_linear.estimate(project_data)
-                }
+                })
             })()
             
             # Khởi tạo mô hình LOC Random Forest
@@ -159,9 +168,9 @@ class EffortEstimator:
                 loc_rf.train()
                 
             self.models['loc_random_forest'] = type('LOCRandomForestWrapper', (), {
-                'estimate': lambda project_data: {
+                'estimate': staticmethod(lambda project_data: {
                     'effort_pm': loc_rf.estimate(project_data)
-                }
+                })
             })()
             
             print("LOC models initialized successfully")
@@ -169,15 +178,15 @@ class EffortEstimator:
             print(f"Error initializing LOC models: {e}")
             # Tạo mô hình LOC giả với công thức phức tạp hơn
             self.models['loc_linear'] = type('obj', (object,), {
-                'estimate': lambda project_data: {
+                'estimate': staticmethod(lambda project_data: {
                     'effort_pm': self._dynamic_loc_estimate(project_data, 'linear')
-                }
+                })
             })()
             
             self.models['loc_random_forest'] = type('obj', (object,), {
-                'estimate': lambda project_data: {
+                'estimate': staticmethod(lambda project_data: {
                     'effort_pm': self._dynamic_loc_estimate(project_data, 'random_forest')
-                }
+                })
             })()        # Đảm bảo rằng ít nhất một mô hình luôn có sẵn
         if not self.models:
             self.models['default'] = type('obj', (object,), {'estimate': lambda project_data: {'effort_pm': 10.0}})()
@@ -264,12 +273,14 @@ class EffortEstimator:
                 # Tạo mô hình giả đơn giản
                 class SimplePredictionModel:
                     def predict(self, X):
-                        # Giả định X[0] là kích thước và X[1] là độ phức tạp
-                        size = X[0][0] if len(X) > 0 and len(X[0]) > 0 else 5.0
-                        complexity = X[0][1] if len(X) > 0 and len(X[0]) > 1 else 1.0
-                        # Công thức ước lượng đơn giản dựa trên kích thước và độ phức tạp
-                        effort = size * (2.5 + 0.5 * complexity)
-                        return [effort]
+                        # Giả định cột 0 là kích thước và cột 1 là độ phức tạp (mỗi hàng một dự án)
+                        efforts = []
+                        for row in (X if len(X) > 0 else [[]]):
+                            size = row[0] if len(row) > 0 else 5.0
+                            complexity = row[1] if len(row) > 1 else 1.0
+                            # Công thức ước lượng đơn giản dựa trên kích thước và độ phức tạp
+                            efforts.append(size * (2.5 + 0.5 * complexity))
+                        return efforts
                 
                 self.ml_models[model_name] = SimplePredictionModel()
                 print(f"Created simple prediction model for {model_name}")
@@ -414,10 +425,147 @@ class EffortEstimator:
             complexity = features.get('complexity', 1.0)
             return size * (2.0 + complexity * 0.5)
 
+    # Sai số tương đối tối đa giữa đường batch và estimate_from_ml_model
+    # (phép nhân ma trận nhiều hàng cộng theo thứ tự khác một hàng)
+    BATCH_RTOL = 1e-12
+
+    # Giá trị mặc định khi thiếu đặc trưng (giống estimate_from_ml_model)
+    ML_FEATURE_DEFAULTS = {'size': 5.0, 'complexity': 1.0, 'developers': 3.0, 'time_months': 6.0}
+
+    @staticmethod
+    def _is_valid_number(value):
+        return isinstance(value, (int, float)) and not np.isnan(value)
+
+    def _ml_feature_names(self, model):
+        """Tên đặc trưng theo thứ tự mô hình mong đợi"""
+        if hasattr(model, 'feature_names_in_'):
+            return model.feature_names_in_
+        if hasattr(self, 'feature_info') and 'numeric_features' in self.feature_info:
+            return self.feature_info['numeric_features']
+        return ['size', 'complexity', 'developers', 'time_months']
+
+    def _prepare_batch_features(self, features):
+        """
+        Chuẩn hóa đầu vào batch thành list các dict (bản sao) với size/complexity hợp lệ
+
+        Args:
+            features: list các dict đặc trưng hoặc DataFrame (mỗi hàng một dự án)
+        """
+        if isinstance(features, pd.DataFrame):
+            rows = features.to_dict('records')
+        else:
+            rows = [dict(f) for f in features]
+
+        for row in rows:
+            for feature in ('size', 'complexity'):
+                if feature not in row or not self._is_valid_number(row[feature]):
+                    row[feature] = self.ML_FEATURE_DEFAULTS[feature]
+        return rows
+
+    def _build_feature_matrix(self, rows, feature_names):
+        """Ma trận (n_projects, n_features), điền mặc định như đường vô hướng"""
+        defaults = [self.ML_FEATURE_DEFAULTS.get(name, 0.0) for name in feature_names]
+        is_valid = self._is_valid_number
+        return np.array([
+            [
+                row[name] if name in row and is_valid(row[name]) else default
+                for name, default in zip(feature_names, defaults)
+            ]
+            for row in rows
+        ], dtype=float).reshape(len(rows), len(feature_names))
+
+    def estimate_batch_from_ml_models(self, features, model_names=None):
+        """
+        Ước lượng nỗ lực cho nhiều dự án cùng lúc bằng các mô hình ML
+
+        Dựng một ma trận đặc trưng cho cả batch, áp dụng preprocessor một lần
+        và gọi predict một lần cho mỗi mô hình. Mặc định, giá trị thiếu/không
+        hợp lệ và công thức dự phòng giống estimate_from_ml_model từng dự án
+        (đầu vào không bị sửa đổi). Mô hình cây cho kết quả giống hệt; mô hình
+        tuyến tính nhân ma trận theo khối (BLAS) nên có thể lệch ở mức làm
+        tròn dấu phẩy động, sai số tương đối <= BATCH_RTOL.
+
+        Args:
+            features: list các dict đặc trưng hoặc DataFrame (mỗi hàng một dự án)
+            model_names (list, optional): Các mô hình cần dùng (mặc định: tất cả)
+
+        Returns:
+            dict: {model_name: list nỗ lực (người-tháng), cùng thứ tự với đầu vào}
+        """
+        rows = self._prepare_batch_features(features)
+        if model_names is None:
+            model_names = list(self.ml_models.keys()) or ["Random_Forest"]
+
+        fallback = np.array([
+            row['size'] * (2.0 + row['complexity'] * 0.5) for row in rows
+        ], dtype=float)
+
+        results = {}
+        # Ma trận đã tiền xử lý, dùng chung cho các mô hình có cùng danh sách đặc trưng
+        matrices = {}
+
+        for requested_name in model_names:
+            model_name = requested_name
+            if model_name not in self.ml_models:
+                available_models = list(self.ml_models.keys())
+                if not available_models:
+                    results[requested_name] = fallback.tolist()
+                    continue
+                model_name = available_models[0]
+                print(f"Warning: Requested model not found. Using {model_name} instead")
+
+            model = self.ml_models[model_name]
+            try:
+                feature_names = tuple(self._ml_feature_names(model))
+                if feature_names not in matrices:
+                    X = self._build_feature_matrix(rows, feature_names)
+                    if hasattr(self, 'preprocessor') and self.preprocessor is not None:
+                        try:
+                            X = self.preprocessor.transform(X)
+                        except Exception as e:
+                            print(f"Error applying preprocessor: {e}")
+                    matrices[feature_names] = X
+
+                efforts = np.asarray(model.predict(matrices[feature_names]), dtype=float).reshape(-1)
+                if len(efforts) != len(rows):
+                    raise ValueError(f"Model returned {len(efforts)} predictions for {len(rows)} projects")
+
+                invalid = (efforts <= 0) | np.isnan(efforts) | np.isinf(efforts)
+                results[requested_name] = np.where(invalid, fallback, efforts).tolist()
+            except Exception as e:
+                print(f"Error estimating batch with ML model {model_name}: {e}")
+                # Giữ nguyên hành vi của đường vô hướng cho từng dự án
+                results[requested_name] = [
+                    self.estimate_from_ml_model(dict(row), requested_name) for row in rows
+                ]
+
+        return results
+
+    def estimate_from_ml_model_batch(self, features, model_name="Random_Forest"):
+        """
+        Phiên bản batch của estimate_from_ml_model cho một mô hình
+
+        Returns:
+            list: Nỗ lực ước lượng (người-tháng) cho từng dự án
+        """
+        return self.estimate_batch_from_ml_models(features, [model_name])[model_name]
+
+    def get_analyzer(self):
+        """RequirementAnalyzer dùng chung cho mọi request (khởi tạo một lần, thread-safe)"""
+        if self.analyzer is None:
+            with self._analyzer_lock:
+                if self.analyzer is None:
+                    from .analyzer import RequirementAnalyzer
+                    self.analyzer = RequirementAnalyzer()
+        return self.analyzer
+    
     def integrated_estimate(self, text_input, advanced_params=None):
         """
         Tích hợp ước lượng từ tất cả các mô hình
         
+        Reentrant: không thay đổi trạng thái của estimator, nên có thể gọi
+        song song từ nhiều thread trên cùng một instance.
+        
         Args:
             text_input (str or dict): Văn bản yêu cầu đầu vào hoặc từ điển tham số đã trích xuất
             advanced_params (dict, optional): Các tham số nâng cao từ người dùng
@@ -442,14 +590,15 @@ class EffortEstimator:
                     extracted_params = text_input
             else:
                 # Phân tích văn bản và trích xuất các tham số
-                from .analyzer import RequirementAnalyzer
-                self.analyzer = RequirementAnalyzer()
-                extracted_params = self.analyzer.extract_parameters(text_input)
+                extracted_params = self.get_analyzer().extract_parameters(text_input)
                 print(f"Extracted parameters from text: {list(extracted_params.keys())}")
             
             # Kết hợp các tham số nâng cao từ người dùng nếu có
             if advanced_params:
                 # If method is provided in advanced_params, extract it but don't add to extracted_params
+                # (works on a copy so the caller's dict is left untouched)
+                if isinstance(advanced_params, dict):
+                    advanced_params = dict(advanced_params)
                 method = advanced_params.pop('method', 'weighted_average') if isinstance(advanced_params, dict) else 'weighted_average'
                 # Add remaining parameters
                 if isinstance(advanced_params, dict) and advanced_params:
@@ -475,23 +624,23 @@ class EffortEstimator:
                 
                 extracted_params['loc_random_forest'] = extracted_params['loc_linear'].copy()
             
-            # Thực hiện ước lượng LOC động nếu mô hình LOC được kích hoạt
+            # Ước lượng LOC động cho request này (truyền xuống qua loc_estimates,
+            # không gán đè estimate của mô hình dùng chung)
+            loc_estimates = {}
             if 'loc_linear' in self.models:
                 try:
-                    linear_est = self._dynamic_loc_estimate(extracted_params['loc_linear'], 'linear')
-                    self.models['loc_linear'].estimate = lambda project_data: {'effort_pm': linear_est}
+                    loc_estimates['loc_linear'] = self._dynamic_loc_estimate(extracted_params['loc_linear'], 'linear')
                 except Exception as e:
                     print(f"Error estimating with LOC Linear model: {e}")
                 
             if 'loc_random_forest' in self.models:
                 try:
-                    rf_est = self._dynamic_loc_estimate(extracted_params['loc_random_forest'], 'random_forest')
-                    self.models['loc_random_forest'].estimate = lambda project_data: {'effort_pm': rf_est}
+                    loc_estimates['loc_random_forest'] = self._dynamic_loc_estimate(extracted_params['loc_random_forest'], 'random_forest')
                 except Exception as e:
                     print(f"Error estimating with LOC Random Forest model: {e}")
             
             # Chuyển sang phương thức cũ
-            return self._integrated_estimate(extracted_params, method=method)
+            return self._integrated_estimate(extracted_params, method=method, loc_estimates=loc_estimates)
             
         except Exception as e:
             print(f"Error in integrated estimate: {e}")
@@ -502,13 +651,15 @@ class EffortEstimator:
                 "error": str(e)
             }
             
-    def _integrated_estimate(self, all_params, method="weighted_average"):
+    def _integrated_estimate(self, all_params, method="weighted_average", loc_estimates=None):
         """
         Ước lượng nỗ lực sử dụng tích hợp đa mô hình
         
         Args:
             all_params (dict): Các tham số cho tất cả các mô hình
             method (str): Phương pháp tích hợp
+            loc_estimates (dict, optional): Ước lượng LOC đã tính cho request này
+                ({'loc_linear': ..., 'loc_random_forest': ...}), ưu tiên hơn mô hình LOC
             
         Returns:
             dict: Kết quả ước lượng tích hợp
@@ -523,6 +674,8 @@ class EffortEstimator:
                 print(f"Error: all_params is not a dictionary, got {type(all_params)}")
                 raise ValueError(f"all_params must be a dictionary, got {type(all_params)}")
             
+            loc_estimates = loc_estimates or {}
+            
             # Initialize estimates dictionary and model_results for more detailed info
             estimates = {}
             model_results = {}
@@ -570,7 +723,9 @@ class EffortEstimator:
             # Get LOC Linear estimate if parameters are available
             if 'loc_linear' in all_params:
                 try:
-                    if 'loc_linear' in self.models:
+                    if 'loc_linear' in loc_estimates:
+                        loc_linear_estimate = loc_estimates['loc_linear']
+                    elif 'loc_linear' in self.models:
                         print("LOC Linear model exists, calling estimate")
                         # Sử dụng estimate method của mô hình
                         result = self.models['loc_linear'].estimate(all_params['loc_linear'])
@@ -595,7 +750,9 @@ class EffortEstimator:
             # Get LOC Random Forest estimate if parameters are available
             if 'loc_random_forest' in all_params:
                 try:
-                    if 'loc_random_forest' in self.models:
+                    if 'loc_random_forest' in loc_estimates:
+                        loc_rf_estimate = loc_estimates['loc_random_forest']
+                    elif 'loc_random_forest' in self.models:
                         print("LOC Random Forest model exists, calling estimate")
                         # Sử dụng estimate method của mô hình
                         result = self.models['loc_random_forest'].estimate(all_params['loc_random_forest'])
@@ -854,9 +1011,9 @@ class EffortEstimator:
                 elif lang in ['assembly', 'c']:
                     lang_factor = 1.5
             
-            # Biến động ngẫu nhiên để tránh giá trị cố định
-            import random
-            random_factor = 0.95 + 0.1 * random.random()  # 0.95 to 1.05
+            # Biến động nhỏ để tránh giá trị cố định; lấy từ chính tham số nên
+            # cùng đầu vào luôn cho cùng kết quả (không dùng trạng thái random toàn cục)
+            random_factor = 0.95 + 0.1 * self._stable_jitter(params, model_type)  # 0.95 to 1.05
             
             # Tính toán nỗ lực với các hệ số mới
             effort = a * (adjusted_kloc ** b) * eaf * random_factor * size_factor * lang_factor
@@ -878,6 +1035,13 @@ class EffortEstimator:
             print(f"Error in dynamic LOC estimation: {e}")
             return 2.5 * (params.get('kloc', 5.0) ** 1.06)  # Công thức dự phòng
     
+    @staticmethod
+    def _stable_jitter(params, model_type):
+        """Số trong [0, 1) xác định theo tham số và loại mô hình"""
+        key = json.dumps(params, sort_keys=True, default=str) + model_type
+        digest = hashlib.sha256(key.encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big') / 2 ** 64
+    
     def _calculate_confidence_level(self, estimates):
         """Tính toán mức độ tin cậy dựa trên sự khác biệt giữa các ước lượng"""
         try:
@@ -1146,11 +1310,8 @@ class EffortEstimator:
             dict: Kết quả ước lượng và phân tích
         """
         try:
-            from .analyzer import RequirementAnalyzer
-            
-            # Phân tích yêu cầu
-            analyzer = RequirementAnalyzer()
-            all_params = analyzer.analyze_requirements_document(text)
+            # Phân tích yêu cầu (analyzer dùng chung)
+            all_params = self.get_analyzer().analyze_requirements_document(text)
             
             # Ước lượng nỗ lực
             try:
@@ -2,11 +2,19 @@
 Ingestion Package
 Extract and process text from files
 """
-from .extract_text import extract_text, extract_text_from_txt, extract_text_from_docx, extract_text_from_pdf
+from .extract_text import (
+    extract_text, extract_text_from_txt, extract_text_from_docx, extract_text_from_pdf,
+    iter_pdf_pages, iter_text, spool_upload, available_pdf_backends, shutdown_pdf_executor,
+)
 
 __all__ = [
     'extract_text',
     'extract_text_from_txt',
     'extract_text_from_docx',
     'extract_text_from_pdf',
+    'iter_pdf_pages',
+    'iter_text',
+    'spool_upload',
+    'available_pdf_backends',
+    'shutdown_pdf_executor',
 ]
@@ -1,13 +1,35 @@
 """
 File Text Extraction Module
 Extract text from various file formats (txt, docx, pdf)
+
+Large PDFs are extracted in parallel over page ranges (process pool) and can
+be consumed page by page with iter_pdf_pages(); uploads can be spooled to a
+temp file with spool_upload() so they never sit in memory as one bytes object.
 """
 import io
-from typing import Optional
+import os
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from importlib.util import find_spec
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+PdfSource = Union[bytes, str, Path]
+
+# PDF libraries in order of preference (import name)
+PDF_BACKENDS = ("fitz", "pdfplumber", "PyPDF2")
+
+# Below this many pages the process pool costs more than it saves
+PARALLEL_MIN_PAGES = 16
+PAGES_PER_TASK = 8
+
 
 def extract_text_from_txt(file_bytes: bytes) -> str:
     """
@@ -70,7 +92,7 @@ def extract_text_from_docx(file_bytes: bytes) -> str:
         return ""
 
 
-def extract_text_from_pdf(file_bytes: bytes) -> str:
+def extract_text_from_pdf(file_bytes: PdfSource) -> str:
     """
     Extract text from PDF files
     
@@ -80,67 +102,211 @@ def extract_text_from_pdf(file_bytes: bytes) -> str:
     3. PyPDF2 - fallback
     
     Args:
-        file_bytes: File content as bytes
+        file_bytes: File content as bytes, or a path to the file
         
     Returns:
-        Extracted text string
+        Extracted text string (non-empty pages joined by blank lines)
     """
-    # Try pymupdf (fitz) first
-    try:
-        import fitz  # PyMuPDF
-        
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-        text_parts = []
-        
-        for page in doc:
-            text_parts.append(page.get_text())
-        
-        doc.close()
-        return '\n\n'.join(text_parts)
+    return '\n\n'.join(text for _, text in iter_pdf_pages(file_bytes) if text)
+
+
+def available_pdf_backends() -> List[str]:
+    """Installed PDF libraries, in order of preference"""
+    return [name for name in PDF_BACKENDS if find_spec(name) is not None]
+
+
+def iter_pdf_pages(
+    source: PdfSource,
+    max_workers: Optional[int] = None,
+    pages_per_task: int = PAGES_PER_TASK,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page_index, text) in page order as soon as each page range is done
     
-    except ImportError:
-        logger.debug("pymupdf not available, trying pdfplumber...")
-    except Exception as e:
-        logger.warning(f"pymupdf extraction failed: {e}")
+    Page ranges of `pages_per_task` pages are extracted in a process pool
+    (PDF_EXTRACT_WORKERS, default min(4, cpu count)); at most two ranges per
+    worker are in flight, so memory stays bounded and the consumer (e.g.
+    segmentation) can start before the last page is extracted. Documents
+    under PARALLEL_MIN_PAGES pages, or max_workers=1, run in-process.
     
-    # Try pdfplumber
-    try:
-        import pdfplumber
+    Each range falls back pymupdf → pdfplumber → PyPDF2 on its own; a range
+    no library can read yields empty pages.
+    """
+    backends = available_pdf_backends()
+    if not backends:
+        logger.error("No PDF library available. Install with: pip install pymupdf pdfplumber PyPDF2")
+        return
+    
+    with _as_file(source, ".pdf") as path:
+        page_count = _pdf_page_count(path, backends)
+        if not page_count:
+            return
         
-        text_parts = []
-        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+        workers = max_workers or _default_pdf_workers()
+        if workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+            yield from enumerate(_iter_pdf_range(path, 0, page_count, backends))
+            return
         
-        return '\n\n'.join(text_parts)
-    
-    except ImportError:
-        logger.debug("pdfplumber not available, trying PyPDF2...")
-    except Exception as e:
-        logger.warning(f"pdfplumber extraction failed: {e}")
-    
-    # Fallback to PyPDF2
+        ranges = [(start, min(start + pages_per_task, page_count))
+                  for start in range(0, page_count, pages_per_task)]
+        executor = _get_pdf_executor(workers)
+        pending = deque()
+        next_range = 0
+        try:
+            while pending or next_range < len(ranges):
+                while next_range < len(ranges) and len(pending) < 2 * workers:
+                    start, stop = ranges[next_range]
+                    pending.append((start, executor.submit(_extract_pdf_range, path, start, stop, backends)))
+                    next_range += 1
+                start, future = pending.popleft()
+                for offset, text in enumerate(future.result()):
+                    yield start + offset, text
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _open_pymupdf(path: str):
     try:
+        import pymupdf
+    except ImportError:
+        import fitz as pymupdf  # PyMuPDF < 1.24
+    return pymupdf.open(path)
+
+
+def _pdf_page_count(path: str, backends: List[str]) -> int:
+    for backend in backends:
+        try:
+            if backend == "fitz":
+                with _open_pymupdf(path) as doc:
+                    return doc.page_count
+            if backend == "pdfplumber":
+                import pdfplumber
+                with pdfplumber.open(path) as pdf:
+                    return len(pdf.pages)
+            from PyPDF2 import PdfReader
+            return len(PdfReader(path).pages)
+        except Exception as e:
+            logger.warning(f"{backend} could not open PDF: {e}")
+    return 0
+
+
+def _read_pdf_pages(backend: str, path: str, start: int, stop: int) -> Iterator[str]:
+    if backend == "fitz":
+        with _open_pymupdf(path) as doc:
+            for i in range(start, stop):
+                yield doc[i].get_text()
+    elif backend == "pdfplumber":
+        import pdfplumber
+        with pdfplumber.open(path) as pdf:
+            for i in range(start, stop):
+                yield pdf.pages[i].extract_text() or ""
+    else:
         from PyPDF2 import PdfReader
-        
-        reader = PdfReader(io.BytesIO(file_bytes))
-        text_parts = []
-        
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-        
-        return '\n\n'.join(text_parts)
+        reader = PdfReader(path)
+        for i in range(start, stop):
+            yield reader.pages[i].extract_text() or ""
+
+
+def _iter_pdf_range(path: str, start: int, stop: int, backends: List[str]) -> Iterator[str]:
+    """
+    Pages [start, stop) of the PDF at `path`, one document open per backend;
+    if a library fails, the next one resumes at the failing page
+    """
+    page = start
+    for backend in backends:
+        try:
+            for text in _read_pdf_pages(backend, path, page, stop):
+                yield text
+                page += 1
+            return
+        except Exception as e:
+            logger.warning(f"{backend} extraction failed at page {page}: {e}")
+    for _ in range(page, stop):
+        yield ""
+
+
+def _extract_pdf_range(path: str, start: int, stop: int, backends: List[str]) -> List[str]:
+    """Worker-process entry point for one page range"""
+    return list(_iter_pdf_range(path, start, stop, backends))
+
+
+def _default_pdf_workers() -> int:
+    return int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+_pdf_executor_workers = 0
+_pdf_executor_lock = threading.Lock()
+
+
+def _get_pdf_executor(workers: int) -> ProcessPoolExecutor:
+    """Shared process pool (recreated if a different size is requested)"""
+    global _pdf_executor, _pdf_executor_workers
+    with _pdf_executor_lock:
+        if _pdf_executor is None or _pdf_executor_workers != workers:
+            if _pdf_executor is not None:
+                _pdf_executor.shutdown(wait=False)
+            _pdf_executor = ProcessPoolExecutor(max_workers=workers)
+            _pdf_executor_workers = workers
+        return _pdf_executor
+
+
+def shutdown_pdf_executor():
+    """Stop the PDF worker processes (call from the app shutdown hook)"""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is not None:
+            _pdf_executor.shutdown(wait=True)
+            _pdf_executor = None
+
+
+@contextmanager
+def _as_file(source: PdfSource, suffix: str) -> Iterator[str]:
+    """Path for `source`; bytes are written to a temp file removed on exit"""
+    if isinstance(source, (str, Path)):
+        yield str(source)
+        return
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(source)
+        yield path
+    finally:
+        os.unlink(path)
+
+
+def spool_upload(fileobj: BinaryIO, suffix: str = "", chunk_size: int = 1024 * 1024) -> str:
+    """
+    Copy an uploaded file object to a named temp file in chunks
     
-    except ImportError:
-        logger.error("No PDF library available. Install with: pip install pymupdf pdfplumber PyPDF2")
-        return ""
-    except Exception as e:
-        logger.error(f"PyPDF2 extraction failed: {e}")
-        return ""
+    Returns:
+        Path of the temp file (the caller deletes it)
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            fileobj.seek(0)
+            shutil.copyfileobj(fileobj, out, chunk_size)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def iter_text(filename: str, source: PdfSource) -> Iterator[str]:
+    """
+    Like extract_text, but yields the text in pieces as they are extracted
+    (one per PDF page; txt/md/docx files are yielded whole)
+    """
+    if filename.lower().endswith('.pdf'):
+        for _, text in iter_pdf_pages(source):
+            if text:
+                yield text
+        return
+    if isinstance(source, (str, Path)):
+        source = Path(source).read_bytes()
+    yield extract_text(filename, source)
 
 
 def extract_text(filename: str, file_bytes: bytes) -> str:
@@ -4,42 +4,22 @@ software specification details for effort estimation
 """
 
 import re
-import nltk
-import numpy as np
-import pandas as pd
-import spacy
 import joblib
 import os
-import torch
-from transformers import AutoTokenizer, AutoModel, pipeline
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import classification_report, accuracy_score
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 
-# Download NLTK resources if needed
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
+    from .nlp_resources import (
+        ensure_nltk_resources, get_spacy,
+        sent_tokenize, word_tokenize,
+    )
+except ImportError:
+    from nlp_resources import (
+        ensure_nltk_resources, get_spacy,
+        sent_tokenize, word_tokenize,
+    )
 
-# Load spaCy model for NER
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    os.system("python -m spacy download en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+# spaCy, transformers, sklearn và pandas được import ở nơi dùng; dữ liệu
+# NLTK và model spaCy nạp ở lần dùng đầu tiên, không tải gì lúc import.
 
 class MLRequirementAnalyzer:
     """
@@ -54,12 +34,18 @@ class MLRequirementAnalyzer:
         Args:
             model_path (str): Path to pre-trained models directory
         """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+        ensure_nltk_resources()
         self.lemmatizer = WordNetLemmatizer()
         self.stop_words = set(stopwords.words('english'))
         self.vectorizer = TfidfVectorizer(max_features=1000)
         
         # Initialize transformer models for advanced NLP tasks
         try:
+            from transformers import AutoTokenizer, AutoModel, pipeline
+            
             # For relevance classification
             self.relevance_tokenizer = AutoTokenizer.from_pretrained("distilbert-base-uncased")
             self.relevance_model = AutoModel.from_pretrained("distilbert-base-uncased")
@@ -125,6 +111,7 @@ class MLRequirementAnalyzer:
             
             elif path.endswith('.csv'):
                 # Process CSV files
+                import pandas as pd
                 df = pd.read_csv(path)
                 if 'Requirement' in df.columns and 'Class' in df.columns:
                     for _, row in df.iterrows():
@@ -139,6 +126,10 @@ class MLRequirementAnalyzer:
         # Convert to TF-IDF features
         X_tfidf = self.vectorizer.fit_transform(X_processed)
         
+        from sklearn.model_selection import train_test_split
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.metrics import classification_report, accuracy_score
+        
         # Split into training and testing sets
         X_train, X_test, y_train, y_test = train_test_split(
             X_tfidf, y, test_size=0.2, random_state=42
@@ -179,6 +170,7 @@ class MLRequirementAnalyzer:
         
         for path in data_paths:
             if path.endswith('.csv'):
+                import pandas as pd
                 df = pd.read_csv(path)
                 if 'Requirement' in df.columns and 'Class' in df.columns:
                     for _, row in df.iterrows():
@@ -198,6 +190,10 @@ class MLRequirementAnalyzer:
         # Convert to TF-IDF features
         X_tfidf = self.vectorizer.fit_transform(X_processed)
         
+        from sklearn.model_selection import train_test_split
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.metrics import accuracy_score
+        
         # Split into training and testing sets
         X_train, X_test, y_train, y_test = train_test_split(
             X_tfidf, y_encoded, test_size=0.2, random_state=42
@@ -328,7 +324,7 @@ class MLRequirementAnalyzer:
             return True
             
         # Check for verb-noun structure using spaCy
-        doc = nlp(sentence)
+        doc = get_spacy()(sentence)
         has_verb = any(token.pos_ == "VERB" for token in doc)
         has_noun = any(token.pos_ == "NOUN" for token in doc)
         
@@ -424,7 +420,7 @@ class MLRequirementAnalyzer:
             complexity_from_sentiment = 2.0  # Default medium complexity
         
         # Analyze sentence structure
-        doc = nlp(sentence)
+        doc = get_spacy()(sentence)
         
         # Count technical terms and entities
         technical_terms = len([token for token in doc if token.pos_ == "NOUN" and len(token.text) > 4])
@@ -472,7 +468,7 @@ class MLRequirementAnalyzer:
         avg_complexity = sum(requirement_complexities) / max(1, len(requirement_complexities))
         
         # Extract entities and technical terms
-        doc = nlp(text)
+        doc = get_spacy()(text)
         entities = [ent.text for ent in doc.ents]
         num_entities = len(set(entities))
         
@@ -743,7 +739,7 @@ class MLRequirementAnalyzer:
         requirements = self.extract_requirements(text)
         
         # Identify actors from text using NER
-        doc = nlp(text)
+        doc = get_spacy()(text)
         actors = set()
         for ent in doc.ents:
             if ent.label_ in ["PERSON", "ORG"]:
@@ -961,7 +957,7 @@ class MLRequirementAnalyzer:
         ucp_params = self.extract_use_case_points_parameters(text)
         
         # Additional linguistic features
-        doc = nlp(text)
+        doc = get_spacy()(text)
         
         # Count verbs, nouns, adjectives (indicators of complexity)
         num_verbs = len([token for token in doc if token.pos_ == "VERB"])
@@ -0,0 +1,138 @@
+"""
+Nạp lười (lazy) các tài nguyên NLP nặng: dữ liệu NLTK và model spaCy
+
+Không có gì được tải hay tải xuống lúc import module. Tài nguyên được nạp ở
+lần dùng đầu tiên (hoặc qua warm_up() khi khởi động worker) và dùng chung
+cho cả tiến trình. Việc tải xuống qua mạng chỉ xảy ra khi biến môi trường
+RA_ALLOW_NLP_DOWNLOADS khác "0"; đặt "0" trên worker không có mạng để
+dùng ngay phương án dự phòng (spacy.blank / tokenizer đơn giản).
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+NLTK_RESOURCES = [
+    ('tokenizers/punkt', 'punkt'),
+    ('tokenizers/punkt_tab', 'punkt_tab'),
+    ('corpora/stopwords', 'stopwords'),
+    ('corpora/wordnet', 'wordnet'),
+]
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+_lock = threading.Lock()
+_nltk_ready = False
+_spacy_models = {}
+
+
+def downloads_allowed():
+    """Có được phép tải dữ liệu/model qua mạng hay không"""
+    return os.getenv("RA_ALLOW_NLP_DOWNLOADS", "1") != "0"
+
+
+def ensure_nltk_data(resource_name, download_name=None):
+    """Safely download NLTK data if not available"""
+    import nltk
+    if download_name is None:
+        download_name = resource_name.split('/')[-1]
+    try:
+        nltk.data.find(resource_name)
+    except (LookupError, OSError):
+        if downloads_allowed():
+            nltk.download(download_name, quiet=True)
+        else:
+            logger.warning("NLTK resource %s missing and downloads are disabled", resource_name)
+
+
+def ensure_nltk_resources():
+    """Đảm bảo các tài nguyên NLTK cần thiết có sẵn (chỉ kiểm tra một lần)"""
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    with _lock:
+        if not _nltk_ready:
+            for resource_name, download_name in NLTK_RESOURCES:
+                ensure_nltk_data(resource_name, download_name)
+            _nltk_ready = True
+
+
+def word_tokenize(text, *args, **kwargs):
+    """nltk.word_tokenize, import nltk ở lần gọi đầu (import nltk mất ~2s)"""
+    from nltk.tokenize import word_tokenize as _word_tokenize
+    return _word_tokenize(text, *args, **kwargs)
+
+
+def sent_tokenize(text, *args, **kwargs):
+    """nltk.sent_tokenize, import nltk ở lần gọi đầu"""
+    from nltk.tokenize import sent_tokenize as _sent_tokenize
+    return _sent_tokenize(text, *args, **kwargs)
+
+
+def _load_spacy(model_name):
+    try:
+        import spacy
+    except ImportError:
+        print("Warning: spaCy not available, using basic text processing")
+        return None
+    try:
+        nlp = spacy.load(model_name)
+        print(f"Loaded spaCy model: {model_name}")
+        return nlp
+    except OSError:
+        pass
+    if downloads_allowed():
+        try:
+            subprocess.run([sys.executable, "-m", "spacy", "download", model_name],
+                           check=True, capture_output=True)
+            nlp = spacy.load(model_name)
+            print(f"Downloaded and loaded spaCy model: {model_name}")
+            return nlp
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("Could not download spaCy model %s: %s", model_name, e)
+    try:
+        nlp = spacy.blank(model_name.split("_")[0])
+        print("Using blank English spaCy model (no NER)")
+        return nlp
+    except Exception:
+        print("Warning: spaCy not available, using basic text processing")
+        return None
+
+
+def get_spacy(model_name=DEFAULT_SPACY_MODEL):
+    """
+    Model spaCy dùng chung, nạp ở lần gọi đầu tiên
+
+    Thứ tự dự phòng giữ như cũ: spacy.load → tải model → spacy.blank → None.
+    """
+    if model_name in _spacy_models:
+        return _spacy_models[model_name]
+    with _lock:
+        if model_name not in _spacy_models:
+            _spacy_models[model_name] = _load_spacy(model_name)
+        return _spacy_models[model_name]
+
+
+def warm_up(spacy_models=(DEFAULT_SPACY_MODEL,)):
+    """
+    Nạp trước dữ liệu NLTK và các model spaCy; trả về thời gian nạp (giây)
+
+    Gọi từ hook khởi động của worker để request đầu tiên không phải chờ.
+    """
+    timings = {}
+    start = time.perf_counter()
+    try:
+        ensure_nltk_resources()
+    except ImportError as e:
+        logger.warning("NLTK not available: %s", e)
+    timings["nltk"] = round(time.perf_counter() - start, 3)
+    for model_name in spacy_models:
+        start = time.perf_counter()
+        get_spacy(model_name)
+        timings[f"spacy:{model_name}"] = round(time.perf_counter() - start, 3)
+    return timings
@@ -1852,6 +1852,44 @@ async def analyze_file_detailed_v3(file: UploadFile = File(...), max_tests: int
 
 # ===== PYTEST EXPORT ENDPOINTS =====
 
+def _generate_v3_test_data(file_content: bytes, file_type: str, max_tests: int):
+    """
+    Parse an upload and run AITestCaseGeneratorV3, reusing a cached result
+    when the same content was already generated with the same max_tests.
+    Returns None when the file contains no requirements.
+    """
+    from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
+    from requirement_analyzer.task_gen.export_cache import get_export_cache
+
+    def generate():
+        parser = RequirementFileParser()
+        if file_type == 'docx':
+            requirements = parser.parse_file(None, file_type, binary_content=file_content)
+        else:
+            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
+
+        if not requirements:
+            return None
+
+        generator = AITestCaseGeneratorV3()
+        return generator.generate(requirements, max_test_cases_per_req=max_tests)
+
+    return get_export_cache().get_or_generate(
+        file_content, file_type, AITestCaseGeneratorV3.VERSION, max_tests, generate
+    )
+
+
+@router.get("/api/v3/test-generation/cache-stats")
+async def get_export_cache_stats():
+    """Hit/miss counters and size of the export result cache"""
+    from requirement_analyzer.task_gen.export_cache import get_export_cache
+
+    return {
+        "status": "success",
+        "cache": get_export_cache().get_stats()
+    }
+
+
 @router.post("/api/v3/test-generation/export-pytest")
 async def export_pytest_code(file: UploadFile = File(...), max_tests: int = 8):
     """
@@ -1859,7 +1897,6 @@ async def export_pytest_code(file: UploadFile = File(...), max_tests: int = 8):
     Returns Python file with all test cases ready to run
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.pytest_export_generator import PytestExportGenerator
         from fastapi.responses import FileResponse
         import os
@@ -1873,22 +1910,14 @@ async def export_pytest_code(file: UploadFile = File(...), max_tests: int = 8):
         if file_type not in supported_types:
             raise ValueError(f"Unsupported file type: .{file_type}")
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             return JSONResponse(
                 {"status": "error", "message": "No requirements found"},
                 status_code=400
             )
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Export to pytest
         exporter = PytestExportGenerator(test_data)
         pytest_code = exporter.generate_pytest_file()
@@ -1924,7 +1953,6 @@ async def export_gherkin_code(file: UploadFile = File(...), max_tests: int = 8):
     Returns feature file for Cucumber/BDD frameworks
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.pytest_export_generator import PytestExportGenerator
         from fastapi.responses import FileResponse
         import tempfile
@@ -1933,22 +1961,14 @@ async def export_gherkin_code(file: UploadFile = File(...), max_tests: int = 8):
         file_content = await file.read()
         file_type = file.filename.split('.')[-1].lower()
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             return JSONResponse(
                 {"status": "error", "message": "No requirements found"},
                 status_code=400
             )
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Export to Gherkin
         exporter = PytestExportGenerator(test_data)
         gherkin_code = exporter.export_gherkin_file()
@@ -1984,7 +2004,6 @@ async def export_rtm_matrix(file: UploadFile = File(...), max_tests: int = 8):
     Returns CSV file showing requirement-to-test mapping
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.pytest_export_generator import PytestExportGenerator
         from fastapi.responses import FileResponse
         import tempfile
@@ -1993,22 +2012,14 @@ async def export_rtm_matrix(file: UploadFile = File(...), max_tests: int = 8):
         file_content = await file.read()
         file_type = file.filename.split('.')[-1].lower()
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             return JSONResponse(
                 {"status": "error", "message": "No requirements found"},
                 status_code=400
             )
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Export to RTM
         exporter = PytestExportGenerator(test_data)
         rtm_csv = exporter.export_rtm_csv()
@@ -2044,7 +2055,6 @@ async def export_json_detailed(file: UploadFile = File(...), max_tests: int = 8)
     Returns complete JSON with all test case details
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.pytest_export_generator import PytestExportGenerator
         from fastapi.responses import FileResponse
         import tempfile
@@ -2053,22 +2063,14 @@ async def export_json_detailed(file: UploadFile = File(...), max_tests: int = 8)
         file_content = await file.read()
         file_type = file.filename.split('.')[-1].lower()
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             return JSONResponse(
                 {"status": "error", "message": "No requirements found"},
                 status_code=400
             )
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Export to JSON
         exporter = PytestExportGenerator(test_data)
         json_data = exporter.export_json_detailed()
@@ -2104,29 +2106,20 @@ async def get_export_statistics(file: UploadFile = File(...), max_tests: int = 8
     Useful for planning and CI/CD integration
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.pytest_export_generator import PytestExportGenerator
         
         # Parse file
         file_content = await file.read()
         file_type = file.filename.split('.')[-1].lower()
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             return JSONResponse(
                 {"status": "error", "message": "No requirements found"},
                 status_code=400
             )
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Get statistics
         exporter = PytestExportGenerator(test_data)
         stats = exporter.get_statistics()
@@ -2155,7 +2148,6 @@ async def export_html_report(file: UploadFile = File(...), max_tests: int = 8):
     Export test cases as interactive HTML report with charts and visualizations
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.report_generator import ReportGenerator
         from fastapi.responses import FileResponse
         import tempfile
@@ -2172,19 +2164,11 @@ async def export_html_report(file: UploadFile = File(...), max_tests: int = 8):
             
         file_type = file.filename.split('.')[-1].lower()
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             raise ValueError("No requirements found in file")
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Generate HTML report
         report_gen = ReportGenerator(test_data)
         html_content = report_gen.generate_html_report()
@@ -2226,7 +2210,6 @@ async def export_pdf_report(file: UploadFile = File(...), max_tests: int = 8):
     Professional format suitable for stakeholder review
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.report_generator import ReportGenerator
         from fastapi.responses import FileResponse
         
@@ -2234,22 +2217,14 @@ async def export_pdf_report(file: UploadFile = File(...), max_tests: int = 8):
         file_content = await file.read()
         file_type = file.filename.split('.')[-1].lower()
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             return JSONResponse(
                 {"status": "error", "message": "No requirements found"},
                 status_code=400
             )
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Generate PDF report
         report_gen = ReportGenerator(test_data)
         pdf_content = report_gen.generate_pdf_report()
@@ -2287,7 +2262,6 @@ async def export_report_statistics(file: UploadFile = File(...), max_tests: int
     Includes quality scores, recommendations, and detailed metrics
     """
     try:
-        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
         from requirement_analyzer.task_gen.report_generator import ReportGenerator
         import json
         
@@ -2295,22 +2269,14 @@ async def export_report_statistics(file: UploadFile = File(...), max_tests: int
         file_content = await file.read()
         file_type = file.filename.split('.')[-1].lower()
         
-        parser = RequirementFileParser()
-        if file_type == 'docx':
-            requirements = parser.parse_file(None, file_type, binary_content=file_content)
-        else:
-            requirements = parser.parse_file(file_content.decode('utf-8'), file_type)
-        
-        if not requirements:
+        # Generate test cases (cached per upload content + max_tests)
+        test_data = _generate_v3_test_data(file_content, file_type, max_tests)
+        if test_data is None:
             return JSONResponse(
                 {"status": "error", "message": "No requirements found"},
                 status_code=400
             )
         
-        # Generate test cases
-        generator = AITestCaseGeneratorV3()
-        test_data = generator.generate(requirements, max_test_cases_per_req=max_tests)
-        
         # Generate statistics
         report_gen = ReportGenerator(test_data)
         stats_json = report_gen.export_statistics_json()
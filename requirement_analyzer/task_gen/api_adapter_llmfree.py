@@ -5,6 +5,7 @@ Direct integration of structured intent extraction + domain-specific test genera
 import sys
 import json
 import time
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -29,6 +30,7 @@ class LLMFreeAPIAdapter:
         Args:
             custom_extractor: Optional custom RequirementExtractor instance with user's AI model
         """
+        self.custom_extractor = custom_extractor
         extractor = custom_extractor or MockRequirementExtractor()
         self.pipeline = TestGenerationPipeline(extractor=extractor)
         self.generated_count = 0
@@ -116,8 +118,7 @@ class LLMFreeAPIAdapter:
                 domain = test.get('domain', 'general')
                 domain_types[domain] = domain_types.get(domain, 0) + 1
             
-            self.generated_count += len(final_tests)
-            self.last_quality = avg_confidence
+            self.record_generation(len(final_tests), avg_confidence)
             
             return {
                 'status': 'success',
@@ -161,6 +162,11 @@ class LLMFreeAPIAdapter:
                 'system': 'llm-free-ai'
             }
     
+    def record_generation(self, num_tests: int, avg_confidence: float):
+        """Update usage counters (also used for results produced by executor workers)"""
+        self.generated_count += num_tests
+        self.last_quality = avg_confidence
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get usage statistics"""
         return {
@@ -183,6 +189,52 @@ def get_llmfree_adapter(custom_extractor=None) -> LLMFreeAPIAdapter:
     return _adapter
 
 
+# ============================================================================
+# EXECUTOR ENTRY POINTS - run generation off the event loop
+# ============================================================================
+_worker_local = threading.local()
+
+
+def generate_tests_in_worker(custom_extractor=None, **kwargs) -> Dict[str, Any]:
+    """
+    Executor job: each worker thread/process keeps its own adapter,
+    so concurrent requests never share pipeline state
+
+    custom_extractor is the shared adapter's extractor, so workers build
+    the same pipeline as the sequential path (it must be picklable when
+    the executor runs in "process" mode).
+    """
+    adapter = getattr(_worker_local, 'adapter', None)
+    if adapter is None:
+        adapter = LLMFreeAPIAdapter(custom_extractor=custom_extractor)
+        _worker_local.adapter = adapter
+    return adapter.generate_tests(**kwargs)
+
+
+async def generate_tests_async(**kwargs) -> Dict[str, Any]:
+    """
+    Run LLMFreeAPIAdapter.generate_tests in the bounded generation executor
+    
+    Adds an 'execution' block (queue_wait_ms, run_ms, executor, queue_depth)
+    to the result. Raises GenerationQueueFull / GenerationTimeout.
+    """
+    from requirement_analyzer.task_gen.generation_executor import get_generation_executor
+    
+    adapter = get_llmfree_adapter()
+    result, execution = await get_generation_executor().run(
+        generate_tests_in_worker, custom_extractor=adapter.custom_extractor, **kwargs
+    )
+    
+    if result.get('status') == 'success':
+        summary = result.get('summary', {})
+        adapter.record_generation(
+            summary.get('unique_tests_final', 0),
+            summary.get('avg_confidence', 0.5)
+        )
+    result['execution'] = execution
+    return result
+
+
 # ============================================================================
 # FASTAPI ROUTER - For API exposure
 # ============================================================================
@@ -221,6 +273,7 @@ class GenerateTestsResponse(BaseModel):
     summary: Dict[str, Any]
     generated_at: str
     system: str = "llm-free-ai"
+    execution: Optional[Dict[str, Any]] = None
 
 
 # Create router with correct prefix
@@ -249,9 +302,10 @@ async def generate_tests_endpoint(request: GenerateTestsRequest):
     }
     ```
     """
+    from requirement_analyzer.task_gen.generation_executor import GenerationQueueFull, GenerationTimeout
+    
     try:
-        adapter = get_llmfree_adapter()
-        result = adapter.generate_tests(
+        result = await generate_tests_async(
             requirements_text=request.requirements,
             max_tests=request.max_tests,
             quality_threshold=request.quality_threshold,
@@ -265,7 +319,13 @@ async def generate_tests_endpoint(request: GenerateTestsRequest):
             )
         
         return result
-        
+    
+    except HTTPException:
+        raise
+    except GenerationQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except GenerationTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -278,8 +338,12 @@ async def generate_tests_endpoint(request: GenerateTestsRequest):
 @router.get("/stats")
 async def get_stats():
     """Get test generation statistics"""
+    from requirement_analyzer.task_gen.generation_executor import get_generation_executor
+    
     adapter = get_llmfree_adapter()
-    return adapter.get_stats()
+    stats = adapter.get_stats()
+    stats['executor'] = get_generation_executor().get_stats()
+    return stats
 
 
 # For testing
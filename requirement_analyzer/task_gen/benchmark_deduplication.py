@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TestCaseDeduplicator pairwise scan vs signature index
+Generates synthetic near-duplicate test cases and checks both modes agree
+
+Usage:
+    python -m requirement_analyzer.task_gen.benchmark_deduplication [n_tests]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+from .deduplication_engine import TestCaseDeduplicator
+
+
+WORDS = (
+    "user login password account order payment cart verify invalid valid "
+    "submit page error message admin report export session token email"
+).split()
+TEST_TYPES = ["happy_path", "negative", "boundary", "security"]
+
+
+def _phrase(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def make_test_cases(n: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Roughly one test in three is a lightly edited copy of an earlier one"""
+    rng = random.Random(seed)
+    test_cases: List[Dict[str, Any]] = []
+    for i in range(n):
+        if test_cases and rng.random() < 0.35:
+            tc = dict(rng.choice(test_cases))
+            tc["title"] = tc["title"] + rng.choice(["", " again", "s"])
+        else:
+            tc = {
+                "title": _phrase(rng, 6),
+                "description": _phrase(rng, 12),
+                "test_type": rng.choice(TEST_TYPES),
+                "steps": [_phrase(rng, 5) for _ in range(rng.randint(2, 5))],
+            }
+        tc["test_id"] = f"TC-{i + 1:04d}"
+        test_cases.append(tc)
+    return test_cases
+
+
+def _timed(dedup: TestCaseDeduplicator, test_cases: List[Dict[str, Any]]):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        kept = dedup.deduplicate(test_cases)
+        groups = dedup.get_duplicate_groups(test_cases)
+    return kept, groups, time.perf_counter() - start
+
+
+def run_benchmark(n: int = 1000):
+    test_cases = make_test_cases(n)
+    
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: TestCaseDeduplicator ({n} test cases, threshold 0.85)")
+    print("=" * 70)
+    
+    kept_p, groups_p, t_pairwise = _timed(TestCaseDeduplicator(use_index=False), test_cases)
+    kept_i, groups_i, t_indexed = _timed(TestCaseDeduplicator(use_index=True), test_cases)
+    
+    print(f"Pairwise scan : {t_pairwise:8.2f}s  kept {len(kept_p)}, {len(groups_p)} groups")
+    print(f"Signature index: {t_indexed:8.2f}s  kept {len(kept_i)}, {len(groups_i)} groups")
+    print(f"Speed-up      : {t_pairwise / max(t_indexed, 1e-9):8.1f}x")
+    print(f"Identical output: {kept_p == kept_i and groups_p == groups_i}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DependencyAI cycle breaking and to_dict() on large backlogs.
+Checks the memoised bitset descendant counts against the per-story DFS the
+old bottlenecks() ran.
+
+Two backlogs:
+  * layered — ~6 prerequisites per story plus backward edges that form
+    cycles (typical density for a real backlog)
+  * parsed  — stories from benchmark_lexicon_matcher; the rule layer links
+    every story to every story sharing a prerequisite intent, so the graph
+    is dense and to_dict() is dominated by emitting edges and violations
+
+Usage:
+    python -m requirement_analyzer.task_gen.benchmark_dependency_graph [n_stories]
+"""
+
+import random
+import sys
+import time
+from typing import Dict, List
+
+from .benchmark_lexicon_matcher import make_requirements
+from .semantic import DependencyAI, SemanticParser
+from .semantic.dependency_ai import Edge
+
+
+def parsed_backlog(n: int, seed: int = 42) -> List[dict]:
+    rng = random.Random(seed)
+    parser = SemanticParser()
+    return [
+        {
+            "ir": parser.parse(text),
+            "story_id": f"US-{i:05d}",
+            "title": text,
+            "sprint": rng.randint(1, 12),
+            "story_points": rng.choice([1, 2, 3, 5, 8, 13]),
+        }
+        for i, text in enumerate(make_requirements(n, seed))
+    ]
+
+
+def layered_graph(n: int, fan_in: int = 6, seed: int = 42) -> DependencyAI:
+    """Stories without rule matches, wired with random local prerequisites"""
+    rng = random.Random(seed)
+    domains = ["Auth", "Billing", "Clinical", "Booking", "Reporting"]
+    dep = DependencyAI().build([
+        {
+            "story_id": f"US-{i:05d}",
+            "title": f"Story {i}",
+            "domain": domains[i * len(domains) // n],
+            "sprint": 1 + i * 12 // n + rng.choice([-1, 0, 0, 1]),
+            "story_points": rng.choice([1, 2, 3, 5, 8, 13]),
+        }
+        for i in range(n)
+    ])
+    ids = list(dep.nodes)
+    for i in range(1, n):
+        for _ in range(rng.randint(0, 2 * fan_in)):
+            j = max(0, i - int(rng.expovariate(1 / 50)) - 1)
+            dep._add_edge(Edge(src=ids[j], dst=ids[i], kind="rule:intent",
+                               weight=1.0, reason="benchmark"))
+    for _ in range(n // 10):  # backward edges → cycles
+        i = rng.randrange(n - 1)
+        j = min(n - 1, i + rng.randint(1, 200))
+        dep._add_edge(Edge(src=ids[j], dst=ids[i], kind="embedding",
+                           weight=rng.choice([0.6, 0.8]), reason="benchmark"))
+    return dep
+
+
+def dfs_descendants(dep: DependencyAI) -> Dict[str, int]:
+    """Reference path: one DFS per story (the old bottlenecks() loop)"""
+    adjacency: Dict[str, List[str]] = {nid: [] for nid in dep.nodes}
+    for e in dep.edges():
+        adjacency[e.src].append(e.dst)
+    counts: Dict[str, int] = {}
+    for nid in adjacency:
+        seen = set()
+        stack = list(adjacency[nid])
+        while stack:
+            v = stack.pop()
+            if v not in seen:
+                seen.add(v)
+                stack.extend(adjacency[v])
+        counts[nid] = len(seen)
+    return counts
+
+
+def report(dep: DependencyAI) -> None:
+    start = time.perf_counter()
+    graph = dep.to_dict()
+    t_dict = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = dfs_descendants(dep)
+    t_dfs = time.perf_counter() - start
+
+    print(f"  Edges:                 {len(graph['edges']):,}")
+    print(f"  Validation issues:     {len(graph['validation_issues']):,}")
+    print(f"  to_dict():             {t_dict:8.3f}s")
+    print(f"  Per-story DFS counts:  {t_dfs:8.3f}s  (old bottlenecks(), once)")
+    print(f"  Identical counts:      {reference == dep._descendant_counts()}")
+
+
+def run_benchmark(n: int = 5000):
+    print(f"Stories: {n:,}")
+
+    print("[layered]")
+    dep = layered_graph(n)
+    before = len(dep.edges())
+    start = time.perf_counter()
+    dep._break_cycles()
+    t_cycles = time.perf_counter() - start
+    print(f"  Cycle breaking:        {t_cycles:8.3f}s  "
+          f"(removed {before - len(dep.edges()):,} of {before:,} edges)")
+    report(dep)
+
+    print("[parsed]")
+    start = time.perf_counter()
+    dep = DependencyAI().build(parsed_backlog(n))
+    print(f"  build():               {time.perf_counter() - start:8.3f}s")
+    report(dep)
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
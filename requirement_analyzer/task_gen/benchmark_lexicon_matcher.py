@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-keyword str.find scans vs the Aho-Corasick LexiconMatcher
+used by SemanticParser, before and after the lexicons grow with learned aliases.
+Checks both paths report the same first occurrence for every lexicon entry
+
+Usage:
+    python -m requirement_analyzer.task_gen.benchmark_lexicon_matcher [n_requirements]
+"""
+
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from .semantic import parser as semantic_parser
+from .semantic.lexicon_matcher import ScanResult
+from .semantic.parser import LEXICON_MATCHER, SemanticParser
+
+
+SUBJECTS = ["Bệnh nhân", "Bác sĩ", "Khách hàng", "Quản trị viên", "Lễ tân",
+            "The user", "Admin", "Nhân viên", "Dược sĩ", "Customer"]
+ACTIONS = ["có thể đặt lịch khám", "cần đăng nhập vào", "muốn thanh toán hóa đơn",
+           "được phép tra cứu hồ sơ bệnh án", "can upload the medical record of",
+           "phải xác nhận đơn hàng", "có thể hủy lịch hẹn", "quản lý tài khoản",
+           "kê đơn thuốc cho", "xuất báo cáo viện phí", "must search the room",
+           "đồng bộ hóa dữ liệu với"]
+OBJECTS = ["bệnh nhân", "bác sĩ", "phòng khách sạn", "đơn thuốc", "người dùng",
+           "giường bệnh", "vai trò và quyền", "invoice", "hệ thống thanh toán"]
+CHANNELS = ["", " qua web", " trên điện thoại", " online", " bằng mobile app", " tại kiosk"]
+
+
+def make_requirements(n: int, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(SUBJECTS)} {rng.choice(ACTIONS)} {rng.choice(OBJECTS)}"
+        f"{rng.choice(CHANNELS)} trong vòng {rng.randint(1, 30)} ngày."
+        for _ in range(n)
+    ]
+
+
+def find_scan(text_lower: str) -> ScanResult:
+    """Reference path: one str.find per keyword, per slot (the old parser loop)"""
+    result: ScanResult = {}
+    for slot, (entries, keywords_of) in LEXICON_MATCHER._lexicons.items():
+        hits: Dict[int, Tuple[int, int]] = {}
+        for index, entry in enumerate(entries):
+            for keyword in keywords_of(entry):
+                pos = text_lower.find(keyword)
+                if pos == -1:
+                    continue
+                prev = hits.get(index)
+                if prev is None or pos < prev[0] or (pos == prev[0] and len(keyword) > prev[1]):
+                    hits[index] = (pos, len(keyword))
+        result[slot] = hits
+    return result
+
+
+def learn_aliases(n: int, seed: int = 7) -> None:
+    """Append synthetic aliases the way FeedbackStore._maybe_learn_alias does"""
+    rng = random.Random(seed)
+    intents = sorted({c for _, c in semantic_parser.INTENT_LEXICON})
+    entities = sorted({c for _, c in semantic_parser.ENTITY_LEXICON})
+    for i in range(n):
+        semantic_parser.INTENT_LEXICON.append((f"đặt {rng.choice(['mới', 'gấp', 'lại'])} {i}", rng.choice(intents)))
+        semantic_parser.ENTITY_LEXICON.append((f"hồ sơ loại {i}", rng.choice(entities)))
+
+
+def _time(fn, texts) -> Tuple[list, float]:
+    start = time.perf_counter()
+    out = [fn(t) for t in texts]
+    return out, time.perf_counter() - start
+
+
+def run_round(label: str, texts: List[str]) -> None:
+    start = time.perf_counter()
+    LEXICON_MATCHER.sync()
+    t_build = time.perf_counter() - start
+
+    reference, t_find = _time(find_scan, texts)
+    matched, t_ac = _time(LEXICON_MATCHER.scan, texts)
+    identical = reference == matched
+
+    parser = SemanticParser()
+    _, t_parse = _time(parser.parse, texts)
+
+    size = sum(len(entries) for entries, _ in LEXICON_MATCHER._lexicons.values())
+    print(f"[{label}] lexicon entries: {size}")
+    print(f"  str.find scans:    {t_find:8.3f}s  ({len(texts) / t_find:,.0f} req/sec)")
+    print(f"  Aho-Corasick scan: {t_ac:8.3f}s  ({len(texts) / t_ac:,.0f} req/sec)  build {t_build * 1000:.1f} ms")
+    print(f"  Speed-up:          {t_find / t_ac:8.1f}x")
+    print(f"  Full parse():      {t_parse:8.3f}s")
+    print(f"  Identical hits:    {identical}")
+
+
+def run_benchmark(n: int = 10000, n_aliases: int = 1000):
+    texts = [t.lower() for t in make_requirements(n)]
+    print(f"Requirements: {n:,}")
+    run_round("stock lexicons", texts)
+    learn_aliases(n_aliases)
+    run_round(f"+{2 * n_aliases} learned aliases", texts)
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
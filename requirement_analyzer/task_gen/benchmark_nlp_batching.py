@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ModelBasedTaskGenerator.generate_batch per-sentence vs nlp.pipe parsing
+Reports sentences/sec for both paths and checks the generated tasks match
+
+Usage:
+    python -m requirement_analyzer.task_gen.benchmark_nlp_batching [n_sentences] [batch_size] [n_process]
+"""
+
+import sys
+import time
+from typing import List
+
+from . import config
+from .generator_model_based import ModelBasedTaskGenerator
+from .segmenter import Sentence
+
+
+TEMPLATES = [
+    "The system shall allow users to export audit logs {n} to CSV",
+    "Users must be able to log in with two-factor authentication on device {n}",
+    "The platform should send email notifications when order {n} is shipped",
+    "Administrators shall manage user roles and permissions for team {n}",
+    "The application must encrypt payment data {n} at rest and in transit",
+    "Customers should search products by category and price range {n}",
+]
+
+
+def make_sentences(n: int) -> List[Sentence]:
+    sentences = []
+    for i in range(n):
+        text = TEMPLATES[i % len(TEMPLATES)].format(n=i)
+        sentences.append(Sentence(text=text, section="Requirements", offset_end=len(text)))
+    return sentences
+
+
+def _task_signature(task):
+    return (task.title, task.description, tuple(task.acceptance_criteria), task.priority)
+
+
+def _timed(generator, sentences, labels, **kwargs):
+    start = time.perf_counter()
+    tasks = generator.generate_batch(sentences, labels, **kwargs)
+    return tasks, time.perf_counter() - start
+
+
+def run_benchmark(n_sentences: int = 500, batch_size: int = None, n_process: int = None):
+    generator = ModelBasedTaskGenerator(model_dir=config.MODEL_DIR)
+    if generator.nlp is None:
+        print("spaCy model en_core_web_sm is not installed - nothing to compare")
+        return
+
+    sentences = make_sentences(n_sentences)
+    labels = [{'type': 'functional', 'priority': 'Medium', 'domain': 'general'}] * n_sentences
+
+    # Warm up both paths (model loading, vocab growth)
+    generator.generate_batch(sentences[:20], labels[:20], batch_size=0)
+    generator.generate_batch(sentences[:20], labels[:20])
+
+    sequential, t_seq = _timed(generator, sentences, labels, batch_size=0)
+    batched, t_batch = _timed(generator, sentences, labels, batch_size=batch_size, n_process=n_process)
+
+    same = [_task_signature(t) for t in sequential] == [_task_signature(t) for t in batched]
+
+    print(f"Sentences:      {n_sentences}")
+    print(f"Batch size:     {batch_size or config.NLP_BATCH_SIZE}")
+    print(f"Processes:      {n_process or config.NLP_N_PROCESS}")
+    print(f"Per-sentence:   {t_seq:.2f}s  ({n_sentences / t_seq:,.0f} sentences/sec)")
+    print(f"nlp.pipe:       {t_batch:.2f}s  ({n_sentences / t_batch:,.0f} sentences/sec)")
+    print(f"Speed-up:       {t_seq / t_batch:.2f}x")
+    print(f"Identical:      {same}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    bs = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    nproc = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    run_benchmark(n, bs, nproc)
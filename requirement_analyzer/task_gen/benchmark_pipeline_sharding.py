@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TestGenerationPipeline sequential vs process-pool sharding
+Scales over 1, 2, 4 and 8 workers and checks every run matches sequential output
+
+Uses the pipeline's default extractor (MockRequirementExtractor). It is very
+cheap per requirement, so speed-ups mostly show with a real model-backed
+extractor; pass your own via TestGenerationPipeline(extractor=...).
+
+Usage:
+    python -m requirement_analyzer.task_gen.benchmark_pipeline_sharding [n_requirements]
+"""
+
+import contextlib
+import io
+import sys
+import time
+from typing import List
+
+from .test_generation_pipeline import TestGenerationPipeline
+
+
+TEMPLATES = [
+    "The system must allow guests to book a {n} room with check-in and check-out dates",
+    "The bank account must support transfer of {n} funds between accounts with authentication",
+    "Customers shall add product {n} to the shopping cart and checkout with payment",
+    "The doctor must access patient {n} medical records securely with password protection",
+    "Users should export report {n} as a PDF file from the dashboard",
+    "Hệ thống phải cho phép đặt phòng {n} với thông tin khách hàng",
+]
+
+
+def make_requirements(n: int) -> List[str]:
+    return [TEMPLATES[i % len(TEMPLATES)].format(n=i) for i in range(n)]
+
+
+def _run(requirements: List[str], n_workers: int):
+    pipeline = TestGenerationPipeline()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if n_workers > 1:
+            # Warm the pool so worker start-up is not counted
+            pipeline.process_requirements(requirements[:64], verbose=False, n_workers=n_workers)
+            pipeline._id_counter = 0
+        start = time.perf_counter()
+        result = pipeline.process_requirements(requirements, verbose=False, n_workers=n_workers)
+        elapsed = time.perf_counter() - start
+    pipeline.close()
+    return result, elapsed
+
+
+def run_benchmark(n: int = 2000, worker_counts=(1, 2, 4, 8)):
+    requirements = make_requirements(n)
+    
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: TestGenerationPipeline sharding ({n} requirements)")
+    print("=" * 70)
+    
+    baseline, baseline_time = None, None
+    for workers in worker_counts:
+        result, elapsed = _run(requirements, workers)
+        if baseline is None:
+            baseline, baseline_time = result, elapsed
+        same = result["test_cases"] == baseline["test_cases"]
+        print(f"{workers} worker(s): {elapsed:7.2f}s  speed-up {baseline_time / elapsed:5.2f}x  "
+              f"{len(result['test_cases'])} tests  identical={same}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
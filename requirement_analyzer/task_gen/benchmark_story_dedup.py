@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: user story dedup, pairwise Jaccard scan vs prefix-filtered index
+Generates synthetic stories (with near-duplicate copies) and checks both
+modes keep the same stories
+
+Usage:
+    python -m requirement_analyzer.task_gen.benchmark_story_dedup [n_stories]
+"""
+
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+from .story_dedup import STORY_DEDUP_THRESHOLD, deduplicate_story_indices
+
+
+ROLES = ["user", "customer", "admin", "manager", "guest", "staff member", "hotel owner", "driver"]
+ACTIONS = (
+    "view update delete create export import search filter approve reject book cancel "
+    "pay refund upload download share archive assign schedule track rate"
+).split()
+OBJECTS = (
+    "order invoice booking room profile account report payment cart product review "
+    "ticket shipment coupon receipt schedule notification password document message"
+).split()
+QUALIFIERS = (
+    "monthly daily pending archived draft shared private public recent overdue "
+    "failed paid unpaid weekly internal external"
+).split()
+BENEFITS = (
+    "save time avoid mistakes stay informed keep records accurate reduce costs "
+    "serve customers faster meet compliance plan ahead"
+).split()
+POINTS = [1, 2, 3, 5, 8, 13]
+
+
+def _domain_terms(rng: random.Random, n: int) -> List[str]:
+    """Synthetic domain nouns (feature, entity and field names of a large spec)"""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(5, 9))) for _ in range(n)]
+
+
+def _story(rng: random.Random, terms: List[str], weights: List[float]) -> Dict[str, Any]:
+    action, obj = rng.choice(ACTIONS), rng.choice(OBJECTS)
+    qualifier = " ".join(rng.sample(QUALIFIERS, rng.randint(1, 3)))
+    if terms:
+        # Zipf-like: a few domain terms are everywhere, most are rare
+        qualifier += " " + " ".join(rng.choices(terms, weights, k=2))
+    benefit = " ".join(rng.sample(BENEFITS, 4))
+    return {
+        "title": f"{action.title()} {qualifier} {obj}",
+        "user_story": f"As a {rng.choice(ROLES)}, I want to {action} {qualifier} {obj}s so that I can {benefit}.",
+        "story_points": rng.choice(POINTS),
+    }
+
+
+def make_stories(n: int, seed: int = 42, domain_terms: int = 2000) -> List[Dict[str, Any]]:
+    """
+    Roughly one story in four is a lightly reworded copy of an earlier one
+
+    domain_terms=0 builds every story from the ~110-word template vocabulary
+    (worst case for the index: every token is frequent).
+    """
+    rng = random.Random(seed)
+    terms = _domain_terms(rng, domain_terms)
+    weights = [1.0 / (k + 1) for k in range(len(terms))]
+    stories: List[Dict[str, Any]] = []
+    for i in range(n):
+        if stories and rng.random() < 0.25:
+            story = dict(rng.choice(stories))
+            story["user_story"] = story["user_story"].replace(" I can ", rng.choice([" I can ", " we can ", " I "]))
+            story["story_points"] = rng.choice(POINTS)
+        else:
+            story = _story(rng, terms, weights)
+        story["id"] = f"REQ-{i // 3 + 1}_ST{i % 3 + 1:02d}"
+        stories.append(story)
+    return stories
+
+
+def _timed(stories: List[Dict[str, Any]], use_index: bool):
+    start = time.perf_counter()
+    kept = deduplicate_story_indices(stories, STORY_DEDUP_THRESHOLD, use_index=use_index)
+    return kept, time.perf_counter() - start
+
+
+def run_benchmark(n: int = 5000):
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: story dedup ({n} stories, Jaccard >= {STORY_DEDUP_THRESHOLD})")
+    print("=" * 70)
+
+    for label, domain_terms in (("2000 domain terms", 2000), ("template words only", 0)):
+        stories = make_stories(n, domain_terms=domain_terms)
+        kept_p, t_pairwise = _timed(stories, use_index=False)
+        kept_i, t_indexed = _timed(stories, use_index=True)
+
+        print(f"\n{label}:")
+        print(f"  Pairwise scan : {t_pairwise:8.2f}s  kept {len(kept_p)}")
+        print(f"  Prefix index  : {t_indexed:8.2f}s  kept {len(kept_i)}")
+        print(f"  Speed-up      : {t_pairwise / max(t_indexed, 1e-9):8.1f}x")
+        print(f"  Identical output: {kept_p == kept_i}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
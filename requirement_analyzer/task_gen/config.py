@@ -66,6 +66,35 @@ ENABLE_TASK_SPLITTING = os.getenv("ENABLE_SPLIT", "false").lower() == "true"
 ENABLE_TASK_MERGING = os.getenv("ENABLE_MERGE", "false").lower() == "true"
 
 
+# ============================================================================
+# GENERATION EXECUTOR (CPU-bound generation off the event loop)
+# ============================================================================
+# "thread" keeps models shared in-process, "process" sidesteps the GIL
+GENERATION_EXECUTOR = os.getenv("GENERATION_EXECUTOR", "thread")
+GENERATION_WORKERS = int(os.getenv("GENERATION_WORKERS", "2"))
+# Max requests queued or running before new ones get 429
+GENERATION_QUEUE_DEPTH = int(os.getenv("GENERATION_QUEUE_DEPTH", "8"))
+# Per-request timeout in seconds (queue wait + run)
+GENERATION_TIMEOUT_S = float(os.getenv("GENERATION_TIMEOUT_S", "120"))
+
+
+# ============================================================================
+# SPACY BATCHING (ModelBasedTaskGenerator.generate_batch)
+# ============================================================================
+NLP_BATCH_SIZE = int(os.getenv("NLP_BATCH_SIZE", "64"))
+# >1 forks worker processes inside nlp.pipe; only pays off for large batches
+NLP_N_PROCESS = int(os.getenv("NLP_N_PROCESS", "1"))
+
+
+# ============================================================================
+# V3 EXPORT RESULT CACHE (routers_testcase export endpoints)
+# ============================================================================
+EXPORT_CACHE_MAX_ENTRIES = int(os.getenv("EXPORT_CACHE_MAX_ENTRIES", "32"))
+EXPORT_CACHE_TTL_S = float(os.getenv("EXPORT_CACHE_TTL_S", "900"))
+# Upper bound on cached results, measured as serialized JSON size
+EXPORT_CACHE_MAX_MB = float(os.getenv("EXPORT_CACHE_MAX_MB", "64"))
+
+
 # ============================================================================
 # LOGGING
 # ============================================================================
@@ -5,6 +5,8 @@ Removes duplicate/similar test cases intelligently
 
 from typing import List, Dict, Any, Set, Tuple
 from difflib import SequenceMatcher
+from collections import Counter
+from bisect import bisect_left, bisect_right, insort
 import json
 
 
@@ -14,13 +16,23 @@ class TestCaseDeduplicator:
     Uses semantic similarity instead of just string matching
     """
     
-    def __init__(self, similarity_threshold: float = 0.85):
+    # Field weights used by _calculate_similarity (sum to 1.0)
+    TITLE_WEIGHT = 0.4
+    DESCRIPTION_WEIGHT = 0.3
+    TYPE_WEIGHT = 0.15
+    STEPS_WEIGHT = 0.15
+    
+    def __init__(self, similarity_threshold: float = 0.85, use_index: bool = True):
         """
         Args:
             similarity_threshold: If similarity > this, consider duplicate (0.0-1.0)
                                  Default 0.85 = 85% similar
+            use_index: Use the signature index so only candidate buckets get an
+                       exact SequenceMatcher check. Results are identical to the
+                       pairwise scan; set False to force the pairwise scan.
         """
         self.similarity_threshold = similarity_threshold
+        self.use_index = use_index
     
     def deduplicate(self, test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -35,6 +47,23 @@ class TestCaseDeduplicator:
         if not test_cases:
             return []
         
+        if self.use_index:
+            keep_indices = self._deduplicate_indexed(test_cases)
+        else:
+            keep_indices = self._deduplicate_pairwise(test_cases)
+        
+        # Return only kept test cases
+        result = [test_cases[i] for i in sorted(keep_indices)]
+        removed = len(test_cases) - len(result)
+        
+        if removed > 0:
+            print(f"\n✅ Deduplication: Removed {removed} duplicates, "
+                  f"kept {len(result)}/{len(test_cases)} unique tests")
+        
+        return result
+    
+    def _deduplicate_pairwise(self, test_cases: List[Dict[str, Any]]) -> Set[int]:
+        """Compare every candidate against every kept test case (O(n²))"""
         # Track which indices to keep
         keep_indices: Set[int] = set()
         keep_indices.add(0)  # Always keep first
@@ -54,22 +83,40 @@ class TestCaseDeduplicator:
                 if similarity > self.similarity_threshold:
                     # This is a duplicate of kept_tc[j]
                     is_duplicate = True
-                    print(f"   ⚠️  Removing duplicate: {current_tc.get('test_id', 'N/A')} "
-                          f"(similar to {kept_tc.get('test_id', 'N/A')}, {similarity:.2f})")
+                    self._report_removed(current_tc, kept_tc, similarity)
                     break
             
             if not is_duplicate:
                 keep_indices.add(i)
         
-        # Return only kept test cases
-        result = [test_cases[i] for i in sorted(keep_indices)]
-        removed = len(test_cases) - len(result)
+        return keep_indices
+    
+    def _deduplicate_indexed(self, test_cases: List[Dict[str, Any]]) -> Set[int]:
+        """Keep-first deduplication where only indexed candidates are compared"""
+        index = TestCaseSignatureIndex(self)
+        signatures = [index.signature(tc) for tc in test_cases]
         
-        if removed > 0:
-            print(f"\n✅ Deduplication: Removed {removed} duplicates, "
-                  f"kept {len(result)}/{len(test_cases)} unique tests")
+        keep_indices: Set[int] = set()
+        for i, sig in enumerate(signatures):
+            is_duplicate = False
+            
+            for j in index.candidates(sig):
+                similarity = self._calculate_similarity(test_cases[i], test_cases[j])
+                if similarity > self.similarity_threshold:
+                    is_duplicate = True
+                    self._report_removed(test_cases[i], test_cases[j], similarity)
+                    break
+            
+            if not is_duplicate:
+                keep_indices.add(i)
+                index.add(i, sig)
         
-        return result
+        return keep_indices
+    
+    @staticmethod
+    def _report_removed(current_tc: Dict[str, Any], kept_tc: Dict[str, Any], similarity: float):
+        print(f"   ⚠️  Removing duplicate: {current_tc.get('test_id', 'N/A')} "
+              f"(similar to {kept_tc.get('test_id', 'N/A')}, {similarity:.2f})")
     
     def _calculate_similarity(self, tc1: Dict[str, Any], tc2: Dict[str, Any]) -> float:
         """
@@ -84,25 +131,25 @@ class TestCaseDeduplicator:
         title1 = str(tc1.get("title", "")).lower()
         title2 = str(tc2.get("title", "")).lower()
         title_sim = self._string_similarity(title1, title2)
-        similarities.append(title_sim * 0.4)  # 40% weight
+        similarities.append(title_sim * self.TITLE_WEIGHT)  # 40% weight
         
         # Compare descriptions
         desc1 = str(tc1.get("description", "")).lower()
         desc2 = str(tc2.get("description", "")).lower()
         desc_sim = self._string_similarity(desc1, desc2)
-        similarities.append(desc_sim * 0.3)  # 30% weight
+        similarities.append(desc_sim * self.DESCRIPTION_WEIGHT)  # 30% weight
         
         # Compare test types
         type1 = str(tc1.get("test_type", "")).lower()
         type2 = str(tc2.get("test_type", "")).lower()
         type_sim = 1.0 if type1 == type2 else 0.0
-        similarities.append(type_sim * 0.15)  # 15% weight
+        similarities.append(type_sim * self.TYPE_WEIGHT)  # 15% weight
         
         # Compare steps (most important for functionality)
         steps1 = tc1.get("steps", [])
         steps2 = tc2.get("steps", [])
         steps_sim = self._steps_similarity(steps1, steps2)
-        similarities.append(steps_sim * 0.15)  # 15% weight
+        similarities.append(steps_sim * self.STEPS_WEIGHT)  # 15% weight
         
         # Overall similarity (weighted average)
         overall = sum(similarities)
@@ -144,6 +191,9 @@ class TestCaseDeduplicator:
         Returns:
             List of groups, where each group is indices of similar tests
         """
+        if self.use_index:
+            return self._duplicate_groups_indexed(test_cases)
+        
         groups = []
         used = set()
         
@@ -169,6 +219,37 @@ class TestCaseDeduplicator:
         
         return groups
     
+    def _duplicate_groups_indexed(self, test_cases: List[Dict[str, Any]]) -> List[List[int]]:
+        """Same grouping as get_duplicate_groups, using the signature index"""
+        index = TestCaseSignatureIndex(self)
+        signatures = [index.signature(tc) for tc in test_cases]
+        for i, sig in enumerate(signatures):
+            index.add(i, sig)
+        
+        groups = []
+        used = set()
+        
+        for i, sig in enumerate(signatures):
+            if i in used:
+                continue
+            
+            group = [i]
+            used.add(i)
+            
+            for j in sorted(index.candidates(sig)):
+                if j <= i or j in used:
+                    continue
+                
+                similarity = self._calculate_similarity(test_cases[i], test_cases[j])
+                if similarity > self.similarity_threshold:
+                    group.append(j)
+                    used.add(j)
+            
+            if len(group) > 1:  # Only track duplicates
+                groups.append(group)
+        
+        return groups
+    
     def report_duplicates(self, test_cases: List[Dict[str, Any]]) -> str:
         """Generate human-readable duplicate report"""
         groups = self.get_duplicate_groups(test_cases)
@@ -188,6 +269,140 @@ class TestCaseDeduplicator:
         return report
 
 
+# Slack applied to the float bounds so they never prune a pair the exact check keeps
+_EPS = 1e-9
+
+
+class _Signature:
+    """Pre-computed shingle signature of one test case"""
+    
+    __slots__ = ("block", "title_len", "title_chars", "desc_len", "desc_chars", "steps")
+    
+    def __init__(self, block, title: str, desc: str, steps: List[Tuple[int, Counter]]):
+        self.block = block
+        self.title_len = len(title)
+        self.title_chars = Counter(title)
+        self.desc_len = len(desc)
+        self.desc_chars = Counter(desc)
+        self.steps = steps
+
+
+class TestCaseSignatureIndex:
+    """
+    Candidate index for TestCaseDeduplicator
+    
+    Test cases are bucketed by (test_type, number of steps) and, inside a
+    bucket, kept sorted by title length. A query only visits the length
+    window that can still reach the threshold, and each visited entry is
+    checked against an upper bound built from character shingle counts
+    (the same bound as SequenceMatcher.quick_ratio) before the exact
+    SequenceMatcher comparison runs.
+    
+    The bounds never under-estimate similarity, so the index returns every
+    pair the pairwise scan would flag - deduplication results are identical.
+    """
+    
+    def __init__(self, deduplicator: TestCaseDeduplicator):
+        d = deduplicator
+        self.threshold = d.similarity_threshold
+        self.w_title = d.TITLE_WEIGHT
+        self.w_desc = d.DESCRIPTION_WEIGHT
+        self.w_type = d.TYPE_WEIGHT
+        self.w_steps = d.STEPS_WEIGHT
+        
+        # A pair whose types differ scores at most w_title + w_desc + w_steps,
+        # and a pair whose step counts differ at most w_title + w_desc + w_type.
+        # When that cannot exceed the threshold the field becomes a bucket key.
+        # (Summed in the same order as _calculate_similarity so rounding matches.)
+        self.block_on_type = sum([self.w_title, self.w_desc, 0.0, self.w_steps]) <= self.threshold
+        self.block_on_steps = sum([self.w_title, self.w_desc, self.w_type, 0.0]) <= self.threshold
+        
+        # Lowest title similarity that can still exceed the threshold
+        rest = self.w_desc + self.w_type + self.w_steps
+        if self.w_title:
+            self.min_title_sim = max(0.0, (self.threshold - rest) / self.w_title - _EPS)
+        else:
+            self.min_title_sim = 0.0
+        
+        # block -> parallel sorted lists of (title_len, idx) and signatures
+        self._keys: Dict[Any, List[Tuple[int, int]]] = {}
+        self._sigs: Dict[int, _Signature] = {}
+    
+    def signature(self, tc: Dict[str, Any]) -> _Signature:
+        """Build the signature of a test case (same normalisation as _calculate_similarity)"""
+        title = str(tc.get("title", "")).lower()
+        desc = str(tc.get("description", "")).lower()
+        test_type = str(tc.get("test_type", "")).lower()
+        raw_steps = tc.get("steps", []) or []
+        
+        steps = [(len(s.lower()), Counter(s.lower())) for s in raw_steps]
+        block = (
+            test_type if self.block_on_type else None,
+            len(raw_steps) if self.block_on_steps else None,
+        )
+        return _Signature(block, title, desc, steps)
+    
+    def add(self, idx: int, sig: _Signature):
+        """Index test case `idx`"""
+        keys = self._keys.setdefault(sig.block, [])
+        insort(keys, (sig.title_len, idx))
+        self._sigs[idx] = sig
+    
+    def candidates(self, sig: _Signature) -> List[int]:
+        """
+        Indexed test cases that may exceed the threshold against `sig`,
+        in insertion (index) order
+        """
+        keys = self._keys.get(sig.block)
+        if not keys:
+            return []
+        
+        if self.min_title_sim > 0:
+            # Empty titles score 0, so nothing can match
+            if sig.title_len == 0:
+                return []
+            # 2*min(a, b) / (a + b) > t  <=>  b in (a*t/(2-t), a*(2-t)/t)
+            t = self.min_title_sim
+            lo = sig.title_len * t / (2.0 - t) * (1.0 - _EPS)
+            hi = sig.title_len * (2.0 - t) / t * (1.0 + _EPS)
+            window = keys[bisect_left(keys, (int(lo), -1)):bisect_right(keys, (int(hi) + 1, -1))]
+        else:
+            window = keys
+        
+        result = []
+        for _, idx in window:
+            other = self._sigs[idx]
+            if self._upper_bound(sig, other) > self.threshold - _EPS:
+                result.append(idx)
+        
+        result.sort()
+        return result
+    
+    def _upper_bound(self, a: _Signature, b: _Signature) -> float:
+        """Upper bound of _calculate_similarity from shingle counts"""
+        bound = self.w_title * _quick_ratio(a.title_len, a.title_chars, b.title_len, b.title_chars)
+        bound += self.w_desc * _quick_ratio(a.desc_len, a.desc_chars, b.desc_len, b.desc_chars)
+        # Types / step counts are equal whenever they are part of the bucket key
+        bound += self.w_type
+        if bound + self.w_steps <= self.threshold - _EPS:
+            return bound
+        
+        if a.steps and b.steps and len(a.steps) == len(b.steps):
+            steps_bound = sum(
+                _quick_ratio(la, ca, lb, cb) for (la, ca), (lb, cb) in zip(a.steps, b.steps)
+            ) / len(a.steps)
+            bound += self.w_steps * steps_bound
+        return bound
+
+
+def _quick_ratio(len_a: int, chars_a: Counter, len_b: int, chars_b: Counter) -> float:
+    """Character-multiset upper bound of SequenceMatcher.ratio()"""
+    if not len_a or not len_b:
+        return 0.0
+    matches = sum((chars_a & chars_b).values())
+    return 2.0 * matches / (len_a + len_b)
+
+
 class TestCaseNormalizer:
     """
     Normalize test cases before comparison
@@ -9,6 +9,8 @@ from typing import List, Dict, Tuple, Optional
 import logging
 import re
 
+from .shared_features import SharedFeatureBatch, get_vectorizer_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,7 @@ class LabelEnricher:
         self.label_name = label_name
         self.model_dir = Path(model_dir)
         self.vectorizer = None
+        self.vectorizer_digest = None
         self.model = None
         self.classes = []
         self.loaded = False
@@ -34,7 +37,7 @@ class LabelEnricher:
                 logger.warning(f"{self.label_name} enricher models not found in {self.model_dir}")
                 return False
             
-            self.vectorizer = joblib.load(vec_path)
+            self.vectorizer, self.vectorizer_digest = get_vectorizer_registry().load(vec_path)
             self.model = joblib.load(model_path)
             
             with open(classes_path, 'r') as f:
@@ -51,11 +54,15 @@ class LabelEnricher:
     def predict(
         self,
         texts: List[str],
-        return_proba: bool = True
+        return_proba: bool = True,
+        features: Optional[SharedFeatureBatch] = None
     ) -> List[Tuple[str, float]]:
         """
         Predict labels for texts
         
+        Args:
+            features: Shared feature batch over the same texts (reuses TF-IDF matrices)
+        
         Returns:
             List of (label, confidence) tuples
         """
@@ -66,8 +73,11 @@ class LabelEnricher:
                 return [(default_label, 0.5) for _ in texts]
         
         try:
-            # Vectorize
-            X = self.vectorizer.transform(texts)
+            # Vectorize (once per batch when features are shared)
+            if features is not None:
+                X = features.transform(self.vectorizer_digest, self.vectorizer)
+            else:
+                X = self.vectorizer.transform(texts)
             
             # Predict
             predictions = self.model.predict(X)
@@ -246,21 +256,30 @@ class EnrichmentPipeline:
     
     def enrich(
         self,
-        texts: List[str]
+        texts: List[str],
+        features: Optional[SharedFeatureBatch] = None
     ) -> List[Dict[str, any]]:
         """
         Enrich texts with all labels
         
+        Args:
+            features: Shared feature batch over the same texts; created here if
+                      omitted so enrichers with hash-identical vectorizers
+                      transform the batch only once
+        
         Returns:
             List of dicts with keys: type, priority, domain, role, confidence
         """
         if not self.loaded:
             self.load()
         
+        if features is None:
+            features = SharedFeatureBatch(texts)
+        
         # Predict all labels
-        types_conf = self.type_enricher.predict(texts)
-        priorities_conf = self.priority_enricher.predict(texts)
-        domains_conf = self.domain_enricher.predict(texts)
+        types_conf = self.type_enricher.predict(texts, features=features)
+        priorities_conf = self.priority_enricher.predict(texts, features=features)
+        domains_conf = self.domain_enricher.predict(texts, features=features)
         
         # Extract labels and confidences
         types, type_confs = zip(*types_conf) if types_conf else ([], [])
@@ -0,0 +1,154 @@
+"""
+Result cache for the v3 export endpoints
+Several exports of the same upload reuse one AITestCaseGeneratorV3.generate() result
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import config
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint as the serialized JSON size in bytes"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return 0
+
+
+class ExportResultCache:
+    """
+    LRU + TTL cache of generation results with a memory cap
+
+    Keys are (sha256 of the uploaded bytes, file type, generator version, max_tests),
+    so a re-upload of identical content hits regardless of file name.
+    Cached results are shared between requests - exporters must treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        ttl_s: float = 900.0,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # key -> (value, size_bytes, stored_at)
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "oversized": 0,
+        }
+
+    @staticmethod
+    def make_key(content: bytes, file_type: str, version: str, max_tests: int) -> Tuple:
+        return (hashlib.sha256(content).hexdigest(), file_type, version, max_tests)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            value, size, stored_at = entry
+            if self.ttl_s and time.monotonic() - stored_at > self.ttl_s:
+                self._remove(key)
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def put(self, key: Tuple, value: Any):
+        size = _estimate_size(value)
+        with self._lock:
+            if size > self.max_bytes:
+                self.stats["oversized"] += 1
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic())
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats["evictions"] += 1
+
+    def get_or_generate(
+        self,
+        content: bytes,
+        file_type: str,
+        version: str,
+        max_tests: int,
+        generate: Callable[[], Optional[Any]],
+    ) -> Optional[Any]:
+        """
+        Return the cached result for this upload, or call generate() and cache it
+
+        A None result (e.g. no requirements found) is returned but not cached.
+        """
+        key = self.make_key(content, file_type, version, max_tests)
+        value = self.get(key)
+        if value is None:
+            value = generate()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def _remove(self, key: Tuple):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+                **self.stats,
+            }
+
+
+# Singleton instance
+_cache: Optional[ExportResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_export_cache() -> ExportResultCache:
+    """Get or create the shared export cache (configured from config.EXPORT_CACHE_*)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ExportResultCache(
+                    max_entries=config.EXPORT_CACHE_MAX_ENTRIES,
+                    ttl_s=config.EXPORT_CACHE_TTL_S,
+                    max_bytes=int(config.EXPORT_CACHE_MAX_MB * 1024 * 1024),
+                )
+    return _cache
@@ -0,0 +1,200 @@
+"""
+Bounded executor for CPU-bound test generation
+Keeps the asyncio event loop free while pipelines run in a thread or process pool
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import config
+
+
+class GenerationQueueFull(Exception):
+    """Raised when the executor already holds `max_queue` requests (map to HTTP 429)"""
+
+    def __init__(self, max_queue: int):
+        super().__init__(f"Generation queue is full ({max_queue} requests in flight)")
+        self.max_queue = max_queue
+
+
+class GenerationTimeout(Exception):
+    """Raised when a request exceeds its timeout (map to HTTP 504)"""
+
+    def __init__(self, timeout_s: float):
+        super().__init__(f"Generation timed out after {timeout_s:g}s")
+        self.timeout_s = timeout_s
+
+
+def _timed_call(func: Callable, args: tuple, kwargs: dict) -> Tuple[Any, float, float]:
+    """Run func in the worker and return (result, started_at, finished_at) as wall-clock times"""
+    started_at = time.time()
+    result = func(*args, **kwargs)
+    return result, started_at, time.time()
+
+
+class GenerationExecutor:
+    """
+    Thread or process pool with a queue-depth limit
+
+    - `max_queue` counts queued + running requests; beyond it submit() raises
+      GenerationQueueFull instead of letting work pile up (back-pressure).
+    - A slot is only released when the work actually finishes, so a request
+      that timed out keeps counting until its worker is free again.
+    - Every call returns timing metadata: queue wait and run time in ms.
+
+    In "process" mode `func` and its arguments must be picklable (module-level
+    functions), and each worker process loads its own models.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int = 2,
+        max_queue: int = 8,
+        timeout_s: Optional[float] = 120.0,
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind} (expected 'thread' or 'process')")
+
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(self.max_workers, max_queue)
+        self.timeout_s = timeout_s
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "failed": 0,
+        }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="generation"
+                )
+        return self._executor
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _acquire(self):
+        with self._lock:
+            if self._in_flight >= self.max_queue:
+                self.stats["rejected"] += 1
+                raise GenerationQueueFull(self.max_queue)
+            self._in_flight += 1
+            self.stats["submitted"] += 1
+
+    def _release(self, future):
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self.stats["failed"] += 1
+            else:
+                self.stats["completed"] += 1
+
+    async def run(
+        self,
+        func: Callable,
+        *args,
+        timeout_s: Optional[float] = None,
+        **kwargs,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Run func(*args, **kwargs) in the pool without blocking the event loop
+
+        Returns:
+            (result, execution metadata)
+
+        Raises:
+            GenerationQueueFull: queue depth limit reached
+            GenerationTimeout: the request did not finish within timeout_s
+        """
+        timeout_s = self.timeout_s if timeout_s is None else timeout_s
+        self._acquire()
+
+        submitted_at = time.time()
+        try:
+            future = self._get_executor().submit(_timed_call, func, args, kwargs)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            result, started_at, finished_at = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=timeout_s
+            )
+        except asyncio.TimeoutError:
+            # Drops the request if it has not started yet; a running worker cannot be interrupted
+            future.cancel()
+            with self._lock:
+                self.stats["timed_out"] += 1
+            raise GenerationTimeout(timeout_s)
+
+        metadata = {
+            "executor": self.kind,
+            "queue_wait_ms": int(max(0.0, started_at - submitted_at) * 1000),
+            "run_ms": int((finished_at - started_at) * 1000),
+            "queue_depth": self._in_flight,
+        }
+        return result, metadata
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "executor": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "timeout_s": self.timeout_s,
+                "in_flight": self._in_flight,
+                **self.stats,
+            }
+
+    def shutdown(self, wait: bool = False):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+_executor: Optional[GenerationExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_generation_executor() -> GenerationExecutor:
+    """Get or create the shared generation executor (configured from config.GENERATION_*)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = GenerationExecutor(
+                    kind=config.GENERATION_EXECUTOR,
+                    max_workers=config.GENERATION_WORKERS,
+                    max_queue=config.GENERATION_QUEUE_DEPTH,
+                    timeout_s=config.GENERATION_TIMEOUT_S,
+                )
+    return _executor
+
+
+def shutdown_generation_executor():
+    """Stop worker threads/processes (call from the app shutdown hook)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -19,8 +19,10 @@ from typing import List, Dict, Optional, Any
 import logging
 import joblib
 
+from . import config
 from .schemas import GeneratedTask, TaskSource
 from .segmenter import Sentence
+from .shared_features import SharedFeatureBatch, get_vectorizer_registry
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,10 @@ class ModelBasedTaskGenerator:
     VI_DIACRITICS = set("ăâđêôơưáàảãạấầẩẫậắằẳẵặéèẻẽẹếềểễệíìỉĩịóòỏõọốồổỗộớờởỡợúùủũụứừửữựýỳỷỹỵ")
     VI_KEYWORDS = {'hệ thống', 'phải', 'cần', 'cho phép', 'đảm bảo', 'thực hiện', 'người dùng'}
     
+    # spaCy components entity extraction never reads (it uses POS, lemma,
+    # dependencies and noun_chunks only); skipped in the batched path
+    NLP_UNUSED_PIPES = ('ner',)
+    
     @staticmethod
     def is_vietnamese(text: str) -> bool:
         """Detect if text is Vietnamese"""
@@ -84,11 +90,11 @@ class ModelBasedTaskGenerator:
                 logger.warning("Requirement detector not found")
                 return None
             
-            vectorizer = joblib.load(vec_path)
+            vectorizer, digest = get_vectorizer_registry().load(vec_path)
             model = joblib.load(model_path)
             
             logger.info("✓ Loaded requirement detector")
-            return {'vectorizer': vectorizer, 'model': model}
+            return {'vectorizer': vectorizer, 'digest': digest, 'model': model}
         except Exception as e:
             logger.error(f"Error loading requirement detector: {e}")
             return None
@@ -103,9 +109,10 @@ class ModelBasedTaskGenerator:
                 model_path = self.model_dir / f'{label}_model.joblib'
                 
                 if vec_path.exists() and model_path.exists():
-                    vectorizer = joblib.load(vec_path)
+                    # Hash-identical vectorizers (e.g. type/domain) are loaded once
+                    vectorizer, digest = get_vectorizer_registry().load(vec_path)
                     model = joblib.load(model_path)
-                    enrichers[label] = {'vectorizer': vectorizer, 'model': model}
+                    enrichers[label] = {'vectorizer': vectorizer, 'digest': digest, 'model': model}
                     logger.info(f"✓ Loaded {label} enricher")
             except Exception as e:
                 logger.error(f"Error loading {label} enricher: {e}")
@@ -169,7 +176,33 @@ class ModelBasedTaskGenerator:
             },
         }
     
-    def extract_entities_enhanced(self, text: str) -> Dict[str, Any]:
+    def parse_texts(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
+    ) -> Optional[List[Any]]:
+        """
+        Parse many sentences with nlp.pipe (same lowercasing as extract_entities_enhanced)
+        
+        Returns:
+            One Doc per text, or None when spaCy is not available
+        """
+        if not self.nlp or not texts:
+            return None
+        
+        batch_size = batch_size or config.NLP_BATCH_SIZE
+        n_process = n_process or config.NLP_N_PROCESS
+        disable = [name for name in self.NLP_UNUSED_PIPES if name in self.nlp.pipe_names]
+        
+        return list(self.nlp.pipe(
+            (text.lower() for text in texts),
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=disable
+        ))
+    
+    def extract_entities_enhanced(self, text: str, doc=None) -> Dict[str, Any]:
         """
         Enhanced entity extraction with proper action/object detection
         
@@ -177,6 +210,10 @@ class ModelBasedTaskGenerator:
         1. Helper verb handling (allow/enable → xcomp)
         2. Object vs format distinction (audit logs → CSV)
         3. Phrasal verb handling (log in, sign up)
+        
+        Args:
+            text: Requirement sentence
+            doc: Pre-parsed Doc of text.lower() (from parse_texts), parsed here if None
         """
         if not self.nlp:
             # Fallback to simple extraction
@@ -190,7 +227,8 @@ class ModelBasedTaskGenerator:
                 'format': None
             }
         
-        doc = self.nlp(text.lower())
+        if doc is None:
+            doc = self.nlp(text.lower())
         
         # Extract basic entities
         verbs = [token.lemma_ for token in doc if token.pos_ == 'VERB']
@@ -546,7 +584,8 @@ class ModelBasedTaskGenerator:
             return None
         
         # Check if it's a requirement
-        X = self.req_detector['vectorizer'].transform([text])
+        features = SharedFeatureBatch([text])
+        X = features.transform(self.req_detector['digest'], self.req_detector['vectorizer'])
         is_req = self.req_detector['model'].predict(X)[0]
         
         if not is_req:
@@ -556,7 +595,7 @@ class ModelBasedTaskGenerator:
         result = {'text': text}
         
         for label, enricher in self.enrichers.items():
-            X = enricher['vectorizer'].transform([text])
+            X = features.transform(enricher['digest'], enricher['vectorizer'])
             pred = enricher['model'].predict(X)[0]
             result[label] = pred
         
@@ -658,15 +697,34 @@ class ModelBasedTaskGenerator:
         self,
         requirement_sentences: List,
         enrichment_results: List[Dict],
-        epic_name: Optional[str] = None
+        epic_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
     ) -> List[GeneratedTask]:
-        """Generate tasks from batch of requirements (standardized interface)"""
+        """
+        Generate tasks from batch of requirements (standardized interface)
+        
+        All sentences are parsed up front with nlp.pipe (batch_size/n_process
+        default to config.NLP_BATCH_SIZE/NLP_N_PROCESS); batch_size=0 falls
+        back to parsing one sentence at a time.
+        """
         tasks = []
         
         # requirement_sentences are Sentence objects
         # enrichment_results contain pre-classified labels
         max_tasks = min(len(requirement_sentences), len(enrichment_results))
         
+        docs = None
+        if batch_size != 0:
+            try:
+                docs = self.parse_texts(
+                    [requirement_sentences[idx].text for idx in range(max_tasks)],
+                    batch_size=batch_size,
+                    n_process=n_process
+                )
+            except Exception as e:
+                logger.warning(f"Batched parsing failed, parsing per sentence: {e}")
+        
         for idx in range(max_tasks):
             sentence = requirement_sentences[idx]
             labels = enrichment_results[idx]
@@ -675,7 +733,8 @@ class ModelBasedTaskGenerator:
                 task = self._generate_from_sentence_and_labels(
                     sentence, 
                     labels,
-                    epic_name=epic_name
+                    epic_name=epic_name,
+                    doc=docs[idx] if docs else None
                 )
                 if task:
                     tasks.append(task)
@@ -689,15 +748,16 @@ class ModelBasedTaskGenerator:
         self,
         sentence: Sentence,
         labels: Dict,
-        epic_name: Optional[str] = None
+        epic_name: Optional[str] = None,
+        doc=None
     ) -> Optional[GeneratedTask]:
-        """Generate task from sentence with pre-computed labels"""
+        """Generate task from sentence with pre-computed labels (and optional pre-parsed Doc)"""
         req_type = labels.get('type', 'functional')
         priority = labels.get('priority', 'Medium')
         domain = labels.get('domain', 'general')
         
         # Extract entities (USE ENHANCED VERSION)
-        entities = self.extract_entities_enhanced(sentence.text)
+        entities = self.extract_entities_enhanced(sentence.text, doc=doc)
         
         # Generate task components
         title = self.generate_title(sentence.text, req_type, entities)
@@ -16,6 +16,7 @@ from .generator_llm import get_llm_generator
 from .generator_model_based import ModelBasedTaskGenerator
 from .postprocess import get_postprocessor
 from .filters import is_valid_requirement_candidate  # Pre-filter function
+from .shared_features import SharedFeatureBatch
 
 logger = logging.getLogger(__name__)
 
@@ -159,19 +160,25 @@ class TaskGenerationPipeline:
         # Stage 2: Requirement Detection
         logger.info("🔍 Stage 2: Detecting requirements...")
         sentence_texts = [s.text for s in sentences]
+        # TF-IDF matrices are computed once per distinct vectorizer and shared
+        # by the detector and the enrichers
+        features = SharedFeatureBatch(sentence_texts)
         detection_results = self.detector.detect(
             sentence_texts,
-            threshold=requirement_threshold
+            threshold=requirement_threshold,
+            features=features
         )
         
         # Filter to requirements only
         requirement_sentences = []
         requirement_confidences = []
+        requirement_indices = []
         
-        for sentence, (is_req, confidence) in zip(sentences, detection_results):
+        for idx, (sentence, (is_req, confidence)) in enumerate(zip(sentences, detection_results)):
             if is_req:
                 requirement_sentences.append(sentence)
                 requirement_confidences.append(confidence)
+                requirement_indices.append(idx)
         
         logger.info(f"   Found {len(requirement_sentences)} requirements "
                    f"(filtered {len(sentences) - len(requirement_sentences)} non-requirements)")
@@ -184,18 +191,22 @@ class TaskGenerationPipeline:
         if len(requirement_sentences) > max_tasks:
             # Sort by confidence and take top max_tasks
             sorted_pairs = sorted(
-                zip(requirement_sentences, requirement_confidences),
+                zip(requirement_sentences, requirement_confidences, requirement_indices),
                 key=lambda x: x[1],
                 reverse=True
             )
-            requirement_sentences = [s for s, _ in sorted_pairs[:max_tasks]]
-            requirement_confidences = [c for _, c in sorted_pairs[:max_tasks]]
+            requirement_sentences = [s for s, _, _ in sorted_pairs[:max_tasks]]
+            requirement_confidences = [c for _, c, _ in sorted_pairs[:max_tasks]]
+            requirement_indices = [i for _, _, i in sorted_pairs[:max_tasks]]
             logger.info(f"   Limited to top {max_tasks} requirements by confidence")
         
         # Stage 3: Enrichment (type, priority, domain, role)
         logger.info("🏷️  Stage 3: Enriching requirements with labels...")
         req_texts = [s.text for s in requirement_sentences]
-        enrichment_results = self.enricher.enrich(req_texts)
+        enrichment_results = self.enricher.enrich(
+            req_texts,
+            features=features.subset(requirement_indices)
+        )
         
         # KEYWORD OVERRIDE: auth/security keywords → type=security, domain=general
         SECURITY_KEYWORDS = [
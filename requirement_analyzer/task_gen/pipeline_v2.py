@@ -10,9 +10,19 @@ Stage 3: Smart Slicing + INVEST Scoring
 Stage 4: Enhanced Task Generation
 
 Includes Quality Gates and Traceability.
+
+process_batch() runs requirements in a process pool when the batch is large
+enough (stages are independent per requirement); each worker builds its own
+refiner / gap detector / slicer once. Per-stage timings are aggregated into
+BatchV2Output.stage_timings.
 """
+import logging
+import math
+import os
+import threading
 import time
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from requirement_analyzer.task_gen.schemas_v2 import (
     Requirement,
     RequirementV2Output,
@@ -24,6 +34,14 @@ from requirement_analyzer.task_gen.refinement import RequirementRefiner
 from requirement_analyzer.task_gen.gap_detector import GapDetector
 from requirement_analyzer.task_gen.slicer import SmartSlicer
 
+logger = logging.getLogger(__name__)
+
+STAGES = ("refine", "gaps", "slice", "traceability")
+
+# A requirement takes well under 1ms of rule-based work, so below this the
+# pickling round trip to worker processes costs more than it saves
+PARALLEL_MIN_REQUIREMENTS = 256
+
 
 class V2Pipeline:
     """V2 Requirements Engineering Pipeline"""
@@ -44,25 +62,35 @@ class V2Pipeline:
         Returns:
             RequirementV2Output with all stages completed
         """
+        output, _ = self._process_timed(requirement)
+        return output
+
+    def _process_timed(self, requirement: Requirement) -> Tuple[RequirementV2Output, Dict[str, float]]:
+        """process_single_requirement plus seconds spent in each of STAGES"""
+        timings = {}
         start_time = time.time()
         
         # Quality Gate 1: Schema validation (already done by Pydantic)
         
         # Stage 1: Refinement
-        print(f"  [Stage 1] Refining {requirement.requirement_id}...")
+        t = time.perf_counter()
         refinement = self.refiner.refine(requirement)
+        timings["refine"] = time.perf_counter() - t
         
         # Stage 2: Gap Detection
-        print(f"  [Stage 2] Detecting gaps in {requirement.requirement_id}...")
+        t = time.perf_counter()
         gap_report = self.gap_detector.detect_gaps(requirement, refinement)
+        timings["gaps"] = time.perf_counter() - t
         
         # Quality Gate 2: Check critical gaps
         if gap_report.critical_count > 0:
-            print(f"  ⚠️  Found {gap_report.critical_count} CRITICAL gaps - flagged for review")
+            logger.debug("%s: %d CRITICAL gaps - flagged for review",
+                         requirement.requirement_id, gap_report.critical_count)
         
         # Stage 3: Smart Slicing + INVEST
-        print(f"  [Stage 3] Slicing {requirement.requirement_id} into stories...")
+        t = time.perf_counter()
         slicing = self.slicer.slice_requirement(refinement)
+        timings["slice"] = time.perf_counter() - t
         
         # Quality Gate 3: Check INVEST scores
         low_invest_count = sum(
@@ -71,10 +99,13 @@ class V2Pipeline:
             if story.invest_score.total < 20
         )
         if low_invest_count > 0:
-            print(f"  ⚠️  {low_invest_count} stories have low INVEST scores")
+            logger.debug("%s: %d stories have low INVEST scores",
+                         requirement.requirement_id, low_invest_count)
         
         # Build Traceability
+        t = time.perf_counter()
         traceability = self._build_traceability(requirement, refinement, slicing, gap_report)
+        timings["traceability"] = time.perf_counter() - t
         
         # Calculate Quality Metrics
         processing_time = time.time() - start_time
@@ -85,10 +116,11 @@ class V2Pipeline:
             processing_time
         )
         
-        print(f"  ✅ Completed {requirement.requirement_id} in {processing_time:.2f}s")
-        print(f"     └─ {slicing.total_stories} stories, {slicing.total_subtasks} subtasks, {gap_report.total_gaps} gaps")
+        logger.debug("Completed %s in %.3fs: %d stories, %d subtasks, %d gaps",
+                     requirement.requirement_id, processing_time,
+                     slicing.total_stories, slicing.total_subtasks, gap_report.total_gaps)
         
-        return RequirementV2Output(
+        output = RequirementV2Output(
             requirement_id=requirement.requirement_id,
             original_requirement=requirement.original_text,
             domain=requirement.domain or "unknown",
@@ -99,32 +131,40 @@ class V2Pipeline:
             traceability=traceability,
             quality_metrics=quality_metrics
         )
+        return output, timings
     
-    def process_batch(self, requirements: List[Requirement]) -> BatchV2Output:
+    def process_batch(self, requirements: List[Requirement],
+                      max_workers: Optional[int] = None) -> BatchV2Output:
         """
         Process batch of requirements through V2 pipeline
         
         Args:
             requirements: List of raw requirements
+            max_workers: Worker processes (default V2_PIPELINE_WORKERS or
+                min(4, CPUs)); 1, or fewer than PARALLEL_MIN_REQUIREMENTS
+                requirements, runs in this process
             
         Returns:
-            BatchV2Output with summary statistics
+            BatchV2Output with summary statistics and per-stage timings,
+            requirements in input order (failed ones are left out)
         """
-        print(f"\n{'='*70}")
-        print(f"V2 Pipeline: Processing {len(requirements)} requirements")
-        print(f"{'='*70}\n")
+        workers = max_workers if max_workers is not None else _default_workers()
+        if len(requirements) < PARALLEL_MIN_REQUIREMENTS:
+            workers = 1
         
         start_time = time.time()
         outputs = []
+        stage_times = {stage: [] for stage in STAGES}
+        failed = []
         
-        for idx, requirement in enumerate(requirements, 1):
-            print(f"[{idx}/{len(requirements)}] Processing {requirement.requirement_id}...")
-            try:
-                output = self.process_single_requirement(requirement)
-                outputs.append(output)
-            except Exception as e:
-                print(f"  ❌ Error processing {requirement.requirement_id}: {e}")
+        for requirement, (output, timings, error) in zip(requirements, self._run(requirements, workers)):
+            if output is None:
+                logger.warning("Error processing %s: %s", requirement.requirement_id, error)
+                failed.append(requirement.requirement_id)
                 continue
+            outputs.append(output)
+            for stage in STAGES:
+                stage_times[stage].append(timings[stage])
         
         processing_time = time.time() - start_time
         
@@ -142,28 +182,28 @@ class V2Pipeline:
         ]
         avg_invest_score = sum(all_invest_scores) / len(all_invest_scores) if all_invest_scores else 0
         
+        stage_timings = _aggregate_stage_timings(stage_times)
+        
         # Summary
         summary = {
             "processing_time_seconds": processing_time,
-            "success_rate": len(outputs) / len(requirements) * 100,
+            "success_rate": len(outputs) / len(requirements) * 100 if requirements else 0,
             "avg_stories_per_requirement": total_stories / len(outputs) if outputs else 0,
             "avg_subtasks_per_requirement": total_subtasks / len(outputs) if outputs else 0,
             "avg_gaps_per_requirement": total_gaps / len(outputs) if outputs else 0,
             "avg_invest_score": avg_invest_score,
             "critical_gaps_count": sum(o.gap_report.critical_count for o in outputs),
             "high_gaps_count": sum(o.gap_report.high_count for o in outputs),
+            "workers": workers,
+            "failed_requirements": failed,
+            "slowest_stage": max(STAGES, key=lambda s: stage_timings[s]["total_seconds"]) if outputs else None,
         }
         
-        print(f"\n{'='*70}")
-        print(f"V2 Pipeline: Completed in {processing_time:.2f}s")
-        print(f"{'='*70}")
-        print(f"  Requirements: {len(requirements)} → {len(outputs)} processed ({summary['success_rate']:.1f}%)")
-        print(f"  Stories: {total_stories} ({summary['avg_stories_per_requirement']:.1f} per req)")
-        print(f"  Subtasks: {total_subtasks} ({summary['avg_subtasks_per_requirement']:.1f} per req)")
-        print(f"  Gaps: {total_gaps} ({summary['avg_gaps_per_requirement']:.1f} per req)")
-        print(f"  INVEST Score: {avg_invest_score:.1f}/30 average")
-        print(f"  Critical Gaps: {summary['critical_gaps_count']}")
-        print(f"{'='*70}\n")
+        logger.info(
+            "V2 batch: %d/%d requirements in %.2fs (%d workers); stage totals %s",
+            len(outputs), len(requirements), processing_time, workers,
+            ", ".join(f"{s}={stage_timings[s]['total_seconds']:.3f}s" for s in STAGES),
+        )
         
         return BatchV2Output(
             requirements=outputs,
@@ -173,8 +213,16 @@ class V2Pipeline:
             total_gaps=total_gaps,
             avg_invest_score=avg_invest_score,
             processing_time_seconds=processing_time,
+            stage_timings=stage_timings,
             summary=summary
         )
+
+    def _run(self, requirements: List[Requirement], workers: int):
+        """(output | None, stage timings, error) per requirement, in input order"""
+        if workers <= 1:
+            return (_process_safely(self, r) for r in requirements)
+        chunksize = max(1, math.ceil(len(requirements) / (workers * 4)))
+        return _get_executor(workers).map(_process_in_worker, requirements, chunksize=chunksize)
     
     def _build_traceability(
         self,
@@ -247,3 +295,71 @@ class V2Pipeline:
             invest_avg_score=invest_avg_score,
             processing_time_seconds=processing_time
         )
+
+
+def _process_safely(pipeline: V2Pipeline, requirement: Requirement):
+    try:
+        output, timings = pipeline._process_timed(requirement)
+        return output, timings, None
+    except Exception as e:
+        # The message, not the exception: it has to cross the process boundary
+        return None, {}, f"{type(e).__name__}: {e}"
+
+
+def _aggregate_stage_timings(stage_times: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    """Per stage: summed seconds (across workers), mean/max per requirement, share of total"""
+    grand_total = sum(sum(times) for times in stage_times.values())
+    return {
+        stage: {
+            "total_seconds": round(sum(times), 6),
+            "avg_ms": round(sum(times) / len(times) * 1000, 4) if times else 0.0,
+            "max_ms": round(max(times) * 1000, 4) if times else 0.0,
+            "share": round(sum(times) / grand_total, 4) if grand_total else 0.0,
+        }
+        for stage, times in stage_times.items()
+    }
+
+
+# ── Worker processes ─────────────────────────────────────────────────────
+
+_worker_pipeline: Optional[V2Pipeline] = None
+
+
+def _init_worker():
+    """Build the stage components once per worker process"""
+    global _worker_pipeline
+    _worker_pipeline = V2Pipeline()
+
+
+def _process_in_worker(requirement: Requirement):
+    return _process_safely(_worker_pipeline, requirement)
+
+
+def _default_workers() -> int:
+    return int(os.getenv("V2_PIPELINE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Shared worker pool (recreated if a different size is requested)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+            _executor_workers = workers
+        return _executor
+
+
+def shutdown_pipeline_executor():
+    """Stop the V2 pipeline worker processes (call from the app shutdown hook)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
@@ -5,9 +5,11 @@ Load trained model và detect requirements từ sentences
 import joblib
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 import logging
 
+from .shared_features import SharedFeatureBatch, get_vectorizer_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +19,7 @@ class RequirementDetector:
     def __init__(self, model_dir: Path):
         self.model_dir = Path(model_dir)
         self.vectorizer = None
+        self.vectorizer_digest = None
         self.model = None
         self.loaded = False
     
@@ -30,7 +33,7 @@ class RequirementDetector:
                 logger.warning(f"Requirement detector models not found in {self.model_dir}")
                 return False
             
-            self.vectorizer = joblib.load(vec_path)
+            self.vectorizer, self.vectorizer_digest = get_vectorizer_registry().load(vec_path)
             self.model = joblib.load(model_path)
             self.loaded = True
             
@@ -45,7 +48,8 @@ class RequirementDetector:
         self,
         texts: List[str],
         threshold: float = 0.5,
-        return_proba: bool = True
+        return_proba: bool = True,
+        features: Optional[SharedFeatureBatch] = None
     ) -> List[Tuple[bool, float]]:
         """
         Detect requirements from list of texts
@@ -54,6 +58,7 @@ class RequirementDetector:
             texts: List of text strings
             threshold: Probability threshold for classification
             return_proba: Whether to return probabilities
+            features: Shared feature batch over the same texts (reuses TF-IDF matrices)
         
         Returns:
             List of (is_requirement, confidence) tuples
@@ -65,8 +70,11 @@ class RequirementDetector:
                 return [(True, 0.5) for _ in texts]
         
         try:
-            # Vectorize
-            X = self.vectorizer.transform(texts)
+            # Vectorize (once per batch when features are shared)
+            if features is not None:
+                X = features.transform(self.vectorizer_digest, self.vectorizer)
+            else:
+                X = self.vectorizer.transform(texts)
             
             # Predict probabilities
             probas = self.model.predict_proba(X)
@@ -0,0 +1,258 @@
+"""
+Per-requirement memo for incremental V2 task generation
+Re-submitting an edited document only re-runs the V2 pipeline for new or
+changed requirement lines; unchanged ones reuse their RequirementV2Output
+"""
+
+import difflib
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from requirement_analyzer.task_gen.schemas_v2 import RequirementV2Output, Traceability
+
+# Bumped with the V2 schema version, so a pipeline upgrade never serves stale output
+PIPELINE_VERSION = RequirementV2Output.model_fields["version"].default
+
+# Story fields compared by diff_stories (sprint placement and ids are derived)
+STORY_CONTENT_FIELDS = (
+    "title", "user_story", "story_points", "priority",
+    "acceptance_criteria", "subtasks", "nfrs",
+)
+
+# Minimum story-text similarity to treat a requirement line as edited, not replaced
+PAIR_MIN_SIMILARITY = 0.5
+
+MemoKey = Tuple[str, str, str, str]
+
+
+def normalize_requirement_text(text: str) -> str:
+    """Unicode NFC + collapsed whitespace: edits that only re-flow a line still hit"""
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def requirement_fingerprint(text: str) -> str:
+    """Short stable hash of a requirement line (used in story source keys)"""
+    return hashlib.sha1(normalize_requirement_text(text).encode("utf-8")).hexdigest()[:12]
+
+
+class RequirementMemo:
+    """
+    Thread-safe LRU of RequirementV2Output keyed by
+    (normalized text, language, domain, pipeline version)
+
+    Outputs are stored with the requirement_id they were generated under;
+    get() rebases them onto the id the requirement has in the new document.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[MemoKey, RequirementV2Output]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, language: str, domain: Optional[str]) -> MemoKey:
+        return (normalize_requirement_text(text), language or "", domain or "", PIPELINE_VERSION)
+
+    def get(self, key: MemoKey, requirement_id: str) -> Optional[RequirementV2Output]:
+        with self._lock:
+            output = self._entries.get(key)
+            if output is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return rebase_requirement_id(output, requirement_id)
+
+    def put(self, key: MemoKey, output: RequirementV2Output):
+        with self._lock:
+            self._entries[key] = output
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# ── Requirement id rebasing ──────────────────────────────────────────────
+
+def rebase_requirement_id(output: RequirementV2Output, new_id: str) -> RequirementV2Output:
+    """
+    Copy of `output` with its requirement id replaced by `new_id`
+
+    Requirement ids are positional (REQ-<line>) and prefix every story/task
+    id (REQ-3_ST01_T02), so a line that moved gets new ids. Only id fields
+    (`*_id`, `*_ids`, `*_refs`) and Traceability links are rewritten — free
+    text such as the requirement itself is left untouched.
+    """
+    old_id = output.requirement_id
+    if old_id == new_id:
+        return output
+    # Whole-token match: REQ-1 must not touch REQ-12; the _ST/_T suffixes may follow
+    pattern = re.compile(rf"(?<![\w-]){re.escape(old_id)}(?![0-9A-Za-z-])")
+    return _rebase(output, pattern, new_id, ids=False)
+
+
+def _is_id_field(name: str) -> bool:
+    return name.endswith(("_id", "_ids", "_refs")) or name == "id"
+
+
+def _rebase(value: Any, pattern: "re.Pattern", new_id: str, ids: bool) -> Any:
+    if isinstance(value, str):
+        return pattern.sub(new_id, value) if ids else value
+    if isinstance(value, BaseModel):
+        in_links = ids or isinstance(value, Traceability)
+        updates = {
+            name: _rebase(getattr(value, name), pattern, new_id, in_links or _is_id_field(name))
+            for name in type(value).model_fields
+        }
+        return value.model_copy(update=updates)
+    if isinstance(value, list):
+        return [_rebase(v, pattern, new_id, ids) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_rebase(v, pattern, new_id, ids) for v in value)
+    if isinstance(value, dict):
+        return {k: _rebase(v, pattern, new_id, ids) for k, v in value.items()}
+    return value
+
+
+# ── Story diff ───────────────────────────────────────────────────────────
+
+def diff_stories(previous: Iterable[Dict[str, Any]], current: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Added / removed / changed user stories between two generations
+
+    Stories are matched by `source_key` ("<requirement fingerprint>:<n>").
+    Requirement lines that were edited (not just moved) are paired up with
+    difflib over the sequence of requirement fingerprints, so the stories of
+    an edited line are reported as changed rather than removed + added.
+    Stories without a source_key (older history) are matched by id.
+    """
+    previous = list(previous)
+    current = list(current)
+    old_by_key = {_story_key(s): s for s in previous}
+    new_by_key = {_story_key(s): s for s in current}
+
+    # Pair edited requirement lines: replace blocks of the fingerprint sequence
+    old_reqs = _requirement_order(previous)
+    new_reqs = _requirement_order(current)
+    renamed: Dict[str, str] = {}  # old fingerprint → new fingerprint
+    matcher = difflib.SequenceMatcher(None, old_reqs, new_reqs, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "replace":
+            renamed.update(_pair_edited(old_reqs[i1:i2], new_reqs[j1:j2], previous, current))
+
+    added, removed, changed = [], [], []
+    unchanged = 0
+    matched_new = set()
+    for old_key, old_story in old_by_key.items():
+        new_key = old_key
+        if old_key not in new_by_key and ":" in old_key:
+            fingerprint, ordinal = old_key.rsplit(":", 1)
+            if fingerprint in renamed:
+                new_key = f"{renamed[fingerprint]}:{ordinal}"
+        new_story = new_by_key.get(new_key)
+        if new_story is None:
+            removed.append(old_story.get("id"))
+            continue
+        matched_new.add(new_key)
+        fields = [
+            f for f in STORY_CONTENT_FIELDS
+            if _content(old_story.get(f)) != _content(new_story.get(f))
+        ]
+        if fields:
+            changed.append({"id": new_story.get("id"), "previous_id": old_story.get("id"), "fields": fields})
+        else:
+            unchanged += 1
+    added = [s.get("id") for k, s in new_by_key.items() if k not in matched_new]
+
+    return {
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "unchanged": unchanged,
+    }
+
+
+def _pair_edited(old_fps: List[str], new_fps: List[str],
+                 previous: List[Dict[str, Any]], current: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Pair the requirement lines of one replace block
+
+    Same number of lines on both sides: edited in place, pair by position.
+    Otherwise lines were also added/removed, so pair greedily by how similar
+    their stories read (ratio >= PAIR_MIN_SIMILARITY).
+    """
+    if len(old_fps) == len(new_fps):
+        return dict(zip(old_fps, new_fps))
+    old_text = _requirement_texts(previous, old_fps)
+    new_text = _requirement_texts(current, new_fps)
+    scored = sorted(
+        (
+            (difflib.SequenceMatcher(None, old_text[o], new_text[n], autojunk=False).ratio(), o, n)
+            for o in old_fps for n in new_fps
+        ),
+        key=lambda item: item[0],
+        reverse=True,
+    )
+    pairs: Dict[str, str] = {}
+    taken = set()
+    for ratio, o, n in scored:
+        if ratio < PAIR_MIN_SIMILARITY:
+            break
+        if o not in pairs and n not in taken:
+            pairs[o] = n
+            taken.add(n)
+    return pairs
+
+
+def _requirement_texts(stories: List[Dict[str, Any]], fingerprints: List[str]) -> Dict[str, str]:
+    texts = {fp: [] for fp in fingerprints}
+    for story in stories:
+        fp = (story.get("source_key") or "").rsplit(":", 1)[0]
+        if fp in texts:
+            texts[fp].append(f"{story.get('title') or ''} {story.get('user_story') or ''}")
+    return {fp: " ".join(parts).lower() for fp, parts in texts.items()}
+
+
+def _story_key(story: Dict[str, Any]) -> str:
+    return story.get("source_key") or f"id:{story.get('id')}"
+
+
+def _content(value: Any) -> Any:
+    """Value with id fields dropped: subtask ids follow the requirement's position"""
+    if isinstance(value, dict):
+        return {k: _content(v) for k, v in value.items() if not _is_id_field(k)}
+    if isinstance(value, list):
+        return [_content(v) for v in value]
+    return value
+
+
+_REQUIREMENT_INDEX = re.compile(r"^REQ-(\d+)_")
+
+
+def _requirement_index(story: Dict[str, Any]) -> float:
+    match = _REQUIREMENT_INDEX.match(str(story.get("id") or ""))
+    return int(match.group(1)) if match else float("inf")
+
+
+def _requirement_order(stories: List[Dict[str, Any]]) -> List[str]:
+    """Requirement fingerprints in document order (stories are sorted by dependency)"""
+    seen: Dict[str, None] = {}
+    for story in sorted(stories, key=_requirement_index):
+        key = story.get("source_key")
+        if key and ":" in key:
+            seen.setdefault(key.rsplit(":", 1)[0], None)
+    return list(seen)
@@ -328,4 +328,8 @@ class BatchV2Output(BaseModel):
     total_gaps: int
     avg_invest_score: float
     processing_time_seconds: float
+    stage_timings: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        description="Per stage (refine, gaps, slice, traceability): total_seconds, avg_ms, max_ms, share"
+    )
     summary: Dict[str, Any] = Field(default_factory=dict)
@@ -25,12 +25,14 @@ from .generator import StoryGenerator
 from .ac_engine import ACGenerator
 from .dependencies import DependencyEngine
 from .dependency_ai import DependencyAI, StoryNode, Edge
+from .what_if import WhatIfSession, WhatIfSessionStore
 from .feedback import FeedbackStore
 from .embedding import (
     SentenceTransformerBackend,
     KeywordOverlapBackend,
     auto_backend,
 )
+from .embedding_cache import EmbeddingCache
 from .sp_estimator import (
     HeuristicEstimator,
     SklearnEstimator,
@@ -49,10 +51,13 @@ __all__ = [
     "DependencyAI",
     "StoryNode",
     "Edge",
+    "WhatIfSession",
+    "WhatIfSessionStore",
     "FeedbackStore",
     "SentenceTransformerBackend",
     "KeywordOverlapBackend",
     "auto_backend",
+    "EmbeddingCache",
     "HeuristicEstimator",
     "SklearnEstimator",
     "train_from_feedback",
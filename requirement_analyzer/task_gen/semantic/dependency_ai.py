@@ -27,6 +27,11 @@ Design
   generation" when the latter is phrased unusually).
 * **Stable IDs** — every story gets a deterministic ``story_id`` so
   the resulting graph is JSON-serialisable and idempotent.
+* **Indexed graph core** — edges live in ``src → {dst: Edge}`` /
+  ``dst → {src: Edge}`` dicts, so dedup and removal are O(1).  Cycles are
+  broken in one Tarjan SCC pass; topological order, transitive
+  descendant counts (bitset reachability) and depths are memoised and
+  dropped whenever an edge is added or removed.
 """
 from __future__ import annotations
 
@@ -147,19 +152,22 @@ class DependencyAI:
         self._embed_threshold = embedding_threshold
         # Lazily-built state
         self._nodes: Dict[str, StoryNode] = {}
-        self._adj: Dict[str, List[Edge]] = defaultdict(list)   # src → edges
-        self._radj: Dict[str, List[Edge]] = defaultdict(list)  # dst → edges
+        self._out: Dict[str, Dict[str, Edge]] = defaultdict(dict)  # src → {dst: edge}
+        self._in: Dict[str, Dict[str, Edge]] = defaultdict(dict)   # dst → {src: edge}
+        self._memo: Dict[str, Any] = {}
 
     # ── Public: build ───────────────────────────────────────────────────
     def build(self, items: Sequence[Any]) -> "DependencyAI":
         """Construct the dependency DAG.
 
         ``items`` may be a list of ``StoryIR``, ``StoryNode`` or plain
-        dicts.  Cycles are broken by dropping the lowest-weight edge.
+        dicts.  Cycles are broken by dropping the low-weight edges that
+        close them (one SCC pass, see ``_break_cycles``).
         """
         self._nodes = {}
-        self._adj = defaultdict(list)
-        self._radj = defaultdict(list)
+        self._out = defaultdict(dict)
+        self._in = defaultdict(dict)
+        self.invalidate()
 
         nodes = _wrap_nodes(items)
         for n in nodes:
@@ -202,15 +210,33 @@ class DependencyAI:
 
     def _add_edge(self, edge: Edge) -> None:
         # Dedup by (src, dst) — keep the highest weight + most informative kind
-        for e in self._adj[edge.src]:
-            if e.dst == edge.dst:
-                if edge.weight > e.weight:
-                    e.weight = edge.weight
-                    e.kind = edge.kind
-                    e.reason = edge.reason
-                return
-        self._adj[edge.src].append(edge)
-        self._radj[edge.dst].append(edge)
+        e = self._out[edge.src].get(edge.dst)
+        if e is not None:
+            if edge.weight > e.weight:
+                e.weight = edge.weight
+                e.kind = edge.kind
+                e.reason = edge.reason
+                self._memo.clear()  # weights feed the critical path / risk scores
+            return
+        self._out[edge.src][edge.dst] = edge
+        self._in[edge.dst][edge.src] = edge
+        self._memo.clear()
+
+    def _remove_edge(self, src: str, dst: str) -> Optional[Edge]:
+        edge = self._out.get(src, {}).pop(dst, None)
+        if edge is not None:
+            self._in[dst].pop(src, None)
+            self._memo.clear()
+        return edge
+
+    def invalidate(self) -> None:
+        """Drop memoised analytics.
+
+        Called on every edge mutation; call it yourself after editing a
+        node's ``ir`` or ``story_points`` in place.  Sprints are never
+        memoised, so ``what_if`` and sprint edits need no invalidation.
+        """
+        self._memo.clear()
 
     # ── Embedding edges ────────────────────────────────────────────────
     def _embedding_links(self, nodes: List[StoryNode]) -> None:
@@ -228,27 +254,19 @@ class DependencyAI:
         # *precedes* this one.  For each story `n`, ask: among all
         # other story descriptions, which is most similar to a
         # synthetic "before <n.intent>" query?
-        for n in nodes:
-            if not n.text_repr.strip() or not n.ir.intent:
-                continue
-            query = f"prerequisite for {n.ir.intent} {n.ir.entity or ''}".strip()
-            candidates_ids = [oid for oid in defs if oid != n.story_id]
-            candidates_text = [defs[i] for i in candidates_ids]
-            try:
-                best, score = self._embed(query, candidates_text)
-            except Exception as exc:  # backend failure should never break us
-                log.debug("Embedding backend error: %s", exc)
-                continue
-            if not best or score < self._embed_threshold:
+        sources = [n for n in nodes if n.text_repr.strip() and n.ir.intent]
+        queries = [f"prerequisite for {n.ir.intent} {n.ir.entity or ''}".strip()
+                   for n in sources]
+        best_sources = self._batched_best_sources(sources, queries, defs)
+        for i, n in enumerate(sources):
+            if best_sources is not None:
+                src_id, score = best_sources[i]
+            else:
+                src_id, score = self._best_source(n, queries[i], defs)
+            if src_id is None or score < self._embed_threshold:
                 continue
-            # Map text back to ID
-            try:
-                idx = candidates_text.index(best)
-            except ValueError:
-                continue
-            src_id = candidates_ids[idx]
             # Avoid creating reverse edges that contradict an existing rule edge
-            if any(e.dst == src_id for e in self._adj[n.story_id]):
+            if src_id in self._out.get(n.story_id, {}):
                 continue
             self._add_edge(Edge(
                 src=src_id, dst=n.story_id,
@@ -256,60 +274,167 @@ class DependencyAI:
                 reason=f"embedding:sim={score:.2f}",
             ))
 
+    def _best_source(
+        self, n: StoryNode, query: str, defs: Dict[str, str],
+    ) -> Tuple[Optional[str], float]:
+        """One backend call: most similar other story to ``query``."""
+        candidates_ids = [oid for oid in defs if oid != n.story_id]
+        candidates_text = [defs[i] for i in candidates_ids]
+        try:
+            best, score = self._embed(query, candidates_text)
+        except Exception as exc:  # backend failure should never break us
+            log.debug("Embedding backend error: %s", exc)
+            return None, 0.0
+        if not best:
+            return None, 0.0
+        # Map text back to ID
+        try:
+            idx = candidates_text.index(best)
+        except ValueError:
+            return None, 0.0
+        return candidates_ids[idx], score
+
+    def _batched_best_sources(
+        self, sources: List[StoryNode], queries: List[str], defs: Dict[str, str],
+    ) -> Optional[List[Tuple[Optional[str], float]]]:
+        """All queries against all stories in one similarity matrix.
+
+        Used when the backend exposes ``similarity_matrix`` (e.g.
+        ``SentenceTransformerBackend``); returns ``None`` otherwise so the
+        caller falls back to one backend call per story.
+        """
+        similarity_matrix = getattr(self._embed, "similarity_matrix", None)
+        if similarity_matrix is None or not sources:
+            return None
+        ids = list(defs)
+        try:
+            sims = similarity_matrix(queries, [defs[i] for i in ids])
+        except Exception as exc:  # backend failure should never break us
+            log.debug("Embedding backend error: %s", exc)
+            return [(None, 0.0)] * len(sources)
+        if sims is None:
+            return [(None, 0.0)] * len(sources)
+
+        column = {sid: j for j, sid in enumerate(ids)}
+        results: List[Tuple[Optional[str], float]] = []
+        for row, n in enumerate(sources):
+            scores = sims[row].copy()
+            own = column.get(n.story_id)
+            if own is not None:
+                scores[own] = float("-inf")  # a story is not its own prerequisite
+            best = int(scores.argmax())
+            # Identical texts share a score; the first one wins as with
+            # ``candidates_text.index`` in the per-story path.
+            results.append((ids[best], float(scores[best])))
+        return results
+
     # ── Cycle breaking ─────────────────────────────────────────────────
     def _break_cycles(self) -> None:
-        """Greedy: while a cycle exists, remove its lowest-weight edge."""
-        while True:
-            cyc = self._find_cycle()
-            if not cyc:
-                return
-            # Find the lowest-weight edge along the cycle
-            worst: Optional[Edge] = None
-            for src, dst in zip(cyc, cyc[1:] + cyc[:1]):
-                for e in self._adj[src]:
-                    if e.dst == dst and (worst is None or e.weight < worst.weight):
-                        worst = e
-            if worst is None:
-                return  # shouldn't happen
-            self._adj[worst.src] = [e for e in self._adj[worst.src]
-                                    if e.dst != worst.dst]
-            self._radj[worst.dst] = [e for e in self._radj[worst.dst]
-                                     if e.src != worst.src]
-            log.debug("Broke cycle by removing %s → %s",
-                      worst.src, worst.dst)
-
-    def _find_cycle(self) -> List[str]:
-        WHITE, GRAY, BLACK = 0, 1, 2
-        color: Dict[str, int] = {nid: WHITE for nid in self._nodes}
-        parent: Dict[str, Optional[str]] = {nid: None for nid in self._nodes}
-        cycle: List[str] = []
-
-        def dfs(u: str) -> bool:
-            color[u] = GRAY
-            for e in self._adj[u]:
-                v = e.dst
-                if color.get(v, WHITE) == GRAY:
-                    # Reconstruct cycle u..v..u
-                    nonlocal cycle
-                    path = [u]
-                    p = parent.get(u)
-                    while p is not None and p != v:
-                        path.append(p)
-                        p = parent.get(p)
-                    path.append(v)
-                    cycle = list(reversed(path))
-                    return True
-                if color.get(v, WHITE) == WHITE:
-                    parent[v] = u
-                    if dfs(v):
-                        return True
-            color[u] = BLACK
-            return False
-
-        for nid in self._nodes:
-            if color[nid] == WHITE and dfs(nid):
-                return cycle
-        return []
+        """Make the graph acyclic, dropping the weakest edge of each cycle.
+
+        One Tarjan pass isolates the strongly connected components; only
+        the cyclic ones are walked again (see ``_break_component``).
+        """
+        for component in self._strongly_connected_components(self._nodes):
+            if len(component) > 1:
+                self._break_component(component, set(component))
+            elif component[0] in self._out.get(component[0], {}):
+                self._remove_edge(component[0], component[0])
+                log.debug("Broke cycle by removing %s → %s", component[0], component[0])
+
+    def _break_component(self, component: List[str], members: Set[str]) -> None:
+        """Single resumable DFS over one strongly connected component.
+
+        A back edge closes the cycle *path-from-target + edge*; its weakest
+        edge is removed.  When that is a tree edge, only the path below it
+        is unwound (those nodes become unvisited again) — finished nodes
+        can only reach finished nodes, so they never need revisiting.
+        """
+        ACTIVE, DONE = 1, 2
+        state: Dict[str, int] = {}
+        for root in component:
+            if root in state:
+                continue
+            state[root] = ACTIVE
+            path_nodes = [root]
+            path_edges: List[Edge] = []
+            position = {root: 0}
+            work = [iter(list(self._out.get(root, {}).values()))]
+            while work:
+                for e in work[-1]:
+                    if e.dst not in members or self._out[e.src].get(e.dst) is not e:
+                        continue  # leaves the component, or already removed
+                    seen = state.get(e.dst)
+                    if seen is None:
+                        state[e.dst] = ACTIVE
+                        position[e.dst] = len(path_nodes)
+                        path_nodes.append(e.dst)
+                        path_edges.append(e)
+                        work.append(iter(list(self._out.get(e.dst, {}).values())))
+                        break
+                    if seen == DONE:
+                        continue
+                    cycle = path_edges[position[e.dst]:] + [e]
+                    weakest = min(cycle, key=lambda c: c.weight)
+                    self._remove_edge(weakest.src, weakest.dst)
+                    log.debug("Broke cycle by removing %s → %s", weakest.src, weakest.dst)
+                    if weakest is e:
+                        continue
+                    cut = position[weakest.src] + 1
+                    for nid in path_nodes[cut:]:
+                        del state[nid], position[nid]
+                    del path_nodes[cut:], path_edges[cut - 1:], work[cut:]
+                    break
+                else:
+                    state[path_nodes.pop()] = DONE
+                    if path_edges:
+                        path_edges.pop()
+                    work.pop()
+
+    def _strongly_connected_components(self, roots: Iterable[str]) -> List[List[str]]:
+        """Iterative Tarjan (no recursion limit on long dependency chains)."""
+        def successors(v: str):
+            return iter(self._out.get(v, {}))
+
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+
+        for root in roots:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, successors(root))]
+            while work:
+                v, children = work[-1]
+                for w in children:
+                    if w not in index:
+                        index[w] = low[w] = len(index)
+                        stack.append(w)
+                        on_stack.add(w)
+                        work.append((w, successors(w)))
+                        break
+                    if w in on_stack:
+                        low[v] = min(low[v], index[w])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[v])
+                    if low[v] == index[v]:
+                        component: List[str] = []
+                        while True:
+                            w = stack.pop()
+                            on_stack.discard(w)
+                            component.append(w)
+                            if w == v:
+                                break
+                        components.append(component)
+        return components
 
     # ── Public: queries ────────────────────────────────────────────────
     @property
@@ -317,13 +442,19 @@ class DependencyAI:
         return self._nodes
 
     def edges(self) -> List[Edge]:
-        return [e for edges in self._adj.values() for e in edges]
+        return [e for edges in self._out.values() for e in edges.values()]
 
     def topological_order(self) -> List[StoryNode]:
         """Kahn's algorithm.  Ties broken by domain → intent for stability."""
+        return [self._nodes[nid] for nid in self._topological_ids()]
+
+    def _topological_ids(self) -> List[str]:
+        if "topo" in self._memo:
+            return self._memo["topo"]
         indeg: Dict[str, int] = {nid: 0 for nid in self._nodes}
-        for e in self.edges():
-            indeg[e.dst] = indeg.get(e.dst, 0) + 1
+        for dst, sources in self._in.items():
+            if sources:
+                indeg[dst] = indeg.get(dst, 0) + len(sources)
         ready = deque(sorted(
             (nid for nid, d in indeg.items() if d == 0),
             key=lambda nid: (
@@ -331,48 +462,78 @@ class DependencyAI:
                 self._nodes[nid].ir.intent or "zzz",
             ),
         ))
-        order: List[StoryNode] = []
+        order: List[str] = []
         while ready:
             nid = ready.popleft()
-            order.append(self._nodes[nid])
-            for e in self._adj[nid]:
-                indeg[e.dst] -= 1
-                if indeg[e.dst] == 0:
-                    ready.append(e.dst)
+            order.append(nid)
+            for dst in self._out.get(nid, {}):
+                indeg[dst] -= 1
+                if indeg[dst] == 0:
+                    ready.append(dst)
+        self._memo["topo"] = order
         return order
 
+    def _descendant_counts(self) -> Dict[str, int]:
+        """Transitive descendants per node, in one reverse-topological sweep.
+
+        Each node's closure is a Python-int bitset (bit *i* = *i*-th node
+        in topological order): its own bit OR'd with its children's closures.
+        """
+        if "descendants" in self._memo:
+            return self._memo["descendants"]
+        order = self._topological_ids()
+        closure: Dict[str, int] = {}
+        counts: Dict[str, int] = {nid: 0 for nid in self._nodes}
+        for i in range(len(order) - 1, -1, -1):
+            nid = order[i]
+            reach = 0
+            for dst in self._out.get(nid, ()):
+                reach |= closure.get(dst, 0)
+            closure[nid] = reach | (1 << i)
+            counts[nid] = bin(reach).count("1")
+        self._memo["descendants"] = counts
+        return counts
+
+    def _depths(self) -> Dict[str, int]:
+        """Longest chain *into* each node (edges count 1)."""
+        if "depths" in self._memo:
+            return self._memo["depths"]
+        depth: Dict[str, int] = {nid: 0 for nid in self._nodes}
+        for nid in self._topological_ids():
+            sources = self._in.get(nid)
+            if sources:
+                depth[nid] = max(map(depth.__getitem__, sources)) + 1
+        self._memo["depths"] = depth
+        return depth
+
     def bottlenecks(self, top_k: int = 5) -> List[Tuple[StoryNode, int]]:
         """Stories that block the most other work (out-degree, transitive).
 
         Returns a list of ``(node, blocked_count)`` ordered desc.
         """
-        blocked: Dict[str, int] = {}
-        for nid in self._nodes:
-            seen: Set[str] = set()
-            stack = [e.dst for e in self._adj[nid]]
-            while stack:
-                v = stack.pop()
-                if v in seen:
-                    continue
-                seen.add(v)
-                stack.extend(e.dst for e in self._adj[v])
-            blocked[nid] = len(seen)
+        blocked = self._descendant_counts()
         ordered = sorted(blocked.items(), key=lambda kv: kv[1], reverse=True)
         return [(self._nodes[nid], n) for nid, n in ordered[:top_k] if n > 0]
 
     def critical_path(self) -> List[StoryNode]:
         """Longest dependency chain weighted by story points (or 1)."""
+        if "critical_path" not in self._memo:
+            self._memo["critical_path"] = self._critical_path_ids()
+        return [self._nodes[i] for i in self._memo["critical_path"]]
+
+    def _critical_path_ids(self) -> List[str]:
         # DAG longest path via topological DP
-        order = [n.story_id for n in self.topological_order()]
+        order = self._topological_ids()
         dist: Dict[str, float] = {nid: 0.0 for nid in self._nodes}
         prev: Dict[str, Optional[str]] = {nid: None for nid in self._nodes}
         for nid in order:
             w = self._nodes[nid].story_points or 1
-            for e in self._adj[nid]:
-                cand = dist[nid] + (w if e.weight >= 1.0 else w * e.weight)
-                if cand > dist.get(e.dst, 0.0):
-                    dist[e.dst] = cand
-                    prev[e.dst] = nid
+            base = dist[nid]
+            for dst, e in self._out.get(nid, {}).items():
+                cand = base + (w if e.weight >= 1.0 else w * e.weight)
+                if cand > dist[dst]:
+                    dist[dst] = cand
+                    prev[dst] = nid
         if not dist:
             return []
         end = max(dist, key=lambda k: dist[k])
@@ -381,7 +542,7 @@ class DependencyAI:
         while cur is not None:
             path.append(cur)
             cur = prev[cur]
-        return [self._nodes[i] for i in reversed(path)]
+        return path[::-1]
 
     def validate_sprints(self) -> List[Dict[str, Any]]:
         """Return a list of plan-violation issues.
@@ -390,44 +551,57 @@ class DependencyAI:
         sprint than one of its prerequisites — that's an unbuildable plan.
         """
         issues: List[Dict[str, Any]] = []
-        for e in self.edges():
-            src = self._nodes[e.src]
-            dst = self._nodes[e.dst]
-            if src.sprint is None or dst.sprint is None:
+        for src_id, out in self._out.items():
+            if self._nodes[src_id].sprint is None:
                 continue
-            if src.sprint > dst.sprint:
-                issues.append({
-                    "type": "dependency_violation",
-                    "blocker": src.story_id,
-                    "blocked": dst.story_id,
-                    "blocker_sprint": src.sprint,
-                    "blocked_sprint": dst.sprint,
-                    "reason": e.reason,
-                    "message": (
-                        f"Story '{dst.title or dst.story_id}' is scheduled in "
-                        f"Sprint {dst.sprint} but depends on "
-                        f"'{src.title or src.story_id}' in Sprint {src.sprint}."
-                    ),
-                })
+            for e in out.values():
+                issue = self._violation(e)
+                if issue is not None:
+                    issues.append(issue)
         return issues
 
+    def _violation(self, e: Edge) -> Optional[Dict[str, Any]]:
+        """The issue dict for ``e`` under the current sprints, or ``None``."""
+        src = self._nodes[e.src]
+        dst = self._nodes[e.dst]
+        if src.sprint is None or dst.sprint is None or src.sprint <= dst.sprint:
+            return None
+        return {
+            "type": "dependency_violation",
+            "blocker": src.story_id,
+            "blocked": dst.story_id,
+            "blocker_sprint": src.sprint,
+            "blocked_sprint": dst.sprint,
+            "reason": e.reason,
+            "message": (
+                f"Story '{dst.title or dst.story_id}' is scheduled in "
+                f"Sprint {dst.sprint} but depends on "
+                f"'{src.title or src.story_id}' in Sprint {src.sprint}."
+            ),
+        }
+
+    def _incident_edges(self, story_id: str) -> List[Edge]:
+        """In- and out-edges of one story (what a sprint move can affect)."""
+        return (list(self._in.get(story_id, {}).values())
+                + list(self._out.get(story_id, {}).values()))
+
     def risk_scores(self) -> Dict[str, Dict[str, float]]:
         """Per-story risk score in [0, 1] with a component breakdown.
 
         risk = w1·dep_depth + w2·blocking_factor + w3·sp_outlier
              + w4·cross_domain + w5·external_dep_flag
         """
+        if "risk_scores" not in self._memo:
+            self._memo["risk_scores"] = self._risk_scores()
+        return {nid: dict(comp) for nid, comp in self._memo["risk_scores"].items()}
+
+    def _risk_scores(self) -> Dict[str, Dict[str, float]]:
         # Depth: longest chain *into* this node
-        depth: Dict[str, int] = {nid: 0 for nid in self._nodes}
-        order = [n.story_id for n in self.topological_order()]
-        for nid in order:
-            for e in self._adj[nid]:
-                depth[e.dst] = max(depth[e.dst], depth[nid] + 1)
+        depth = self._depths()
         max_depth = max(depth.values()) if depth else 1
 
         # Blocking factor: transitive descendants
-        blocked = {nid: cnt for (n, cnt) in self.bottlenecks(top_k=10**9)
-                   for nid in [n.story_id]}
+        blocked = {nid: cnt for nid, cnt in self._descendant_counts().items() if cnt > 0}
         max_blocked = max(blocked.values()) if blocked else 1
 
         # SP outlier: distance from median SP, normalised
@@ -439,11 +613,14 @@ class DependencyAI:
 
         # Cross-domain: edges whose endpoints span different domains
         cross_dom: Dict[str, int] = defaultdict(int)
-        for e in self.edges():
-            sd = self._nodes[e.src].ir.domain or ""
-            dd = self._nodes[e.dst].ir.domain or ""
-            if sd and dd and sd != dd:
-                cross_dom[e.dst] += 1
+        for src_id, out in self._out.items():
+            sd = self._nodes[src_id].ir.domain or ""
+            if not sd:
+                continue
+            for dst_id in out:
+                dd = self._nodes[dst_id].ir.domain or ""
+                if dd and sd != dd:
+                    cross_dom[dst_id] += 1
         max_cross = max(cross_dom.values()) if cross_dom else 1
 
         scores: Dict[str, Dict[str, float]] = {}
@@ -472,19 +649,23 @@ class DependencyAI:
         """Move a story to ``new_sprint`` and re-validate.
 
         The original plan is left untouched; the result includes the
-        delta in violations and the affected stories.
+        delta in violations and the affected stories.  Only the moved
+        story's edges can change state, so the delta is computed from
+        those; ``after_issues`` still needs one full validation.  For
+        repeated moves use :class:`.WhatIfSession`.
         """
         if story_id not in self._nodes:
             raise KeyError(story_id)
-        old_sprint = self._nodes[story_id].sprint
-        before = {(i["blocker"], i["blocked"])
-                  for i in self.validate_sprints()}
-        self._nodes[story_id].sprint = new_sprint
+        node = self._nodes[story_id]
+        old_sprint = node.sprint
+        incident = self._incident_edges(story_id)
+        before = {(e.src, e.dst) for e in incident if self._violation(e)}
+        node.sprint = new_sprint
         try:
+            after = {(e.src, e.dst) for e in incident if self._violation(e)}
             after_issues = self.validate_sprints()
         finally:
-            self._nodes[story_id].sprint = old_sprint
-        after = {(i["blocker"], i["blocked"]) for i in after_issues}
+            node.sprint = old_sprint
         return {
             "story_id": story_id,
             "from_sprint": old_sprint,
@@ -502,10 +683,13 @@ class DependencyAI:
         Combines: critical-path bottlenecks, sprint violations, high-risk
         stories, and over-allocated sprints.
         """
+        return self._recommendations(self.validate_sprints())
+
+    def _recommendations(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         recs: List[Dict[str, Any]] = []
 
         # 1) Resolve every dependency violation by suggesting a sprint move
-        for issue in self.validate_sprints():
+        for issue in issues:
             recs.append({
                 "kind": "fix_dependency_violation",
                 "priority": "high",
@@ -576,6 +760,7 @@ class DependencyAI:
 
     # ── Export ─────────────────────────────────────────────────────────
     def to_dict(self) -> Dict[str, Any]:
+        issues = self.validate_sprints()
         return {
             "nodes": [
                 {
@@ -601,6 +786,6 @@ class DependencyAI:
                 for n, cnt in self.bottlenecks()
             ],
             "risk_scores": self.risk_scores(),
-            "validation_issues": self.validate_sprints(),
-            "recommendations": self.recommendations(),
+            "validation_issues": issues,
+            "recommendations": self._recommendations(issues),
         }
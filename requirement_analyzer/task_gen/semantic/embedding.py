@@ -24,11 +24,17 @@ Two backends ship here:
 from __future__ import annotations
 
 import logging
+import os
 import re
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .embedding_cache import EmbeddingCache
 
 log = logging.getLogger(__name__)
 
+# Set to a directory to persist embeddings across restarts (memory-mapped).
+_DEFAULT_CACHE_DIR = os.environ.get("RA_EMBEDDING_CACHE_DIR") or None
+
 
 # ── Pretty labels (used as fake "definitions" the encoder embeds) ──────────
 # Mapping a canonical key to a richer phrase improves embedding-similarity
@@ -74,6 +80,12 @@ class SentenceTransformerBackend:
     candidate label (rendered through ``LABEL_DESCRIPTIONS`` when known).
     The model is loaded lazily and cached on the instance.
 
+    Every text is encoded at most once per model: embeddings go through
+    an ``EmbeddingCache`` keyed by text hash, and all cache misses of a
+    call are encoded in one batched ``model.encode``.  ``score_batch`` /
+    ``similarity_matrix`` score many queries against one candidate
+    matrix with a single matrix multiply.
+
     Parameters
     ----------
     model_name:
@@ -81,17 +93,25 @@ class SentenceTransformerBackend:
         the default because the corpus is mixed Vietnamese + English.
     device:
         ``"cpu"`` | ``"cuda"``.  ``None`` → auto.
+    cache_size:
+        Embeddings kept in memory (LRU).
+    cache_dir:
+        Directory for the persistent memory-mapped store; defaults to
+        ``$RA_EMBEDDING_CACHE_DIR``.  ``None`` → memory only.
     """
 
     def __init__(
         self,
         model_name: str = "paraphrase-multilingual-MiniLM-L12-v2",
         device: Optional[str] = None,
+        cache_size: int = 50_000,
+        cache_dir: Optional[str] = _DEFAULT_CACHE_DIR,
     ) -> None:
         self.model_name = model_name
         self.device = device
         self._model = None
-        self._cand_cache: dict[Tuple[str, ...], "object"] = {}
+        self.cache = EmbeddingCache(model_name, max_entries=cache_size, cache_dir=cache_dir)
+        self.model_passes = 0
 
     # Lazy heavy import — only when actually called
     def _ensure_model(self) -> bool:
@@ -116,36 +136,60 @@ class SentenceTransformerBackend:
     def _describe(self, label: str) -> str:
         return LABEL_DESCRIPTIONS.get(label, label.replace("_", " "))
 
+    def encode(self, texts: Sequence[str]):
+        """Normalised embeddings (``n × dim`` float32 array) for ``texts``.
+
+        Cached texts are not re-encoded; the rest go through the model in
+        one batch.  Requires the model (see ``_ensure_model``).
+        """
+        import numpy as np
+
+        vectors = self.cache.get_many(texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+        if missing:
+            encoded = self._model.encode(  # type: ignore[union-attr]
+                missing, convert_to_numpy=True, normalize_embeddings=True,
+            ).astype(np.float32, copy=False)
+            self.model_passes += 1
+            self.cache.put_many(missing, encoded)
+            fresh = dict(zip(missing, encoded))
+            vectors = [fresh[t] if v is None else v for t, v in zip(texts, vectors)]
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(vectors)
+
+    def similarity_matrix(self, texts: Sequence[str], candidates: Sequence[str]):
+        """Cosine similarity of every text to every candidate (``n × m``),
+        or ``None`` when the model is unavailable."""
+        if not texts or not candidates or not self._ensure_model():
+            return None
+        queries = self.encode(list(texts))
+        cands = self.encode([self._describe(c) for c in candidates])
+        # Vectors are normalised → cosine similarity is a dot product
+        return queries @ cands.T
+
+    def score_batch(
+        self, texts: Sequence[str], candidates: Iterable[str]
+    ) -> List[Tuple[Optional[str], float]]:
+        """Best candidate per text — ``__call__`` for many texts at once."""
+        cand_list: List[str] = [c for c in candidates if c]
+        results: List[Tuple[Optional[str], float]] = [(None, 0.0)] * len(texts)
+        live = [i for i, t in enumerate(texts) if t.strip()]
+        sims = self.similarity_matrix([texts[i] for i in live], cand_list) if live else None
+        if sims is None:
+            return results
+        best = sims.argmax(axis=1)
+        for row, i in enumerate(live):
+            results[i] = (cand_list[int(best[row])], float(sims[row, best[row]]))
+        return results
+
+    def cache_stats(self) -> dict:
+        return {**self.cache.get_stats(), "model_passes": self.model_passes}
+
     def __call__(
         self, text: str, candidates: Iterable[str]
     ) -> Tuple[Optional[str], float]:
-        cand_list: List[str] = [c for c in candidates if c]
-        if not cand_list or not text.strip():
-            return None, 0.0
-        if not self._ensure_model():
-            return None, 0.0
-
-        # Cache candidate embeddings — they don't change between calls
-        key = tuple(cand_list)
-        cand_emb = self._cand_cache.get(key)
-        if cand_emb is None:
-            cand_emb = self._model.encode(  # type: ignore[union-attr]
-                [self._describe(c) for c in cand_list],
-                convert_to_tensor=True,
-                normalize_embeddings=True,
-            )
-            self._cand_cache[key] = cand_emb
-
-        text_emb = self._model.encode(  # type: ignore[union-attr]
-            text, convert_to_tensor=True, normalize_embeddings=True
-        )
-
-        # Cosine similarity (vectors are normalised → dot product)
-        from sentence_transformers import util  # type: ignore
-        sims = util.cos_sim(text_emb, cand_emb)[0]
-        best_idx = int(sims.argmax())
-        best_score = float(sims[best_idx])
-        return cand_list[best_idx], best_score
+        return self.score_batch([text], candidates)[0]
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,200 @@
+"""
+EmbeddingCache
+==============
+
+Per-text embedding cache for ``SentenceTransformerBackend``.
+
+Vectors are keyed by the SHA-1 of the text; one cache belongs to one
+model, and the on-disk store lives in a sub-directory named after the
+model, so switching models never returns stale vectors.
+
+Two tiers:
+
+1. **Memory** — bounded LRU (``max_entries`` vectors).
+2. **Disk** (optional) — an append-only ``vectors.f32`` file read through
+   ``numpy.memmap`` plus an ``index.tsv`` of ``hash<TAB>row`` lines.  It
+   survives restarts; rows whose index line was never written (crash
+   mid-append) are ignored and a torn trailing row is truncated on the
+   next load.  One writer process per directory is assumed.
+
+``numpy`` is imported lazily so the rule-only parser keeps working in
+minimal environments.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class _DiskStore:
+    """Append-only memory-mapped vector file + text-hash index."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = directory / "vectors.f32"
+        self._index_path = directory / "index.tsv"
+        self._meta_path = directory / "meta.json"
+        self.dim: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._mmap = None
+        self._mapped_rows = 0
+        self._load()
+
+    def _load(self) -> None:
+        if self._meta_path.exists():
+            self.dim = int(json.loads(self._meta_path.read_text())["dim"])
+        if self.dim is None or not self._index_path.exists():
+            return
+        stored_rows = 0
+        if self._vectors_path.exists():
+            size = self._vectors_path.stat().st_size
+            stored_rows = size // (4 * self.dim)
+            if size != stored_rows * 4 * self.dim:
+                os.truncate(self._vectors_path, stored_rows * 4 * self.dim)
+        with self._index_path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                key, _, row = line.rstrip("\n").partition("\t")
+                if row.isdigit() and int(row) < stored_rows:
+                    self._rows[key] = int(row)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: str):
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        if row >= self._mapped_rows:
+            import numpy as np
+            total = self._vectors_path.stat().st_size // (4 * self.dim)
+            self._mmap = np.memmap(self._vectors_path, dtype=np.float32, mode="r",
+                                   shape=(total, self.dim))
+            self._mapped_rows = total
+        return self._mmap[row]
+
+    def put_many(self, keys: Sequence[str], vectors) -> None:
+        import numpy as np
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+            self._meta_path.write_text(json.dumps({"dim": self.dim}))
+        elif vectors.shape[1] != self.dim:
+            log.warning("Embedding dim changed (%s → %s); not persisting",
+                        self.dim, vectors.shape[1])
+            return
+
+        with self._vectors_path.open("ab") as fh:
+            start = fh.tell() // (4 * self.dim)
+            fh.write(vectors.tobytes())
+        with self._index_path.open("a", encoding="utf-8") as fh:
+            fh.writelines(f"{key}\t{start + i}\n" for i, key in enumerate(keys))
+        for i, key in enumerate(keys):
+            self._rows[key] = start + i
+
+
+class EmbeddingCache:
+    """Bounded LRU of normalised embeddings with an optional disk tier.
+
+    Parameters
+    ----------
+    model_name:
+        Part of the cache identity; the disk store is
+        ``<cache_dir>/<sanitised model name>/``.
+    max_entries:
+        Vectors kept in memory (LRU).  The disk tier is unbounded.
+    cache_dir:
+        Enables the memory-mapped disk store.  ``None`` → memory only.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_entries: int = 50_000,
+        cache_dir: Optional[os.PathLike] = None,
+    ) -> None:
+        self.model_name = model_name
+        self.max_entries = max(1, max_entries)
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[_DiskStore] = None
+        if cache_dir:
+            safe_name = re.sub(r"[^\w.-]+", "_", model_name)
+            try:
+                self._disk = _DiskStore(Path(cache_dir) / safe_name)
+            except OSError as exc:
+                log.warning("Embedding disk cache disabled (%s): %s", cache_dir, exc)
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[Any]]:
+        """Cached vector per text, ``None`` where it must be encoded."""
+        found: List[Optional[Any]] = []
+        with self._lock:
+            for text in texts:
+                key = text_key(text)
+                vec = self._memory.get(key)
+                if vec is not None:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                elif self._disk is not None and (vec := self._disk.get(key)) is not None:
+                    self._remember(key, vec)
+                    self.stats["disk_hits"] += 1
+                else:
+                    self.stats["misses"] += 1
+                found.append(vec)
+        return found
+
+    def put_many(self, texts: Sequence[str], vectors) -> None:
+        keys = [text_key(t) for t in texts]
+        with self._lock:
+            for key, vec in zip(keys, vectors):
+                self._remember(key, vec)
+            if self._disk is not None:
+                try:
+                    self._disk.put_many(keys, vectors)
+                except OSError as exc:
+                    log.warning("Embedding disk cache write failed: %s", exc)
+
+    def _remember(self, key: str, vec: Any) -> None:
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop the memory tier (the disk store is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["misses"]
+            hits = lookups - self.stats["misses"]
+            return {
+                "model": self.model_name,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_entries": len(self._disk) if self._disk is not None else None,
+                "disk_path": str(self._disk.directory) if self._disk is not None else None,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                **self.stats,
+            }
@@ -74,7 +74,8 @@ class FeedbackStore:
         """Cheap heuristic: if the edited story contains a phrase that
         the parser failed to recognize but maps cleanly to ``ir.intent``
         or ``ir.entity``, register it in the in-memory lexicon so future
-        runs catch it.
+        runs catch it.  The lists are append-only: ``LEXICON_MATCHER``
+        compiles the new aliases into its automaton on the next parse.
         """
         edited = edited_story.lower()
         if ir.intent and ir.intent != "unknown":
@@ -0,0 +1,201 @@
+"""
+LexiconMatcher
+==============
+
+Aho–Corasick automaton over the parser lexicons.  One left-to-right pass
+over the lowered requirement text reports the first occurrence of every
+keyword of every slot (actor, intent, entity, channel, domain), replacing
+one ``str.find`` scan per keyword.
+
+The lexicons stay plain module-level lists so ``FeedbackStore`` can keep
+appending learned aliases.  The matcher remembers how many entries of
+each list it has compiled; when a list grows, only the new keywords are
+inserted into the trie and the failure links are recomputed (a BFS over
+the states, cheap next to re-scanning the text per keyword).  A list that
+shrinks or is rebound is recompiled from scratch.
+
+The compiled automaton is immutable once published, so ``scan`` can run
+concurrently with a rebuild triggered from another thread.
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Keywords of one lexicon entry: ``(keyword, canonical)`` → ``(keyword,)``,
+# ``(domain, [hints])`` → hints.
+KeywordsOf = Callable[[object], Iterable[str]]
+
+# slot → {entry index → (first position, matched keyword length)}
+ScanResult = Dict[str, Dict[int, Tuple[int, int]]]
+
+
+def first_item(entry) -> Iterable[str]:
+    return (entry[0],)
+
+
+def second_item(entry) -> Iterable[str]:
+    return entry[1]
+
+
+@dataclass
+class _Automaton:
+    goto: List[Dict[str, int]] = field(default_factory=lambda: [{}])
+    fail: List[int] = field(default_factory=lambda: [0])
+    # state → keyword ids ending here (own + along the failure chain)
+    output: List[Tuple[int, ...]] = field(default_factory=lambda: [()])
+    # keyword id → (length, ((slot, entry index), ...))
+    keywords: List[Tuple[int, Tuple[Tuple[str, int], ...]]] = field(default_factory=list)
+    keyword_ids: Dict[str, int] = field(default_factory=dict)
+    # state → keyword id whose last character it is (-1 for inner states)
+    terminal: List[int] = field(default_factory=lambda: [-1])
+
+    def copy(self) -> "_Automaton":
+        return _Automaton(
+            goto=[dict(edges) for edges in self.goto],
+            fail=list(self.fail),
+            output=list(self.output),
+            keywords=list(self.keywords),
+            keyword_ids=dict(self.keyword_ids),
+            terminal=list(self.terminal),
+        )
+
+    def add(self, keyword: str, slot: str, index: int) -> None:
+        if not keyword:
+            return
+        kid = self.keyword_ids.get(keyword)
+        if kid is not None:
+            length, payload = self.keywords[kid]
+            self.keywords[kid] = (length, payload + ((slot, index),))
+            return
+
+        state = 0
+        for ch in keyword:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+                self.terminal.append(-1)
+                self.goto[state][ch] = nxt
+            state = nxt
+        kid = len(self.keywords)
+        self.keywords.append((len(keyword), ((slot, index),)))
+        self.keyword_ids[keyword] = kid
+        self.terminal[state] = kid
+
+    def link(self) -> None:
+        """(Re)compute failure links and merged outputs breadth-first."""
+        queue = deque()
+        for nxt in self.goto[0].values():
+            self.fail[nxt] = 0
+            queue.append(nxt)
+        self.output[0] = ()
+        while queue:
+            state = queue.popleft()
+            own = self.terminal[state]
+            inherited = self.output[self.fail[state]]
+            self.output[state] = ((own,) + inherited) if own >= 0 else inherited
+            for ch, nxt in self.goto[state].items():
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                queue.append(nxt)
+
+
+class LexiconMatcher:
+    """Multi-slot keyword matcher.
+
+    Parameters
+    ----------
+    lexicons:
+        ``slot → (entries, keywords_of)``.  ``entries`` is the live list
+        (kept by reference); ``keywords_of(entry)`` yields the keywords of
+        one entry.
+
+    Examples
+    --------
+    >>> m = LexiconMatcher({"channel": ([("web", "web"), ("mobile", "mobile")], first_item)})
+    >>> m.scan("đặt lịch qua web hoặc mobile")
+    {'channel': {0: (13, 3), 1: (22, 6)}}
+    """
+
+    def __init__(self, lexicons: Dict[str, Tuple[Sequence, KeywordsOf]]) -> None:
+        self._lexicons = lexicons
+        self._lock = threading.Lock()
+        self._compiled: Dict[str, Tuple[int, int]] = {}  # slot → (id(list), entries compiled)
+        self._automaton = _Automaton()
+        self.rebuilds = 0
+
+    # ── Compilation ─────────────────────────────────────────────────────
+    def _stale(self) -> bool:
+        for slot, (entries, _) in self._lexicons.items():
+            if self._compiled.get(slot) != (id(entries), len(entries)):
+                return True
+        return False
+
+    def sync(self) -> None:
+        """Compile entries added since the last call (no-op when current)."""
+        if not self._stale():
+            return
+        with self._lock:
+            if not self._stale():
+                return
+            incremental = all(
+                slot in self._compiled
+                and self._compiled[slot][0] == id(entries)
+                and self._compiled[slot][1] <= len(entries)
+                for slot, (entries, _) in self._lexicons.items()
+            )
+            automaton = self._automaton.copy() if incremental else _Automaton()
+            compiled = {}
+            for slot, (entries, keywords_of) in self._lexicons.items():
+                start = self._compiled[slot][1] if incremental else 0
+                snapshot = list(entries)
+                for index in range(start, len(snapshot)):
+                    for keyword in keywords_of(snapshot[index]):
+                        automaton.add(keyword, slot, index)
+                compiled[slot] = (id(entries), len(snapshot))
+            automaton.link()
+            self._automaton = automaton
+            self._compiled = compiled
+            self.rebuilds += 1
+
+    # ── Matching ────────────────────────────────────────────────────────
+    def scan(self, text: str) -> ScanResult:
+        """First occurrence of every matching entry, per slot.
+
+        ``text`` must already be lowercased (the lexicons are).  For an
+        entry with several keywords the earliest one is reported.
+        """
+        self.sync()
+        automaton = self._automaton
+        goto, fail, output = automaton.goto, automaton.fail, automaton.output
+
+        first: Dict[int, int] = {}
+        state = 0
+        for i, ch in enumerate(text):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            for kid in output[state]:
+                if kid not in first:
+                    first[kid] = i
+
+        result: ScanResult = {slot: {} for slot in self._lexicons}
+        keywords = automaton.keywords
+        for kid, end in first.items():
+            length, payload = keywords[kid]
+            pos = end - length + 1
+            for slot, index in payload:
+                hits = result[slot]
+                prev = hits.get(index)
+                if prev is None or pos < prev[0] or (pos == prev[0] and length > prev[1]):
+                    hits[index] = (pos, length)
+        return result
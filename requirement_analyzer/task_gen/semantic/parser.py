@@ -26,6 +26,7 @@ import re
 from typing import Callable, Iterable, List, Optional, Tuple
 
 from .ir import CANONICAL_INTENTS, RequirementType, StoryIR
+from .lexicon_matcher import LexiconMatcher, ScanResult, first_item, second_item
 
 
 # ── Lexicons (rule layer) ───────────────────────────────────────────────────
@@ -224,6 +225,18 @@ DOMAIN_RULES: List[Tuple[str, List[str]]] = [
 ]
 
 
+# One Aho–Corasick pass finds every lexicon keyword above.  The lists are
+# held by reference, so aliases appended by ``FeedbackStore`` are compiled
+# in on the next parse.
+LEXICON_MATCHER = LexiconMatcher({
+    "actor":   (ACTOR_LEXICON, first_item),
+    "intent":  (INTENT_LEXICON, first_item),
+    "entity":  (ENTITY_LEXICON, first_item),
+    "channel": (CHANNEL_LEXICON, first_item),
+    "domain":  (DOMAIN_RULES, second_item),
+})
+
+
 # ── NFR / DevOps / Tech detectors ───────────────────────────────────────────
 NFR_HINTS = [
     "uptime", "availability", "sẵn sàng", "%",
@@ -281,12 +294,13 @@ class SemanticParser:
         ir = StoryIR(source_text=text)
         text_lower = text.lower()
 
-        # Layer 1 — lexicon
-        self._fill_actor(ir, text_lower)
-        self._fill_intent(ir, text_lower)
-        self._fill_entity(ir, text_lower)
-        self._fill_channel(ir, text_lower)
-        self._fill_domain(ir, text_lower)
+        # Layer 1 — lexicon (single automaton pass shared by all slots)
+        hits = LEXICON_MATCHER.scan(text_lower)
+        self._fill_actor(ir, text_lower, hits)
+        self._fill_intent(ir, text_lower, hits)
+        self._fill_entity(ir, text_lower, hits)
+        self._fill_channel(ir, text_lower, hits)
+        self._fill_domain(ir, text_lower, hits)
         self._fill_type(ir, text_lower)
         self._fill_behavioral_flags(ir, text_lower)
 
@@ -301,21 +315,16 @@ class SemanticParser:
         return ir
 
     # ── Lexicon helpers ─────────────────────────────────────────────────
-    def _fill_actor(self, ir: StoryIR, text_lower: str) -> None:
+    def _fill_actor(self, ir: StoryIR, text_lower: str,
+                    hits: Optional[ScanResult] = None) -> None:
         # Pick the actor whose keyword appears earliest in the text —
         # subject position is a strong signal ("Bác sĩ kê đơn cho bệnh
-        # nhân" → actor is *Bác sĩ*, not *Bệnh nhân*).
-        best_pos: int = -1
-        best_canonical: Optional[str] = None
-        for keyword, canonical in ACTOR_LEXICON:
-            pos = text_lower.find(keyword)
-            if pos == -1:
-                continue
-            if best_pos == -1 or pos < best_pos:
-                best_pos = pos
-                best_canonical = canonical
-        if best_canonical is not None:
-            ir.actor = best_canonical
+        # nhân" → actor is *Bác sĩ*, not *Bệnh nhân*).  Ties go to the
+        # entry listed first.
+        actor_hits = (hits or LEXICON_MATCHER.scan(text_lower))["actor"]
+        if actor_hits:
+            best = min(actor_hits, key=lambda i: (actor_hits[i][0], i))
+            ir.actor = ACTOR_LEXICON[best][1]
             ir.confidence["actor"] = 0.9
             ir.parser_layers.append("rule:actor")
             return
@@ -323,50 +332,41 @@ class SemanticParser:
         ir.actor = "Người dùng"
         ir.confidence["actor"] = 0.3
 
-    def _fill_intent(self, ir: StoryIR, text_lower: str) -> None:
+    def _fill_intent(self, ir: StoryIR, text_lower: str,
+                     hits: Optional[ScanResult] = None) -> None:
         # Same earliest-position strategy. When two phrases tie, longer
         # (more specific) one wins — e.g. "đăng nhập" beats "đăng".
-        best_pos: int = -1
-        best_len: int = 0
-        best_canonical: Optional[str] = None
-        for keyword, canonical in INTENT_LEXICON:
-            pos = text_lower.find(keyword)
-            if pos == -1:
-                continue
-            if (
-                best_pos == -1
-                or pos < best_pos
-                or (pos == best_pos and len(keyword) > best_len)
-            ):
-                best_pos = pos
-                best_len = len(keyword)
-                best_canonical = canonical
-        if best_canonical is not None:
-            ir.intent = best_canonical
+        intent_hits = (hits or LEXICON_MATCHER.scan(text_lower))["intent"]
+        if intent_hits:
+            best = min(
+                intent_hits,
+                key=lambda i: (intent_hits[i][0], -intent_hits[i][1], i),
+            )
+            ir.intent = INTENT_LEXICON[best][1]
             ir.confidence["intent"] = 0.9
             ir.parser_layers.append("rule:intent")
             return
         ir.intent = "unknown"
         ir.confidence["intent"] = 0.0
 
-    def _fill_entity(self, ir: StoryIR, text_lower: str) -> None:
+    def _fill_entity(self, ir: StoryIR, text_lower: str,
+                     hits: Optional[ScanResult] = None) -> None:
         # Earliest-position wins for the *primary* entity. Secondary
         # entities are kept in ``ir.entities`` in their order of appearance.
         # Drop any entity whose canonical matches the chosen actor — e.g.
         # "Bác sĩ kê đơn thuốc cho bệnh nhân" should resolve to entity
         # ``prescription``, not ``doctor`` (the subject) or ``patient``
         # (the indirect object that *is* the actor in another reading).
-        hits: List[Tuple[int, int, str]] = []  # (pos, -length, canonical)
-        for keyword, canonical in ENTITY_LEXICON:
-            pos = text_lower.find(keyword)
-            if pos != -1:
-                hits.append((pos, -len(keyword), canonical))
-        if not hits:
+        entity_hits: List[Tuple[int, int, str]] = [  # (pos, -length, canonical)
+            (pos, -length, ENTITY_LEXICON[i][1])
+            for i, (pos, length) in (hits or LEXICON_MATCHER.scan(text_lower))["entity"].items()
+        ]
+        if not entity_hits:
             return
-        hits.sort()  # earliest position, then longer keyword wins on ties
+        entity_hits.sort()  # earliest position, then longer keyword wins on ties
         actor_canonical = _ACTOR_TO_ENTITY.get(ir.actor or "")
         seen: List[str] = []
-        for _, _, canonical in hits:
+        for _, _, canonical in entity_hits:
             if canonical == actor_canonical:
                 continue
             if canonical not in seen:
@@ -378,21 +378,24 @@ class SemanticParser:
         ir.confidence["entity"] = 0.85
         ir.parser_layers.append("rule:entity")
 
-    def _fill_channel(self, ir: StoryIR, text_lower: str) -> None:
-        for keyword, canonical in CHANNEL_LEXICON:
-            if keyword in text_lower:
-                ir.channel = canonical
-                ir.confidence["channel"] = 0.8
-                ir.parser_layers.append("rule:channel")
-                return
-
-    def _fill_domain(self, ir: StoryIR, text_lower: str) -> None:
-        for domain, hints in DOMAIN_RULES:
-            if any(h in text_lower for h in hints):
-                ir.domain = domain
-                ir.confidence["domain"] = 0.85
-                ir.parser_layers.append("rule:domain")
-                return
+    def _fill_channel(self, ir: StoryIR, text_lower: str,
+                      hits: Optional[ScanResult] = None) -> None:
+        # First listed channel that occurs anywhere in the text.
+        channel_hits = (hits or LEXICON_MATCHER.scan(text_lower))["channel"]
+        if channel_hits:
+            ir.channel = CHANNEL_LEXICON[min(channel_hits)][1]
+            ir.confidence["channel"] = 0.8
+            ir.parser_layers.append("rule:channel")
+
+    def _fill_domain(self, ir: StoryIR, text_lower: str,
+                     hits: Optional[ScanResult] = None) -> None:
+        # DOMAIN_RULES is ordered specific → generic; first rule with a hit wins.
+        domain_hits = (hits or LEXICON_MATCHER.scan(text_lower))["domain"]
+        if domain_hits:
+            ir.domain = DOMAIN_RULES[min(domain_hits)][0]
+            ir.confidence["domain"] = 0.85
+            ir.parser_layers.append("rule:domain")
+            return
         ir.domain = "General"
         ir.confidence["domain"] = 0.3
 
@@ -0,0 +1,184 @@
+"""
+WhatIfSession
+=============
+
+Stateful sprint-plan simulation over a built :class:`.DependencyAI`.
+
+``DependencyAI.what_if`` answers one question and forgets; a planner
+dragging stories around asks hundreds.  A session keeps the graph and the
+current violation set (keyed by ``(blocker, blocked)``) and updates it
+incrementally: a move only re-checks the moved story's in- and out-edges,
+so each move costs O(degree) instead of O(E) plus a rebuild.
+
+Moves are applied in batches; every batch is one undo step.
+
+    session = WhatIfSession(DependencyAI().build(stories))
+    session.apply([("S3", 2), ("S7", 4)])
+    session.undo()
+
+:class:`WhatIfSessionStore` keeps sessions server-side under an opaque id
+(bounded LRU with idle expiry) for the API layer.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .dependency_ai import DependencyAI
+
+Move = Tuple[str, Optional[int]]
+EdgeKey = Tuple[str, str]
+
+
+class WhatIfSession:
+    """Incrementally maintained sprint plan + violation set.
+
+    The session owns ``ai``: moves change ``StoryNode.sprint`` in place,
+    so build a dedicated :class:`.DependencyAI` per session.
+    """
+
+    def __init__(self, ai: DependencyAI, max_undo: int = 200) -> None:
+        self.ai = ai
+        self.max_undo = max_undo
+        self._violations: Dict[EdgeKey, Dict[str, Any]] = {
+            (i["blocker"], i["blocked"]): i for i in ai.validate_sprints()
+        }
+        self._undo: List[List[Move]] = []
+        self._lock = threading.Lock()
+
+    # ── Public: state ──────────────────────────────────────────────────
+    def issues(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self._violations[k] for k in sorted(self._violations)]
+
+    def plan(self) -> Dict[str, Optional[int]]:
+        return {nid: n.sprint for nid, n in self.ai.nodes.items()}
+
+    @property
+    def undo_depth(self) -> int:
+        return len(self._undo)
+
+    def summary(self) -> Dict[str, Any]:
+        issues = self.issues()
+        return {
+            "violation_count": len(issues),
+            "issues": issues,
+            "plan": self.plan(),
+            "undo_depth": self.undo_depth,
+        }
+
+    # ── Public: moves ──────────────────────────────────────────────────
+    def apply(self, moves: Iterable[Move]) -> Dict[str, Any]:
+        """Apply ``(story_id, new_sprint)`` moves as one undoable batch.
+
+        The batch is validated up front: an unknown ``story_id`` raises
+        ``KeyError`` and nothing is moved.
+        """
+        moves = list(moves)
+        for story_id, _ in moves:
+            if story_id not in self.ai.nodes:
+                raise KeyError(story_id)
+        with self._lock:
+            inverse, delta = self._move(moves)
+            self._undo.append(inverse)
+            if len(self._undo) > self.max_undo:
+                self._undo.pop(0)
+        return self._result(moves, delta)
+
+    def move(self, story_id: str, new_sprint: Optional[int]) -> Dict[str, Any]:
+        return self.apply([(story_id, new_sprint)])
+
+    def undo(self) -> Dict[str, Any]:
+        """Revert the last batch.  Raises ``IndexError`` when there is none."""
+        with self._lock:
+            if not self._undo:
+                raise IndexError("nothing to undo")
+            inverse = self._undo.pop()
+            _, delta = self._move(inverse)
+        return self._result(inverse, delta)
+
+    # ── Internals ──────────────────────────────────────────────────────
+    def _move(self, moves: Sequence[Move]) -> Tuple[List[Move], Tuple[set, set]]:
+        """Apply moves, returning the inverse batch and (resolved, introduced)."""
+        nodes = self.ai.nodes
+        before: Dict[EdgeKey, bool] = {}
+        inverse: List[Move] = []
+        for story_id, new_sprint in moves:
+            node = nodes[story_id]
+            inverse.append((story_id, node.sprint))
+            node.sprint = new_sprint
+            for e in self.ai._incident_edges(story_id):
+                key = (e.src, e.dst)
+                before.setdefault(key, key in self._violations)
+                issue = self.ai._violation(e)
+                if issue is None:
+                    self._violations.pop(key, None)
+                else:
+                    self._violations[key] = issue
+        inverse.reverse()
+        resolved = {k for k, was in before.items() if was and k not in self._violations}
+        introduced = {k for k, was in before.items() if not was and k in self._violations}
+        return inverse, (resolved, introduced)
+
+    def _result(self, moves: Sequence[Move], delta: Tuple[set, set]) -> Dict[str, Any]:
+        resolved, introduced = delta
+        return {
+            "moves": [{"story_id": sid, "sprint": sprint} for sid, sprint in moves],
+            "violations_resolved": sorted(resolved),
+            "violations_introduced": sorted(introduced),
+            "net_delta": len(introduced) - len(resolved),
+            "violation_count": len(self._violations),
+            "undo_depth": self.undo_depth,
+        }
+
+
+class WhatIfSessionStore:
+    """Thread-safe id → :class:`WhatIfSession` map.
+
+    At most ``max_sessions`` are kept (least recently used evicted first);
+    sessions idle for more than ``ttl_seconds`` are dropped on access.
+    """
+
+    def __init__(self, max_sessions: int = 64, ttl_seconds: float = 1800.0) -> None:
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._sessions: "OrderedDict[str, Tuple[WhatIfSession, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, ai: DependencyAI) -> Tuple[str, WhatIfSession]:
+        session = WhatIfSession(ai)
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._expire()
+            self._sessions[session_id] = (session, time.monotonic())
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id, session
+
+    def get(self, session_id: str) -> Optional[WhatIfSession]:
+        with self._lock:
+            self._expire()
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            self._sessions[session_id] = (entry[0], time.monotonic())
+            self._sessions.move_to_end(session_id)
+            return entry[0]
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._sessions:
+            session_id, (_, last_used) = next(iter(self._sessions.items()))
+            if last_used >= cutoff:
+                break
+            del self._sessions[session_id]
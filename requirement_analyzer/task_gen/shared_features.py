@@ -0,0 +1,122 @@
+"""
+Shared TF-IDF features for the detector and enrichers
+- Vectorizer artifacts with identical bytes are loaded once (keyed by content hash)
+- Each sentence batch is transformed once per distinct vectorizer and the
+  sparse matrix is reused by every classifier that shares it
+"""
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+import logging
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a model artifact"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class VectorizerRegistry:
+    """Process-wide cache of vectorizers keyed by artifact content hash"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_digest: Dict[str, Any] = {}
+        self._digest_by_path: Dict[Tuple[str, float, int], str] = {}
+        self.stats = {'loads': 0, 'reuses': 0}
+
+    def load(self, path: Path) -> Tuple[Any, str]:
+        """
+        Load a vectorizer artifact
+
+        Returns:
+            (vectorizer, digest) - the same object for hash-identical files
+        """
+        path = Path(path)
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime, stat.st_size)
+
+        with self._lock:
+            digest = self._digest_by_path.get(key)
+            if digest is None:
+                digest = file_digest(path)
+                self._digest_by_path[key] = digest
+
+            vectorizer = self._by_digest.get(digest)
+            if vectorizer is None:
+                vectorizer = joblib.load(path)
+                self._by_digest[digest] = vectorizer
+                self.stats['loads'] += 1
+                logger.info(f"✓ Loaded vectorizer {path.name} ({digest[:12]})")
+            else:
+                self.stats['reuses'] += 1
+                logger.info(f"✓ Reusing vectorizer {digest[:12]} for {path.name}")
+
+        return vectorizer, digest
+
+    def clear(self):
+        with self._lock:
+            self._by_digest.clear()
+            self._digest_by_path.clear()
+
+
+class SharedFeatureBatch:
+    """
+    One batch of texts whose TF-IDF matrices are shared between classifiers
+
+    transform(digest, vectorizer) runs vectorizer.transform once per distinct
+    digest; later callers with the same digest get the cached sparse matrix.
+    subset(indices) returns a batch over some of the rows that keeps the
+    already computed matrices (TF-IDF rows are independent, so slicing is exact).
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        self.texts = list(texts)
+        self._matrices: Dict[str, Any] = {}
+        self.transforms = 0
+        self.reuses = 0
+
+    def __len__(self):
+        return len(self.texts)
+
+    def transform(self, digest: Optional[str], vectorizer) -> Any:
+        if digest is None:
+            # Unknown provenance - cannot be shared safely
+            self.transforms += 1
+            return vectorizer.transform(self.texts)
+
+        X = self._matrices.get(digest)
+        if X is None:
+            X = vectorizer.transform(self.texts)
+            self._matrices[digest] = X
+            self.transforms += 1
+        else:
+            self.reuses += 1
+        return X
+
+    def subset(self, indices: Sequence[int]) -> "SharedFeatureBatch":
+        indices = list(indices)
+        batch = SharedFeatureBatch([self.texts[i] for i in indices])
+        for digest, X in self._matrices.items():
+            batch._matrices[digest] = X[indices]
+        return batch
+
+
+# Singleton instance
+_registry = None
+
+
+def get_vectorizer_registry() -> VectorizerRegistry:
+    """Get singleton vectorizer registry"""
+    global _registry
+    if _registry is None:
+        _registry = VectorizerRegistry()
+    return _registry
@@ -0,0 +1,188 @@
+"""
+Near-duplicate user story detection
+Token-set Jaccard similarity with a prefix-filtered inverted index
+(AllPairs / PPJoin candidate generation), so only story pairs that can
+reach the threshold are compared exactly
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+# 75% token overlap → duplicate
+STORY_DEDUP_THRESHOLD = 0.75
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Slack applied to the float bounds so they never prune a pair the exact check keeps
+_EPS = 1e-9
+
+
+def story_tokens(story: Dict[str, Any]) -> FrozenSet[str]:
+    """Lower-cased word tokens of a story's title + user story text"""
+    text = (story.get("title", "") or "") + " " + (story.get("user_story", "") or "")
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    # |a ∪ b| from the intersection: same value, without building the union set
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def deduplicate_story_indices(
+    stories: List[Dict[str, Any]],
+    threshold: float = STORY_DEDUP_THRESHOLD,
+    use_index: bool = True,
+) -> List[int]:
+    """
+    Indices of the stories to keep, in ascending order
+
+    Stories are scanned in order; a story whose Jaccard similarity with an
+    already kept story is >= threshold is a duplicate of the first such
+    story, and of the two the one with more story_points is kept (more
+    granular). use_index=False forces the pairwise scan; both modes return
+    the same indices.
+    """
+    token_sets = [story_tokens(s) for s in stories]
+    points = [s.get("story_points") or 0 for s in stories]
+    if use_index:
+        kept = _deduplicate_indexed(token_sets, points, threshold)
+    else:
+        kept = _deduplicate_pairwise(token_sets, points, threshold)
+    return sorted(kept)
+
+
+def _deduplicate_pairwise(token_sets: List[FrozenSet[str]], points: List[float], threshold: float) -> List[int]:
+    """Compare every story against every kept story (O(n²))"""
+    kept: List[int] = []
+    seen: List[FrozenSet[str]] = []
+    for i, tokens in enumerate(token_sets):
+        for j, prev_tokens in enumerate(seen):
+            if jaccard(tokens, prev_tokens) >= threshold:
+                if points[i] > points[kept[j]]:
+                    kept[j] = i
+                    seen[j] = tokens
+                break
+        else:
+            kept.append(i)
+            seen.append(tokens)
+    return kept
+
+
+def _deduplicate_indexed(token_sets: List[FrozenSet[str]], points: List[float], threshold: float) -> List[int]:
+    """Same scan as _deduplicate_pairwise; only indexed candidates are compared"""
+    index = StoryTokenIndex(token_sets, threshold)
+    kept: List[int] = []
+    for i, tokens in enumerate(token_sets):
+        for slot in index.candidates(tokens):
+            if jaccard(tokens, index.tokens(slot)) >= threshold:
+                if points[i] > points[kept[slot]]:
+                    kept[slot] = i
+                    index.replace(slot, tokens)
+                break
+        else:
+            kept.append(i)
+            index.add(tokens)
+    return kept
+
+
+class StoryTokenIndex:
+    """
+    Candidate index over the token sets of kept stories ("slots")
+
+    Tokens are ordered globally by document frequency (rarest first). If
+    J(x, y) >= t then x and y overlap in at least
+    alpha = ceil(t / (1 + t) * (|x| + |y|)) tokens, so the first
+    |x| - ceil(t * |x|) + 1 tokens of x (its prefix) share a token with the
+    prefix of y. Only prefixes are indexed, with token positions:
+    - size filter: t * |x| <= |y| <= |x| / t
+    - positional filter (PPJoin): a shared prefix token at positions i, j
+      bounds the remaining overlap by min(|x| - i, |y| - j); a candidate
+      that can no longer reach alpha is dropped
+
+    The filters never drop a pair that reaches the threshold, so callers
+    see the same duplicates as a pairwise scan. A slot whose story is
+    replaced is re-indexed with the new token set.
+    """
+
+    def __init__(self, token_sets: Iterable[FrozenSet[str]], threshold: float):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        df = Counter(token for tokens in token_sets for token in tokens)
+        self._rank = {token: r for r, token in enumerate(sorted(df, key=lambda tok: (df[tok], tok)))}
+        # token -> {slot: (position of the token in the slot's prefix, slot size)}
+        self._postings: Dict[str, Dict[int, Tuple[int, int]]] = {}
+        self._slots: List[FrozenSet[str]] = []
+        self._prefixes: List[List[str]] = []
+        self._empty: List[int] = []  # slots with no tokens: J(∅, ∅) = 1
+
+    def prefix(self, tokens: FrozenSet[str]) -> List[str]:
+        n = len(tokens)
+        length = n - math.ceil(self.threshold * n - _EPS) + 1
+        rank = self._rank
+        # Tokens missing from the corpus sort first (as if df were 0)
+        ordered = sorted(tokens, key=lambda tok: (rank.get(tok, -1), tok))
+        return ordered[:length]
+
+    def tokens(self, slot: int) -> FrozenSet[str]:
+        return self._slots[slot]
+
+    def candidates(self, tokens: FrozenSet[str]) -> List[int]:
+        """Slots that may reach the threshold against `tokens`, in slot order"""
+        n = len(tokens)
+        if n == 0:
+            return list(self._empty)
+        t = self.threshold
+        # Size filter + minimum overlap alpha, per candidate size
+        min_size = math.ceil(t * n - _EPS)
+        max_size = math.floor(n / t + _EPS)
+        alpha = {
+            size: math.ceil(t / (1 + t) * (n + size) - _EPS)
+            for size in range(min_size, max_size + 1)
+        }
+        overlap: Dict[int, int] = {}
+        for i, token in enumerate(self.prefix(tokens)):
+            rest_x = n - i - 1
+            for slot, (j, size) in self._postings.get(token, {}).items():
+                seen = overlap.get(slot, 0)
+                if seen < 0:
+                    continue  # already pruned
+                need = alpha.get(size)
+                rest_y = size - j - 1
+                if need is not None and seen + 1 + (rest_x if rest_x < rest_y else rest_y) >= need:
+                    overlap[slot] = seen + 1
+                else:
+                    overlap[slot] = -1
+        return sorted(slot for slot, seen in overlap.items() if seen > 0)
+
+    def add(self, tokens: FrozenSet[str]) -> int:
+        slot = len(self._slots)
+        self._slots.append(tokens)
+        self._prefixes.append([])
+        self._index(slot, tokens)
+        return slot
+
+    def replace(self, slot: int, tokens: FrozenSet[str]):
+        if not self._slots[slot]:
+            self._empty.remove(slot)
+        for token in self._prefixes[slot]:
+            del self._postings[token][slot]
+        self._slots[slot] = tokens
+        self._index(slot, tokens)
+
+    def _index(self, slot: int, tokens: FrozenSet[str]):
+        if not tokens:
+            self._empty.append(slot)
+            self._empty.sort()
+            self._prefixes[slot] = []
+            return
+        prefix = self.prefix(tokens)
+        self._prefixes[slot] = prefix
+        size = len(tokens)
+        for j, token in enumerate(prefix):
+            self._postings.setdefault(token, {})[slot] = (j, size)
@@ -2,20 +2,156 @@
 Task History Manager
 ====================
 Saves and loads task generation history to disk.
-Each session is stored as a JSON file with timestamp.
+
+Sessions live in a SQLite database next to the legacy JSON directory:
+- `sessions` holds the summary columns, indexed by session_id and created_at,
+  so listing never reads task payloads
+- `payloads` holds the tasks of each session as zlib-compressed JSON
+
+Older installs stored one JSON file per session in HISTORY_DIR; those are
+imported once on first use (see migrate_json_directory).
 """
 import json
+import sqlite3
+import threading
 import uuid
+import zlib
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
-# History stored in requirement_analyzer/data/task_history/
+# History stored in requirement_analyzer/data/
 HISTORY_DIR = Path(__file__).parent.parent / "data" / "task_history"
+HISTORY_DB = Path(__file__).parent.parent / "data" / "task_history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id      TEXT PRIMARY KEY,
+    created_at      TEXT NOT NULL,
+    source_filename TEXT,
+    total_tasks     INTEGER NOT NULL DEFAULT 0,
+    source_preview  TEXT,
+    metadata        TEXT,
+    file            TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON sessions (created_at DESC);
+CREATE TABLE IF NOT EXISTS payloads (
+    session_id TEXT PRIMARY KEY,
+    tasks      BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_SUMMARY_COLUMNS = "session_id, created_at, source_filename, total_tasks, source_preview, file"
+
+# Rows saved before `file` was filled in: derive the same
+# "<YYYYmmdd_HHMMSS>_<session_id>.json" name from created_at
+_BACKFILL_FILE = """
+UPDATE sessions
+SET file = replace(replace(replace(substr(created_at, 1, 19), '-', ''), ':', ''), 'T', '_')
+           || '_' || session_id || '.json'
+WHERE file IS NULL AND length(created_at) >= 19
+"""
+
+_init_lock = threading.Lock()
+_initialized_db: Optional[Path] = None
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a connection, creating the schema and migrating JSON history on first use"""
+    global _initialized_db
+    db_path = Path(HISTORY_DB)
+
+    if _initialized_db != db_path:
+        with _init_lock:
+            if _initialized_db != db_path:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(db_path))
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    conn.execute(_BACKFILL_FILE)
+                    conn.commit()
+                    _migrate_once(conn)
+                finally:
+                    conn.close()
+                _initialized_db = db_path
 
+    conn = sqlite3.connect(str(db_path), timeout=10)
+    conn.row_factory = sqlite3.Row
+    return conn
 
-def _ensure_dir():
-    HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+
+def _pack_tasks(tasks: List[Dict[str, Any]]) -> bytes:
+    return zlib.compress(json.dumps(tasks, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _unpack_tasks(blob: bytes) -> List[Dict[str, Any]]:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _insert_record(conn: sqlite3.Connection, record: Dict[str, Any], file: Optional[str] = None):
+    conn.execute(
+        "INSERT OR REPLACE INTO sessions "
+        "(session_id, created_at, source_filename, total_tasks, source_preview, metadata, file) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            record["session_id"],
+            record.get("created_at") or "",
+            record.get("source_filename"),
+            record.get("total_tasks", 0),
+            record.get("source_preview", ""),
+            json.dumps(record.get("metadata") or {}, ensure_ascii=False, default=str),
+            file,
+        ),
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO payloads (session_id, tasks) VALUES (?, ?)",
+        (record["session_id"], _pack_tasks(record.get("tasks") or [])),
+    )
+
+
+def migrate_json_directory(conn: sqlite3.Connection, directory: Path = None) -> int:
+    """
+    Import legacy per-session JSON files into the database.
+
+    Unreadable files are skipped; the JSON files themselves are left in place.
+
+    Returns:
+        Number of sessions imported
+    """
+    directory = Path(directory or HISTORY_DIR)
+    if not directory.is_dir():
+        return 0
+
+    imported = 0
+    for f in sorted(directory.glob("*.json")):
+        try:
+            with open(f, encoding="utf-8") as fp:
+                record = json.load(fp)
+        except Exception:
+            continue
+        if not isinstance(record, dict) or not record.get("session_id"):
+            continue
+        _insert_record(conn, record, file=f.name)
+        imported += 1
+    conn.commit()
+    return imported
+
+
+def _migrate_once(conn: sqlite3.Connection):
+    done = conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()
+    if done:
+        return
+    imported = migrate_json_directory(conn)
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)",
+        (json.dumps({"imported": imported, "at": datetime.now().isoformat()}),),
+    )
+    conn.commit()
 
 
 def save_history(
@@ -30,9 +166,9 @@ def save_history(
     Returns:
         session_id (str)
     """
-    _ensure_dir()
     session_id = str(uuid.uuid4())[:8]
-    ts = datetime.now().isoformat()
+    now = datetime.now()
+    ts = now.isoformat()
 
     record = {
         "session_id": session_id,
@@ -44,38 +180,42 @@ def save_history(
         "tasks": tasks
     }
 
-    out_file = HISTORY_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{session_id}.json"
-    with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(record, f, ensure_ascii=False, indent=2, default=str)
+    conn = _connect()
+    try:
+        with conn:
+            # Same name the JSON store used, so summaries keep a `file` for every session
+            _insert_record(conn, record, file=f"{now.strftime('%Y%m%d_%H%M%S')}_{session_id}.json")
+    finally:
+        conn.close()
 
     return session_id
 
 
-def list_history(limit: int = 20) -> List[Dict[str, Any]]:
+def list_history(limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
     """
     List recent task generation sessions (most recent first).
 
     Returns:
         List of session summaries (no tasks payload)
     """
-    _ensure_dir()
-    files = sorted(HISTORY_DIR.glob("*.json"), reverse=True)[:limit]
-    summaries = []
-    for f in files:
-        try:
-            with open(f, encoding="utf-8") as fp:
-                record = json.load(fp)
-            summaries.append({
-                "session_id": record.get("session_id"),
-                "created_at": record.get("created_at"),
-                "source_filename": record.get("source_filename"),
-                "total_tasks": record.get("total_tasks", 0),
-                "source_preview": record.get("source_preview", ""),
-                "file": f.name
-            })
-        except Exception:
-            continue
-    return summaries
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            f"SELECT {_SUMMARY_COLUMNS} FROM sessions ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (max(0, limit), max(0, offset)),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+
+def count_history() -> int:
+    """Total number of stored sessions"""
+    conn = _connect()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    finally:
+        conn.close()
 
 
 def get_history_session(session_id: str) -> Optional[Dict[str, Any]]:
@@ -85,22 +225,51 @@ def get_history_session(session_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Full record with tasks, or None if not found
     """
-    _ensure_dir()
-    for f in HISTORY_DIR.glob("*.json"):
-        if session_id in f.name:
-            try:
-                with open(f, encoding="utf-8") as fp:
-                    return json.load(fp)
-            except Exception:
-                return None
-    return None
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT s.session_id, s.created_at, s.source_filename, s.total_tasks, "
+            "s.source_preview, s.metadata, p.tasks "
+            "FROM sessions s LEFT JOIN payloads p ON p.session_id = s.session_id "
+            "WHERE s.session_id = ?",
+            (session_id,),
+        ).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    try:
+        return {
+            "session_id": row["session_id"],
+            "created_at": row["created_at"],
+            "source_filename": row["source_filename"],
+            "total_tasks": row["total_tasks"],
+            "source_preview": row["source_preview"],
+            "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
+            "tasks": _unpack_tasks(row["tasks"]) if row["tasks"] is not None else [],
+        }
+    except Exception:
+        return None
 
 
 def delete_history_session(session_id: str) -> bool:
-    """Delete a history session by session_id"""
-    _ensure_dir()
-    for f in HISTORY_DIR.glob("*.json"):
-        if session_id in f.name:
-            f.unlink()
-            return True
-    return False
+    """Delete a history session by session_id (and its legacy JSON file, if any)"""
+    conn = _connect()
+    try:
+        with conn:
+            row = conn.execute(
+                "SELECT file FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM payloads WHERE session_id = ?", (session_id,))
+    finally:
+        conn.close()
+
+    if row["file"]:
+        legacy_file = HISTORY_DIR / row["file"]
+        if legacy_file.exists():
+            legacy_file.unlink()
+    return True
@@ -37,6 +37,9 @@ class AITestCaseGeneratorV3:
     ✓ Actionable, usable test cases
     """
 
+    # Bump when generation output changes (invalidates cached export results)
+    VERSION = "3.0.0"
+
     def __init__(self):
         self.parser = RequirementParser()
         self.builder = ProductionTestCaseBuilder()
@@ -3,7 +3,8 @@ LLM-Free AI Test Generation Pipeline
 Integrates: Requirement Extraction → Structured Intent → Smart Test Generation → Deduplication
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import json
 from datetime import datetime
 
@@ -37,12 +38,15 @@ class TestGenerationPipeline:
             "test_cases_deduplicated": 0,
             "avg_confidence": 0.0,
         }
+        self._shard_pool: Optional[ProcessPoolExecutor] = None
+        self._shard_pool_workers = 0
     
     def process_requirements(
         self,
         requirements: List[str],
         auto_deduplicate: bool = True,
-        verbose: bool = True
+        verbose: bool = True,
+        n_workers: int = 1,
     ) -> Dict[str, Any]:
         """
         Process multiple requirements end-to-end
@@ -51,6 +55,9 @@ class TestGenerationPipeline:
             requirements: List of requirement texts
             auto_deduplicate: Whether to remove duplicates
             verbose: Print progress
+            n_workers: > 1 splits the requirements across worker processes
+                      (see _process_requirements_sharded). Output is identical
+                      to the sequential mode.
             
         Returns:
             Dict with:
@@ -63,6 +70,12 @@ class TestGenerationPipeline:
             print("🚀 TEST GENERATION PIPELINE (NO EXTERNAL API)")
             print("=" * 70)
         
+        if n_workers > 1 and len(requirements) >= MIN_REQUIREMENTS_PER_SHARD * 2:
+            all_test_cases, num_intents = self._process_requirements_sharded(
+                requirements, n_workers, verbose
+            )
+            return self._finish(all_test_cases, num_intents, auto_deduplicate, verbose)
+        
         all_test_cases = []
         intents = []
         
@@ -101,6 +114,16 @@ class TestGenerationPipeline:
                 if verbose:
                     print(f"   ❌ {intent.requirement_id}: {e}")
         
+        return self._finish(all_test_cases, len(intents), auto_deduplicate, verbose)
+    
+    def _finish(
+        self,
+        all_test_cases: List[Dict[str, Any]],
+        num_intents: int,
+        auto_deduplicate: bool,
+        verbose: bool
+    ) -> Dict[str, Any]:
+        """Steps 3-4: deduplicate across all requirements and build the result"""
         self.stats["test_cases_generated"] = len(all_test_cases)
         
         # Step 3: Deduplicate
@@ -128,11 +151,90 @@ class TestGenerationPipeline:
                 "test_cases_generated": self.stats["test_cases_generated"],
                 "test_cases_deduplicated": self.stats["test_cases_deduplicated"],
                 "unique_tests_final": len(all_test_cases),
-                "intents_extracted": len(intents),
+                "intents_extracted": num_intents,
             },
             "generated_at": datetime.now().isoformat(),
         }
     
+    # ------------------------------------------------------------------
+    # Parallel mode: shard requirements across worker processes
+    # ------------------------------------------------------------------
+    
+    def _process_requirements_sharded(
+        self,
+        requirements: List[str],
+        n_workers: int,
+        verbose: bool
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Steps 1-2 in worker processes
+        
+        Requirements are split into contiguous shards tagged with their global
+        index, so REQ-xxx ids are the same as in sequential mode. Workers number
+        test ids from zero per requirement; the merge walks shards in input order
+        and renumbers them with this pipeline's _next_id, which reproduces the
+        sequential ids exactly. Cross-shard deduplication happens afterwards in
+        _finish.
+        
+        Returns:
+            (test cases in sequential order, number of intents extracted)
+        """
+        if verbose:
+            print(f"\n📊 Steps 1-2: Extracting intents and generating tests "
+                  f"for {len(requirements)} requirements on {n_workers} workers...")
+        
+        shards = _make_shards(requirements, n_workers)
+        pool = self._get_shard_pool(n_workers)
+        
+        all_test_cases = []
+        num_intents = 0
+        
+        for shard_result in pool.map(_process_shard, shards):
+            for idx, intent_info, tests, ids_used, error in shard_result:
+                if intent_info is not None:
+                    num_intents += 1
+                
+                if tests is not None:
+                    for test in tests:
+                        prefix = test["test_id"].rsplit("-", 1)[0]
+                        test["test_id"] = f"{prefix}-{self._next_id()}"
+                    self._id_counter += ids_used - len(tests)
+                    all_test_cases.extend(tests)
+                else:
+                    self._id_counter += ids_used
+                
+                if verbose:
+                    if intent_info is None:
+                        print(f"   [{idx}] ❌ Error: {error}")
+                    elif tests is None:
+                        print(f"   ❌ REQ-{idx:03d}: {error}")
+                    else:
+                        domain, confidence = intent_info
+                        print(f"   [{idx}] ✅ {domain} | Confidence: {confidence:.1%} | "
+                              f"{len(tests)} tests generated")
+        
+        self.stats["requirements_processed"] = num_intents
+        return all_test_cases, num_intents
+    
+    def _get_shard_pool(self, n_workers: int) -> ProcessPoolExecutor:
+        """Worker pool reused across calls; each worker builds its pipeline once"""
+        if self._shard_pool is None or self._shard_pool_workers != n_workers:
+            self.close()
+            self._shard_pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_shard_worker,
+                initargs=(self.extractor,),
+            )
+            self._shard_pool_workers = n_workers
+        return self._shard_pool
+    
+    def close(self):
+        """Shut down the shard worker pool, if any"""
+        if self._shard_pool is not None:
+            self._shard_pool.shutdown(wait=True)
+            self._shard_pool = None
+            self._shard_pool_workers = 0
+    
     def _generate_tests_from_intent(self, intent: StructuredIntent) -> List[Dict[str, Any]]:
         """Generate test cases from a single StructuredIntent"""
         tests = []
@@ -455,6 +557,62 @@ class TestGenerationPipeline:
         return f"{self._id_counter:03d}"
 
 
+# ============================================================================
+# Shard workers (module level so they can be pickled by ProcessPoolExecutor)
+# ============================================================================
+
+# Below this many requirements per shard, process start-up costs more than it saves
+MIN_REQUIREMENTS_PER_SHARD = 8
+
+# Shards per worker, so one slow shard does not leave other workers idle
+SHARDS_PER_WORKER = 4
+
+_shard_pipeline: Optional[TestGenerationPipeline] = None
+
+
+def _init_shard_worker(extractor: RequirementExtractor):
+    """Process initializer: load the extractor / pipeline once per worker"""
+    global _shard_pipeline
+    _shard_pipeline = TestGenerationPipeline(extractor=extractor)
+
+
+def _make_shards(requirements: List[str], n_workers: int) -> List[List[Tuple[int, str]]]:
+    """Contiguous shards of (1-based global index, requirement text)"""
+    indexed = list(enumerate(requirements, 1))
+    n_shards = max(1, min(n_workers * SHARDS_PER_WORKER, len(indexed) // MIN_REQUIREMENTS_PER_SHARD))
+    size = -(-len(indexed) // n_shards)
+    return [indexed[i:i + size] for i in range(0, len(indexed), size)]
+
+
+def _process_shard(shard: List[Tuple[int, str]]) -> List[Tuple[int, Any, Any, int, Optional[str]]]:
+    """
+    Extract + generate for one shard inside a worker
+    
+    Returns one (idx, (domain, confidence) | None, tests | None, ids_used, error)
+    per requirement, in shard order.
+    """
+    pipeline = _shard_pipeline
+    results = []
+    
+    for idx, req_text in shard:
+        try:
+            intent = pipeline.extractor.extract(req_text)
+            intent.requirement_id = f"REQ-{idx:03d}"
+        except Exception as e:
+            results.append((idx, None, None, 0, str(e)))
+            continue
+        
+        intent_info = (intent.domain.value, intent.confidence_score)
+        pipeline._id_counter = 0
+        try:
+            tests = pipeline._generate_tests_from_intent(intent)
+            results.append((idx, intent_info, tests, pipeline._id_counter, None))
+        except Exception as e:
+            results.append((idx, intent_info, None, pipeline._id_counter, str(e)))
+    
+    return results
+
+
 # For backward compatibility
 def create_pipeline(extractor: Optional[RequirementExtractor] = None) -> TestGenerationPipeline:
     """Factory function to create pipeline"""
@@ -16,7 +16,9 @@ __version__ = "1.0.0"
 __author__ = "Huy VNNIC"
 
 from .models.canonical import CanonicalRequirement, TestCase
-from .core.pipeline import run_pipeline, run_pipeline_from_text
+from .core.pipeline import (
+    run_pipeline, run_pipeline_from_text, stream_pipeline, stream_pipeline_from_text,
+)
 from .exports.export_handler import export_json, export_csv, export_excel, export_markdown
 
 __all__ = [
@@ -24,6 +26,8 @@ __all__ = [
     "TestCase",
     "run_pipeline",
     "run_pipeline_from_text",
+    "stream_pipeline",
+    "stream_pipeline_from_text",
     "export_json",
     "export_csv",
     "export_excel",
@@ -5,6 +5,7 @@ Kết nối toàn bộ pipeline từ đầu đến cuối.
 
 import os
 import sys
+from typing import Iterable, Iterator
 
 # Add parent dir to path forus importing
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -16,7 +17,7 @@ from .normalizer       import normalize
 from .test_generator   import generate_tests
 from ..models.canonical import CanonicalRequirement, TestCase
 
-from ..parsers.free_text_parser  import parse_free_text
+from ..parsers.free_text_parser  import parse_free_text, iter_free_text
 from ..parsers.user_story_parser import parse_user_story
 from ..parsers.use_case_parser   import parse_use_case
 from ..parsers.excel_parser      import parse_excel
@@ -29,6 +30,12 @@ PARSER_MAP = {
     "excel":      parse_excel,
 }
 
+# Parser dạng generator: requirement được normalize và sinh test ngay khi
+# parse xong, không đợi cả tài liệu
+STREAMING_PARSER_MAP = {
+    "free_text":  iter_free_text,
+}
+
 
 def run_pipeline(
     filepath: str,
@@ -44,6 +51,50 @@ def run_pipeline(
     Returns:
         dict với keys: requirements, test_cases, summary, format_detected
     """
+    fmt, canonical_reqs = _parse_file(filepath, force_format)
+    return _collect(fmt, canonical_reqs)
+
+
+def run_pipeline_from_text(
+    text: str,
+    force_format: str = "free_text",
+) -> dict:
+    """
+    Chạy pipeline từ raw text string (dùng cho API nếu không có file).
+    """
+    fmt = force_format
+    return _collect(fmt, _parse_text(preprocess(text), fmt))
+
+
+def stream_pipeline(
+    filepath: str,
+    force_format: str | None = None,
+) -> Iterator[dict]:
+    """
+    Như run_pipeline nhưng yield kết quả dần (mỗi dict là 1 dòng NDJSON):
+
+        {"type": "format",      "format_detected": ...}
+        {"type": "requirement", "requirement": {...}, "test_cases": [...]}   # lặp lại
+        {"type": "summary",     "summary": {...}}
+
+    Không giữ lại requirement/test case đã yield, nên bộ nhớ không tăng theo
+    kích thước tài liệu.
+    """
+    fmt, canonical_reqs = _parse_file(filepath, force_format)
+    return _stream(fmt, canonical_reqs)
+
+
+def stream_pipeline_from_text(
+    text: str,
+    force_format: str = "free_text",
+) -> Iterator[dict]:
+    """Như stream_pipeline nhưng từ raw text string."""
+    fmt = force_format
+    return _stream(fmt, _parse_text(preprocess(text), fmt))
+
+
+def _parse_file(filepath: str, force_format: str | None):
+    """Step 1-3: extract → detect format → preprocess, trả về (fmt, iterator requirement)."""
 
     # ── Step 1: Extract raw text ──
     raw_text = extract_raw_text(filepath)
@@ -53,89 +104,88 @@ def run_pipeline(
 
     # ── Step 3: Preprocess (với Excel thì bỏ qua, parser đọc file trực tiếp) ──
     if fmt == "excel":
-        clean_text = raw_text
-        parser = PARSER_MAP["excel"]
-        canonical_reqs = parser(filepath)           # Excel parser nhận filepath
-    else:
-        clean_text = preprocess(raw_text)
-        parser = PARSER_MAP[fmt]
-        canonical_reqs = parser(clean_text)         # Các parser khác nhận text
-
-    # ── Step 4: Normalize ──
-    canonical_reqs = [normalize(r) for r in canonical_reqs]
-    canonical_reqs = [r for r in canonical_reqs if r.is_valid()]
-
-    # ── Step 5: Generate test cases ──
-    test_cases: list[TestCase] = []
-    for req in canonical_reqs:
-        test_cases.extend(generate_tests(req))
+        return fmt, iter(PARSER_MAP["excel"](filepath))    # Excel parser nhận filepath
+    return fmt, _parse_text(preprocess(raw_text), fmt)      # Các parser khác nhận text
 
-    # ── Step 6: Build summary ──
-    summary = _build_summary(canonical_reqs, test_cases, fmt)
 
-    return {
-        "format_detected": fmt,
-        "requirements":    [_req_to_dict(r) for r in canonical_reqs],
-        "test_cases":      [tc.to_dict() for tc in test_cases],
-        "summary":         summary,
-        "_objects": {
-            "requirements": canonical_reqs,
-            "test_cases":   test_cases,
-        }
-    }
-
-
-def run_pipeline_from_text(
-    text: str,
-    force_format: str = "free_text",
-) -> dict:
-    """
-    Chạy pipeline từ raw text string (dùng cho API nếu không có file).
-    """
-    fmt = force_format
-    clean_text = preprocess(text)
+def _parse_text(clean_text: str, fmt: str) -> Iterator[CanonicalRequirement]:
+    if fmt in STREAMING_PARSER_MAP:
+        return STREAMING_PARSER_MAP[fmt](clean_text)
     parser = PARSER_MAP.get(fmt, parse_free_text)
-    canonical_reqs = parser(clean_text)
-    canonical_reqs = [normalize(r) for r in canonical_reqs]
-    canonical_reqs = [r for r in canonical_reqs if r.is_valid()]
+    return iter(parser(clean_text))
 
-    test_cases = []
+
+def _iter_results(canonical_reqs: Iterable[CanonicalRequirement]):
+    """Step 4-5 cho từng requirement: normalize → sinh test cases."""
     for req in canonical_reqs:
-        test_cases.extend(generate_tests(req))
+        req = normalize(req)
+        if req.is_valid():
+            yield req, generate_tests(req)
+
 
+def _collect(fmt: str, canonical_reqs: Iterable[CanonicalRequirement]) -> dict:
+    reqs: list[CanonicalRequirement] = []
+    test_cases: list[TestCase] = []
+    summary = _SummaryCounter()
+    for req, tests in _iter_results(canonical_reqs):
+        reqs.append(req)
+        test_cases.extend(tests)
+        summary.add(req, tests)
+
+    # ── Step 6: Build summary ──
     return {
         "format_detected": fmt,
-        "requirements":    [_req_to_dict(r) for r in canonical_reqs],
+        "requirements":    [_req_to_dict(r) for r in reqs],
         "test_cases":      [tc.to_dict() for tc in test_cases],
-        "summary":         _build_summary(canonical_reqs, test_cases, fmt),
+        "summary":         summary.to_dict(fmt),
         "_objects": {
-            "requirements": canonical_reqs,
+            "requirements": reqs,
             "test_cases":   test_cases,
         }
     }
 
 
-def _build_summary(reqs, test_cases, fmt) -> dict:
-    by_type = {}
-    by_priority = {}
-    by_req_type = {}
-
-    for tc in test_cases:
-        by_type[tc.test_type]       = by_type.get(tc.test_type, 0) + 1
-        by_priority[tc.priority]    = by_priority.get(tc.priority, 0) + 1
-
-    for r in reqs:
-        by_req_type[r.req_type] = by_req_type.get(r.req_type, 0) + 1
-
-    return {
-        "input_format":          fmt,
-        "total_requirements":    len(reqs),
-        "total_test_cases":      len(test_cases),
-        "avg_tests_per_req":     round(len(test_cases) / max(len(reqs), 1), 1),
-        "test_cases_by_type":    by_type,
-        "test_cases_by_priority":by_priority,
-        "requirements_by_type":  by_req_type,
-    }
+def _stream(fmt: str, canonical_reqs: Iterable[CanonicalRequirement]) -> Iterator[dict]:
+    yield {"type": "format", "format_detected": fmt}
+    summary = _SummaryCounter()
+    for req, tests in _iter_results(canonical_reqs):
+        summary.add(req, tests)
+        yield {
+            "type":        "requirement",
+            "requirement": _req_to_dict(req),
+            "test_cases":  [tc.to_dict() for tc in tests],
+        }
+    yield {"type": "summary", "summary": summary.to_dict(fmt)}
+
+
+class _SummaryCounter:
+    """Đếm dần cho summary, không cần giữ requirement/test case."""
+
+    def __init__(self):
+        self.total_requirements = 0
+        self.total_test_cases = 0
+        self.by_type = {}
+        self.by_priority = {}
+        self.by_req_type = {}
+
+    def add(self, req: CanonicalRequirement, test_cases: list[TestCase]):
+        self.total_requirements += 1
+        self.by_req_type[req.req_type] = self.by_req_type.get(req.req_type, 0) + 1
+        for tc in test_cases:
+            self.by_type[tc.test_type]    = self.by_type.get(tc.test_type, 0) + 1
+            self.by_priority[tc.priority] = self.by_priority.get(tc.priority, 0) + 1
+        self.total_test_cases += len(test_cases)
+
+    def to_dict(self, fmt: str) -> dict:
+        return {
+            "input_format":          fmt,
+            "total_requirements":    self.total_requirements,
+            "total_test_cases":      self.total_test_cases,
+            "avg_tests_per_req":     round(self.total_test_cases / max(self.total_requirements, 1), 1),
+            "test_cases_by_type":    self.by_type,
+            "test_cases_by_priority":self.by_priority,
+            "requirements_by_type":  self.by_req_type,
+        }
 
 
 def _req_to_dict(r: CanonicalRequirement) -> dict:
@@ -4,11 +4,14 @@ FastAPI application - REST API layer.
 Endpoints:
   POST /generate         → upload file → trả về test cases JSON
   POST /generate/text    → raw text input → trả về test cases JSON
+  POST /generate/stream  → upload file → stream kết quả NDJSON (tài liệu lớn)
+  POST /generate/text/stream → raw text input → stream kết quả NDJSON
   POST /export/excel     → upload file → trả về file Excel
   GET  /health           → health check
   GET  /formats          → list supported formats
 """
 
+import json
 import os
 import sys
 import tempfile
@@ -20,13 +23,15 @@ rule_based_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, rule_based_dir)
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional
 
 # Import from core modules
-from core.pipeline import run_pipeline, run_pipeline_from_text
+from core.pipeline import (
+    run_pipeline, run_pipeline_from_text, stream_pipeline, stream_pipeline_from_text,
+)
 from exports.export_handler import export_json, export_excel
 
 
@@ -158,6 +163,64 @@ async def generate_from_text(request: TextRequest):
         raise HTTPException(status_code=500, detail=f"Pipeline error: {str(e)}")
 
 
+def _ndjson(events, cleanup_dir: str | None = None):
+    """
+    Serialize pipeline events thành NDJSON. Lỗi giữa chừng (header 200 đã
+    gửi) được báo bằng dòng {"type": "error"} cuối cùng.
+    """
+    try:
+        for event in events:
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    except Exception as e:
+        yield json.dumps({"type": "error", "detail": f"Pipeline error: {str(e)}"}) + "\n"
+    finally:
+        if cleanup_dir:
+            shutil.rmtree(cleanup_dir, ignore_errors=True)
+
+
+@app.post("/generate/stream")
+async def generate_stream_from_file(
+    file: UploadFile = File(..., description="Requirement document"),
+    force_format: Optional[str] = Form(None, description="Ép format: free_text|user_story|use_case|excel"),
+):
+    """
+    Như /generate nhưng stream NDJSON: mỗi requirement (kèm test cases) là 1
+    dòng, gửi ngay khi parse xong; dòng cuối là summary. Dùng cho tài liệu
+    lớn (PDF hàng trăm trang) — bộ nhớ server không tăng theo kích thước file.
+    """
+    allowed = {".pdf", ".docx", ".txt", ".xlsx", ".csv", ".xls"}
+    ext = Path(file.filename).suffix.lower()
+    if ext not in allowed:
+        raise HTTPException(status_code=400, detail=f"File type '{ext}' not supported. Allowed: {allowed}")
+
+    tmp_dir = tempfile.mkdtemp()
+    tmp_path = os.path.join(tmp_dir, file.filename)
+
+    try:
+        content = await file.read()
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        events = stream_pipeline(tmp_path, force_format=force_format)
+    except Exception as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise HTTPException(status_code=500, detail=f"Pipeline error: {str(e)}")
+
+    # File tạm được xoá khi stream kết thúc
+    return StreamingResponse(_ndjson(events, cleanup_dir=tmp_dir), media_type="application/x-ndjson")
+
+
+@app.post("/generate/text/stream")
+async def generate_stream_from_text(request: TextRequest):
+    """
+    Như /generate/text nhưng stream NDJSON (không giới hạn 50,000 ký tự).
+    """
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="Text is empty")
+
+    events = stream_pipeline_from_text(request.text, force_format=request.format)
+    return StreamingResponse(_ndjson(events), media_type="application/x-ndjson")
+
+
 @app.post("/export/excel")
 async def export_to_excel(
     file: UploadFile = File(...),
@@ -1,12 +1,13 @@
 """Requirement format parsers."""
 
-from .free_text_parser import parse_free_text
+from .free_text_parser import parse_free_text, iter_free_text
 from .user_story_parser import parse_user_story
 from .use_case_parser import parse_use_case
 from .excel_parser import parse_excel
 
 __all__ = [
     "parse_free_text",
+    "iter_free_text",
     "parse_user_story",
     "parse_use_case",
     "parse_excel",
@@ -6,6 +6,7 @@ Dùng spaCy dependency parsing để extract actor/action/object/condition.
 
 import re
 import sys
+from typing import Iterator
 
 # Lazy load spaCy để không crash nếu chưa cài
 _nlp = None
@@ -38,25 +39,76 @@ CONDITION_KEYWORDS = {"if", "when", "unless", "until", "while", "provided", "giv
 EXPECTED_KEYWORDS = {"should", "must", "shall", "will", "can", "need to"}
 
 
+# Streaming: văn bản dài được cắt thành chunk theo đoạn rồi parse bằng
+# nlp.pipe, nên không bao giờ giữ Doc của cả tài liệu (và không chạm
+# giới hạn nlp.max_length của spaCy với PDF hàng trăm trang)
+CHUNK_MAX_CHARS = 20_000
+PIPE_BATCH_SIZE = 8
+
+# Ranh giới cắt chunk, theo thứ tự ưu tiên: đoạn → dòng → câu
+_CHUNK_BOUNDARIES = (
+    re.compile(r"\n\s*\n"),
+    re.compile(r"\n"),
+    re.compile(r"(?<=[.!?])\s+"),
+)
+
+
 def parse_free_text(text: str) -> list[CanonicalRequirement]:
     """
     Parse văn bản tự do → list CanonicalRequirement.
     Mỗi câu có nghĩa → 1 requirement.
     """
+    return list(iter_free_text(text))
+
+
+def iter_free_text(
+    text: str,
+    batch_size: int = PIPE_BATCH_SIZE,
+    max_chars: int = CHUNK_MAX_CHARS,
+) -> Iterator[CanonicalRequirement]:
+    """
+    Như parse_free_text nhưng là generator: yield từng requirement ngay khi
+    chunk chứa nó được parse xong. Bộ nhớ chỉ phụ thuộc batch_size × max_chars,
+    không phụ thuộc độ dài tài liệu.
+    """
     nlp = _get_nlp()
-    doc = nlp(text)
-    results = []
+    for doc in nlp.pipe(iter_text_chunks(text, max_chars), batch_size=batch_size):
+        for sent in doc.sents:
+            sent_text = sent.text.strip()
+            if len(sent_text.split()) < 3:
+                continue  # Bỏ qua câu quá ngắn
 
-    for sent in doc.sents:
-        sent_text = sent.text.strip()
-        if len(sent_text.split()) < 3:
-            continue  # Bỏ qua câu quá ngắn
+            req = _parse_sentence(sent, sent_text)
+            if req.is_valid():
+                yield req
 
-        req = _parse_sentence(sent, sent_text)
-        if req.is_valid():
-            results.append(req)
 
-    return results
+def iter_text_chunks(text: str, max_chars: int = CHUNK_MAX_CHARS) -> Iterator[str]:
+    """
+    Cắt text thành các chunk ≤ max_chars, ưu tiên cắt ở dòng trống giữa các
+    đoạn, rồi xuống dòng, rồi cuối câu; không tìm được thì cắt cứng.
+    Text ngắn hơn max_chars được trả nguyên vẹn (1 chunk).
+    """
+    start = 0
+    while len(text) - start > max_chars:
+        end = _cut_point(text, start, start + max_chars)
+        if text[start:end].strip():
+            yield text[start:end]
+        start = end
+    if text[start:].strip():
+        yield text[start:]
+
+
+def _cut_point(text: str, start: int, limit: int) -> int:
+    """Vị trí cắt tốt nhất trong text[start:limit] (ký tự phân cách thuộc chunk trước)."""
+    window = text[start:limit]
+    for boundary in _CHUNK_BOUNDARIES:
+        last = None
+        for last in boundary.finditer(window):
+            pass
+        if last is not None:
+            return start + last.end()
+    return limit
 
 
 def _parse_sentence(sent, raw_text: str) -> CanonicalRequirement:
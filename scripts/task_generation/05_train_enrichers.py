@@ -23,10 +23,15 @@ sys.path.append(str(PROJECT_ROOT))
 class EnricherTrainer:
     """Train multi-class classifiers for type/priority/domain"""
     
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, shared_vectorizer=False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # One TF-IDF vectorizer for all labels: saved byte-identical under each
+        # {label}_vectorizer.joblib, so inference loads and applies it once
+        self.shared_vectorizer = shared_vectorizer
+        self.vectorizer = None
+        
         self.models = {}  # {label_name: (vectorizer, model)}
         self.metrics = {}
         self.label_encodings = {}
@@ -58,6 +63,12 @@ class EnricherTrainer:
         print(f"   Val:   {len(val_df):,} requirements")
         print(f"   Test:  {len(test_df):,} requirements")
         
+        if self.shared_vectorizer:
+            print("\n🔧 Training shared TF-IDF vectorizer...")
+            self.vectorizer = self._build_vectorizer()
+            self.vectorizer.fit(train_df['text'].fillna('').astype(str).tolist())
+            print(f"   Feature space: {len(self.vectorizer.vocabulary_):,} features")
+        
         # Train each classifier
         for label_name in labels_to_train:
             print(f"\n{'='*80}")
@@ -98,7 +109,7 @@ class EnricherTrainer:
             print(f"   ⚠️  Skipping {label_name}: only {len(classes)} class(es) found")
             return
         
-        print(f"\n📊 Class distribution (train):")
+        print("\n📊 Class distribution (train):")
         train_dist = pd.Series(y_train).value_counts()
         for cls, count in train_dist.items():
             print(f"   {cls}: {count:,} ({count/len(y_train):.1%})")
@@ -106,26 +117,21 @@ class EnricherTrainer:
         print(f"\n   Total classes: {len(classes)}")
         
         # Train vectorizer
-        print(f"\n🔧 Training TF-IDF vectorizer...")
-        vectorizer = TfidfVectorizer(
-            max_features=5000,
-            ngram_range=(1, 2),
-            min_df=2,
-            max_df=0.95,
-            sublinear_tf=True,
-            strip_accents='unicode',
-            lowercase=True,
-            stop_words='english'
-        )
-        
-        X_train_vec = vectorizer.fit_transform(X_train)
+        if self.vectorizer is not None:
+            print("\n🔧 Using shared TF-IDF vectorizer...")
+            vectorizer = self.vectorizer
+            X_train_vec = vectorizer.transform(X_train)
+        else:
+            print("\n🔧 Training TF-IDF vectorizer...")
+            vectorizer = self._build_vectorizer()
+            X_train_vec = vectorizer.fit_transform(X_train)
         X_val_vec = vectorizer.transform(X_val)
         X_test_vec = vectorizer.transform(X_test)
         
         print(f"   Feature space: {X_train_vec.shape[1]:,} features")
         
         # Train model
-        print(f"\n🏋️  Training Logistic Regression...")
+        print("\n🏋️  Training Logistic Regression...")
         model = LogisticRegression(
             penalty='l2',
             C=1.0,
@@ -139,10 +145,10 @@ class EnricherTrainer:
         )
         
         model.fit(X_train_vec, y_train)
-        print(f"   ✓ Training complete")
+        print("   ✓ Training complete")
         
         # Evaluate
-        print(f"\n📈 Evaluating...")
+        print("\n📈 Evaluating...")
         
         y_train_pred = model.predict(X_train_vec)
         y_val_pred = model.predict(X_val_vec)
@@ -161,7 +167,7 @@ class EnricherTrainer:
         }
         
         # Print classification reports
-        print(f"\n📋 Classification Report (Test):")
+        print("\n📋 Classification Report (Test):")
         print(classification_report(y_test, y_test_pred, zero_division=0))
         
         # Store model
@@ -174,6 +180,20 @@ class EnricherTrainer:
         # Plot confusion matrix
         self._plot_confusion_matrix(y_test, y_test_pred, classes, label_name)
     
+    @staticmethod
+    def _build_vectorizer():
+        """TF-IDF settings used by every enricher"""
+        return TfidfVectorizer(
+            max_features=5000,
+            ngram_range=(1, 2),
+            min_df=2,
+            max_df=0.95,
+            sublinear_tf=True,
+            strip_accents='unicode',
+            lowercase=True,
+            stop_words='english'
+        )
+    
     def _prepare_data(self, df, label_name, classes=None):
         """Prepare data for training"""
         # Get text
@@ -259,6 +279,7 @@ class EnricherTrainer:
         summary = {
             'trained_at': datetime.now().isoformat(),
             'models': list(self.models.keys()),
+            'shared_vectorizer': self.shared_vectorizer,
             'metrics': self.metrics,
             'label_encodings': self.label_encodings
         }
@@ -297,6 +318,8 @@ def main():
     parser.add_argument('--labels', type=str, nargs='+',
                        default=['type', 'priority', 'domain'],
                        help='Labels to train classifiers for')
+    parser.add_argument('--shared-vectorizer', action='store_true',
+                       help='Fit one TF-IDF vectorizer shared by all labels')
     
     args = parser.parse_args()
     
@@ -314,7 +337,7 @@ def main():
     
     output_dir = PROJECT_ROOT / args.output_dir
     
-    trainer = EnricherTrainer(output_dir)
+    trainer = EnricherTrainer(output_dir, shared_vectorizer=args.shared_vectorizer)
     metrics = trainer.train_all(
         train_file, val_file, test_file,
         labels_to_train=args.labels
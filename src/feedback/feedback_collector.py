@@ -6,11 +6,21 @@ after project completion, which will be used for model retraining.
 """
 
 import os
+import csv
 import json
+import math
+import bisect
+import threading
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,51 +30,148 @@ logging.basicConfig(
 logger = logging.getLogger('feedback_collector')
 
 FEEDBACK_DIR = "datasets/feedback"
+# Compacted feedback (same CSV format as before)
 FEEDBACK_FILE = os.path.join(FEEDBACK_DIR, "feedback_data.csv")
+# Append-only log of entries not yet compacted into FEEDBACK_FILE
+FEEDBACK_LOG = os.path.join(FEEDBACK_DIR, "feedback_log.jsonl")
+FEEDBACK_LOCK = os.path.join(FEEDBACK_DIR, ".feedback.lock")
+
+# Fold the log into the CSV once it holds this many entries
+COMPACT_THRESHOLD = 500
+
+FEEDBACK_COLUMNS = [
+    'project_id', 'task_id', 'requirement_text',
+    'estimated_effort', 'actual_effort', 'effort_unit',
+    'model_used', 'features', 'timestamp'
+]
+
+_thread_lock = threading.RLock()
+
+
+@contextmanager
+def _feedback_lock():
+    """Serialize writers across threads and (where fcntl exists) processes"""
+    with _thread_lock:
+        ensure_feedback_dir()
+        with open(FEEDBACK_LOCK, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 def ensure_feedback_dir():
     """Ensure the feedback directory exists"""
     if not os.path.exists(FEEDBACK_DIR):
-        os.makedirs(FEEDBACK_DIR)
+        os.makedirs(FEEDBACK_DIR, exist_ok=True)
         logger.info(f"Created feedback directory at {FEEDBACK_DIR}")
 
+def _read_csv_rows():
+    """Yield rows of the compacted CSV as dicts"""
+    if not os.path.exists(FEEDBACK_FILE):
+        return
+    with open(FEEDBACK_FILE, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+def _read_log_rows(offset=0):
+    """Yield (entry dict, end offset) from the append-only log"""
+    if not os.path.exists(FEEDBACK_LOG):
+        return
+    with open(FEEDBACK_LOG, 'r', encoding='utf-8') as f:
+        f.seek(offset)
+        for line in iter(f.readline, ''):
+            if not line.endswith('\n'):
+                # Partially written line - picked up on the next read
+                break
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.error("Skipping corrupt feedback log line")
+                entry = None
+            if entry is not None:
+                yield entry, f.tell()
+
+def iter_feedback():
+    """Stream every feedback entry (compacted CSV first, then the log) as dicts"""
+    yield from _read_csv_rows()
+    for entry, _ in _read_log_rows():
+        yield entry
+
 def load_existing_feedback():
-    """Load existing feedback data or create a new DataFrame"""
+    """Load all feedback (compacted CSV + append-only log) as a DataFrame"""
     ensure_feedback_dir()
-    
+    frames = []
+
     if os.path.exists(FEEDBACK_FILE):
         try:
-            return pd.read_csv(FEEDBACK_FILE)
+            frames.append(pd.read_csv(FEEDBACK_FILE))
         except Exception as e:
             logger.error(f"Error loading feedback data: {e}")
-            return pd.DataFrame(columns=[
-                'project_id', 'task_id', 'requirement_text', 
-                'estimated_effort', 'actual_effort', 'effort_unit',
-                'model_used', 'features', 'timestamp'
-            ])
-    else:
-        return pd.DataFrame(columns=[
-            'project_id', 'task_id', 'requirement_text', 
-            'estimated_effort', 'actual_effort', 'effort_unit',
-            'model_used', 'features', 'timestamp'
-        ])
+
+    log_entries = [entry for entry, _ in _read_log_rows()]
+    if log_entries:
+        frames.append(pd.DataFrame(log_entries, columns=FEEDBACK_COLUMNS))
+
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=FEEDBACK_COLUMNS)
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
 
 def save_feedback(feedback_df):
-    """Save feedback data to CSV file"""
-    ensure_feedback_dir()
+    """Replace all stored feedback with feedback_df (written as the compacted CSV)"""
     try:
-        feedback_df.to_csv(FEEDBACK_FILE, index=False)
+        with _feedback_lock():
+            feedback_df.to_csv(FEEDBACK_FILE, index=False)
+            if os.path.exists(FEEDBACK_LOG):
+                os.remove(FEEDBACK_LOG)
+            _stats.reset()
         logger.info(f"Saved feedback data to {FEEDBACK_FILE}")
         return True
     except Exception as e:
         logger.error(f"Error saving feedback data: {e}")
         return False
 
+def compact_feedback_log():
+    """
+    Append the log's entries to the compacted CSV and truncate the log
+
+    Cost is O(entries in the log), not O(total feedback).
+
+    Returns:
+        int: Number of entries moved
+    """
+    with _feedback_lock():
+        # Count the log tail first so moving rows into the CSV is not double counted
+        _stats.refresh()
+
+        entries = [entry for entry, _ in _read_log_rows()]
+        if not entries:
+            return 0
+
+        write_header = not os.path.exists(FEEDBACK_FILE) or os.path.getsize(FEEDBACK_FILE) == 0
+        with open(FEEDBACK_FILE, 'a', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=FEEDBACK_COLUMNS, extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            writer.writerows(entries)
+        os.remove(FEEDBACK_LOG)
+
+        _stats.mark_compacted()
+        logger.info(f"Compacted {len(entries)} feedback entries into {FEEDBACK_FILE}")
+        return len(entries)
+
 def add_feedback(project_id, task_id, requirement_text, estimated_effort, 
                 actual_effort, effort_unit, model_used=None, features=None):
     """
     Add new feedback entry to the collection
     
+    The entry is appended as one JSON line to FEEDBACK_LOG under a file lock,
+    so each call is O(1) and concurrent submitters cannot lose writes.
+    
     Args:
         project_id (str): Project identifier
         task_id (str): Task identifier
@@ -78,9 +185,6 @@ def add_feedback(project_id, task_id, requirement_text, estimated_effort,
     Returns:
         bool: True if feedback was successfully added
     """
-    # Load existing feedback
-    feedback_df = load_existing_feedback()
-    
     # Create new feedback entry
     new_feedback = {
         'project_id': project_id,
@@ -94,40 +198,122 @@ def add_feedback(project_id, task_id, requirement_text, estimated_effort,
         'timestamp': datetime.now().isoformat()
     }
     
-    # Add to DataFrame
-    feedback_df = feedback_df._append(new_feedback, ignore_index=True)
+    try:
+        line = json.dumps(new_feedback, default=str) + '\n'
+        with _feedback_lock():
+            with open(FEEDBACK_LOG, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+                log_size = f.tell()
+    except Exception as e:
+        logger.error(f"Error saving feedback data: {e}")
+        return False
     
-    # Save updated feedback
-    success = save_feedback(feedback_df)
+    logger.info(f"Added feedback for task {task_id} in project {project_id}")
     
-    if success:
-        logger.info(f"Added feedback for task {task_id} in project {project_id}")
+    # Rough size check avoids counting lines on every call
+    if log_size > COMPACT_THRESHOLD * 256 and _count_log_entries() >= COMPACT_THRESHOLD:
+        try:
+            compact_feedback_log()
+        except Exception as e:
+            logger.error(f"Error compacting feedback log: {e}")
     
-    return success
+    return True
 
-def get_feedback_statistics():
-    """Get statistics about collected feedback"""
-    feedback_df = load_existing_feedback()
-    
-    if feedback_df.empty:
+def _count_log_entries():
+    if not os.path.exists(FEEDBACK_LOG):
+        return 0
+    with open(FEEDBACK_LOG, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+class _FeedbackStats:
+    """
+    Running feedback statistics
+
+    The compacted CSV only changes on compaction, so it is read once; after
+    that only log lines appended since the last call are parsed. If the CSV
+    changed behind its back (compacted by another process or rewritten by
+    save_feedback) or the log shrank, it rebuilds from scratch.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.csv_size = None
+        self.log_offset = 0
+        self.total = 0
+        self.error_sum = 0.0
+        self.errors = []  # sorted error percentages, for the median
+        self.last_timestamp = None
+
+    def _add(self, entry):
+        self.total += 1
+        timestamp = entry.get('timestamp')
+        if timestamp and (self.last_timestamp is None or str(timestamp) > self.last_timestamp):
+            self.last_timestamp = str(timestamp)
+        try:
+            estimated = float(entry.get('estimated_effort'))
+            actual = float(entry.get('actual_effort'))
+        except (TypeError, ValueError):
+            return
+        if not actual or math.isnan(estimated) or math.isnan(actual):
+            return
+        error_percent = (estimated - actual) / actual * 100
+        self.error_sum += error_percent
+        bisect.insort(self.errors, error_percent)
+
+    def refresh(self):
+        csv_size = os.path.getsize(FEEDBACK_FILE) if os.path.exists(FEEDBACK_FILE) else 0
+        log_size = os.path.getsize(FEEDBACK_LOG) if os.path.exists(FEEDBACK_LOG) else 0
+        if (self.csv_size is not None and csv_size != self.csv_size) or log_size < self.log_offset:
+            self.reset()
+
+        if self.csv_size is None:
+            for row in _read_csv_rows():
+                self._add(row)
+            self.csv_size = csv_size
+        if log_size > self.log_offset:
+            for entry, end in _read_log_rows(self.log_offset):
+                self._add(entry)
+                self.log_offset = end
+
+    def mark_compacted(self):
+        """Log rows (already counted) now live at the end of the CSV"""
+        self.csv_size = os.path.getsize(FEEDBACK_FILE) if os.path.exists(FEEDBACK_FILE) else 0
+        self.log_offset = 0
+
+    def snapshot(self):
+        if self.total == 0:
+            return {
+                "total_feedback": 0,
+                "avg_estimation_error": 0,
+                "last_feedback": None
+            }
+        n = len(self.errors)
+        if n:
+            mid = n // 2
+            median = self.errors[mid] if n % 2 else (self.errors[mid - 1] + self.errors[mid]) / 2
+            mean = self.error_sum / n
+        else:
+            median = mean = float('nan')
         return {
-            "total_feedback": 0,
-            "avg_estimation_error": 0,
-            "last_feedback": None
+            "total_feedback": self.total,
+            "avg_estimation_error": mean,
+            "median_error": median,
+            "last_feedback": self.last_timestamp
         }
-    
-    # Calculate error metrics
-    feedback_df['error'] = feedback_df['estimated_effort'] - feedback_df['actual_effort']
-    feedback_df['error_percent'] = (feedback_df['error'] / feedback_df['actual_effort']) * 100
-    
-    stats = {
-        "total_feedback": len(feedback_df),
-        "avg_estimation_error": feedback_df['error_percent'].mean(),
-        "median_error": feedback_df['error_percent'].median(),
-        "last_feedback": feedback_df['timestamp'].max()
-    }
-    
-    return stats
+
+
+_stats = _FeedbackStats()
+
+def get_feedback_statistics():
+    """Get statistics about collected feedback (reads only entries added since the last call)"""
+    with _thread_lock:
+        _stats.refresh()
+        return _stats.snapshot()
 
 if __name__ == "__main__":
     # Simple test
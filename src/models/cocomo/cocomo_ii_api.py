@@ -123,12 +123,12 @@ class CocomoIIAPI:
             }
         return {'models': self.get_available_models()}
     
-    def _prepare_input(self, 
-                       schema: str, 
-                       size: float, 
-                       extra_features: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    def _input_row(self, 
+                   schema: str, 
+                   size: float, 
+                   extra_features: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Chuẩn bị dữ liệu đầu vào cho mô hình
+        Tạo một hàng đặc trưng (dict) cho một dự án
 
         Args:
             schema: Loại schema ('LOC', 'FP', hoặc 'UCP')
@@ -136,7 +136,7 @@ class CocomoIIAPI:
             extra_features: Các đặc trưng bổ sung (tùy chọn)
 
         Returns:
-            DataFrame chứa dữ liệu đầu vào đã chuẩn bị
+            Dictionary đặc trưng
         """
         # Tạo dữ liệu cơ bản với tất cả các đặc trưng mặc định là 0
         data = {feature: 0.0 for feature in self.features}
@@ -181,8 +181,25 @@ class CocomoIIAPI:
                 if key in data:
                     data[key] = value
         
+        return data
+    
+    def _prepare_input(self, 
+                       schema: str, 
+                       size: float, 
+                       extra_features: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """
+        Chuẩn bị dữ liệu đầu vào cho mô hình
+
+        Args:
+            schema: Loại schema ('LOC', 'FP', hoặc 'UCP')
+            size: Kích thước (KLOC, FP, hoặc UCP)
+            extra_features: Các đặc trưng bổ sung (tùy chọn)
+
+        Returns:
+            DataFrame chứa dữ liệu đầu vào đã chuẩn bị
+        """
         # Tạo DataFrame
-        df = pd.DataFrame([data])
+        df = pd.DataFrame([self._input_row(schema, size, extra_features)])
         
         # Đảm bảo tất cả các cột cần thiết đều có và đúng thứ tự
         # Tạo DataFrame mới với các cột theo đúng thứ tự trong self.features
@@ -192,6 +209,18 @@ class CocomoIIAPI:
         
         return result_df
     
+    def _resolve_model_name(self, model_name: Optional[str]) -> str:
+        """Mô hình mặc định là Random Forest (nếu có), nếu không thì mô hình đầu tiên"""
+        if model_name is None:
+            if 'Random_Forest' in self.models:
+                model_name = 'Random_Forest'
+            else:
+                model_name = list(self.models.keys())[0]
+        
+        if model_name not in self.models:
+            raise ValueError(f"Không tìm thấy mô hình '{model_name}'. Các mô hình có sẵn: {self.get_available_models()}")
+        return model_name
+    
     def predict(self, 
                 schema: str, 
                 size: float, 
@@ -213,15 +242,7 @@ class CocomoIIAPI:
         input_data = self._prepare_input(schema, size, extra_features)
         
         # Xác định mô hình để sử dụng
-        if model_name is None:
-            # Sử dụng Random Forest nếu có, nếu không thì sử dụng mô hình đầu tiên
-            if 'Random_Forest' in self.models:
-                model_name = 'Random_Forest'
-            else:
-                model_name = list(self.models.keys())[0]
-        
-        if model_name not in self.models:
-            raise ValueError(f"Không tìm thấy mô hình '{model_name}'. Các mô hình có sẵn: {self.get_available_models()}")
+        model_name = self._resolve_model_name(model_name)
         
         # Lấy mô hình
         model = self.models[model_name]
@@ -280,6 +301,9 @@ class CocomoIIAPI:
         """
         Thực hiện dự đoán hàng loạt cho nhiều đầu vào
 
+        Dựng một DataFrame cho toàn bộ batch, áp dụng preprocessor một lần và
+        gọi predict một lần; kết quả từng phần tử giống hệt predict()
+
         Args:
             inputs: Danh sách các đầu vào, mỗi đầu vào là một dictionary với các khóa 'schema', 'size' và tùy chọn 'extra_features'
             model_name: Tên mô hình để sử dụng (nếu không cung cấp, sẽ sử dụng mô hình tốt nhất)
@@ -287,23 +311,91 @@ class CocomoIIAPI:
         Returns:
             Danh sách các kết quả dự đoán
         """
-        results = []
-        for input_data in inputs:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(inputs)
+        rows = []
+        row_positions = []
+        
+        for pos, input_data in enumerate(inputs):
             schema = input_data.get('schema')
             size = input_data.get('size')
-            extra_features = input_data.get('extra_features')
             
             if not schema or not size:
-                results.append({'error': 'Thiếu schema hoặc size'})
+                results[pos] = {'error': 'Thiếu schema hoặc size'}
                 continue
             
             try:
-                result = self.predict(schema, size, model_name, extra_features)
-                results.append(result)
+                rows.append(self._input_row(schema, size, input_data.get('extra_features')))
+                row_positions.append(pos)
             except Exception as e:
-                results.append({'error': str(e)})
+                results[pos] = {'error': str(e)}
+        
+        if rows:
+            try:
+                resolved_name = self._resolve_model_name(model_name)
+            except Exception as e:
+                for pos in row_positions:
+                    results[pos] = {'error': str(e)}
+                return results
+            
+            try:
+                effort_preds = self._predict_matrix(
+                    self.models[resolved_name],
+                    pd.DataFrame(rows).reindex(columns=self.features, fill_value=0.0)
+                )
+            except Exception:
+                # Giữ hành vi của predict() (kể cả lỗi riêng từng phần tử)
+                for pos in row_positions:
+                    input_data = inputs[pos]
+                    try:
+                        results[pos] = self.predict(
+                            input_data.get('schema'), input_data.get('size'),
+                            model_name, input_data.get('extra_features')
+                        )
+                    except Exception as e:
+                        results[pos] = {'error': str(e)}
+                return results
+            
+            # Chuyển đổi ngược nếu đã áp dụng biến đổi logarithmic
+            effort_pm = np.expm1(effort_preds) if self.log_transform else effort_preds
+            time_months = 3.67 * (effort_pm ** 0.28)
+            developers = np.ceil(effort_pm / time_months)
+            cost = effort_pm * 5000
+            timestamp = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            for i, pos in enumerate(row_positions):
+                input_data = inputs[pos]
+                results[pos] = {
+                    'input': {
+                        'schema': input_data.get('schema'),
+                        'size': input_data.get('size'),
+                        'model_name': resolved_name
+                    },
+                    'predictions': {
+                        'effort_pm': float(effort_pm[i]),
+                        'time_months': float(time_months[i]),
+                        'developers': int(developers[i]),
+                        'cost_usd': float(cost[i])
+                    },
+                    'timestamp': timestamp
+                }
         
         return results
+    
+    def _predict_matrix(self, model, input_data: pd.DataFrame) -> np.ndarray:
+        """predict cho nhiều hàng, cùng cách xử lý preprocessor như predict()"""
+        if self.preprocessor:
+            try:
+                preds = model.predict(self.preprocessor.transform(input_data))
+            except Exception as e:
+                print(f"Lỗi khi tiền xử lý hoặc dự đoán: {str(e)}")
+                preds = model.predict(input_data)
+        else:
+            preds = model.predict(input_data)
+        
+        preds = np.asarray(preds, dtype=float).reshape(-1)
+        if len(preds) != len(input_data):
+            raise ValueError(f"Mô hình trả về {len(preds)} dự đoán cho {len(input_data)} hàng")
+        return preds
 
 # Sử dụng API
 if __name__ == "__main__":
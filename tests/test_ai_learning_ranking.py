@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the AILearningSystem ranking index (per-test signal aggregates)
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+
+from requirement_analyzer.ai_learning_system import AILearningSystem
+
+
+class TestRankingIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'learning.db')
+        self.system = AILearningSystem(self.db_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def store(self, feedback_id, test_id, feedback_type, comment=''):
+        signal = self.system.convert_feedback_to_signal(
+            feedback_id, {'id': test_id, 'title': 'Login'}, {'type': feedback_type, 'comment': comment}
+        )
+        self.system.store_learning_signal(signal)
+
+    def ranking(self, test_id):
+        return self.system.rank_test_cases([{'id': test_id, 'quality_score': 0.6}])[0]
+
+    def test_aggregates_follow_stored_signals(self):
+        self.store('f1', 'T1', 'good', 'clear')
+        self.store('f2', 'T1', 'bad')
+        r = self.ranking('T1')
+        self.assertEqual(r.feedback_count, 2)
+        self.assertAlmostEqual(r.positive_ratio, 0.5)
+        self.assertAlmostEqual(r.learned_quality, (0.8 * 1.0 - 0.8 * 0.7) / 1.7)
+
+    def test_replaced_feedback_moves_between_tests(self):
+        self.store('f1', 'T1', 'good')
+        self.assertEqual(self.ranking('T1').feedback_count, 1)
+        self.store('f1', 'T2', 'bad')
+        self.assertEqual(self.ranking('T1').feedback_count, 0)
+        self.assertEqual(self.ranking('T2').feedback_count, 1)
+
+    def test_existing_signals_are_backfilled(self):
+        self.store('f1', 'T1', 'good')
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('DROP TABLE test_signal_stats')
+        reopened = AILearningSystem(self.db_path)
+        self.assertEqual(reopened.rank_test_cases([{'id': 'T1'}])[0].feedback_count, 1)
+
+    def test_workers_opening_an_existing_db_backfill_once(self):
+        for i in range(20):
+            self.store(f'f{i}', f'T{i % 4}', 'good')
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # interleave the check and the backfill
+        try:
+            for _ in range(30):
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute('DROP TABLE test_signal_stats')
+                errors = self.open_concurrently(8)
+                self.assertEqual(errors, [])
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        reopened = AILearningSystem(self.db_path)
+        self.assertEqual(reopened.rank_test_cases([{'id': 'T0'}])[0].feedback_count, 5)
+
+    def open_concurrently(self, n):
+        barrier = threading.Barrier(n)
+        errors = []
+
+        def open_db():
+            barrier.wait()
+            try:
+                AILearningSystem(self.db_path)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=open_db) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return errors
+
+if __name__ == "__main__":
+    unittest.main()
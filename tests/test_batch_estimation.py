@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch ML estimation paths: EffortEstimator.estimate_batch_from_ml_models
+against estimate_from_ml_model, and CocomoIIAPI.batch_predict against predict()
+"""
+
+import contextlib
+import io
+import json
+import math
+import shutil
+import tempfile
+import unittest
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeRegressor
+
+from requirement_analyzer.estimator import EffortEstimator
+from src.models.cocomo.cocomo_ii_api import CocomoIIAPI
+
+
+ML_FEATURES = ['size', 'complexity', 'developers', 'time_months']
+
+PROJECTS = [
+    {'size': 12.0, 'complexity': 1.5, 'developers': 4, 'time_months': 9.0},
+    {'complexity': 2.0},                                     # size missing
+    {'size': float('nan'), 'complexity': 1.0},               # NaN size
+    {'size': 'large', 'complexity': 'high'},                 # non-numeric
+    {'size': 30, 'complexity': float('nan'), 'developers': None},
+    {'size': 13.0, 'complexity': 1.0},                       # RowModel -> negative
+    {'size': 17.0, 'complexity': 1.0},                       # RowModel -> NaN
+    {'size': 19.0, 'complexity': 0.5},                       # RowModel -> inf
+    {'size': 250.0, 'time_months': 'soon'},
+]
+
+
+class RowModel:
+    """Stand-in regressor with known outputs, including invalid ones"""
+
+    feature_names_in_ = np.array(ML_FEATURES)
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=float)
+        out = X[:, 0] * 3.0 + X[:, 1]
+        out[X[:, 0] == 13.0] = -1.0
+        out[X[:, 0] == 17.0] = np.nan
+        out[X[:, 0] == 19.0] = np.inf
+        return out
+
+
+def quiet(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+class TestEstimateBatchFromMLModels(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.estimator = quiet(EffortEstimator)
+        cls.saved = (cls.estimator.ml_models, getattr(cls.estimator, 'preprocessor', None))
+
+    def tearDown(self):
+        self.estimator.ml_models, self.estimator.preprocessor = self.saved
+
+    def scalar(self, model_name):
+        return [quiet(self.estimator.estimate_from_ml_model, dict(p), model_name) for p in PROJECTS]
+
+    def assert_rows_match(self, batch, model_name, exact=True):
+        expected = self.scalar(model_name)
+        self.assertEqual(len(batch), len(expected))
+        for i, (got, want) in enumerate(zip(batch, expected)):
+            if exact:
+                self.assertEqual(got, want, f"{model_name} row {i}")
+            else:
+                self.assertTrue(math.isclose(got, want, rel_tol=EffortEstimator.BATCH_RTOL, abs_tol=0.0),
+                                f"{model_name} row {i}: {got} != {want}")
+
+    def test_invalid_predictions_use_the_fallback_formula(self):
+        self.estimator.ml_models = {'Row': RowModel()}
+        self.estimator.preprocessor = None
+        snapshot = [dict(p) for p in PROJECTS]
+
+        batch = quiet(self.estimator.estimate_batch_from_ml_models, PROJECTS, ['Row'])
+
+        self.assert_rows_match(batch['Row'], 'Row')
+        self.assertEqual(batch['Row'][5], 13.0 * 2.5)
+        self.assertEqual(batch['Row'][6], 17.0 * 2.5)
+        self.assertEqual(batch['Row'][7], 19.0 * 2.25)
+        self.assertEqual(repr(PROJECTS), repr(snapshot))
+
+    def test_unknown_model_name_uses_the_first_model(self):
+        self.estimator.ml_models = {'Row': RowModel()}
+        self.estimator.preprocessor = None
+
+        batch = quiet(self.estimator.estimate_batch_from_ml_models, PROJECTS, ['Missing'])
+
+        self.assert_rows_match(batch['Missing'], 'Missing')
+
+    def test_no_models_uses_the_fallback_formula(self):
+        self.estimator.ml_models = {}
+
+        batch = quiet(self.estimator.estimate_batch_from_ml_models, PROJECTS)
+
+        self.assert_rows_match(batch['Random_Forest'], 'Random_Forest')
+
+    def test_loaded_models_match_row_by_row(self):
+        if not self.saved[0]:
+            self.skipTest("no trained ML models could be loaded")
+        names = list(self.saved[0])
+
+        batch = quiet(self.estimator.estimate_batch_from_ml_models, pd.DataFrame(PROJECTS), names)
+
+        for name in names:
+            self.assert_rows_match(batch[name], name, exact=False)
+
+
+class TestCocomoBatchPredict(unittest.TestCase):
+
+    FEATURES = ['size', 'kloc', 'fp', 'ucp', 'developers', 'time_months',
+                'manager_exp', 'team_exp', 'adjustment', 'transactions',
+                'entities', 'points_non_adjust']
+
+    @classmethod
+    def setUpClass(cls):
+        cls.model_dir = tempfile.mkdtemp()
+        rng = np.random.RandomState(0)
+        X = pd.DataFrame(rng.uniform(0, 50, size=(200, len(cls.FEATURES))), columns=cls.FEATURES)
+        y = np.log1p(X['size'] * 2.0 + X['developers'])
+        scaler = StandardScaler().fit(X)
+        joblib.dump(scaler, f"{cls.model_dir}/preprocessor.pkl")
+        joblib.dump(LinearRegression().fit(scaler.transform(X), y), f"{cls.model_dir}/Linear_Regression.pkl")
+        joblib.dump(DecisionTreeRegressor(random_state=0).fit(scaler.transform(X), y),
+                    f"{cls.model_dir}/Random_Forest.pkl")
+        with open(f"{cls.model_dir}/config.json", "w") as f:
+            json.dump({'models': ['Linear_Regression', 'Random_Forest'],
+                       'feature_names': cls.FEATURES, 'log_transform': True}, f)
+        cls.api = quiet(CocomoIIAPI, cls.model_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.model_dir, ignore_errors=True)
+
+    INPUTS = [
+        {'schema': 'LOC', 'size': 10},
+        {'schema': 'FP', 'size': 300, 'extra_features': {'developers': 9}},
+        {'schema': 'UCP', 'size': 45.5},
+        {'schema': 'COSMIC', 'size': 5},
+        {'size': 4},
+        {'schema': 'LOC', 'size': 0},
+        {'schema': 'loc', 'size': 120},
+    ]
+
+    def reference(self, model_name):
+        """Item-by-item loop batch_predict replaced"""
+        results = []
+        for item in self.INPUTS:
+            if not item.get('schema') or not item.get('size'):
+                results.append({'error': 'Thiếu schema hoặc size'})
+                continue
+            try:
+                results.append(quiet(self.api.predict, item['schema'], item['size'],
+                                     model_name, item.get('extra_features')))
+            except Exception as e:
+                results.append({'error': str(e)})
+        return results
+
+    def assert_same(self, batch, expected):
+        self.assertEqual(len(batch), len(expected))
+        for got, want in zip(batch, expected):
+            if 'error' in want:
+                self.assertEqual(got, want)
+                continue
+            self.assertEqual(got['input'], want['input'])
+            self.assertEqual(got['predictions']['developers'], want['predictions']['developers'])
+            for key in ('effort_pm', 'time_months', 'cost_usd'):
+                self.assertTrue(math.isclose(got['predictions'][key], want['predictions'][key],
+                                             rel_tol=EffortEstimator.BATCH_RTOL),
+                                f"{key}: {got['predictions'][key]} != {want['predictions'][key]}")
+
+    def test_matches_predict_including_error_items(self):
+        for model_name in (None, 'Linear_Regression', 'Random_Forest'):
+            batch = quiet(self.api.batch_predict, self.INPUTS, model_name)
+            self.assert_same(batch, self.reference(model_name))
+            self.assertEqual([('error' in r) for r in batch],
+                             [False, False, False, True, True, True, False])
+
+    def test_unknown_model_is_an_error_per_item(self):
+        batch = quiet(self.api.batch_predict, self.INPUTS, 'Missing')
+        self.assertEqual(batch, self.reference('Missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar COCOMO II formula against COCOMOII.estimate_effort
+"""
+
+import contextlib
+import io
+import unittest
+
+try:
+    import numpy as np
+    import pandas as pd
+    from multi_model_integration.columnar_evaluation import cocomo_ii_effort, projects_to_frame
+    from multi_model_integration.estimation_models import COCOMOII
+except ImportError:  # numpy/pandas are optional
+    np = None
+
+NAN = float("nan")
+
+
+@unittest.skipIf(np is None, "numpy/pandas not installed")
+class TestColumnarCocomo(unittest.TestCase):
+
+    def scalar(self, projects):
+        model = COCOMOII()
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [model.estimate_effort(p)["effort_pm"] for p in projects]
+
+    def test_size_fallback_matches_estimate_effort(self):
+        projects = [
+            {"size": 12.0, "kloc": 30.0},
+            {"kloc": NAN, "loc": 20000, "function_points": 300},  # kloc present but NaN
+            {"loc": 20000, "function_points": 300},  # kloc missing
+            {"kloc": 40.0},
+            {"loc": NAN},
+            {"function_points": 300},
+            {"size": NAN, "kloc": 8.0},
+            {"size": -1.0, "kloc": 8.0},
+            {"size": float("inf")},
+            {"size": "12", "kloc": 3.0},
+            {},
+        ]
+        self.assertEqual(cocomo_ii_effort(projects_to_frame(projects)).tolist(),
+                         self.scalar(projects))
+
+    def test_dataframe_columns_count_as_present(self):
+        frame = pd.DataFrame({"kloc": [NAN, 10.0], "loc": [20000.0, 20000.0]})
+        rows = [row.to_dict() for _, row in frame.iterrows()]
+        self.assertEqual(cocomo_ii_effort(frame).tolist(), self.scalar(rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
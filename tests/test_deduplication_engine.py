@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for the TestCaseDeduplicator signature index
+"""
+
+import contextlib
+import io
+import unittest
+
+from requirement_analyzer.task_gen.deduplication_engine import TestCaseDeduplicator
+from requirement_analyzer.task_gen.benchmark_deduplication import make_test_cases
+
+
+class TestDeduplicatorIndex(unittest.TestCase):
+    """The indexed mode must return exactly what the pairwise scan returns"""
+    
+    def setUp(self):
+        self.test_cases = make_test_cases(120, seed=7)
+    
+    def _run(self, dedup):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return dedup.deduplicate(self.test_cases), dedup.get_duplicate_groups(self.test_cases)
+    
+    def test_same_result_as_pairwise(self):
+        for threshold in (0.5, 0.7, 0.85, 0.95):
+            pairwise = self._run(TestCaseDeduplicator(threshold, use_index=False))
+            indexed = self._run(TestCaseDeduplicator(threshold, use_index=True))
+            self.assertEqual(pairwise, indexed, f"threshold={threshold}")
+    
+    def test_keeps_first_occurrence(self):
+        tc = {"title": "Login with valid password", "description": "User logs in",
+              "test_type": "happy_path", "steps": ["Open page", "Submit form"]}
+        dup = dict(tc, test_id="TC-2")
+        with contextlib.redirect_stdout(io.StringIO()):
+            kept = TestCaseDeduplicator().deduplicate([dict(tc, test_id="TC-1"), dup])
+        self.assertEqual([t["test_id"] for t in kept], ["TC-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the DependencyAI graph core (cycle breaking, descendant counts,
+memo invalidation) and incremental what-if sessions
+"""
+
+import random
+import unittest
+
+from requirement_analyzer.task_gen.semantic import DependencyAI, WhatIfSession, WhatIfSessionStore
+from requirement_analyzer.task_gen.semantic.dependency_ai import Edge
+
+
+def make_graph(edges, n=5):
+    dep = DependencyAI().build([{"story_id": f"s{i}", "sprint": 1} for i in range(n)])
+    for src, dst, weight in edges:
+        dep._add_edge(Edge(src=src, dst=dst, kind="rule:intent", weight=weight, reason="test"))
+    return dep
+
+
+class TestDependencyGraph(unittest.TestCase):
+
+    def test_cycles_lose_their_weakest_edge(self):
+        dep = make_graph([
+            ("s0", "s1", 1.0), ("s1", "s2", 1.0), ("s2", "s0", 0.6),
+            ("s2", "s3", 1.0), ("s3", "s2", 0.7), ("s4", "s4", 1.0),
+        ])
+        dep._break_cycles()
+        kept = {(e.src, e.dst) for e in dep.edges()}
+        self.assertEqual(kept, {("s0", "s1"), ("s1", "s2"), ("s2", "s3")})
+        self.assertEqual(len(dep.topological_order()), 5)
+
+    def test_bottlenecks_count_transitive_descendants(self):
+        dep = make_graph([("s0", "s1", 1.0), ("s0", "s2", 1.0), ("s1", "s3", 1.0), ("s2", "s3", 1.0)])
+        blocked = [(n.story_id, count) for n, count in dep.bottlenecks(top_k=10)]
+        self.assertEqual(blocked, [("s0", 3), ("s1", 1), ("s2", 1)])
+
+    def test_mutation_invalidates_memoised_analytics(self):
+        dep = make_graph([("s0", "s1", 1.0)])
+        self.assertEqual(dep.risk_scores()["s3"]["dep_depth"], 0.0)
+        dep._add_edge(Edge(src="s1", dst="s3", kind="rule:intent", weight=1.0, reason="test"))
+        self.assertEqual(dep.risk_scores()["s3"]["dep_depth"], 1.0)
+        self.assertEqual([n.story_id for n in dep.critical_path()], ["s0", "s1", "s3"])
+
+    def test_raising_an_edge_weight_invalidates_memoised_analytics(self):
+        dep = make_graph([("s0", "s2", 0.1), ("s1", "s2", 0.5)])
+        self.assertEqual([n.story_id for n in dep.critical_path()], ["s1", "s2"])
+        dep._add_edge(Edge(src="s0", dst="s2", kind="rule:intent", weight=1.0, reason="test"))
+        self.assertEqual([n.story_id for n in dep.critical_path()], ["s0", "s2"])
+
+
+class TestWhatIfSession(unittest.TestCase):
+
+    def make_session(self, n=40, seed=3):
+        rng = random.Random(seed)
+        edges = {(f"s{rng.randrange(i)}", f"s{i}", 1.0) for i in range(1, n) for _ in range(3)}
+        dep = make_graph(edges, n)
+        for node in dep.nodes.values():
+            node.sprint = rng.randint(1, 6)
+        return WhatIfSession(dep), rng
+
+    def assert_in_sync(self, session):
+        self.assertEqual(session.issues(),
+                         sorted(session.ai.validate_sprints(), key=lambda i: (i["blocker"], i["blocked"])))
+
+    def test_moves_and_undo_track_full_validation(self):
+        session, rng = self.make_session()
+        original = session.plan()
+        for _ in range(30):
+            batch = [(f"s{rng.randrange(40)}", rng.choice([None, 1, 3, 6])) for _ in range(rng.randint(1, 3))]
+            result = session.apply(batch)
+            self.assertEqual(result["violation_count"], len(session.ai.validate_sprints()))
+            self.assert_in_sync(session)
+        while session.undo_depth:
+            session.undo()
+            self.assert_in_sync(session)
+        self.assertEqual(session.plan(), original)
+
+    def test_move_reports_delta_like_what_if(self):
+        session, _ = self.make_session()
+        expected = session.ai.what_if("s5", 1)
+        result = session.move("s5", 1)
+        self.assertEqual(result["violations_resolved"], expected["violations_resolved"])
+        self.assertEqual(result["violations_introduced"], expected["violations_introduced"])
+        self.assertEqual(result["net_delta"], expected["net_delta"])
+
+    def test_unknown_story_moves_nothing(self):
+        session, _ = self.make_session()
+        plan = session.plan()
+        with self.assertRaises(KeyError):
+            session.apply([("s1", 9), ("missing", 1)])
+        self.assertEqual(session.plan(), plan)
+        self.assertEqual(session.undo_depth, 0)
+
+    def test_store_evicts_least_recently_used(self):
+        store = WhatIfSessionStore(max_sessions=2)
+        first, _ = store.create(make_graph([]))
+        second, _ = store.create(make_graph([]))
+        store.get(first)
+        third, _ = store.create(make_graph([]))
+        self.assertIsNone(store.get(second))
+        self.assertIsNotNone(store.get(first))
+        self.assertTrue(store.delete(third))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched / cached SentenceTransformerBackend
+A tiny hashing encoder stands in for the sentence-transformers model
+"""
+
+import hashlib
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from requirement_analyzer.task_gen.semantic import DependencyAI, SemanticParser
+from requirement_analyzer.task_gen.semantic.embedding import SentenceTransformerBackend
+
+
+class HashingEncoder:
+    """Deterministic bag-of-words encoder with a call counter"""
+
+    dim = 64
+
+    def __init__(self):
+        self.calls = 0
+        self.encoded = 0
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True):
+        self.calls += 1
+        self.encoded += len(texts)
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in text.lower().split():
+                out[i, int(hashlib.md5(token.encode()).hexdigest(), 16) % self.dim] += 1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        return out / np.where(norms == 0, 1, norms)
+
+
+def make_backend(cache_dir=None):
+    backend = SentenceTransformerBackend(model_name="hashing-test", cache_dir=cache_dir)
+    backend._model = HashingEncoder()
+    return backend
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestEmbeddingCache(unittest.TestCase):
+
+    def test_call_matches_batch_and_reuses_embeddings(self):
+        backend = make_backend()
+        candidates = ["password login", "invoice pay", "room search"]
+        texts = ["user login with password", "pay the invoice", "search rooms"]
+        batch = backend.score_batch(texts, candidates)
+        self.assertEqual([label for label, _ in batch], candidates)
+        encoded = backend._model.encoded
+        self.assertEqual([backend(t, candidates) for t in texts], batch)
+        self.assertEqual(backend._model.encoded, encoded)
+        self.assertGreater(backend.cache_stats()["memory_hits"], 0)
+
+    def test_disk_store_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first = make_backend(tmp)
+            vectors = first.encode(["đặt lịch khám", "thanh toán"])
+            second = make_backend(tmp)
+            np.testing.assert_allclose(second.encode(["đặt lịch khám", "thanh toán"]), vectors)
+            self.assertEqual(second._model.calls, 0)
+            self.assertEqual(second.cache_stats()["disk_hits"], 2)
+
+    def test_dependency_analysis_uses_one_model_pass(self):
+        parser = SemanticParser()
+        texts = [
+            "Người dùng đăng ký tài khoản",
+            "Người dùng đăng nhập vào hệ thống",
+            "Khách hàng đặt phòng khách sạn online",
+            "Khách hàng thanh toán hóa đơn đặt phòng",
+            "Quản trị viên xuất báo cáo doanh thu",
+        ]
+        irs = [parser.parse(t) for t in texts]
+        backend = make_backend()
+        DependencyAI(embedding_backend=backend, embedding_threshold=0.0).build(irs)
+        self.assertLessEqual(backend.model_passes, 2)  # queries + story texts
+
+
+if __name__ == "__main__":
+    unittest.main()
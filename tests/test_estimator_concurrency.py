@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Concurrency tests for EffortEstimator.integrated_estimate
+"""
+
+import contextlib
+import copy
+import io
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from requirement_analyzer.analyzer import _FeaturesCache
+from requirement_analyzer.estimator import EffortEstimator
+
+
+N_PARALLEL = 64
+
+
+def make_inputs(n):
+    """Distinct parameter sets so a leaked LOC estimate would show up in another result"""
+    inputs = []
+    for i in range(n):
+        size = 2.0 + i * 3.5
+        inputs.append({
+            'cocomo': {'size': size, 'eaf': 0.8 + (i % 5) * 0.1},
+            'function_points': {'fp': 50.0 + i * 10},
+            'use_case_points': {'ucp': 40.0 + i * 5},
+            'loc_linear': {'kloc': size, 'complexity': 1.0 + (i % 3) * 0.2,
+                           'tech_score': 1.0, 'experience': 1.0},
+            'loc_random_forest': {'kloc': size * 1.1, 'complexity': 1.0,
+                                  'tech_score': 1.0 + (i % 4) * 0.1, 'experience': 0.9},
+            'ml_features': {'size': size, 'complexity': 1.0 + (i % 3) * 0.5},
+        })
+    return inputs
+
+
+class TestIntegratedEstimateConcurrency(unittest.TestCase):
+    """Parallel calls on one estimator must match their serial results"""
+
+    @classmethod
+    def setUpClass(cls):
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.estimator = EffortEstimator()
+
+    def _estimate(self, params):
+        return self.estimator.integrated_estimate(copy.deepcopy(params))
+
+    def test_parallel_matches_serial(self):
+        inputs = make_inputs(N_PARALLEL)
+        loc_models = {name: self.estimator.models.get(name) for name in ('loc_linear', 'loc_random_forest')}
+        model_state = {name: dict(vars(model)) for name, model in loc_models.items() if model is not None}
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = [self._estimate(params) for params in inputs]
+            with ThreadPoolExecutor(max_workers=N_PARALLEL) as pool:
+                parallel = list(pool.map(self._estimate, inputs))
+
+        for i, (expected, actual) in enumerate(zip(serial, parallel)):
+            self.assertNotIn('error', actual, f"input {i}")
+            self.assertEqual(expected, actual, f"input {i}")
+
+        # Estimator is not mutated by requests (no per-call estimate overrides)
+        for name, model in loc_models.items():
+            self.assertIs(self.estimator.models.get(name), model)
+            if model is not None:
+                self.assertEqual(dict(vars(model)), model_state[name])
+
+    def test_repeated_call_is_deterministic(self):
+        params = make_inputs(1)[0]
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = self._estimate(params)
+            second = self._estimate(params)
+        self.assertEqual(first, second)
+
+    def test_advanced_params_not_mutated(self):
+        advanced = {'method': 'simple_average'}
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.estimator.integrated_estimate(copy.deepcopy(make_inputs(1)[0]), advanced_params=advanced)
+        self.assertEqual(advanced, {'method': 'simple_average'})
+
+
+NFR_WORDS = ['performance', 'security', 'usability']
+
+
+def make_texts(n):
+    """Free-text documents with different requirement counts and sizes"""
+    texts = []
+    for i in range(n):
+        lines = [f"The system shall allow user group {k} to upload files of {i + k} MB." for k in range(2 + i % 5)]
+        lines.append(f"The system must respond to search within {1 + i % 3} seconds.")
+        lines.extend(f"{quality.title()} is required for the admin area." for quality in NFR_WORDS[:i % 4])
+        lines.append("Admins should export monthly reports through a REST API.")
+        texts.append("\n".join(lines))
+    return texts
+
+
+class TestFreeTextConcurrency(unittest.TestCase):
+    """Concurrent text requests share one RequirementAnalyzer"""
+
+    @classmethod
+    def setUpClass(cls):
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.estimator = EffortEstimator()
+            try:
+                cls.analyzer = cls.estimator.get_analyzer()
+            except (LookupError, ImportError, OSError) as e:
+                raise unittest.SkipTest(f"NLP resources not available: {e}")
+
+    def test_parallel_text_requests_get_real_features(self):
+        texts = make_texts(16)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)  # interleave the threads as much as possible
+        out = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(out):
+                with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+                    parallel = list(pool.map(self.analyzer.extract_parameters, texts))
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.analyzer._features_cache.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = [self.analyzer.extract_parameters(text) for text in texts]
+
+        self.assertNotIn("Maximum recursion depth", out.getvalue())
+        for i, (expected, actual) in enumerate(zip(serial, parallel)):
+            self.assertEqual(expected, actual, f"text {i}")
+        # Not the fallback features: those lack the detected technologies and
+        # have a fixed requirement count
+        for params in parallel:
+            self.assertIn('technologies', params['features'])
+        counts = {params['features']['num_requirements'] for params in parallel}
+        self.assertGreater(len(counts), 1)
+
+    def test_parallel_integrated_estimate_from_text(self):
+        texts = make_texts(8)
+        with contextlib.redirect_stdout(io.StringIO()):
+            with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+                parallel = list(pool.map(self.estimator.integrated_estimate, texts))
+            self.analyzer._features_cache.clear()
+            serial = [self.estimator.integrated_estimate(text) for text in texts]
+        for i, (expected, actual) in enumerate(zip(serial, parallel)):
+            self.assertNotIn('error', actual, f"text {i}")
+            self.assertEqual(expected, actual, f"text {i}")
+
+
+class TestFeaturesCache(unittest.TestCase):
+
+    def test_bounded_and_returns_copies(self):
+        cache = _FeaturesCache(max_entries=3)
+        for i in range(5):
+            cache.put(f"k{i}", {'size': i})
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get("k0"))
+        cache.get("k2")['size'] = 99
+        self.assertEqual(cache.get("k2"), {'size': 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
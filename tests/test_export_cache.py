@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the v3 export result cache: LRU/TTL/size bounds of ExportResultCache
+and reuse of one generation across the export endpoints
+"""
+
+import copy
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from requirement_analyzer.task_gen import export_cache
+from requirement_analyzer.task_gen.export_cache import ExportResultCache
+
+
+REQUIREMENTS = b"""The user shall be able to log in with email and password.
+The system must send a confirmation email after a booking is created.
+The admin shall be able to cancel a booking before check-in.
+"""
+
+EXPORTS = [
+    "export-pytest",
+    "export-gherkin",
+    "export-rtm",
+    "export-json",
+    "get-statistics",
+]
+
+
+class TestExportResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(export_cache.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_content_hits_regardless_of_name(self):
+        cache = ExportResultCache()
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return {"results": [1, 2, 3]}
+
+        first = cache.get_or_generate(b"abc", "txt", "3.0.0", 8, generate)
+        second = cache.get_or_generate(b"abc", "txt", "3.0.0", 8, generate)
+        cache.get_or_generate(b"abc", "txt", "3.0.0", 4, generate)      # other max_tests
+        cache.get_or_generate(b"abc", "txt", "3.0.1", 8, generate)      # other version
+
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 3)
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 3, 3))
+
+    def test_none_results_are_not_cached(self):
+        cache = ExportResultCache()
+        self.assertIsNone(cache.get_or_generate(b"", "txt", "3.0.0", 8, lambda: None))
+        self.assertIsNone(cache.get_or_generate(b"", "txt", "3.0.0", 8, lambda: None))
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_entries_expire_after_ttl(self):
+        cache = ExportResultCache(ttl_s=60)
+        key = cache.make_key(b"abc", "txt", "3.0.0", 8)
+        cache.put(key, {"a": 1})
+
+        self.now += 60
+        self.assertEqual(cache.get(key), {"a": 1})
+        self.now += 1
+        self.assertIsNone(cache.get(key))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["expirations"], stats["entries"], stats["bytes"]), (1, 0, 0))
+
+    def test_lru_bound_evicts_least_recently_used(self):
+        cache = ExportResultCache(max_entries=2)
+        a, b, c = (cache.make_key(name, "txt", "3.0.0", 8) for name in (b"a", b"b", b"c"))
+        cache.put(a, "A")
+        cache.put(b, "B")
+        cache.get(a)  # b is now the least recently used
+        cache.put(c, "C")
+
+        self.assertEqual(cache.get(a), "A")
+        self.assertIsNone(cache.get(b))
+        self.assertEqual(cache.get(c), "C")
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_byte_bound_evicts_and_skips_oversized(self):
+        cache = ExportResultCache(max_bytes=100)
+        cache.put(("big",), "x" * 200)
+        self.assertEqual(cache.get_stats()["oversized"], 1)
+
+        cache.put(("a",), "a" * 60)
+        cache.put(("b",), "b" * 60)
+        stats = cache.get_stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (1, 1))
+        self.assertLessEqual(stats["bytes"], 100)
+        self.assertIsNone(cache.get(("a",)))
+
+
+class TestV3ExportEndpoints(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from requirement_analyzer import routers_testcase
+        app = FastAPI()
+        app.include_router(routers_testcase.router)
+        cls.client = TestClient(app)
+
+    def setUp(self):
+        self.cache = ExportResultCache()
+        patcher = mock.patch.object(export_cache, "_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def export(self, name, filename="requirements.txt", content=REQUIREMENTS):
+        response = self.client.post(f"/api/v3/test-generation/{name}",
+                                     files={"file": (filename, content, "text/plain")})
+        self.assertEqual(response.status_code, 200, response.text[:200])
+        return response
+
+    def cache_stats(self):
+        return self.client.get("/api/v3/test-generation/cache-stats").json()["cache"]
+
+    def test_repeated_export_is_a_cache_hit(self):
+        from requirement_analyzer.task_gen.test_case_generator_v3 import AITestCaseGeneratorV3
+
+        with mock.patch.object(AITestCaseGeneratorV3, "generate",
+                               autospec=True, side_effect=AITestCaseGeneratorV3.generate) as generate:
+            first = self.export("export-json")
+            self.assertEqual(self.cache_stats()["misses"], 1)
+            second = self.export("export-json", filename="renamed.txt")
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        stats = self.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+
+    def test_exports_do_not_mutate_the_shared_payload(self):
+        self.export("export-json")
+        (payload, _, _), = self.cache._entries.values()
+        snapshot = copy.deepcopy(payload)
+        first_json = self.export("export-json").content
+
+        for name in EXPORTS:
+            self.export(name)
+            self.assertEqual(payload, snapshot, f"{name} mutated the cached result")
+
+        self.assertEqual(self.export("export-json").content, first_json)
+        stats = self.cache_stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, len(EXPORTS) + 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the effort feedback collector: append-only log under the file
+lock, compaction into the CSV and the incremental statistics
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+import pandas as pd
+
+from src.feedback import feedback_collector as fc
+
+
+N_THREADS = 8
+PER_THREAD = 100
+PADDING = "x" * 300  # keeps each log line above the 256-byte size check
+
+
+class TestFeedbackCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self._saved = {name: getattr(fc, name) for name in
+                       ('FEEDBACK_DIR', 'FEEDBACK_FILE', 'FEEDBACK_LOG', 'FEEDBACK_LOCK', 'COMPACT_THRESHOLD')}
+        fc.FEEDBACK_DIR = self.tmp.name
+        fc.FEEDBACK_FILE = os.path.join(self.tmp.name, 'feedback_data.csv')
+        fc.FEEDBACK_LOG = os.path.join(self.tmp.name, 'feedback_log.jsonl')
+        fc.FEEDBACK_LOCK = os.path.join(self.tmp.name, '.feedback.lock')
+        fc.COMPACT_THRESHOLD = 50
+        fc._stats.reset()
+
+    def tearDown(self):
+        for name, value in self._saved.items():
+            setattr(fc, name, value)
+        fc._stats.reset()
+        self.tmp.cleanup()
+
+    def write(self, thread, i):
+        # Some entries have no usable actual effort and only count towards the total
+        actual = 0 if i % 10 == 0 else 10.0 + (thread * PER_THREAD + i) % 37
+        return fc.add_feedback(
+            f"P{thread}", f"T{thread}-{i}", f"requirement {i} {PADDING}",
+            estimated_effort=12.0 + i % 7, actual_effort=actual, effort_unit='HOUR',
+            model_used='cocomo', features={'thread': thread},
+        )
+
+    def csv_rows(self):
+        return list(fc._read_csv_rows())
+
+    def log_rows(self):
+        return [entry for entry, _ in fc._read_log_rows()]
+
+    def test_concurrent_writes_survive_compaction(self):
+        stats_during, failed = [], []
+
+        def writer(thread):
+            for i in range(PER_THREAD):
+                if not self.write(thread, i):
+                    failed.append((thread, i))
+                if i % 25 == 0:
+                    stats_during.append(fc.get_feedback_statistics()['total_feedback'])
+
+        threads = [threading.Thread(target=writer, args=(t,)) for t in range(N_THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(failed, [])
+        total = N_THREADS * PER_THREAD
+        csv_rows, log_rows = self.csv_rows(), self.log_rows()
+        self.assertGreaterEqual(len(csv_rows), fc.COMPACT_THRESHOLD)  # compaction ran
+        self.assertEqual(len(csv_rows) + len(log_rows), total)
+        self.assertEqual({row['task_id'] for row in csv_rows + log_rows},
+                         {f"T{t}-{i}" for t in range(N_THREADS) for i in range(PER_THREAD)})
+        self.assertTrue(all(0 < n <= total for n in stats_during))
+
+        fc.compact_feedback_log()
+        for i in range(3):
+            self.write(99, i)
+        self.assertEqual(len(self.csv_rows()), total)
+        self.assertEqual(len(self.log_rows()), 3)
+
+        df = fc.load_existing_feedback()
+        self.assertEqual(len(df), total + 3)
+        self.assertEqual(set(df['task_id']), {row['task_id'] for row in self.csv_rows() + self.log_rows()})
+
+        self.assert_stats_match(df)
+
+        # A fresh reader (another worker) gets the same numbers from the files
+        fc._stats.reset()
+        self.assert_stats_match(df)
+
+    def assert_stats_match(self, df):
+        stats = fc.get_feedback_statistics()
+        estimated = pd.to_numeric(df['estimated_effort'], errors='coerce')
+        actual = pd.to_numeric(df['actual_effort'], errors='coerce')
+        valid = actual.notna() & (actual != 0) & estimated.notna()
+        errors = (estimated[valid] - actual[valid]) / actual[valid] * 100
+
+        self.assertEqual(stats['total_feedback'], len(df))
+        self.assertAlmostEqual(stats['avg_estimation_error'], errors.mean(), places=9)
+        self.assertAlmostEqual(stats['median_error'], errors.median(), places=9)
+        self.assertEqual(stats['last_feedback'], df['timestamp'].astype(str).max())
+
+
+if __name__ == '__main__':
+    unittest.main()
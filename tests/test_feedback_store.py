@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for the /api/tasks feedback store: write-behind batches, daily
+rollups, migration of an existing feedback.db and per-thread connections
+"""
+
+import json
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from app.feedback_store import FeedbackStore
+
+
+class TestFeedbackStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / 'feedback.db'
+        self.store = FeedbackStore(self.db_path, batch_size=16)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def count(self, table):
+        with sqlite3.connect(str(self.db_path)) as conn:
+            return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def test_queued_writes_reach_sqlite_after_flush_and_close(self):
+        for i in range(40):
+            self.store.add_feedback({'title': f'task {i}'}, rating=i % 5)
+        self.store.flush()
+        self.assertEqual(self.count('feedback'), 40)
+
+        for i in range(25):
+            self.store.log_generation(mode='model', num_tasks=i)
+        self.store.close()
+        self.assertEqual(self.count('generation_logs'), 25)
+
+        reopened = FeedbackStore(self.db_path)
+        try:
+            exported = reopened.export_feedback(limit=100)
+        finally:
+            reopened.close()
+        self.assertEqual(len(exported), 40)
+        self.assertEqual({row['generated_task']['title'] for row in exported},
+                         {f'task {i}' for i in range(40)})
+
+    def test_daily_rollup_counts(self):
+        self.store.log_generation(mode='model', latency_ms=100, avg_confidence=0.8,
+                                  quality_gates={'title_repairs': 2, 'ac_dedupes': 1})
+        self.store.log_generation(mode='model', latency_ms=300, avg_confidence=None,
+                                  quality_gates={'priority_boosts': 4})
+        self.store.log_generation(mode='template', latency_ms=None, avg_confidence=0.5)
+        self.store.flush()
+
+        with sqlite3.connect(str(self.db_path)) as conn:
+            rows = conn.execute('''
+                SELECT mode, requests, latency_sum, latency_n, confidence_sum, confidence_n,
+                       title_repairs, ac_dedupes, priority_boosts
+                FROM generation_daily ORDER BY mode
+            ''').fetchall()
+        today = datetime.now().date().isoformat()
+        self.assertEqual(rows, [
+            ('model', 2, 400.0, 2, 0.8, 1, 2, 1, 4),
+            ('template', 1, 0.0, 0, 0.5, 1, 0, 0, 0),
+        ])
+        with sqlite3.connect(str(self.db_path)) as conn:
+            self.assertEqual(conn.execute('SELECT DISTINCT day FROM generation_daily').fetchall(), [(today,)])
+
+        stats = self.store.get_stats(days=7)
+        self.assertEqual(stats['total_requests'], 3)
+        self.assertEqual(stats['mode_distribution'], {'model': 2, 'template': 1})
+        self.assertAlmostEqual(stats['avg_latency_ms'], 200.0)
+        self.assertAlmostEqual(stats['avg_confidence'], 0.65)
+        self.assertEqual(stats['quality_gates_summary'],
+                         {'title_repairs': 2, 'ac_dedupes': 1, 'priority_boosts': 4})
+
+    def test_existing_database_is_migrated(self):
+        self.store.close()
+        self.db_path.unlink()
+        for suffix in ('-wal', '-shm'):
+            Path(str(self.db_path) + suffix).unlink(missing_ok=True)
+
+        # feedback.db as written before generation_daily existed
+        now = datetime.now().isoformat()
+        with sqlite3.connect(str(self.db_path)) as conn:
+            conn.executescript('''
+                CREATE TABLE feedback (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, task_id TEXT,
+                    generated_task TEXT NOT NULL, final_task TEXT, rating INTEGER, comment TEXT,
+                    session_id TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE TABLE generation_logs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, mode TEXT NOT NULL,
+                    num_sentences INTEGER, num_requirements INTEGER, num_tasks INTEGER,
+                    latency_ms INTEGER, avg_confidence REAL, quality_gates TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                );
+            ''')
+            conn.execute('INSERT INTO feedback (timestamp, generated_task, rating) VALUES (?, ?, ?)',
+                         (now, json.dumps({'title': 'old'}), 5))
+            conn.executemany(
+                'INSERT INTO generation_logs (timestamp, mode, latency_ms, avg_confidence, quality_gates) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(now, 'model', 50, 0.9, json.dumps({'ac_dedupes': 3})),
+                 (now, 'model', 150, 0.7, None),
+                 (now, 'llm', None, None, 'not json')],
+            )
+
+        self.store = FeedbackStore(self.db_path)
+        with sqlite3.connect(str(self.db_path)) as conn:
+            rollups = conn.execute(
+                'SELECT mode, requests, latency_sum, ac_dedupes FROM generation_daily ORDER BY mode'
+            ).fetchall()
+        self.assertEqual(rollups, [('llm', 1, 0.0, 0), ('model', 2, 200.0, 3)])
+        self.assertEqual(self.store.get_stats(days=7)['total_requests'], 3)
+        self.assertEqual(self.store.export_feedback()[0]['generated_task'], {'title': 'old'})
+
+        # Reopening does not backfill a second time
+        self.store.close()
+        self.store = FeedbackStore(self.db_path)
+        self.assertEqual(self.count('generation_daily'), 2)
+        self.assertEqual(self.store.get_stats(days=7)['total_requests'], 3)
+
+    def test_concurrent_writers_use_their_own_connections(self):
+        n_threads, per_thread = 8, 50
+        barrier = threading.Barrier(n_threads)
+        ids, connections, errors = [], [], []
+        lock = threading.Lock()
+
+        def writer(t):
+            try:
+                connections.append(self.store.connection())
+                barrier.wait()
+                futures = [self.store.add_feedback({'thread': t, 'i': i}, session_id=str(t))
+                           for i in range(per_thread)]
+                row_ids = [f.result(timeout=10) for f in futures]
+                self.store.connection().execute('SELECT COUNT(*) FROM feedback').fetchone()
+                with lock:
+                    ids.extend(row_ids)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(t,)) for t in range(n_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(map(id, connections))), n_threads)
+        self.assertEqual(len(set(ids)), n_threads * per_thread)
+        self.assertEqual(self.count('feedback'), n_threads * per_thread)
+        self.assertEqual(self.store.stats['rows_written'], n_threads * per_thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Tests for paragraph-aligned chunking used by the streaming free-text parser
+"""
+
+import unittest
+
+from rule_based_system.parsers.free_text_parser import iter_text_chunks
+
+
+class TestTextChunks(unittest.TestCase):
+
+    def test_short_text_is_a_single_untouched_chunk(self):
+        text = "The user must log in.\n\nThe admin can approve refunds."
+        self.assertEqual(list(iter_text_chunks(text)), [text])
+
+    def test_chunks_are_bounded_and_cover_the_text(self):
+        text = "\n\n".join(f"Paragraph {i}. The user must submit order {i}." for i in range(500))
+        chunks = list(iter_text_chunks(text, max_chars=1000))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(c) <= 1000 for c in chunks))
+        self.assertEqual("".join(chunks), text)
+        # Cut at paragraph breaks: every chunk after the first starts a paragraph
+        self.assertTrue(all(c.startswith("Paragraph") for c in chunks))
+
+    def test_falls_back_to_sentence_then_hard_cuts(self):
+        sentences = "One sentence here. " * 10
+        self.assertTrue(all(c.endswith(". ") for c in iter_text_chunks(sentences, 50)))
+        self.assertEqual(list(iter_text_chunks("a" * 50, 20)), ["a" * 20, "a" * 20, "a" * 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
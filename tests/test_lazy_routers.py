@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for lazily mounted routers (LazyRouter / LazyRouterMiddleware) and
+the /health and /warmup endpoints of the task generation app
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+import uuid
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.lazy_routers import LazyRouter, LazyRouterMiddleware
+
+
+ROUTER_SOURCE = '''
+from fastapi import APIRouter
+
+router = APIRouter(prefix="{prefix}")
+
+
+@router.get("/ping")
+def ping():
+    return {{"pong": "{prefix}"}}
+'''
+
+
+class TestLazyRouterMiddleware(unittest.TestCase):
+
+    def setUp(self):
+        self.module_dir = tempfile.mkdtemp()
+        sys.path.insert(0, self.module_dir)
+        self.modules = []
+
+    def tearDown(self):
+        sys.path.remove(self.module_dir)
+        for name in self.modules:
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.module_dir, ignore_errors=True)
+
+    def lazy_router(self, prefix):
+        name = f"lazy_router_fixture_{uuid.uuid4().hex}"
+        with open(os.path.join(self.module_dir, f"{name}.py"), "w") as f:
+            f.write(textwrap.dedent(ROUTER_SOURCE.format(prefix=prefix)))
+        self.modules.append(name)
+        return LazyRouter(name, name, prefix=prefix)
+
+    def make_app(self, routers):
+        app = FastAPI()
+
+        @app.get("/other")
+        def other():
+            return {"ok": True}
+
+        app.add_middleware(LazyRouterMiddleware, target=app, routers=routers)
+        return TestClient(app)
+
+    def test_router_is_mounted_on_first_request_under_its_prefix(self):
+        alpha, beta = self.lazy_router("/alpha"), self.lazy_router("/beta")
+        client = self.make_app([alpha, beta])
+
+        self.assertEqual(client.get("/other").status_code, 200)
+        self.assertEqual(client.get("/alphabet").status_code, 404)
+        self.assertNotIn(alpha.module, sys.modules)
+        self.assertEqual(alpha.status()["state"], "lazy")
+
+        self.assertEqual(client.get("/alpha/ping").json(), {"pong": "/alpha"})
+        self.assertEqual(alpha.status()["state"], "mounted")
+        self.assertEqual(beta.status()["state"], "lazy")
+        self.assertNotIn(beta.module, sys.modules)
+
+    def test_openapi_mounts_every_router(self):
+        alpha, beta = self.lazy_router("/alpha"), self.lazy_router("/beta")
+        disabled = self.lazy_router("/gamma")
+        disabled.enabled = lambda: False
+        client = self.make_app([alpha, beta, disabled])
+
+        paths = client.get("/openapi.json").json()["paths"]
+
+        self.assertIn("/alpha/ping", paths)
+        self.assertIn("/beta/ping", paths)
+        self.assertNotIn("/gamma/ping", paths)
+        self.assertEqual([r.status()["state"] for r in (alpha, beta, disabled)],
+                         ["mounted", "mounted", "skipped"])
+
+
+class TestHealthAndWarmup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import app.main as main
+        cls.main = main
+        cls.client = TestClient(main.app)
+
+    def test_health_reports_each_router_state(self):
+        routers = self.client.get("/health").json()["routers"]
+        self.assertEqual(routers, {r.label: r.status() for r in self.main.LAZY_ROUTERS})
+        self.assertEqual(set(routers), {"LLM-Free Router", "V3 Hybrid LLM Router"})
+
+    def test_warmup_preloads_without_downloads(self):
+        from requirement_analyzer import nlp_resources
+
+        saved = (nlp_resources._nltk_ready, dict(nlp_resources._spacy_models))
+        nlp_resources._nltk_ready = False
+        nlp_resources._spacy_models.clear()
+        try:
+            with mock.patch.dict(os.environ, {"RA_ALLOW_NLP_DOWNLOADS": "0"}), \
+                    mock.patch("nltk.download") as nltk_download, \
+                    mock.patch("subprocess.run") as subprocess_run:
+                timings = self.client.post("/warmup").json()
+            nltk_download.assert_not_called()
+            subprocess_run.assert_not_called()
+        finally:
+            nlp_resources._nltk_ready = saved[0]
+            nlp_resources._spacy_models.clear()
+            nlp_resources._spacy_models.update(saved[1])
+
+        self.assertIn("nltk", timings["nlp"])
+        self.assertIn(f"spacy:{nlp_resources.DEFAULT_SPACY_MODEL}", timings["nlp"])
+        states = {label: timings[label]["state"] for label in ("LLM-Free Router", "V3 Hybrid LLM Router")}
+        self.assertNotIn("lazy", states.values())
+        if states["LLM-Free Router"] == "mounted":
+            self.assertEqual(states["V3 Hybrid LLM Router"], "skipped")
+
+        routers = self.client.get("/health").json()["routers"]
+        self.assertEqual({label: r["state"] for label, r in routers.items()}, states)
+
+
+if __name__ == "__main__":
+    unittest.main()
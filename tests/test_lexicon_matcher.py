@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the Aho-Corasick LexiconMatcher behind SemanticParser
+"""
+
+import unittest
+
+from requirement_analyzer.task_gen.semantic.lexicon_matcher import (
+    LexiconMatcher, first_item, second_item,
+)
+from requirement_analyzer.task_gen.semantic.parser import SemanticParser
+
+
+class TestLexiconMatcher(unittest.TestCase):
+
+    def test_first_occurrence_and_overlaps(self):
+        intents = [("đăng", "x"), ("đăng nhập", "login"), ("nhập", "import")]
+        matcher = LexiconMatcher({"intent": (intents, first_item)})
+        hits = matcher.scan("đăng nhập rồi đăng nhập lại")
+        self.assertEqual(hits["intent"], {0: (0, 4), 1: (0, 9), 2: (5, 4)})
+
+    def test_multi_keyword_entries_report_earliest(self):
+        rules = [("A", ["zeta", "alpha"]), ("B", ["beta"])]
+        matcher = LexiconMatcher({"domain": (rules, second_item)})
+        self.assertEqual(matcher.scan("alpha beta zeta")["domain"], {0: (0, 5), 1: (6, 4)})
+
+    def test_appended_aliases_are_compiled_incrementally(self):
+        entities = [("hồ sơ", "record")]
+        matcher = LexiconMatcher({"entity": (entities, first_item)})
+        self.assertEqual(matcher.scan("xem bệnh án"), {"entity": {}})
+        entities.append(("bệnh án", "medical_record"))
+        self.assertEqual(matcher.scan("xem bệnh án"), {"entity": {1: (4, 7)}})
+        self.assertEqual(matcher.rebuilds, 2)
+        matcher.scan("xem hồ sơ")
+        self.assertEqual(matcher.rebuilds, 2)
+
+
+class TestParserTieBreaking(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = SemanticParser()
+
+    def test_earliest_actor_wins(self):
+        ir = self.parser.parse("Bác sĩ kê đơn thuốc cho bệnh nhân")
+        self.assertEqual(ir.actor, "Bác sĩ")
+        self.assertEqual(ir.intent, "prescribe")
+        self.assertEqual(ir.entity, "prescription")
+
+    def test_longest_intent_wins_on_same_position(self):
+        self.assertEqual(self.parser.parse("Đồng bộ hóa danh bạ").intent, "sync")
+        self.assertEqual(self.parser.parse("Xuất báo cáo doanh thu").intent, "report")
+
+    def test_docstring_example(self):
+        ir = self.parser.parse("Bệnh nhân có thể đặt lịch khám với bác sĩ online")
+        self.assertEqual(
+            (ir.actor, ir.intent, ir.entity, ir.channel, ir.domain),
+            ("Bệnh nhân", "book", "appointment", "online", "Clinical"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
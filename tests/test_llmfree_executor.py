@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for LLM-Free generation in the generation executor: worker adapters
+must be built like the shared adapter (same custom extractor)
+"""
+
+import asyncio
+import threading
+import unittest
+
+from requirement_analyzer.task_gen import api_adapter_llmfree
+from requirement_analyzer.task_gen.requirement_extractor import MockRequirementExtractor
+
+
+class RecordingExtractor(MockRequirementExtractor):
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def extract(self, requirement_text):
+        with self._lock:
+            self.calls += 1
+        return super().extract(requirement_text)
+
+
+class TestWorkerAdapter(unittest.TestCase):
+
+    def setUp(self):
+        self._saved = api_adapter_llmfree._adapter
+        api_adapter_llmfree._adapter = None
+
+    def tearDown(self):
+        api_adapter_llmfree._adapter = self._saved
+
+    def test_workers_use_the_custom_extractor(self):
+        extractor = RecordingExtractor()
+        api_adapter_llmfree.get_llmfree_adapter(custom_extractor=extractor)
+
+        result = asyncio.run(api_adapter_llmfree.generate_tests_async(
+            requirements_text="The system shall allow users to log in with email and password.",
+            max_tests=5,
+        ))
+
+        self.assertEqual(result["status"], "success")
+        self.assertGreater(extractor.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests that ModelBasedTaskGenerator.generate_batch gives the same tasks with
+nlp.pipe parsing (batch_size > 0, NER disabled) as with per-sentence parsing
+"""
+
+import random
+import unittest
+
+try:
+    from requirement_analyzer.task_gen import config
+    from requirement_analyzer.task_gen.benchmark_nlp_batching import make_sentences
+    from requirement_analyzer.task_gen.generator_model_based import ModelBasedTaskGenerator
+except ImportError:  # spaCy is optional
+    ModelBasedTaskGenerator = None
+
+
+N_SENTENCES = 40
+LABELS = [
+    {'type': 'functional', 'priority': 'Medium', 'domain': 'general'},
+    {'type': 'security', 'priority': 'High', 'domain': 'finance'},
+    {'type': 'interface', 'priority': 'Low', 'domain': 'ecommerce'},
+    {'type': 'data', 'priority': 'Medium', 'domain': 'general'},
+]
+
+
+@unittest.skipIf(ModelBasedTaskGenerator is None, "spaCy not installed")
+class TestGenerateBatchParsing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.generator = ModelBasedTaskGenerator(model_dir=config.MODEL_DIR)
+        if cls.generator.nlp is None:
+            raise unittest.SkipTest("spaCy model en_core_web_sm not installed")
+        cls.sentences = make_sentences(N_SENTENCES)
+        cls.labels = [LABELS[i % len(LABELS)] for i in range(N_SENTENCES)]
+
+    def generate(self, **kwargs):
+        random.seed(0)  # description starters and AC themes are sampled
+        tasks = self.generator.generate_batch(self.sentences, self.labels, epic_name="Epic", **kwargs)
+        return [task.dict(exclude={'task_id', 'generated_at'}) for task in tasks]
+
+    def test_parse_texts_skips_ner(self):
+        docs = self.generator.parse_texts([s.text for s in self.sentences[:4]], batch_size=2)
+        self.assertEqual(len(docs), 4)
+        self.assertTrue(all(doc.ents == () for doc in docs))
+        self.assertEqual(docs[0].text, self.sentences[0].text.lower())
+
+    def test_batched_parsing_matches_per_sentence(self):
+        sequential = self.generate(batch_size=0)
+        self.assertEqual(len(sequential), N_SENTENCES)
+        for batch_size in (None, 1, 7):
+            self.assertEqual(self.generate(batch_size=batch_size), sequential, f"batch_size={batch_size}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for page-range PDF extraction and upload spooling
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from importlib.util import find_spec
+
+from requirement_analyzer.ingestion import iter_pdf_pages, shutdown_pdf_executor, spool_upload
+
+
+class TestSpoolUpload(unittest.TestCase):
+
+    def test_copies_the_whole_stream_to_a_temp_file(self):
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        path = spool_upload(io.BytesIO(data), ".bin", chunk_size=64 * 1024)
+        try:
+            self.assertTrue(path.endswith(".bin"))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), data)
+        finally:
+            os.unlink(path)
+
+
+@unittest.skipUnless(find_spec("fitz"), "pymupdf not installed")
+class TestParallelPdfPages(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import fitz
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "spec.pdf")
+        doc = fitz.open()
+        for i in range(40):
+            page = doc.new_page()
+            if i % 9:
+                page.insert_text((40, 40), f"REQ-{i}: The user shall export report {i}.")
+        doc.save(cls.path)
+        doc.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pdf_executor()
+        cls.tmp.cleanup()
+
+    def test_parallel_pages_match_sequential_in_order(self):
+        sequential = list(iter_pdf_pages(self.path, max_workers=1))
+        parallel = list(iter_pdf_pages(self.path, max_workers=2, pages_per_task=3))
+        self.assertEqual(parallel, sequential)
+        self.assertEqual([i for i, _ in parallel], list(range(40)))
+        self.assertIn("REQ-10:", parallel[10][1])
+        self.assertEqual(parallel[9][1].strip(), "")
+
+    def test_bytes_source_matches_path(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        self.assertEqual(list(iter_pdf_pages(data, max_workers=1)), list(iter_pdf_pages(self.path, max_workers=1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
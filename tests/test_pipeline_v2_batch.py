@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for V2Pipeline.process_batch: process-pool mode keeps input order and
+matches the sequential output; per-stage timings are aggregated
+"""
+
+import unittest
+
+from requirement_analyzer.task_gen.pipeline_v2 import (
+    PARALLEL_MIN_REQUIREMENTS,
+    STAGES,
+    V2Pipeline,
+    shutdown_pipeline_executor,
+)
+from requirement_analyzer.task_gen.schemas_v2 import Requirement
+
+
+TEXTS = [
+    "The system shall allow users to register with email and password.",
+    "Admins must be able to deactivate user accounts.",
+    "Customers must be able to pay by credit card at checkout.",
+    "The system shall respond to search queries within 2 seconds.",
+]
+VOLATILE = {"created_at": True, "quality_metrics": {"processing_time_seconds"}}
+
+
+class TestProcessBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pipeline = V2Pipeline()
+        cls.requirements = [
+            Requirement(requirement_id=f"REQ-{i}", original_text=f"{TEXTS[i % len(TEXTS)]} Case {i}.", language="en")
+            for i in range(PARALLEL_MIN_REQUIREMENTS)
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pipeline_executor()
+
+    def test_parallel_matches_sequential_in_input_order(self):
+        sequential = self.pipeline.process_batch(self.requirements, max_workers=1)
+        parallel = self.pipeline.process_batch(self.requirements, max_workers=2)
+
+        self.assertEqual(parallel.summary["workers"], 2)
+        self.assertEqual([o.requirement_id for o in parallel.requirements],
+                         [r.requirement_id for r in self.requirements])
+        self.assertEqual([o.model_dump(exclude=VOLATILE) for o in parallel.requirements],
+                         [o.model_dump(exclude=VOLATILE) for o in sequential.requirements])
+
+    def test_stage_timings_are_aggregated(self):
+        batch = self.pipeline.process_batch(self.requirements[:10])
+
+        self.assertEqual(batch.summary["workers"], 1)
+        self.assertEqual(set(batch.stage_timings), set(STAGES))
+        self.assertAlmostEqual(sum(t["share"] for t in batch.stage_timings.values()), 1.0, places=2)
+        self.assertIn(batch.summary["slowest_stage"], STAGES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental V2 generation: requirement id rebasing of memoized
+outputs and the story diff between two generations
+"""
+
+import unittest
+
+from requirement_analyzer.task_gen.pipeline_v2 import V2Pipeline
+from requirement_analyzer.task_gen.requirement_memo import (
+    RequirementMemo,
+    diff_stories,
+    rebase_requirement_id,
+    requirement_fingerprint,
+)
+from requirement_analyzer.task_gen.schemas_v2 import Requirement
+
+
+VOLATILE = {"created_at": True, "quality_metrics": {"processing_time_seconds"}}
+TEXT = "The system shall allow customers to pay by credit card at checkout."
+
+
+def story(req_index, text, title, n=0):
+    return {
+        "id": f"REQ-{req_index}_ST{n + 1:02d}",
+        "source_key": f"{requirement_fingerprint(text)}:{n}",
+        "title": title,
+        "subtasks": [{"id": f"REQ-{req_index}_ST{n + 1:02d}_T01", "title": "Backend"}],
+    }
+
+
+class TestRequirementMemo(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pipeline = V2Pipeline()
+
+    def process(self, requirement_id):
+        output = self.pipeline.process_single_requirement(
+            Requirement(requirement_id=requirement_id, original_text=TEXT, language="en")
+        )
+        return output.model_dump(exclude=VOLATILE)
+
+    def test_rebased_output_matches_fresh_output(self):
+        memo = RequirementMemo()
+        key = RequirementMemo.key(TEXT, "en", None)
+        memo.put(key, self.pipeline.process_single_requirement(
+            Requirement(requirement_id="REQ-1", original_text=TEXT, language="en")
+        ))
+
+        rebased = memo.get(RequirementMemo.key("  " + TEXT.replace(" ", "\n", 1), "en", None), "REQ-12")
+        self.assertIsNotNone(rebased)
+        self.assertEqual(rebased.model_dump(exclude=VOLATILE),
+                         self.process("REQ-12"))
+        self.assertIsNone(memo.get(RequirementMemo.key(TEXT, "vi", None), "REQ-1"))
+
+    def test_rebase_only_touches_whole_id_tokens(self):
+        output = self.pipeline.process_single_requirement(
+            Requirement(requirement_id="REQ-1", original_text=TEXT + " See REQ-1.", language="en")
+        )
+        rebased = rebase_requirement_id(output, "REQ-2")
+        self.assertEqual(rebased.requirement_id, "REQ-2")
+        self.assertIn("REQ-1", rebased.original_requirement)
+        stories = [st for sl in rebased.slicing.slices for st in sl.stories]
+        self.assertTrue(stories and all(st.story_id.startswith("REQ-2_") for st in stories))
+        self.assertEqual(rebase_requirement_id(rebased, "REQ-1").model_dump(), output.model_dump())
+
+    def test_diff_pairs_edited_lines_and_ignores_moves(self):
+        a, b, c = TEXT, "Admins must be able to deactivate accounts.", "Managers must export reports."
+        edited = "Managers must export reports to CSV."
+        new = "Users must be able to log in with Google."
+        previous = [story(1, a, "Pay"), story(2, b, "Deactivate"), story(3, c, "Export")]
+        # Dependency sorting puts stories out of document order
+        current = [story(3, edited, "Export CSV"), story(1, new, "Login"), story(2, a, "Pay")]
+
+        diff = diff_stories(previous, current)
+
+        self.assertEqual(diff["added"], ["REQ-1_ST01"])
+        self.assertEqual(diff["removed"], ["REQ-2_ST01"])
+        self.assertEqual(diff["changed"], [
+            {"id": "REQ-3_ST01", "previous_id": "REQ-3_ST01", "fields": ["title"]},
+        ])
+        self.assertEqual(diff["unchanged"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
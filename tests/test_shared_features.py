@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for shared TF-IDF features: VectorizerRegistry content-hash reuse and
+SharedFeatureBatch matrices against each component's own transform
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from requirement_analyzer.task_gen import shared_features
+from requirement_analyzer.task_gen.enrichers import LabelEnricher
+from requirement_analyzer.task_gen.shared_features import SharedFeatureBatch, VectorizerRegistry
+
+
+CORPUS = [
+    "The user shall be able to log in with email and password",
+    "The system must encrypt stored payment data",
+    "Admins can export monthly booking reports",
+    "The page should load in under two seconds",
+    "Customers receive a confirmation email after checkout",
+    "The API must reject requests without a valid token",
+]
+OTHER_CORPUS = [
+    "Patients can book an appointment with a doctor",
+    "The clinic dashboard shows daily visits",
+    "Doctors shall sign prescriptions electronically",
+]
+LABELS = {
+    'type': ['functional', 'security', 'functional', 'performance', 'functional', 'security'],
+    'priority': ['High', 'High', 'Low', 'Medium', 'Medium', 'High'],
+    'domain': ['ecommerce', 'finance', 'hotel', 'general', 'ecommerce', 'general'],
+}
+TEXTS = [
+    "The user must reset the password by email",
+    "Reports are exported as CSV for admins",
+    "Checkout should finish in under one second",
+]
+
+
+class TestVectorizerRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.registry = VectorizerRegistry()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def dump(self, vectorizer, name):
+        path = self.dir / name
+        joblib.dump(vectorizer, path)
+        return path
+
+    def test_same_content_hash_returns_the_same_vectorizer(self):
+        fitted = TfidfVectorizer().fit(CORPUS)
+        a = self.dump(fitted, 'type_vectorizer.joblib')
+        b = self.dump(fitted, 'priority_vectorizer.joblib')
+
+        vec_a, digest_a = self.registry.load(a)
+        vec_b, digest_b = self.registry.load(b)
+        vec_a_again, _ = self.registry.load(a)
+
+        self.assertEqual(digest_a, digest_b)
+        self.assertIs(vec_a, vec_b)
+        self.assertIs(vec_a, vec_a_again)
+        self.assertEqual(self.registry.stats, {'loads': 1, 'reuses': 2})
+        self.assertEqual(vec_a.transform(TEXTS).toarray().tolist(),
+                         fitted.transform(TEXTS).toarray().tolist())
+
+    def test_different_corpus_is_a_different_vectorizer(self):
+        a = self.dump(TfidfVectorizer().fit(CORPUS), 'type_vectorizer.joblib')
+        b = self.dump(TfidfVectorizer().fit(OTHER_CORPUS), 'domain_vectorizer.joblib')
+
+        vec_a, digest_a = self.registry.load(a)
+        vec_b, digest_b = self.registry.load(b)
+
+        self.assertNotEqual(digest_a, digest_b)
+        self.assertIsNot(vec_a, vec_b)
+        self.assertEqual(self.registry.stats, {'loads': 2, 'reuses': 0})
+
+
+class TestSharedFeatureBatch(unittest.TestCase):
+
+    def test_matrices_match_transform_and_are_reused(self):
+        vec = TfidfVectorizer().fit(CORPUS)
+        other = TfidfVectorizer().fit(OTHER_CORPUS)
+        batch = SharedFeatureBatch(TEXTS)
+
+        X = batch.transform('a', vec)
+        self.assertIs(batch.transform('a', vec), X)
+        self.assertEqual(X.toarray().tolist(), vec.transform(TEXTS).toarray().tolist())
+        self.assertEqual(batch.transform('b', other).toarray().tolist(),
+                         other.transform(TEXTS).toarray().tolist())
+        batch.transform(None, vec)  # unknown digest is never cached
+        self.assertEqual((batch.transforms, batch.reuses), (3, 1))
+
+        sub = batch.subset([2, 0])
+        self.assertEqual(sub.texts, [TEXTS[2], TEXTS[0]])
+        self.assertEqual(sub.transform('a', vec).toarray().tolist(),
+                         vec.transform(sub.texts).toarray().tolist())
+        self.assertEqual(sub.transforms, 0)
+
+    def test_enrichers_give_the_same_predictions_with_shared_features(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            model_dir = Path(tmp)
+            shared = TfidfVectorizer().fit(CORPUS)
+            for label, y in LABELS.items():
+                # type and priority ship byte-identical vectorizers, domain its own
+                vec = shared if label != 'domain' else TfidfVectorizer(ngram_range=(1, 2)).fit(CORPUS)
+                joblib.dump(vec, model_dir / f'{label}_vectorizer.joblib')
+                joblib.dump(LogisticRegression().fit(vec.transform(CORPUS), y),
+                            model_dir / f'{label}_model.joblib')
+                with open(model_dir / f'{label}_classes.json', 'w') as f:
+                    json.dump(sorted(set(y)), f)
+
+            with mock.patch.object(shared_features, '_registry', VectorizerRegistry()):
+                enrichers = [LabelEnricher(label, model_dir) for label in LABELS]
+                batch = SharedFeatureBatch(TEXTS)
+                for enricher in enrichers:
+                    shared_out = enricher.predict(TEXTS, features=batch)
+                    own_out = enricher.predict(TEXTS)
+                    self.assertEqual([label for label, _ in shared_out], [label for label, _ in own_out])
+                    self.assertEqual([float(c) for _, c in shared_out], [float(c) for _, c in own_out])
+
+                self.assertEqual((batch.transforms, batch.reuses), (2, 1))
+                self.assertIs(enrichers[0].vectorizer, enrichers[1].vectorizer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for the user story dedup index (prefix-filtered Jaccard candidates)
+"""
+
+import unittest
+
+from requirement_analyzer.task_gen.benchmark_story_dedup import make_stories
+from requirement_analyzer.task_gen.story_dedup import deduplicate_story_indices
+
+
+class TestStoryDedupIndex(unittest.TestCase):
+    """The indexed mode must keep exactly what the pairwise scan keeps"""
+
+    def test_same_result_as_pairwise(self):
+        for domain_terms in (0, 300):
+            stories = make_stories(600, seed=3, domain_terms=domain_terms)
+            for threshold in (0.5, 0.75, 0.9, 1.0):
+                self.assertEqual(
+                    deduplicate_story_indices(stories, threshold, use_index=False),
+                    deduplicate_story_indices(stories, threshold, use_index=True),
+                    f"threshold={threshold} domain_terms={domain_terms}",
+                )
+
+    def test_keeps_story_with_more_points(self):
+        stories = [
+            {"title": "Export report", "user_story": "As a manager I want to export the monthly report", "story_points": 3},
+            {"title": "Book room", "user_story": "As a guest I want to book a room online", "story_points": 5},
+            {"title": "Export report", "user_story": "As a manager I want to export the monthly reports", "story_points": 8},
+            {"title": "Export report", "user_story": "As a manager I want to export the monthly report", "story_points": 5},
+            {"title": "", "user_story": ""},
+            {"title": None, "user_story": None, "story_points": 2},
+        ]
+        for use_index in (False, True):
+            self.assertEqual(deduplicate_story_indices(stories, use_index=use_index), [1, 2, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite task history store: session summaries keep the
+per-session `file` name of the JSON store, legacy JSON import, paging and
+compressed task payloads
+"""
+
+import json
+import re
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from requirement_analyzer.task_gen import task_history
+
+
+class TestTaskHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self._saved = (task_history.HISTORY_DB, task_history.HISTORY_DIR, task_history._initialized_db)
+        task_history.HISTORY_DB = self.tmp / "task_history.db"
+        task_history.HISTORY_DIR = self.tmp / "task_history"
+        task_history._initialized_db = None
+
+    def tearDown(self):
+        task_history.HISTORY_DB, task_history.HISTORY_DIR, task_history._initialized_db = self._saved
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_saved_sessions_list_their_file(self):
+        session_id = task_history.save_history([{"title": "Login"}], "Users log in", filename="spec.pdf")
+
+        summary = task_history.list_history()[0]
+        self.assertEqual(summary["session_id"], session_id)
+        self.assertEqual(summary["source_filename"], "spec.pdf")
+        self.assertRegex(summary["file"], rf"^\d{{8}}_\d{{6}}_{re.escape(session_id)}\.json$")
+        self.assertTrue(task_history.delete_history_session(session_id))
+
+    def test_rows_without_file_are_backfilled(self):
+        task_history.save_history([], "text")
+        conn = sqlite3.connect(str(task_history.HISTORY_DB))
+        with conn:
+            conn.execute("UPDATE sessions SET file = NULL, session_id = 'abc12345', "
+                         "created_at = '2026-10-17T05:08:39.123456'")
+        conn.close()
+
+        task_history._initialized_db = None
+        self.assertEqual(task_history.list_history()[0]["file"], "20261017_050839_abc12345.json")
+
+    def write_legacy(self, name, content):
+        task_history.HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        path = task_history.HISTORY_DIR / name
+        path.write_text(content if isinstance(content, str) else json.dumps(content), encoding="utf-8")
+        return path
+
+    def test_legacy_json_is_imported_once(self):
+        for i in range(3):
+            self.write_legacy(f"2026101{i}_120000_s{i}.json", {
+                "session_id": f"s{i}", "created_at": f"2026-10-1{i}T12:00:00",
+                "source_filename": f"spec{i}.docx", "total_tasks": 1,
+                "tasks": [{"title": f"Task {i}"}],
+            })
+        self.write_legacy("broken.json", "{not json")
+        self.write_legacy("list.json", [1, 2])
+        self.write_legacy("no_id.json", {"tasks": []})
+
+        summaries = task_history.list_history()
+        self.assertEqual([s["session_id"] for s in summaries], ["s2", "s1", "s0"])
+        self.assertEqual(summaries[0]["file"], "20261012_120000_s2.json")
+        self.assertEqual(task_history.get_history_session("s1")["tasks"], [{"title": "Task 1"}])
+
+        conn = sqlite3.connect(str(task_history.HISTORY_DB))
+        marker = json.loads(conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()[0])
+        conn.close()
+        self.assertEqual(marker["imported"], 3)
+
+        # Deleted sessions and new files are not re-imported on the next start
+        self.assertTrue(task_history.delete_history_session("s0"))
+        self.assertFalse((task_history.HISTORY_DIR / "20261010_120000_s0.json").exists())
+        self.write_legacy("20261013_120000_s3.json", {"session_id": "s3", "created_at": "2026-10-13T12:00:00"})
+        task_history._initialized_db = None
+        self.assertEqual(task_history.count_history(), 2)
+        self.assertIsNone(task_history.get_history_session("s3"))
+
+    def test_limit_offset_and_count(self):
+        conn = task_history._connect()
+        with conn:
+            for i in range(25):
+                task_history._insert_record(conn, {"session_id": f"s{i:02d}",
+                                                   "created_at": f"2026-10-17T10:{i:02d}:00"})
+        conn.close()
+
+        self.assertEqual(task_history.count_history(), 25)
+        self.assertEqual(len(task_history.list_history()), 20)
+        pages = [task_history.list_history(limit=10, offset=o) for o in (0, 10, 20, 30)]
+        self.assertEqual([len(p) for p in pages], [10, 10, 5, 0])
+        ids = [s["session_id"] for page in pages for s in page]
+        self.assertEqual(ids, [f"s{i:02d}" for i in reversed(range(25))])
+        self.assertEqual(task_history.list_history(limit=-1, offset=-5), [])
+
+    def test_session_round_trips_compressed_tasks(self):
+        tasks = [{"title": f"Xử lý đơn hàng {i}", "acceptance_criteria": ["a" * 200] * 5,
+                  "story_points": i, "nested": {"ok": True, "none": None}} for i in range(50)]
+        session_id = task_history.save_history(tasks, "x" * 500, filename="spec.md",
+                                               metadata={"mode": "model"})
+
+        session = task_history.get_history_session(session_id)
+        self.assertEqual(session["tasks"], tasks)
+        self.assertEqual(session["total_tasks"], 50)
+        self.assertEqual(session["metadata"], {"mode": "model"})
+        self.assertEqual(session["source_preview"], "x" * 200 + "...")
+        self.assertIsNone(task_history.get_history_session("missing"))
+
+        conn = sqlite3.connect(str(task_history.HISTORY_DB))
+        blob = conn.execute("SELECT tasks FROM payloads WHERE session_id = ?", (session_id,)).fetchone()[0]
+        conn.close()
+        self.assertLess(len(blob), len(json.dumps(tasks, ensure_ascii=False).encode("utf-8")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled unified-router client: concurrent fan-out, response
+cache and circuit breaker (backends served by an in-process mock transport)
+"""
+
+import asyncio
+import time
+import unittest
+
+import httpx
+
+from app.unified_client import Backend, CircuitOpen, UnifiedClient
+
+
+DELAY_S = 0.2
+
+
+class TestUnifiedClient(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.fail = False
+        self.invalid_json = False
+
+        async def handler(request):
+            self.calls.append(request.url.path)
+            await asyncio.sleep(DELAY_S)
+            if self.fail:
+                return httpx.Response(503)
+            if self.invalid_json:
+                return httpx.Response(200, text="<html>Bad Gateway</html>")
+            return httpx.Response(200, json={"test_cases": [{"id": request.url.path}]})
+
+        self.transport = httpx.MockTransport(handler)
+
+    def run_with_client(self, scenario):
+        async def main():
+            client = UnifiedClient(
+                Backend("Analyzer", "http://analyzer", 5.0, failure_threshold=2, reset_timeout=60.0),
+                Backend("Test Generator", "http://testgen", 5.0),
+                transport=self.transport,
+            )
+            try:
+                return await scenario(client)
+            finally:
+                await client.aclose()
+        return asyncio.run(main())
+
+    def test_backends_run_concurrently_and_results_are_cached(self):
+        async def scenario(client):
+            start = time.perf_counter()
+            first = await asyncio.gather(
+                client.generate(client.analyzer, "/api/v3/generate", "text", "free_text"),
+                client.generate(client.testgen, "/generate/text", "text", "free_text"),
+            )
+            elapsed = time.perf_counter() - start
+            again = await client.generate(client.analyzer, "/api/v3/generate", "text", "free_text")
+            return first, elapsed, again
+
+        (analyzer, testgen), elapsed, again = self.run_with_client(scenario)
+        self.assertLess(elapsed, 2 * DELAY_S)
+        self.assertEqual(analyzer["result"]["test_cases"][0]["id"], "/api/v3/generate")
+        self.assertEqual(testgen["result"]["test_cases"][0]["id"], "/generate/text")
+        self.assertEqual(again, analyzer)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_identical_concurrent_calls_share_one_request(self):
+        async def scenario(client):
+            return await asyncio.gather(*[
+                client.generate(client.analyzer, "/api/v3/generate", "same", None) for _ in range(5)
+            ])
+
+        results = self.run_with_client(scenario)
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(r == results[0] for r in results))
+
+    def test_failures_open_the_circuit_and_are_not_cached(self):
+        self.fail = True
+
+        async def scenario(client):
+            outcomes = [
+                await client.generate(client.analyzer, "/api/v3/generate", "text", None)
+                for _ in range(3)
+            ]
+            return outcomes, client.analyzer.breaker.state
+
+        outcomes, state = self.run_with_client(scenario)
+        self.assertEqual([o["error"] for o in outcomes[:2]], [503, 503])
+        self.assertIn("circuit open", outcomes[2]["error"])
+        self.assertEqual(state, "open")
+        self.assertEqual(len(self.calls), 2)
+
+    def test_invalid_json_counts_as_failure(self):
+        self.invalid_json = True
+
+        async def scenario(client):
+            outcomes = [
+                await client.generate(client.analyzer, "/api/v3/generate", "text", None)
+                for _ in range(3)
+            ]
+            return outcomes, client.analyzer.breaker.state
+
+        outcomes, state = self.run_with_client(scenario)
+        self.assertTrue(all("invalid JSON" in o["error"] for o in outcomes[:2]))
+        self.assertIn("circuit open", outcomes[2]["error"])
+        self.assertEqual(state, "open")
+        self.assertEqual(len(self.calls), 2)
+
+    def test_half_open_lets_one_trial_through(self):
+        async def scenario(client):
+            breaker = client.analyzer.breaker
+            breaker.record_failure()
+            breaker.record_failure()
+            breaker.opened_at -= breaker.reset_timeout
+            breaker.before_call()
+            with self.assertRaises(CircuitOpen):
+                breaker.before_call()
+            breaker.record_success()
+            return breaker.state
+
+        self.assertEqual(self.run_with_client(scenario), "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+PDF extraction benchmark
+Builds a synthetic requirements PDF (needs pymupdf) and compares sequential
+extraction with the parallel page-range extractor: total time, time per page
+and time to first page (how soon segmentation could start)
+
+Usage:
+    python tools/benchmark_pdf_extraction.py [--pages 400] [--workers 4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from requirement_analyzer.ingestion.extract_text import (  # noqa: E402
+    available_pdf_backends, iter_pdf_pages, shutdown_pdf_executor,
+)
+
+LINES_PER_PAGE = 45
+
+
+def build_pdf(path, pages):
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    for p in range(pages):
+        page = doc.new_page()
+        lines = [
+            f"REQ-{p:03d}-{i:02d}: The system shall allow the user to update order {p * 100 + i} "
+            f"when the payment is confirmed."
+            for i in range(LINES_PER_PAGE)
+        ]
+        page.insert_text((40, 40), "\n".join(lines), fontsize=7)
+    doc.save(path)
+    doc.close()
+
+
+def measure(path, workers):
+    start = time.perf_counter()
+    first = None
+    chars = pages = 0
+    for _, text in iter_pdf_pages(path, max_workers=workers):
+        if first is None:
+            first = time.perf_counter() - start
+        chars += len(text)
+        pages += 1
+    return time.perf_counter() - start, first, pages, chars
+
+
+def run_benchmark(pages, workers):
+    if "fitz" not in available_pdf_backends():
+        print("pymupdf is required to build the synthetic PDF: pip install pymupdf")
+        return
+    print(f"backends: {', '.join(available_pdf_backends())}  cpus: {os.cpu_count()}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "spec.pdf")
+        build_pdf(path, pages)
+        print(f"synthetic PDF: {pages} pages, {os.path.getsize(path) / 1e6:.1f} MB\n")
+
+        print(f"{'mode':<22} {'total (s)':>10} {'ms/page':>8} {'first page (ms)':>16} {'chars':>10}")
+        print("-" * 70)
+        measure(path, workers)  # start the pool outside the timing
+        for label, w in (("sequential", 1), (f"parallel ({workers} procs)", workers)):
+            total, first, n, chars = measure(path, w)
+            print(f"{label:<22} {total:10.2f} {total / n * 1000:8.2f} {first * 1000:16.1f} {chars:10d}")
+    shutdown_pdf_executor()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--pages", type=int, default=400)
+    ap.add_argument("--workers", type=int, default=4)
+    args = ap.parse_args()
+    run_benchmark(args.pages, args.workers)
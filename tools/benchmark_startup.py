@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark
+Imports each module in a fresh interpreter (cold, like a new worker) and
+reports its import time plus the heaviest modules it pulled in
+(from `python -X importtime`)
+
+Usage:
+    python tools/benchmark_startup.py [module ...]
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+DEFAULT_MODULES = [
+    "app.main",
+    "requirement_analyzer.api",
+    "requirement_analyzer.analyzer",
+    "requirement_analyzer.ml_requirement_analyzer",
+    # Lazy routers / models: paid on first request or warm-up, not at start
+    "requirement_analyzer.task_gen.api_adapter_llmfree",
+    "requirement_analyzer.task_gen.api_adapter_v3",
+    "requirement_analyzer.task_gen.smart_ai_generator_v2",
+    "requirement_analyzer.api_v2_test_generation",
+]
+
+TIMER = (
+    "import time, sys; t = time.perf_counter(); import {module}; "
+    "sys.stdout.write('%.6f' % (time.perf_counter() - t))"
+)
+
+
+def measure(module, top=3):
+    """Returns (seconds or None, error, [(cumulative_s, name)] heaviest imports)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TIMER.format(module=module)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    heaviest = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            heaviest.append((int(cumulative) / 1e6, name.strip()))
+        except ValueError:
+            continue  # header line
+    heaviest = [h for h in sorted(heaviest, reverse=True) if h[1] != module][:top]
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1:] or ["failed"]
+        return None, last[0], heaviest
+    return float(proc.stdout.strip().splitlines()[-1]), None, heaviest
+
+
+def run_benchmark(modules):
+    print(f"{'module':<50} {'import (s)':>10}  heaviest dependencies")
+    print("-" * 110)
+    for module in modules:
+        seconds, error, heaviest = measure(module)
+        deps = ", ".join(f"{name} {s:.2f}s" for s, name in heaviest)
+        shown = f"{seconds:10.3f}" if seconds is not None else f"{'error':>10}"
+        print(f"{module:<50} {shown}  {deps}")
+        if error:
+            print(f"{'':<50} {'':>10}  ↳ {error[:100]}")
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:] or DEFAULT_MODULES)
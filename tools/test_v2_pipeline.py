@@ -228,6 +228,8 @@ def main():
     print(f"Gaps: {batch_output.total_gaps}")
     print(f"INVEST Avg: {batch_output.avg_invest_score:.1f}/30")
     print(f"Time: {batch_output.processing_time_seconds:.2f}s")
+    for stage, t in batch_output.stage_timings.items():
+        print(f"  {stage:<13} {t['total_seconds']:8.3f}s  {t['avg_ms']:8.2f} ms/req  {t['share'] * 100:5.1f}%")
     print("="*70 + "\n")
 
 